@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark d'ingestion en masse
+Compare add_nodes_bulk / add_edges_bulk, pour les deux modes de stockage
+du graphe, à la référence : add_node / add_edge appelés en boucle sur le
+stockage NetworkX (le chemin d'origine)
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import contextlib
+import gc
+import io
+import os
+import sys
+import time
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_manager import GraphManager, STORAGE_COLUMNAR, STORAGE_NETWORKX
+
+# Gain visé par l'import en masse à 100 000 artéfacts
+TARGET_SPEEDUP = 20
+
+# Chaque mesure garde le meilleur de plusieurs passes
+REPEATS = 3
+
+
+def generate_artifacts(count):
+    """
+    Génère un jeu d'artéfacts variés (IP, hash, fichiers, domaines...)
+    """
+    artifacts = []
+    for i in range(count):
+        kind = i % 5
+        if kind == 0:
+            artifacts.append(f"10.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}")
+        elif kind == 1:
+            artifacts.append(f"{i:032x}")
+        elif kind == 2:
+            artifacts.append(f"payload_{i}.exe")
+        elif kind == 3:
+            artifacts.append(f"host-{i}.example.com")
+        else:
+            artifacts.append(f"artifact_{i}")
+    return artifacts
+
+
+def bench_per_call(artifacts, edges, storage=STORAGE_NETWORKX):
+    # Le graphe de la passe précédente ne doit pas être collecté pendant la mesure
+    gc.collect()
+    with contextlib.redirect_stdout(io.StringIO()):
+        graph_manager = GraphManager(storage=storage)
+        start = time.perf_counter()
+        for artifact in artifacts:
+            graph_manager.add_node(artifact)
+        for artifact1, artifact2 in edges:
+            graph_manager.add_edge(artifact1, artifact2)
+        return time.perf_counter() - start
+
+
+def bench_bulk(artifacts, edges, storage=STORAGE_NETWORKX):
+    gc.collect()
+    with contextlib.redirect_stdout(io.StringIO()):
+        graph_manager = GraphManager(storage=storage)
+        start = time.perf_counter()
+        graph_manager.add_nodes_bulk(artifacts)
+        graph_manager.add_edges_bulk(edges)
+        return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    artifacts = generate_artifacts(count)
+    edges = list(zip(artifacts, artifacts[1:]))
+
+    # pandas, chargé au premier import en masse, n'est pas compté
+    import pandas  # noqa: F401
+
+    print(f"⏱️ Ingestion de {count} artéfacts et {len(edges)} liens")
+    reference = min(bench_per_call(artifacts, edges) for _ in range(REPEATS))
+    print(f"  • Référence add_node/add_edge ({STORAGE_NETWORKX}): {reference:.2f}s "
+          f"({count / reference:,.0f} artéfacts/s)")
+    for storage in (STORAGE_NETWORKX, STORAGE_COLUMNAR):
+        bulk = min(bench_bulk(artifacts, edges, storage) for _ in range(REPEATS))
+        speedup = reference / bulk
+        status = "atteint" if speedup >= TARGET_SPEEDUP else "non atteint"
+        print(f"  • add_nodes_bulk/add_edges_bulk ({storage}): {bulk:.2f}s "
+              f"({count / bulk:,.0f} artéfacts/s), gain x{speedup:.1f} "
+              f"(objectif x{TARGET_SPEEDUP} {status})")
+
+if __name__ == "__main__":
+    main()
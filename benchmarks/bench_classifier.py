@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark de classification des artéfacts
+Compare la détection unitaire et la classification par colonne
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from artifact_classifier import ArtifactClassifier
+from bench_bulk_ingestion import generate_artifacts
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    artifacts = generate_artifacts(count)
+    classifier = ArtifactClassifier()
+
+    print(f"⏱️ Classification de {count} artéfacts")
+
+    start = time.perf_counter()
+    single = [classifier.classify(artifact) for artifact in artifacts]
+    elapsed = time.perf_counter() - start
+    print(f"  • classify (unitaire): {elapsed:.2f}s")
+
+    for label, column in (("liste", artifacts),
+                          ("tableau NumPy", np.array(artifacts)),
+                          ("Series pandas", pd.Series(artifacts))):
+        start = time.perf_counter()
+        types = classifier.classify_many(column)
+        elapsed = time.perf_counter() - start
+        assert types.tolist() == single
+        print(f"  • classify_many ({label}): {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
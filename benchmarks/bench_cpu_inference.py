@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark de l'inférence sur CPU
+Compare, sur le même prompt d'investigation, le modèle non quantifié et
+sa quantification dynamique int8 : délai avant le premier token (TTFT)
+et débit de génération (tokens/s)
+
+Usage: python benchmarks/bench_cpu_inference.py [tokens] [threads]
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ai_manager import AIManager
+from config_manager import load_config
+from cpu_inference import QUANTIZATION_MODES, prepare_model
+from model_cache import checkpoint_path, load_model, read_manifest
+
+# Description d'un petit graphe d'investigation
+SAMPLE_DESCRIPTION = """Artéfacts (4):
+- powershell.exe (process)
+- 185.220.101.45 (ip)
+- invoice.docm (file)
+- 44d88612fea8a8f36de82e1278abb02f (hash)
+Liens:
+- invoice.docm -> powershell.exe
+- powershell.exe -> 185.220.101.45"""
+
+
+def load(ai_config):
+    """
+    Charge le modèle sur CPU, depuis le checkpoint converti s'il existe
+    """
+    path = checkpoint_path(ai_config['model_name'], ai_config['checkpoint_dir'])
+    if read_manifest(path) is not None:
+        return load_model(path)
+    from transformers import AutoTokenizer, AutoModelForCausalLM
+    tokenizer = AutoTokenizer.from_pretrained(ai_config['model_name'], trust_remote_code=True)
+    model = AutoModelForCausalLM.from_pretrained(ai_config['model_name'], trust_remote_code=True,
+                                                 torch_dtype="auto", low_cpu_mem_usage=True)
+    return tokenizer, model
+
+
+def measure(model, tokenizer, prompt, max_new_tokens):
+    """
+    Génère en glouton et renvoie (TTFT en s, tokens générés, durée totale en s)
+    """
+    from transformers import TextIteratorStreamer
+
+    inputs = tokenizer(prompt, return_tensors="pt")
+    streamer = TextIteratorStreamer(tokenizer, skip_prompt=True)
+    thread = threading.Thread(target=model.generate, kwargs=dict(
+        **inputs, streamer=streamer, max_new_tokens=max_new_tokens, do_sample=False))
+    start = time.perf_counter()
+    thread.start()
+    first = None
+    text = ""
+    for chunk in streamer:
+        if first is None and chunk:
+            first = time.perf_counter() - start
+        text += chunk
+    thread.join()
+    elapsed = time.perf_counter() - start
+    tokens = len(tokenizer(text, add_special_tokens=False)["input_ids"])
+    return first or elapsed, tokens, elapsed
+
+
+def main():
+    max_new_tokens = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    if importlib.util.find_spec("transformers") is None:
+        print("⚠️ Transformers non disponible : benchmark ignoré")
+        return
+
+    ai_config = load_config()['ai']
+    prompt = AIManager(discover=False, ai_config=ai_config)._build_investigation_prompt(SAMPLE_DESCRIPTION)
+    print(f"\n🧮 Inférence CPU de {ai_config['model_name']} ({max_new_tokens} tokens)")
+
+    for quantization in QUANTIZATION_MODES:
+        tokenizer, model = load(ai_config)
+        start = time.perf_counter()
+        model, used_threads = prepare_model(model, quantization, threads)
+        prepared = time.perf_counter() - start
+        ttft, tokens, elapsed = measure(model, tokenizer, prompt, max_new_tokens)
+        rate = max(tokens - 1, 0) / max(elapsed - ttft, 1e-9)
+        print(f"  {quantization:<5} ({used_threads} threads): TTFT {ttft:.2f}s, "
+              f"{rate:.2f} tokens/s, préparation {prepared:.1f}s")
+        del model
+
+
+if __name__ == '__main__':
+    main()
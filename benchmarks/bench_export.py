@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark de l'export sans interface
+Génère des dossiers enregistrés puis mesure leur rendu PNG par lots, dans
+le processus courant puis réparti sur les cœurs disponibles
+
+Usage: python benchmarks/bench_export.py [dossiers] [artéfacts par dossier]
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+import networkx as nx
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from batch_export import export_cases
+from graph_manager import GraphManager
+
+
+def generate_cases(case_dir, count, size):
+    """
+    Enregistre count dossiers de size artéfacts (graphes sans échelle)
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(count):
+            graph = nx.barabasi_albert_graph(size, 1, seed=i)
+            artifacts = [f"host-{node}.case{i}.local" for node in graph]
+            graph_manager = GraphManager()
+            graph_manager.add_nodes_bulk(artifacts)
+            graph_manager.add_edges_bulk((artifacts[a], artifacts[b]) for a, b in graph.edges())
+            graph_manager.layout.update(graph_manager.graph)
+            graph_manager.save_case(os.path.join(case_dir, f"case{i:04d}.json"))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    with tempfile.TemporaryDirectory() as tmp:
+        case_dir = os.path.join(tmp, "cases")
+        os.makedirs(case_dir)
+        generate_cases(case_dir, count, size)
+        print(f"\n🖼️ Export de {count} dossiers de {size} artéfacts (PNG)")
+
+        for workers in sorted({1, os.cpu_count() or 1}):
+            output_dir = os.path.join(tmp, f"images-{workers}")
+            start = time.perf_counter()
+            results = export_cases(case_dir, output_dir, ("png",), workers=workers)
+            elapsed = time.perf_counter() - start
+            failures = sum(1 for _, _, error in results if error is not None)
+            print(f"  {workers} processus: {elapsed:.2f}s, {count / elapsed:.1f} dossiers/s "
+                  f"({failures} échecs)")
+
+
+if __name__ == '__main__':
+    main()
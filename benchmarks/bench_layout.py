@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark des moteurs de disposition
+Compare nx.spring_layout et le moteur Barnes-Hut/ForceAtlas2 sur des
+graphes de 1k, 10k et 100k nœuds
+
+Usage: python benchmarks/bench_layout.py [itérations] [limite spring]
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import time
+
+import networkx as nx
+import numpy as np
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_layout import BarnesHutLayoutEngine, SPRING_K, graph_snapshot
+
+SIZES = (1000, 10000, 100000)
+
+
+def generate_graph(node_count, seed=0):
+    """
+    Graphe proche d'une ingestion de logs : quelques nœuds très connectés
+    (hôtes, processus parents) et une majorité de feuilles
+    """
+    graph = nx.barabasi_albert_graph(node_count, 1, seed=seed)
+    rng = np.random.default_rng(seed)
+    extra = rng.integers(0, node_count, (node_count // 4, 2))
+    graph.add_edges_from(edge for edge in extra.tolist() if edge[0] != edge[1])
+    return graph
+
+
+def edge_ratio(positions, edges, seed=0):
+    """
+    Longueur moyenne des arêtes / distance moyenne entre nœuds au hasard
+    (plus c'est bas, plus les voisins sont regroupés)
+    """
+    rng = np.random.default_rng(seed)
+    sample = rng.integers(0, len(positions), (10000, 2))
+    edge_length = np.linalg.norm(positions[edges[:, 0]] - positions[edges[:, 1]], axis=1).mean()
+    random_length = np.linalg.norm(positions[sample[:, 0]] - positions[sample[:, 1]], axis=1).mean()
+    return edge_length / random_length
+
+
+def bench_spring(graph, iterations):
+    start = time.perf_counter()
+    layout = nx.spring_layout(graph, k=SPRING_K, iterations=iterations, seed=0)
+    elapsed = time.perf_counter() - start
+    return elapsed, np.array([layout[node] for node in graph])
+
+
+def bench_barnes_hut(node_count, edges, iterations):
+    start = time.perf_counter()
+    positions, done = BarnesHutLayoutEngine().run(node_count, edges, iterations=iterations, seed=0)
+    return time.perf_counter() - start, positions, done
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    spring_limit = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    print(f"⏱️ Disposition ({iterations} itérations au plus)")
+    for node_count in SIZES:
+        graph = generate_graph(node_count)
+        _, edges = graph_snapshot(graph)
+        print(f"\n📊 {node_count:,} nœuds, {len(edges):,} arêtes")
+
+        elapsed, positions, done = bench_barnes_hut(node_count, edges, iterations)
+        print(f"  • barnes_hut: {elapsed:.2f}s ({done} itérations, "
+              f"ratio arêtes {edge_ratio(positions, edges):.3f})")
+
+        if node_count > spring_limit:
+            print(f"  • spring_layout: ignoré au-delà de {spring_limit:,} nœuds (O(n²) par itération)")
+            continue
+        try:
+            elapsed, positions = bench_spring(graph, iterations)
+        except ImportError as e:
+            print(f"  • spring_layout: indisponible ({e})")
+            continue
+        print(f"  • spring_layout: {elapsed:.2f}s ({iterations} itérations, "
+              f"ratio arêtes {edge_ratio(positions, edges):.3f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark mémoire du stockage du graphe
+Mesure les octets par nœud des stockages NetworkX et colonnaire
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_manager import GraphManager, STORAGE_NETWORKX, STORAGE_COLUMNAR
+from bench_bulk_ingestion import generate_artifacts
+
+
+def measure(storage, artifacts, edges):
+    """
+    Construit un graphe et retourne la mémoire qu'il retient (octets)
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    graph_manager = GraphManager(storage=storage)
+    graph_manager.add_nodes_bulk(artifacts)
+    graph_manager.add_edges_bulk(edges)
+
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return retained
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    artifacts = generate_artifacts(count)
+    edges = list(zip(artifacts, artifacts[1:]))
+
+    # Les chaînes d'artéfacts sont partagées avec l'appelant : seul le
+    # surcoût du stockage est mesuré
+    print(f"💾 Mémoire retenue pour {count} nœuds et {len(edges)} liens")
+    results = {}
+    for storage in (STORAGE_NETWORKX, STORAGE_COLUMNAR):
+        results[storage] = measure(storage, artifacts, edges)
+        print(f"  • {storage}: {results[storage] / 1e6:.1f} Mo "
+              f"({results[storage] / count:.0f} octets/nœud)")
+    print(f"  • Réduction: x{results[STORAGE_NETWORKX] / results[STORAGE_COLUMNAR]:.1f}")
+
+
+if __name__ == "__main__":
+    main()
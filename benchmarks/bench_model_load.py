@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark du chargement du modèle
+Compare, dans des processus neufs, le chargement du modèle depuis le Hub
+(cache Hugging Face) et depuis le checkpoint local converti
+(python main.py convert-model)
+
+Usage: python benchmarks/bench_model_load.py [répétitions]
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Chargement mesuré dans un processus neuf (pas de cache de pages Python)
+LOAD_CODE = """
+import sys, time
+from config_manager import load_config
+from model_cache import checkpoint_path, load_model
+source = sys.argv[1]
+ai_config = load_config()['ai']
+start = time.perf_counter()
+if source == "checkpoint":
+    load_model(checkpoint_path(ai_config['model_name'], ai_config['checkpoint_dir']))
+else:
+    from transformers import AutoTokenizer, AutoModelForCausalLM
+    AutoTokenizer.from_pretrained(ai_config['model_name'], trust_remote_code=True)
+    AutoModelForCausalLM.from_pretrained(ai_config['model_name'], trust_remote_code=True,
+                                         torch_dtype="auto", device_map="auto")
+print(f"@@ {time.perf_counter() - start:.2f}")
+"""
+
+
+def load_time(source):
+    """
+    Durée du chargement (s) dans un processus neuf
+    """
+    result = subprocess.run([sys.executable, "-c", LOAD_CODE, source], cwd=SRC_DIR,
+                            capture_output=True, text=True, check=True)
+    return float(next(line[3:] for line in result.stdout.splitlines() if line.startswith("@@ ")))
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    if importlib.util.find_spec("transformers") is None:
+        print("⚠️ Transformers non disponible : benchmark ignoré")
+        return
+
+    sys.path.insert(0, SRC_DIR)
+    from config_manager import load_config
+    from model_cache import checkpoint_path, read_manifest
+
+    ai_config = load_config()['ai']
+    print(f"\n⏱️ Chargement de {ai_config['model_name']} (meilleur de {repeats})")
+    hub = min(load_time("hub") for _ in range(repeats))
+    print(f"  Hub (cache Hugging Face): {hub:.2f}s")
+    if read_manifest(checkpoint_path(ai_config['model_name'], ai_config['checkpoint_dir'])) is None:
+        print("  Checkpoint local absent : lancer 'python main.py convert-model'")
+        return
+    local = min(load_time("checkpoint") for _ in range(repeats))
+    print(f"  Checkpoint local (mmap): {local:.2f}s ({hub / local:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
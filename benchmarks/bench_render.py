@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark du rendu du graphe
+Mesure un rendu complet puis la mise à jour de l'affichage après l'ajout
+d'un nœud relié au graphe (canvas Agg, sans interface)
+
+Usage: python benchmarks/bench_render.py [nœuds] [ajouts]
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import time
+
+import networkx as nx
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_layout import PositionCache
+from graph_manager import GraphManager
+from layout_worker import LayoutWorker
+
+
+def build_manager(node_count, worker):
+    """
+    GraphManager relié à un canvas Agg, rempli d'un graphe aléatoire
+    """
+    graph_manager = GraphManager(layout=PositionCache(seed=0), layout_worker=worker)
+    figure = Figure(figsize=(8, 6), dpi=100, facecolor='white')
+    graph_manager.attach_canvas(figure, FigureCanvasAgg(figure))
+
+    graph = nx.barabasi_albert_graph(node_count, 1, seed=0)
+    artifacts = [f"host-{node}.corp.local" for node in graph]
+    graph_manager.add_nodes_bulk(artifacts)
+    graph_manager.add_edges_bulk((artifacts[a], artifacts[b]) for a, b in graph.edges())
+    return graph_manager, artifacts
+
+
+def main():
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    additions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    worker = LayoutWorker()
+    try:
+        graph_manager, artifacts = build_manager(node_count, worker)
+
+        start = time.perf_counter()
+        graph_manager.update_display()
+        print(f"\n⏱️ Rendu complet ({node_count:,} nœuds): {time.perf_counter() - start:.2f}s")
+
+        # Attendre la disposition en arrière-plan puis l'afficher
+        while worker.pending is not None:
+            time.sleep(0.1)
+            if graph_manager.apply_finished_layout():
+                graph_manager.update_display()
+
+        for index in range(additions):
+            artifact = f"evil-{index}.exe"
+            start = time.perf_counter()
+            graph_manager.add_node(artifact)
+            graph_manager.add_edge(artifact, artifacts[index])
+            graph_manager.update_display()
+            elapsed = time.perf_counter() - start
+            print(f"  • ajout de {artifact}: {elapsed * 1000:.1f} ms ({graph_manager.renderer.last_update})")
+    finally:
+        worker.shutdown()
+
+
+if __name__ == "__main__":
+    main()
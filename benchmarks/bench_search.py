@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark de la recherche d'artéfacts
+Mesure la recherche incrémentale par préfixe (une requête par caractère
+saisi) et la mise à jour de l'index sur un grand nombre d'artéfacts
+
+Usage: python benchmarks/bench_search.py [artéfacts]
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import time
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bench_bulk_ingestion import generate_artifacts
+from graph_stats import GraphStatistics
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    artifacts = generate_artifacts(count)
+
+    stats = GraphStatistics()
+    start = time.perf_counter()
+    stats.nodes_added([(artifact, "default") for artifact in artifacts])
+    print(f"\n🔎 Index de {count:,} artéfacts construit en {time.perf_counter() - start:.2f}s")
+
+    # Saisie progressive, une requête (première page) par caractère
+    for query in ("Host-12343.EXAMPLE.com", "payload_99", "10.1.", "a"):
+        start = time.perf_counter()
+        for length in range(1, len(query) + 1):
+            matches, total = stats.search(query[:length], 0, 20)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  Saisie de '{query}': {elapsed / len(query):.3f} ms par frappe "
+              f"({total:,} résultats au final)")
+
+    start = time.perf_counter()
+    stats.search("host-", 400000, 20)
+    print(f"  Page lointaine: {(time.perf_counter() - start) * 1000:.3f} ms")
+
+    start = time.perf_counter()
+    for i in range(100):
+        stats.node_added(f"NEW-artifact-{i}", "default")
+    for i in range(100):
+        stats.node_removed(f"NEW-artifact-{i}", "default", [])
+    print(f"  Ajout + suppression: {(time.perf_counter() - start) * 10:.3f} ms par artéfact")
+
+
+if __name__ == '__main__':
+    main()
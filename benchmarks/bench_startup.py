@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark du démarrage
+Mesure, avec "python -X importtime", le temps d'import de l'application
+et les modules les plus coûteux, puis la création des gestionnaires, et
+signale tout dépassement du budget de démarrage ou tout module lent
+(Matplotlib, pandas, torch...) chargé avant l'affichage de la fenêtre
+
+Usage: python benchmarks/bench_startup.py [répétitions]
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Budget d'import de l'application (la fenêtre doit apparaître en moins d'1 s)
+IMPORT_BUDGET_MS = 500
+
+# Modules qui ne doivent pas être importés au démarrage
+DEFERRED_MODULES = ("matplotlib", "pandas", "requests", "transformers", "torch")
+
+# Création des gestionnaires, mesurée dans le même processus que l'import
+SETUP_CODE = """
+import time
+start = time.perf_counter()
+import chronosense_app
+from config_manager import load_config
+from graph_layout import PositionCache
+from graph_manager import GraphManager
+from ai_manager import AIManager
+imported = time.perf_counter()
+config = load_config()
+GraphManager(layout=PositionCache.from_config(config['interface']), display_config=config['interface'])
+AIManager(discover=False)
+print(f"@@ {(imported - start) * 1000:.1f} {(time.perf_counter() - imported) * 1000:.1f}")
+import sys
+print("@@", ",".join(m for m in DEFERRED_MODULES if m in sys.modules))
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Lignes "import time: self | cumulé | module" -> {module: (self µs, cumulé µs)}
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def run_once():
+    """
+    Lance un interpréteur neuf et renvoie (modules, import ms, création ms, modules différés chargés)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"DEFERRED_MODULES = {DEFERRED_MODULES!r}\n" + SETUP_CODE],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    lines = [line[3:] for line in result.stdout.splitlines() if line.startswith("@@ ")]
+    import_ms, setup_ms = map(float, lines[0].split())
+    loaded = [name for name in lines[1].split(",") if name]
+    return parse_importtime(result.stderr), import_ms, setup_ms, loaded
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    runs = [run_once() for _ in range(repeats)]
+    modules, _, _, loaded = runs[-1]
+    import_ms = min(run[1] for run in runs)
+    setup_ms = min(run[2] for run in runs)
+
+    print(f"\n🚀 Démarrage de Chronosense (meilleur de {repeats})")
+    print(f"  Import de l'application: {import_ms:.0f} ms (budget {IMPORT_BUDGET_MS} ms)")
+    print(f"  Création des gestionnaires: {setup_ms:.0f} ms")
+    print("  Modules les plus coûteux (cumulé):")
+    top_level = {name: times for name, times in modules.items() if "." not in name}
+    for name, (_, cumulative_us) in sorted(top_level.items(), key=lambda item: -item[1][1])[:10]:
+        print(f"    {name:<24} {cumulative_us / 1000:7.1f} ms")
+
+    failed = False
+    if loaded:
+        print(f"❌ Modules chargés au démarrage: {', '.join(loaded)}")
+        failed = True
+    if import_ms > IMPORT_BUDGET_MS:
+        print("❌ Budget d'import dépassé")
+        failed = True
+    if not failed:
+        print("✅ Démarrage dans le budget")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
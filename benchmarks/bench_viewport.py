@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Benchmark de la navigation dans la vue
+Mesure le zoom progressif, le déplacement et la sélection sur un grand
+graphe : seuls les nœuds et arêtes qui touchent la vue sont redessinés
+(canvas Agg, sans interface)
+
+Usage: python benchmarks/bench_viewport.py [nœuds]
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_navigation import ViewNavigator
+from graph_renderer import GraphRenderer
+
+TYPES = ("ip", "hash", "file", "process", "domain")
+COLORS = ('#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7')
+
+
+def style(node):
+    """
+    Style du benchmark : couleur et type selon l'ID
+    """
+    return COLORS[node % 5], f"host-{node}", TYPES[node % 5]
+
+
+def build_graph(node_count, seed=0):
+    """
+    Positions en amas (comme une disposition force) et arêtes courtes
+    vers un voisin d'ID proche, plus quelques arêtes longues
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-100, 100, size=(max(node_count // 500, 1), 2))
+    positions = centers[rng.integers(0, len(centers), node_count)] + rng.normal(0, 3, (node_count, 2))
+    order = np.argsort(positions[:, 0] // 10 * 1000 + positions[:, 1])
+    sources = order[1:]
+    targets = order[:-1]
+    extra = rng.integers(0, node_count, size=(node_count // 100, 2))
+    edges = np.vstack((np.column_stack((sources, targets)), extra))
+    return list(range(node_count)), positions, edges
+
+
+def timed(label, action, renderer):
+    """
+    Exécute une action (le canvas Agg dessine aussitôt) et affiche la durée
+    """
+    start = time.perf_counter()
+    action()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label} ({renderer.mode}, {renderer._visible_count:,} visibles): {elapsed:7.1f} ms")
+
+
+def main():
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    warnings.filterwarnings("ignore", message="Glyph")
+    nodes, positions, edges = build_graph(node_count)
+
+    figure = Figure(figsize=(8, 6), dpi=100, facecolor='white')
+    renderer = GraphRenderer(figure, figure.add_subplot(111), FigureCanvasAgg(figure))
+    navigator = ViewNavigator(renderer)
+
+    print(f"\n🗺️ Navigation dans un graphe de {node_count:,} nœuds, {len(edges):,} arêtes")
+    timed("Rendu complet (index compris)", lambda: renderer.update(nodes, positions, edges, style, "Titre"),
+          renderer)
+
+    center = tuple(positions[0])
+    for step in range(12):
+        timed(f"Zoom {step + 1:2d}", lambda: navigator.zoom(2.0, center), renderer)
+
+    (x0, x1), _ = navigator.view()
+    for step in range(5):
+        timed(f"Déplacement {step + 1}", lambda: navigator.pan((x1 - x0) / 4, 0), renderer)
+
+    timed("Vue d'ensemble", navigator.reset, renderer)
+
+    # Test de clic (sélection) au plus près, puis sélection au rectangle
+    navigator.zoom(64.0, center)
+    probes = positions[np.random.default_rng(1).integers(0, node_count, 1000)]
+    start = time.perf_counter()
+    for x, y in probes:
+        renderer.hit_test(x, y)
+    print(f"  Test de clic: {(time.perf_counter() - start) * 1000:.3f} ms pour 1000 clics")
+    start = time.perf_counter()
+    selected = renderer.nodes_in((center[0] - 20, center[0] + 20), (center[1] - 20, center[1] + 20))
+    print(f"  Rectangle: {len(selected):,} nœuds en {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
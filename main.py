@@ -9,16 +9,30 @@ Version: 0.1 (Preuve de Concept)
 
 import sys
 import os
+import time
 
 # Ajouter le répertoire src au path pour les imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from chronosense_app import ChronosenseApp
-
 def main():
     """
     Fonction principale pour lancer l'application Chronosense
+    
+    "python main.py export ..." rend des dossiers enregistrés en images
+    sans interface (voir batch_export) ; Tk n'est alors pas chargé.
+    "python main.py convert-model" prépare le checkpoint local du modèle
+    (voir model_cache).
     """
+    if len(sys.argv) > 1 and sys.argv[1] == "export":
+        from batch_export import main as export_main
+        sys.exit(export_main(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "convert-model":
+        from model_cache import main as convert_main
+        sys.exit(convert_main(sys.argv[2:]))
+    
+    started = time.perf_counter()
+    from chronosense_app import ChronosenseApp
+    
     try:
         print("Démarrage de Chronosense v0.1...")
         print("Assistant d'Investigation DFIR avec IA Locale")
@@ -26,7 +40,7 @@ def main():
         
         # Créer et lancer l'application
         app = ChronosenseApp()
-        app.run()
+        app.run(started)
         
     except KeyboardInterrupt:
         print("\nArrêt de l'application demandé par l'utilisateur.")
@@ -8,115 +8,334 @@ Version: 0.1 (Preuve de Concept)
 """
 
 import json
-import requests
+import importlib.util
+import queue
+import threading
 from datetime import datetime
 import time
 
-# Import conditionnel pour Transformers (Hugging Face)
-try:
-    from transformers import AutoTokenizer, AutoModelForCausalLM, pipeline
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
-    print("⚠️ Transformers non disponible. Utilisation du mode simulation.")
+from cpu_inference import (QUANTIZATION_INT8, QUANTIZATION_MODES, QUANTIZATION_NONE, default_thread_count,
+                           prepare_model)
+from model_cache import checkpoint_path, load_model, read_manifest
+from ollama_client import OllamaClient, OllamaError
+
+# Transformers (et torch) ne sont importés qu'au chargement du modèle :
+# leur présence est seulement vérifiée ici, sans les charger
+TRANSFORMERS_AVAILABLE = importlib.util.find_spec("transformers") is not None
+
+# Préférence des modes : le plus précis disponible l'emporte, même s'il
+# est prêt après un autre
+MODE_PRIORITY = {"simulation": 0, "api": 1, "transformers": 2}
+
+# Intervalle de vérification de l'annulation pendant les attentes (s)
+CANCEL_POLL_S = 0.05
 
 class AIManager:
     """
     Gestionnaire d'IA pour l'analyse d'investigation DFIR
     Intègre le modèle Microsoft Phi-3 en local
+    
+    Le chargement de Transformers et la détection d'Ollama (préchauffage)
+    se font en parallèle, dans des threads : le premier moteur prêt sert
+    les requêtes, Transformers remplace l'API dès qu'il est chargé.
     """
     
-    def __init__(self):
+    def __init__(self, discover=True, ai_config=None):
         """
         Initialise le gestionnaire d'IA
+        
+        Args:
+            discover (bool): Préchauffer le modèle immédiatement (bloquant) ;
+                             sinon le mode simulation est utilisé jusqu'à
+                             l'appel de start_warmup()
+            ai_config (dict): Section "ai" de la configuration (valeurs par
+                              défaut sinon)
         """
-        self.model_name = "microsoft/Phi-3-mini-4k-instruct"
+        ai_config = ai_config or {}
+        self.model_name = ai_config.get('model_name', "microsoft/Phi-3-mini-4k-instruct")
         self.model = None
         self.tokenizer = None
         self.pipeline = None
         
         # Configuration
-        self.max_tokens = 512
-        self.temperature = 0.7
-        self.api_url = "http://localhost:11434/api/generate"  # URL pour Ollama local
+        self.max_tokens = ai_config.get('max_tokens', 512)
+        self.temperature = ai_config.get('temperature', 0.7)
+        self.api_url = ai_config.get('api_url', "http://localhost:11434/api/generate")  # URL pour Ollama local
+        self.api_model = "phi3"  # Nom du modèle dans Ollama
+        
+        # Client HTTP partagé (connexions maintenues, requêtes simultanées bornées)
+        self.client = OllamaClient.from_config(ai_config)
+        
+        # Inférence sur CPU : quantification et threads de calcul
+        self.quantization = ai_config.get('quantization', QUANTIZATION_NONE)
+        if self.quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"Mode de quantification inconnu: {self.quantization}")
+        self.cpu_threads = ai_config.get('cpu_threads', 0)  # 0 : cœurs disponibles
+        
+        # Checkpoint local converti (python main.py convert-model)
+        self.checkpoint = checkpoint_path(self.model_name, ai_config.get('checkpoint_dir'))
+        self.model_source = None  # "checkpoint" ou "hub" une fois chargé
         
         # Mode de fonctionnement
         self.mode = "simulation"  # "transformers", "api", "simulation"
         
+        # Mesures de la dernière génération en flux (s)
+        self.last_ttft = None
+        self.last_generation_time = None
+        
+        # État du préchauffage
+        self._lock = threading.Lock()
+        self.ready_event = threading.Event()
+        self.warming_up = False
+        self.ready_time = None      # Délai avant le premier moteur prêt (s)
+        self.warmup_time = None     # Durée totale du préchauffage (s)
+        self.backend_times = {}     # Durée de chaque tentative (s)
+        
         # Initialiser le modèle
-        self._initialize_model()
+        if discover:
+            for thread in self.start_warmup():
+                thread.join()
         
         print(f"AIManager initialisé en mode: {self.mode}")
     
-    def _initialize_model(self):
+    def start_warmup(self, on_update=None):
         """
-        Initialise le modèle Phi-3 selon la méthode disponible
+        Lance le préchauffage : chargement Transformers et détection
+        d'Ollama en parallèle
+        
+        Args:
+            on_update (callable): Appelé avec get_model_info() à la fin de
+                                  chaque tentative, depuis son thread
+            
+        Returns:
+            list: Threads de préchauffage
         """
-        # Essayer d'abord avec Transformers (Hugging Face)
+        tasks = [("api", self._probe_api)]
         if TRANSFORMERS_AVAILABLE:
+            tasks.insert(0, ("transformers", self._load_transformers))
+        else:
+            print("⚠️ Transformers non disponible")
+        
+        with self._lock:
+            self.warming_up = True
+            self.ready_event.clear()
+            self.ready_time = self.warmup_time = None
+            self.backend_times = {}
+        started = time.perf_counter()
+        remaining = [len(tasks)]
+        
+        def run(mode, load):
+            attempt = time.perf_counter()
             try:
-                print("🔄 Tentative de chargement du modèle Phi-3 via Transformers...")
-                self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, trust_remote_code=True)
-                self.model = AutoModelForCausalLM.from_pretrained(
-                    self.model_name,
-                    trust_remote_code=True,
-                    torch_dtype="auto",
-                    device_map="auto"
-                )
-                
-                self.pipeline = pipeline(
-                    "text-generation",
-                    model=self.model,
-                    tokenizer=self.tokenizer,
-                    max_new_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                    do_sample=True,
-                    pad_token_id=self.tokenizer.eos_token_id
-                )
-                
-                self.mode = "transformers"
-                print("✅ Modèle Phi-3 chargé avec succès via Transformers")
-                return
-                
+                loaded = load()
             except Exception as e:
-                print(f"❌ Erreur lors du chargement via Transformers: {e}")
+                print(f"❌ Préchauffage {mode} échoué: {e}")
+                loaded = False
+            
+            with self._lock:
+                now = time.perf_counter()
+                self.backend_times[mode] = now - attempt
+                if loaded and MODE_PRIORITY[mode] > MODE_PRIORITY[self.mode]:
+                    self.mode = mode
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    self.warming_up = False
+                    self.warmup_time = now - started
+                    if self.mode == "simulation":
+                        print("⚠️ Mode simulation activé - Aucun modèle IA réel disponible")
+                # Prêt : un moteur réel répond, ou plus rien à attendre
+                if (self.mode != "simulation" or not self.warming_up) and not self.ready_event.is_set():
+                    self.ready_time = now - started
+                    self.ready_event.set()
+            
+            if on_update is not None:
+                on_update(self.get_model_info())
         
-        # Essayer avec une API locale (Ollama, etc.)
-        try:
-            print("🔄 Tentative de connexion à l'API locale...")
-            response = requests.get("http://localhost:11434/api/tags", timeout=5)
-            if response.status_code == 200:
-                self.mode = "api"
-                print("✅ API locale détectée (Ollama)")
-                return
-        except Exception as e:
-            print(f"❌ API locale non disponible: {e}")
+        threads = [threading.Thread(target=run, args=task, name=f"ai-warmup-{task[0]}", daemon=True)
+                   for task in tasks]
+        for thread in threads:
+            thread.start()
+        return threads
+    
+    def wait_ready(self, timeout=None):
+        """
+        Attend qu'un moteur soit prêt (ou la fin du préchauffage)
         
-        # Mode simulation par défaut
-        self.mode = "simulation"
-        print("⚠️ Mode simulation activé - Aucun modèle IA réel disponible")
+        Returns:
+            bool: True si le préchauffage a abouti dans le délai
+        """
+        return self.ready_event.wait(timeout)
     
-    def generate_hypotheses(self, graph_description):
+    def _load_transformers(self):
+        """
+        Charge le modèle Phi-3 via Transformers
+        
+        Returns:
+            bool: True si le pipeline est prêt
+        """
+        print("🔄 Tentative de chargement du modèle Phi-3 via Transformers...")
+        from transformers import AutoTokenizer, AutoModelForCausalLM, pipeline
+        
+        if read_manifest(self.checkpoint) is not None:
+            # Checkpoint converti : projection mémoire, sans accès au Hub
+            print(f"⚡ Chargement du checkpoint local {self.checkpoint}")
+            tokenizer, model = load_model(self.checkpoint)
+            source = "checkpoint"
+        else:
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name, trust_remote_code=True)
+            # Quantification int8 : le modèle reste sur CPU
+            placement = {} if self.quantization == QUANTIZATION_INT8 else {"device_map": "auto"}
+            model = AutoModelForCausalLM.from_pretrained(
+                self.model_name,
+                trust_remote_code=True,
+                torch_dtype="auto",
+                low_cpu_mem_usage=True,
+                **placement
+            )
+            source = "hub"
+            print("💡 'python main.py convert-model' accélère les prochains démarrages")
+        
+        model, self.cpu_threads = prepare_model(model, self.quantization, self.cpu_threads)
+        
+        # Le pipeline n'est publié qu'une fois complet (lu par les
+        # générations lancées pendant le préchauffage)
+        self.tokenizer, self.model = tokenizer, model
+        self.pipeline = pipeline(
+            "text-generation",
+            model=model,
+            tokenizer=tokenizer,
+            max_new_tokens=self.max_tokens,
+            temperature=self.temperature,
+            do_sample=True,
+            pad_token_id=tokenizer.eos_token_id
+        )
+        self.model_source = source
+        print("✅ Modèle Phi-3 chargé avec succès via Transformers")
+        return True
+    
+    def _probe_api(self):
+        """
+        Détecte une API locale (Ollama)
+        
+        Returns:
+            bool: True si l'API répond
+        """
+        print("🔄 Tentative de connexion à l'API locale...")
+        if not self.client.is_available():
+            return False
+        print("✅ API locale détectée (Ollama)")
+        return True
+    
+    def generate_hypotheses(self, graph_description, wait_ready=None):
         """
         Génère des hypothèses d'investigation basées sur le graphe
         
+        Pendant le préchauffage, la requête attend au plus wait_ready
+        secondes qu'un moteur soit prêt, puis est traitée avec le meilleur
+        mode disponible (simulation à défaut).
+        
         Args:
             graph_description (str): Description textuelle du graphe
+            wait_ready (float): Attente maximale du préchauffage (s) ;
+                                None : pas d'attente
             
         Returns:
             str: Hypothèses générées par l'IA
         """
+        self._wait_for_warmup(wait_ready)
+        
         # Construire le prompt structuré
         prompt = self._build_investigation_prompt(graph_description)
         
         # Générer la réponse selon le mode disponible
-        if self.mode == "transformers":
+        mode = self.mode
+        if mode == "transformers":
             return self._generate_with_transformers(prompt)
-        elif self.mode == "api":
+        elif mode == "api":
             return self._generate_with_api(prompt)
         else:
             return self._generate_simulation(graph_description)
     
+    def generate_hypotheses_stream(self, graph_description, wait_ready=None, cancel=None, on_start=None):
+        """
+        Génère des hypothèses au fil de l'eau
+        
+        Les morceaux de texte sont produits dès que le moteur les émet
+        (flux NDJSON d'Ollama, TextIteratorStreamer pour Transformers) ;
+        le délai avant le premier morceau est conservé dans last_ttft.
+        
+        Args:
+            graph_description (str): Description textuelle du graphe
+            wait_ready (float): Attente maximale du préchauffage (s)
+            cancel (threading.Event): Une fois levé, interrompt l'attente du
+                                      préchauffage, coupe le flux HTTP et
+                                      arrête Transformers au token suivant ;
+                                      le flux se termine sans horodatage
+            on_start (callable): Appelé, avant le premier morceau, avec les
+                                 réglages du moteur retenu pour ce flux
+                                 (generation_settings) ; le préchauffage
+                                 peut changer self.mode entre-temps
+            
+        Yields:
+            str: Morceaux de la réponse, horodatage final compris
+            
+        Raises:
+            Exception: Échec du moteur (OllamaError, requests.RequestException,
+                       erreur de génération Transformers), propagé à l'appelant
+                       au lieu d'être restitué comme texte
+        """
+        start = time.perf_counter()
+        self.last_ttft = None
+        self._wait_for_warmup(wait_ready, cancel)
+        if cancel is not None and cancel.is_set():
+            return
+        
+        prompt = self._build_investigation_prompt(graph_description)
+        mode = self.mode
+        if mode == "transformers":
+            chunks = self._stream_with_transformers(prompt, cancel)
+        elif mode == "api":
+            chunks = self._stream_with_api(prompt, cancel)
+        else:
+            chunks = self._stream_simulation(graph_description)
+        if on_start is not None:
+            on_start(self.generation_settings(mode))
+        
+        leading = True
+        for chunk in chunks:
+            if leading:
+                # Comme _post_process_response : pas d'espaces en tête
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                leading = False
+                self.last_ttft = time.perf_counter() - start
+            yield chunk
+        
+        if cancel is not None and cancel.is_set():
+            return
+        self.last_generation_time = time.perf_counter() - start
+        if self.last_ttft is None:
+            self.last_ttft = self.last_generation_time
+        if mode != "simulation":
+            yield f"\n\n⏰ Analyse générée le {datetime.now().strftime('%d/%m/%Y à %H:%M:%S')}"
+    
+    def _wait_for_warmup(self, timeout, cancel=None):
+        """
+        Pendant le préchauffage, attend au plus timeout secondes un moteur
+        prêt ; l'attente s'arrête aussi dès que cancel est levé
+        """
+        if timeout and self.warming_up and not self.ready_event.is_set():
+            print("⏳ En attente du modèle IA...")
+            if cancel is None:
+                self.ready_event.wait(timeout)
+                return
+            deadline = time.perf_counter() + timeout
+            while not cancel.is_set():
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or self.ready_event.wait(min(CANCEL_POLL_S, remaining)):
+                    return
+    
     def _build_investigation_prompt(self, graph_description):
         """
         Construit le prompt structuré pour l'analyse DFIR
@@ -187,34 +406,95 @@ Présente ta réponse de manière claire et concise.
         """
         try:
             print("🧠 Génération via API locale...")
+            generated_text = self.client.generate(prompt, self.api_model, self._api_options())
+            return self._post_process_response(generated_text)
             
-            payload = {
-                "model": "phi3",  # Nom du modèle dans Ollama
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": self.temperature,
-                    "num_predict": self.max_tokens
-                }
-            }
-            
-            response = requests.post(
-                self.api_url,
-                json=payload,
-                timeout=60
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                generated_text = result.get('response', '')
-                return self._post_process_response(generated_text)
-            else:
-                return f"Erreur API: {response.status_code} - {response.text}"
-                
+        except OllamaError as e:
+            return str(e)
         except Exception as e:
             print(f"❌ Erreur lors de la génération via API: {e}")
             return f"Erreur lors de la génération d'hypothèses: {e}"
     
+    def _stream_with_transformers(self, prompt, cancel=None):
+        """
+        Génère une réponse Transformers morceau par morceau
+        
+        La génération tourne dans un thread ; TextIteratorStreamer restitue
+        le texte décodé au fur et à mesure. Si cancel est levé, un critère
+        d'arrêt termine la génération au token suivant et le flux rend la
+        main sans attendre (évaluation du prompt comprise).
+        """
+        import torch
+        from transformers import StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
+        
+        class CancelCriteria(StoppingCriteria):
+            def __call__(self, input_ids, scores, **kwargs):
+                stop = cancel is not None and cancel.is_set()
+                return torch.full((input_ids.shape[0],), stop, dtype=torch.bool, device=input_ids.device)
+        
+        print("🧠 Génération en flux avec Transformers...")
+        # Délai de lecture : l'annulation est vérifiée entre deux tokens
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True,
+                                        timeout=CANCEL_POLL_S)
+        errors = []
+        
+        def run():
+            try:
+                self.pipeline(
+                    prompt,
+                    max_new_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    do_sample=True,
+                    return_full_text=False,
+                    streamer=streamer,
+                    stopping_criteria=StoppingCriteriaList([CancelCriteria()])
+                )
+            except Exception as e:
+                errors.append(e)
+                # Débloque l'itération du flux
+                streamer.end()
+        
+        thread = threading.Thread(target=run, name="ai-stream", daemon=True)
+        thread.start()
+        while True:
+            try:
+                chunk = next(streamer)
+            except StopIteration:
+                break
+            except queue.Empty:
+                if cancel is not None and cancel.is_set():
+                    # Le thread s'arrête seul au token suivant
+                    return
+                continue
+            yield chunk
+        thread.join()
+        if errors:
+            print(f"❌ Erreur lors de la génération: {errors[0]}")
+            raise errors[0]
+    
+    def _stream_with_api(self, prompt, cancel=None):
+        """
+        Génère une réponse via Ollama en flux NDJSON (un objet JSON par ligne)
+        """
+        print("🧠 Génération en flux via API locale...")
+        try:
+            yield from self.client.generate_stream(prompt, self.api_model, self._api_options(), cancel=cancel)
+        except Exception as e:
+            print(f"❌ Erreur lors de la génération via API: {e}")
+            raise
+    
+    def _api_options(self):
+        """
+        Options de génération transmises à Ollama
+        """
+        return {"temperature": self.temperature, "num_predict": self.max_tokens}
+    
+    def _stream_simulation(self, graph_description):
+        """
+        Réponse simulée, restituée ligne par ligne
+        """
+        yield from self._generate_simulation(graph_description).splitlines(keepends=True)
+    
     def _generate_simulation(self, graph_description):
         """
         Génère une réponse simulée pour les tests
@@ -324,10 +604,40 @@ Présente ta réponse de manière claire et concise.
             "model_name": self.model_name,
             "mode": self.mode,
             "available": self.mode != "simulation",
+            "model_source": self.model_source,
+            "quantization": self.quantization,
+            "cpu_threads": self.cpu_threads or default_thread_count(),
+            "checkpoint": self.checkpoint if read_manifest(self.checkpoint) is not None else None,
+            "ready": self.ready_event.is_set(),
+            "warming_up": self.warming_up,
+            "ready_time": self.ready_time,
+            "warmup_time": self.warmup_time,
+            "backend_times": dict(self.backend_times),
+            "last_ttft": self.last_ttft,
+            "last_generation_time": self.last_generation_time,
             "max_tokens": self.max_tokens,
             "temperature": self.temperature
         }
     
+    def generation_settings(self, mode=None):
+        """
+        Réglages qui déterminent la réponse d'un moteur (clé du cache des
+        hypothèses)
+        
+        Args:
+            mode (str): Moteur concerné ; None : le moteur actif
+        
+        Returns:
+            dict: model_name, mode, temperature, max_tokens
+        """
+        mode = mode or self.mode
+        return {
+            "model_name": self.api_model if mode == "api" else self.model_name,
+            "mode": mode,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens
+        }
+    
     def test_connection(self):
         """
         Teste la connexion au modèle d'IA
@@ -343,14 +653,8 @@ Présente ta réponse de manière claire et concise.
                 return "ok" in outputs[0]['generated_text'].lower()
             
             elif self.mode == "api":
-                payload = {
-                    "model": "phi3",
-                    "prompt": test_prompt,
-                    "stream": False,
-                    "options": {"num_predict": 10}
-                }
-                response = requests.post(self.api_url, json=payload, timeout=30)
-                return response.status_code == 200
+                self.client.generate(test_prompt, self.api_model, {"num_predict": 10}, timeout=30)
+                return True
             
             else:
                 return True  # Mode simulation toujours disponible
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Planificateur des requêtes IA
+File à priorités servie par un nombre fixe de threads, regroupement des
+requêtes identiques en cours et annulation des générations devenues
+obsolètes (graphe modifié) ou abandonnées par l'utilisateur ; les réponses
+déjà produites sont servies depuis le cache des hypothèses
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+from hypothesis_cache import cache_key
+
+# Nombre de générations simultanées par défaut (clé "workers" de la section "ai")
+DEFAULT_WORKERS = 2
+
+# Priorités (la plus petite est servie d'abord)
+PRIORITY_INTERACTIVE = 0    # Demande explicite de l'analyste
+PRIORITY_BACKGROUND = 10    # Préparation, analyses de fond
+
+# États d'une requête
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_CANCELLED = "cancelled"
+STATUS_ERROR = "error"
+
+
+class AIRequest:
+    """
+    Demande de génération soumise au planificateur
+
+    Plusieurs demandes identiques partagent une même génération ; chacune
+    reçoit tous les morceaux de la réponse, y compris ceux produits avant
+    son arrivée.
+    """
+
+    def __init__(self, job, on_chunk=None, on_done=None):
+        self.job = job
+        self.on_chunk = on_chunk
+        self.on_done = on_done
+        self.status = STATUS_PENDING
+        self.error = None
+        self.coalesced = False     # Rattachée à une génération déjà demandée
+        self.cached = False        # Servie depuis le cache des hypothèses
+        self.submitted = time.perf_counter()
+        self.ttft = None           # Délai avant le premier morceau reçu (s)
+        self.elapsed = None        # Durée totale (s)
+
+    @property
+    def done(self):
+        return self.status in (STATUS_DONE, STATUS_CANCELLED, STATUS_ERROR)
+
+    def _chunk(self, chunk):
+        if self.ttft is None:
+            self.ttft = time.perf_counter() - self.submitted
+        if self.on_chunk is not None:
+            self.on_chunk(chunk)
+
+    def _finish(self, status, error=None):
+        self.status = status
+        self.error = error
+        self.elapsed = time.perf_counter() - self.submitted
+        if self.on_done is not None:
+            self.on_done(self)
+
+
+class _Job:
+    """
+    Une génération, partagée par les demandes identiques
+    """
+
+    def __init__(self, key, description, version, priority):
+        self.key = key
+        self.description = description
+        self.version = version
+        self.priority = priority
+        self.status = STATUS_PENDING
+        self.requests = []
+        self.chunks = []
+        self.cancel_event = threading.Event()
+        self.settings = None       # Réglages du moteur qui a répondu (clé du cache)
+
+
+class AIScheduler:
+    """
+    Planificateur placé devant AIManager.generate_hypotheses_stream
+
+    Les demandes sont rangées dans une file à priorités servie par un
+    nombre fixe de threads. Une demande identique à une génération en
+    attente ou en cours s'y rattache au lieu d'en lancer une autre. Une
+    génération est annulée quand plus aucune demande ne l'attend ou quand
+    le graphe a changé depuis sa soumission (cancel_stale) : l'événement
+    d'annulation de la génération est levé, et le flux rend la main au
+    thread de travail en quelques dizaines de millisecondes, qu'il attende
+    le préchauffage, l'évaluation du prompt par Ollama (connexion coupée)
+    ou le token suivant de Transformers (critère d'arrêt).
+
+    Avec un cache (HypothesisCache), une demande dont la réponse est
+    connue pour les réglages du moteur actif est servie immédiatement,
+    sans passer par la file ; les générations terminées y sont enregistrées.
+
+    Les fonctions de rappel sont appelées depuis les threads de travail et
+    doivent rester brèves (dépôt dans une file, root.after...).
+    """
+
+    def __init__(self, ai_manager, workers=DEFAULT_WORKERS, wait_ready=None, cache=None):
+        """
+        Initialise le planificateur (les threads démarrent à la première demande)
+
+        Args:
+            ai_manager (AIManager): Gestionnaire d'IA
+            workers (int): Générations simultanées
+            wait_ready (float): Attente maximale du préchauffage du modèle (s)
+            cache (HypothesisCache): Cache des hypothèses (aucun par défaut)
+        """
+        if workers < 1:
+            raise ValueError(f"workers doit être positif: {workers}")
+        self.ai_manager = ai_manager
+        self.workers = workers
+        self.wait_ready = wait_ready
+        self.cache = cache
+
+        self._lock = threading.Condition()
+        self._queue = []
+        self._sequence = itertools.count()
+        self._jobs = {}
+        self._threads = []
+        self._closed = False
+
+        # Compteurs
+        self.submitted = 0
+        self.coalesced = 0
+        self.cancelled = 0
+        self.completed = 0
+
+    def submit(self, description, version=None, priority=PRIORITY_INTERACTIVE, on_chunk=None, on_done=None):
+        """
+        Demande des hypothèses pour une description de graphe
+
+        Args:
+            description (str): Description du graphe (get_graph_description)
+            version (int): Version du graphe décrit (voir cancel_stale)
+            priority (int): Priorité, la plus petite d'abord
+            on_chunk (callable): Appelé avec chaque morceau de texte
+            on_done (callable): Appelé avec la demande une fois terminée,
+                                annulée ou en échec
+
+        Returns:
+            AIRequest: Demande (statut, erreur, délais) ; déjà terminée si la
+            réponse était en cache
+        """
+        # Lecture du cache hors du verrou (accès disque)
+        entry = None
+        if self.cache is not None:
+            key = cache_key(description, **self.ai_manager.generation_settings())
+            if key is not None:
+                entry = self.cache.get(key)
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Planificateur arrêté")
+            self.submitted += 1
+            if entry is not None:
+                request = AIRequest(None, on_chunk, on_done)
+                request.cached = True
+                request._chunk(entry["response"])
+                request._finish(STATUS_DONE)
+                return request
+            job = self._jobs.get(description)
+            if job is None:
+                job = _Job(description, description, version, priority)
+                self._jobs[description] = job
+                self._push(job)
+                request = AIRequest(job, on_chunk, on_done)
+                job.requests.append(request)
+                self._start_workers()
+                return request
+
+            # Génération identique déjà demandée : on s'y rattache
+            self.coalesced += 1
+            request = AIRequest(job, on_chunk, on_done)
+            request.coalesced = True
+            if job.status == STATUS_RUNNING:
+                request.status = STATUS_RUNNING
+            if priority < job.priority and job.status == STATUS_PENDING:
+                job.priority = priority
+                self._push(job)
+            for chunk in job.chunks:
+                request._chunk(chunk)
+            job.requests.append(request)
+            return request
+
+    def cancel(self, request):
+        """
+        Abandonne une demande ; la génération est arrêtée si plus aucune
+        demande ne l'attend
+
+        Returns:
+            bool: True si la demande était encore en cours
+        """
+        with self._lock:
+            if request.done:
+                return False
+            job = request.job
+            job.requests.remove(request)
+            self.cancelled += 1
+            if not job.requests:
+                self._cancel_job(job)
+            request._finish(STATUS_CANCELLED)
+            return True
+
+    def cancel_stale(self, version):
+        """
+        Annule les générations demandées pour une autre version du graphe
+
+        Returns:
+            int: Nombre de demandes annulées
+        """
+        with self._lock:
+            stale = [request for job in self._jobs.values()
+                     if job.version is not None and job.version != version
+                     for request in job.requests]
+        return sum(self.cancel(request) for request in stale)
+
+    def cancel_all(self):
+        """
+        Annule toutes les demandes en attente ou en cours
+
+        Returns:
+            int: Nombre de demandes annulées
+        """
+        with self._lock:
+            pending = [request for job in self._jobs.values() for request in job.requests]
+        return sum(self.cancel(request) for request in pending)
+
+    def shutdown(self):
+        """
+        Annule tout et arrête les threads
+        """
+        self.cancel_all()
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+
+    def pending_count(self):
+        """
+        Générations en attente ou en cours
+        """
+        with self._lock:
+            return len(self._jobs)
+
+    def _push(self, job):
+        heapq.heappush(self._queue, (job.priority, next(self._sequence), job))
+        self._lock.notify()
+
+    def _cancel_job(self, job):
+        job.cancel_event.set()
+        if job.status == STATUS_PENDING:
+            job.status = STATUS_CANCELLED
+        # Une nouvelle demande identique lancera une autre génération
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+
+    def _start_workers(self):
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name=f"ai-worker-{len(self._threads)}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _work(self):
+        while True:
+            with self._lock:
+                while not self._queue and not self._closed:
+                    self._lock.wait()
+                if self._closed:
+                    return
+                _, _, job = heapq.heappop(self._queue)
+                # Entrée périmée (priorité relevée, génération annulée)
+                if job.status != STATUS_PENDING:
+                    continue
+                job.status = STATUS_RUNNING
+                for request in job.requests:
+                    request.status = STATUS_RUNNING
+            self._run(job)
+
+    def _run(self, job):
+        status, error = STATUS_DONE, None
+        finished = False           # Flux lu jusqu'au bout, sans exception
+        # Le flux annonce le moteur qu'il a retenu : la réponse est mise en
+        # cache sous ses réglages, même si le préchauffage change de mode
+        # pendant la génération
+        stream = self.ai_manager.generate_hypotheses_stream(
+            job.description, wait_ready=self.wait_ready, cancel=job.cancel_event,
+            on_start=lambda settings: setattr(job, "settings", settings)
+        )
+        try:
+            for chunk in stream:
+                if job.cancel_event.is_set():
+                    break
+                with self._lock:
+                    job.chunks.append(chunk)
+                    for request in job.requests:
+                        request._chunk(chunk)
+            else:
+                finished = True
+        except Exception as e:
+            status, error = STATUS_ERROR, e
+        finally:
+            # Ferme le flux HTTP ou le streamer en cours
+            stream.close()
+
+        try:
+            # Seule une réponse complète du moteur est conservée : jamais un
+            # échec ni une génération interrompue
+            key = None
+            if finished and self.cache is not None and job.settings is not None:
+                key = cache_key(job.description, **job.settings)
+            if key is not None and not job.cancel_event.is_set():
+                self.cache.put(key, "".join(job.chunks), job.settings["model_name"], job.settings["mode"])
+        except OSError as e:
+            # Répertoire en lecture seule, disque plein... : la réponse reste valable
+            print(f"⚠️ Écriture du cache impossible: {e}")
+        finally:
+            with self._lock:
+                if job.cancel_event.is_set():
+                    status = STATUS_CANCELLED
+                job.status = status
+                if self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+                requests, job.requests = job.requests, []
+                if status == STATUS_DONE:
+                    self.completed += 1
+                for request in requests:
+                    request._finish(status, error)
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Classification des artéfacts
+Détecte le type des artéfacts (IP, hash, processus, fichier, domaine),
+à l'unité ou par colonnes entières
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import os
+import re
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from keyword_matcher import KeywordMatcher, load_keyword_file
+
+# Patterns de détection compilés une seule fois au chargement du module
+IP_REGEX = r'(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)'
+HASH_REGEX = r'[a-fA-F0-9]{32,128}'  # MD5, SHA1, SHA256, etc.
+DOMAIN_REGEX = r'[a-zA-Z0-9][a-zA-Z0-9-]{1,61}[a-zA-Z0-9](?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*\.[a-zA-Z]{2,}'
+
+IP_PATTERN = re.compile(f'^{IP_REGEX}$')
+DOMAIN_PATTERN = re.compile(f'^{DOMAIN_REGEX}$')
+
+# IP et hash réunis dans une seule alternative nommée
+STRUCTURED_PATTERN = re.compile(f'(?P<ip>{IP_REGEX}$)|(?P<hash>{HASH_REGEX}$)')
+
+FILE_EXTENSIONS = ('.exe', '.dll', '.bat', '.ps1', '.doc', '.pdf')
+PROCESS_NAMES = ('powershell', 'cmd', 'rundll32', 'regsvr32', 'svchost')
+
+# Mots-clés utilisés si aucun dictionnaire n'est disponible
+DEFAULT_KEYWORDS = {
+    'process': PROCESS_NAMES,
+    'extension': FILE_EXTENSIONS
+}
+
+# Dictionnaire de mots-clés livré avec Chronosense
+DEFAULT_KEYWORD_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'keywords.txt')
+
+# Type d'artéfact attribué par chaque catégorie de mots-clés
+CATEGORY_TYPES = {
+    'process': 'process',
+    'lolbin': 'process',
+    'tool': 'process',
+    'extension': 'file'
+}
+
+# Nom d'hôte pleinement qualifié dans un artéfact : ses labels ne portent
+# pas de mots-clés ("cmdb.example.com" n'est pas cmd). Le dernier label ne
+# doit pas être une extension de fichier ("cmd.exe" reste un processus).
+HOSTNAME_TEMPLATE = (r'(?<![\w.-])(?:[a-z0-9](?:[a-z0-9-]{{0,61}}[a-z0-9])?\.)+'
+                     r'(?!(?:{extensions})(?![\w.-]))[a-z]{{2,63}}(?![\w.-])')
+
+# Types dans leur ordre de priorité ; 'default' ferme la liste
+ARTIFACT_TYPES = ('ip', 'hash', 'process', 'file', 'domain', 'default')
+TYPE_CODES = {name: code for code, name in enumerate(ARTIFACT_TYPES)}
+DEFAULT_CODE = TYPE_CODES['default']
+
+
+def hostname_pattern(keywords):
+    """
+    Compile le motif des noms d'hôte pour un jeu de mots-clés
+
+    Les extensions de FILE_EXTENSIONS et celles des catégories de type
+    'file' ne sont jamais prises pour un domaine de premier niveau.
+
+    Args:
+        keywords (dict): Catégorie -> liste de mots-clés
+
+    Returns:
+        re.Pattern: Motif des noms d'hôte
+    """
+    extensions = {extension.lstrip('.') for extension in FILE_EXTENSIONS}
+    for category, words in keywords.items():
+        if CATEGORY_TYPES.get(category) == 'file':
+            extensions.update(word.strip().lower().lstrip('.') for word in words)
+    extensions = sorted((extension for extension in extensions if extension.isalpha()), key=len, reverse=True)
+    return re.compile(HOSTNAME_TEMPLATE.format(extensions='|'.join(extensions)), re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _tag_types(tags):
+    """
+    Types d'artéfact désignés par un ensemble d'étiquettes
+    """
+    return frozenset(CATEGORY_TYPES.get(category) for category in tags)
+
+
+def mask_hostnames(pattern, value):
+    """
+    Remplace les noms d'hôte d'une valeur par un espace avant la recherche
+    des mots-clés
+    """
+    if '.' not in value:
+        return value
+    return pattern.sub(' ', value)
+
+
+class ArtifactClassifier:
+    """
+    Classifieur d'artéfacts
+
+    Les formats structurés (IP, hash) sont reconnus par une expression
+    régulière combinée ; les processus et fichiers par un automate de
+    mots-clés qui étiquette l'artéfact en un seul parcours de ses
+    caractères.
+    """
+
+    def __init__(self, keywords=None, keyword_file=None):
+        """
+        Initialise le classifieur
+
+        Args:
+            keywords (dict): Catégorie -> mots-clés ; prioritaire sur keyword_file
+            keyword_file (str): Dictionnaire de mots-clés (data/keywords.txt par défaut)
+        """
+        self._type_array = np.array(ARTIFACT_TYPES)
+        self._lock = threading.Lock()
+        self.keyword_file = None
+        self.matcher = None
+        self._engine = None
+        self.reload_keywords(keywords=keywords, keyword_file=keyword_file)
+
+    def reload_keywords(self, keywords=None, keyword_file=None):
+        """
+        Reconstruit l'automate de mots-clés (rechargement à chaud)
+
+        Le nouvel automate est construit à part puis remplace l'ancien en
+        une seule affectation : les classifications en cours ne sont pas
+        perturbées.
+
+        Args:
+            keywords (dict): Catégorie -> mots-clés ; prioritaire sur keyword_file
+            keyword_file (str): Dictionnaire à charger (le dernier utilisé si None)
+
+        Returns:
+            int: Nombre de mots-clés chargés
+        """
+        with self._lock:
+            if keywords is None:
+                path = keyword_file or self.keyword_file or DEFAULT_KEYWORD_FILE
+                if os.path.exists(path):
+                    keywords = load_keyword_file(path)
+                    self.keyword_file = path
+                elif keyword_file:
+                    raise FileNotFoundError(f"Dictionnaire de mots-clés introuvable: {keyword_file}")
+                else:
+                    keywords = DEFAULT_KEYWORDS
+
+            matcher = KeywordMatcher(keywords)
+            self._engine = (matcher, hostname_pattern(keywords))
+            self.matcher = matcher
+
+        return len(matcher)
+
+    def analyze(self, artifact):
+        """
+        Détecte le type d'un artéfact et ses étiquettes de mots-clés
+
+        Args:
+            artifact (str): L'artéfact à analyser
+
+        Returns:
+            tuple: (type détecté, catégories de mots-clés trouvées)
+        """
+        code, tags = self._analyze(artifact)
+        return ARTIFACT_TYPES[code], tags
+
+    def classify(self, artifact):
+        """
+        Détecte le type d'un artéfact
+
+        Args:
+            artifact (str): L'artéfact à analyser
+
+        Returns:
+            str: Le type détecté
+        """
+        return ARTIFACT_TYPES[self._analyze(artifact)[0]]
+
+    def _analyze(self, value):
+        """
+        Retourne le code de type et les étiquettes d'une valeur
+        (non-chaînes: 'default', sans étiquette)
+        """
+        if not isinstance(value, str):
+            return DEFAULT_CODE, frozenset()
+
+        match = STRUCTURED_PATTERN.match(value)
+        if match:
+            return TYPE_CODES[match.lastgroup], frozenset()
+
+        matcher, hostnames = self._engine
+        return self._classify_tagged(value, matcher.match_categories(mask_hostnames(hostnames, value)))
+
+    def _analyze_many(self, values):
+        """
+        _analyze appliqué à une liste de valeurs, les mots-clés étant
+        recherchés en un seul lot (KeywordMatcher.match_many)
+        """
+        matcher, hostnames = self._engine
+        structured_match = STRUCTURED_PATTERN.match
+        analyzed = [(DEFAULT_CODE, frozenset())] * len(values)
+        texts = []
+        positions = []
+        for position, value in enumerate(values):
+            if not isinstance(value, str):
+                continue
+            match = structured_match(value)
+            if match:
+                analyzed[position] = (TYPE_CODES[match.lastgroup], frozenset())
+            else:
+                texts.append(hostnames.sub(' ', value) if '.' in value else value)
+                positions.append(position)
+
+        classify_tagged = self._classify_tagged
+        for position, tags in zip(positions, matcher.match_many(texts)):
+            analyzed[position] = classify_tagged(values[position], tags)
+        return analyzed
+
+    @classmethod
+    def _classify_tagged(cls, value, tags):
+        """
+        Code de type d'une valeur non structurée, d'après ses étiquettes
+        """
+        code = cls._tagged_code(tags, value) if tags else None
+        if code is not None:
+            return code, tags
+        if DOMAIN_PATTERN.match(value):
+            return TYPE_CODES['domain'], tags
+        return DEFAULT_CODE, tags
+
+    @staticmethod
+    def _tagged_code(tags, value):
+        """
+        Code imposé par les étiquettes (processus, ou fichier si la valeur
+        a une extension), None sinon
+        """
+        types = _tag_types(tags)
+        if 'process' in types:
+            return TYPE_CODES['process']
+        if 'file' in types and '.' in value:
+            return TYPE_CODES['file']
+        return None
+
+    def classify_many(self, artifacts, return_tags=False):
+        """
+        Détecte le type d'une colonne entière d'artéfacts
+
+        Les valeurs sont d'abord factorisées : chaque valeur distincte n'est
+        analysée qu'une fois, puis les types sont redistribués par indexation
+        NumPy.
+
+        Args:
+            artifacts: Liste, tableau NumPy de chaînes ou Series pandas
+            return_tags (bool): Retourner aussi les étiquettes de chaque artéfact
+
+        Returns:
+            numpy.ndarray: Types détectés, dans l'ordre des artéfacts
+            (ou tuple (types, liste des étiquettes) si return_tags)
+        """
+        # pandas (~0,2 s à importer) n'est chargé qu'au premier import en masse
+        import pandas as pd
+
+        if isinstance(artifacts, pd.Series):
+            values = artifacts.to_numpy(dtype=object)
+        else:
+            values = np.asarray(artifacts, dtype=object)
+
+        if values.size == 0:
+            types = np.array([], dtype=self._type_array.dtype)
+            return (types, []) if return_tags else types
+
+        codes, uniques = pd.factorize(values)
+        analyzed = self._analyze_many(uniques.tolist())
+
+        # Une entrée supplémentaire en fin de tableau : les valeurs manquantes
+        # (code -1) retombent ainsi sur 'default'
+        unique_codes = np.fromiter(
+            (code for code, _ in analyzed),
+            dtype=np.int8,
+            count=len(analyzed)
+        )
+        unique_codes = np.append(unique_codes, np.int8(DEFAULT_CODE))
+        types = self._type_array[unique_codes[codes]]
+
+        if not return_tags:
+            return types
+
+        unique_tags = [tags for _, tags in analyzed]
+        unique_tags.append(frozenset())
+        return types, [unique_tags[code] for code in codes.tolist()]
+
+
+_default_classifier = None
+
+
+def classify_artifacts(artifacts):
+    """
+    Classe une colonne d'artéfacts avec le classifieur par défaut
+
+    Args:
+        artifacts: Liste, tableau NumPy de chaînes ou Series pandas
+
+    Returns:
+        numpy.ndarray: Types détectés
+    """
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = ArtifactClassifier()
+    return _default_classifier.classify_many(artifacts)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Recherche incrémentale d'artéfacts
+Champ d'autocomplétion alimenté page par page par l'index de préfixes du
+graphe (GraphManager.search_artifacts) : aucune liste complète des
+artéfacts n'est copiée dans le widget
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+# Propositions affichées par page
+SEARCH_PAGE_SIZE = 20
+
+# Touches qui ne modifient pas le texte saisi
+NAVIGATION_KEYS = ('Up', 'Down', 'Left', 'Right', 'Return', 'KP_Enter', 'Escape',
+                   'Prior', 'Next', 'Tab', 'Shift_L', 'Shift_R', 'Control_L', 'Control_R')
+
+
+class ArtifactSearchBox(ttk.Frame):
+    """
+    Combobox éditable dont les propositions suivent la saisie
+
+    À chaque frappe, la première page des artéfacts commençant par le texte
+    saisi remplace les propositions ; Page précédente / Page suivante
+    parcourent les pages. Entrée ou le choix d'une proposition appelle
+    on_choose avec l'artéfact.
+    """
+
+    def __init__(self, parent, search, on_choose=None, page_size=SEARCH_PAGE_SIZE, width=40):
+        """
+        Crée le champ
+
+        Args:
+            parent: Widget parent
+            search (callable): (préfixe, début, nombre) -> (artéfacts, total),
+                               par exemple GraphManager.search_artifacts
+            on_choose (callable): Appelé avec l'artéfact choisi
+            page_size (int): Propositions par page
+            width (int): Largeur du champ (caractères)
+        """
+        super().__init__(parent)
+        self.search = search
+        self.on_choose = on_choose
+        self.page_size = page_size
+        self.start = 0
+        self.total = 0
+
+        self.var = tk.StringVar()
+        self.combo = ttk.Combobox(self, textvariable=self.var, font=("Consolas", 10), width=width)
+        self.combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.info_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.info_var, width=16, anchor=tk.E).pack(side=tk.LEFT, padx=(5, 0))
+
+        self.combo.bind('<KeyRelease>', self._on_key)
+        self.combo.bind('<Prior>', lambda event: self.show_page(self.start - self.page_size))
+        self.combo.bind('<Next>', lambda event: self.show_page(self.start + self.page_size))
+        self.combo.bind('<Return>', lambda event: self.choose())
+        self.combo.bind('<<ComboboxSelected>>', lambda event: self.choose())
+        self.combo.configure(postcommand=lambda: self.show_page(self.start))
+
+    def get(self):
+        """
+        Texte saisi
+        """
+        return self.var.get().strip()
+
+    def set(self, text):
+        """
+        Remplace le texte saisi et les propositions
+        """
+        self.var.set(text)
+        self.show_page(0)
+
+    def show_page(self, start):
+        """
+        Affiche la page de propositions commençant au rang start
+        """
+        if self.total:
+            # Pas au-delà de la dernière page connue
+            start = min(start, (self.total - 1) // self.page_size * self.page_size)
+        start = max(start, 0)
+        matches, self.total = self.search(self.get(), start, self.page_size)
+        self.start = start
+        self.combo['values'] = matches
+        if self.total:
+            self.info_var.set(f"{start + 1}-{start + len(matches)} / {self.total:,}")
+        else:
+            self.info_var.set("aucun résultat")
+        return "break"
+
+    def choose(self):
+        """
+        Transmet l'artéfact saisi ou choisi à on_choose
+        """
+        if self.on_choose is not None and self.get():
+            self.on_choose(self.get())
+
+    def _on_key(self, event):
+        """
+        Frappe : propositions recalculées depuis la première page
+        """
+        if event.keysym not in NAVIGATION_KEYS:
+            self.total = 0
+            self.show_page(0)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Export des graphes sans interface
+Rend des dossiers d'investigation enregistrés (GraphManager.save_case) en
+images PNG/SVG avec le backend Agg, sans Tk, répartis sur plusieurs
+processus
+
+Usage: python main.py export DOSSIERS [-o SORTIE] [-f png svg] [-j PROCESSUS]
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from config_manager import load_config
+from graph_layout import PositionCache
+from graph_manager import GraphManager
+
+# Formats d'image produits par défaut
+DEFAULT_FORMATS = ("png",)
+
+# Taille (pouces) et résolution des images
+EXPORT_FIGSIZE = (12, 9)
+EXPORT_DPI = 100
+
+# Motif des fichiers de dossiers dans le répertoire d'entrée
+CASE_PATTERN = "*.json"
+
+
+def render_case(case_path, output_paths, display_config=None, figsize=EXPORT_FIGSIZE, dpi=EXPORT_DPI):
+    """
+    Rend un dossier enregistré dans un ou plusieurs fichiers image
+
+    La disposition est calculée dans le processus courant pour les nœuds
+    sans position enregistrée.
+
+    Args:
+        case_path (str): Dossier enregistré (JSON)
+        output_paths (list): Images à produire (format selon l'extension)
+        display_config (dict): Section "interface" de la configuration
+        figsize (tuple): Taille de l'image en pouces
+        dpi (int): Résolution
+    """
+    display_config = display_config or {}
+    graph_manager = GraphManager(layout=PositionCache.from_config(display_config, seed=0),
+                                 display_config=display_config)
+    graph_manager.load_case(case_path)
+
+    figure = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+    graph_manager.attach_canvas(figure, FigureCanvasAgg(figure))
+    for output_path in output_paths:
+        graph_manager.renderer.save(output_path, dpi=dpi)
+
+
+def export_case(task):
+    """
+    Rend un dossier (appelé dans un processus de travail)
+
+    Args:
+        task (tuple): (dossier, répertoire de sortie, formats, configuration, dpi)
+
+    Returns:
+        tuple: (dossier, images produites, message d'erreur ou None)
+    """
+    case_path, output_dir, formats, display_config, dpi = task
+    name = os.path.splitext(os.path.basename(case_path))[0]
+    outputs = [os.path.join(output_dir, f"{name}.{image_format}") for image_format in formats]
+    try:
+        # Les traces de GraphManager (une par import) noieraient la progression
+        with contextlib.redirect_stdout(io.StringIO()):
+            render_case(case_path, outputs, display_config, dpi=dpi)
+    except Exception as e:
+        return case_path, [], str(e)
+    return case_path, outputs, None
+
+
+def find_cases(case_dir):
+    """
+    Dossiers enregistrés d'un répertoire, triés
+    """
+    return sorted(glob.glob(os.path.join(case_dir, CASE_PATTERN)))
+
+
+def export_cases(case_dir, output_dir, formats=DEFAULT_FORMATS, workers=None, display_config=None,
+                 dpi=EXPORT_DPI, progress=None):
+    """
+    Rend tous les dossiers d'un répertoire, en parallèle
+
+    Args:
+        case_dir (str): Répertoire des dossiers enregistrés
+        output_dir (str): Répertoire des images (créé au besoin)
+        formats (tuple): Formats d'image ("png", "svg"...)
+        workers (int): Processus de travail (nombre de cœurs par défaut ;
+                       1 : rendu dans le processus courant)
+        display_config (dict): Section "interface" de la configuration
+        dpi (int): Résolution
+        progress (callable): Appelé avec (terminés, total) après chaque dossier
+
+    Returns:
+        list: (dossier, images produites, erreur ou None) par dossier
+    """
+    cases = find_cases(case_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [(case_path, output_dir, tuple(formats), display_config, dpi) for case_path in cases]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(tasks) or 1))
+
+    results = []
+    with contextlib.ExitStack() as stack:
+        if workers == 1:
+            outcomes = map(export_case, tasks)
+        else:
+            # "spawn" : les processus ne copient pas l'état du parent (Tk...) ;
+            # les dossiers sont distribués par paquets pour amortir les échanges
+            context = multiprocessing.get_context("spawn")
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers, mp_context=context))
+            outcomes = executor.map(export_case, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+        for outcome in outcomes:
+            results.append(outcome)
+            if progress is not None:
+                progress(len(results), len(tasks))
+    return results
+
+
+def main(argv=None):
+    """
+    Point d'entrée de la commande d'export
+
+    Returns:
+        int: Code de sortie (1 si un dossier a échoué)
+    """
+    parser = argparse.ArgumentParser(
+        prog="chronosense export",
+        description="Rend des dossiers d'investigation enregistrés en images, sans interface"
+    )
+    parser.add_argument("cases", help="Répertoire des dossiers enregistrés (*.json)")
+    parser.add_argument("-o", "--output", default="export", help="Répertoire des images")
+    parser.add_argument("-f", "--format", nargs="+", default=list(DEFAULT_FORMATS),
+                        choices=["png", "svg", "pdf"], help="Formats d'image")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="Processus de travail (nombre de cœurs par défaut)")
+    parser.add_argument("--dpi", type=int, default=EXPORT_DPI, help="Résolution des images")
+    args = parser.parse_args(argv)
+
+    def report(done, total):
+        if done == total or done % 50 == 0:
+            print(f"  {done}/{total} dossiers rendus")
+
+    print(f"🖼️ Export des dossiers de {args.cases} vers {args.output}...")
+    start = time.perf_counter()
+    results = export_cases(args.cases, args.output, args.format, args.workers,
+                           load_config()['interface'], args.dpi, progress=report)
+    failures = [(case_path, error) for case_path, _, error in results if error is not None]
+    for case_path, error in failures:
+        print(f"❌ {case_path}: {error}")
+    print(f"✅ {len(results) - len(failures)} dossiers rendus en {time.perf_counter() - start:.1f}s"
+          f" ({len(failures)} échecs)")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -8,10 +8,43 @@ Version: 0.1 (Preuve de Concept)
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, filedialog
 import threading
+import queue
+import time
+from config_manager import load_config
 from graph_manager import GraphManager
+from graph_layout import PositionCache
+from layout_worker import LayoutWorker
 from ai_manager import AIManager
+from ai_scheduler import AIScheduler, DEFAULT_WORKERS, STATUS_CANCELLED, STATUS_ERROR
+from hypothesis_cache import HypothesisCache
+from log_ingestion import LogIngestor
+from virtual_text import VirtualTextView, GraphSummarySource, TextLineSource
+from artifact_search import ArtifactSearchBox
+from redraw_scheduler import RedrawScheduler, REDRAW_INTERVAL_MS
+
+# Nombre maximal de lots en attente entre le thread de lecture et l'interface
+INGESTION_QUEUE_SIZE = 4
+
+# Événements par lot d'import : chaque lot est inséré dans le graphe par un
+# seul rappel de la boucle Tk, qui doit rester court pour ne pas la geler
+INGESTION_SLICE_EVENTS = 1000
+
+# Intervalle de scrutation de l'ingestion (ms)
+INGESTION_POLL_MS = 50
+
+# Intervalle de scrutation des dispositions calculées en arrière-plan (ms)
+LAYOUT_POLL_MS = 50
+
+# Au-delà de ce nombre de liens à créer depuis la sélection, confirmation
+LINK_CONFIRM_THRESHOLD = 20
+
+# Attente maximale du préchauffage du modèle avant une génération (s)
+AI_READY_WAIT_S = 30
+
+# Intervalle de scrutation des morceaux de réponse de l'IA (ms)
+STREAM_POLL_MS = 50
 
 class ChronosenseApp:
     """
@@ -30,8 +63,36 @@ class ChronosenseApp:
         self.root.minsize(800, 600)
         
         # Initialiser les gestionnaires
-        self.graph_manager = GraphManager()
-        self.ai_manager = AIManager()
+        self.config = load_config()
+        self.layout_worker = LayoutWorker()
+        self.graph_manager = GraphManager(
+            layout=PositionCache.from_config(self.config['interface']),
+            layout_worker=self.layout_worker,
+            display_config=self.config['interface']
+        )
+        # Le modèle est recherché en arrière-plan une fois la fenêtre affichée
+        self.ai_manager = AIManager(discover=False, ai_config=self.config['ai'])
+        
+        # Une seule file de générations, servie par un nombre fixe de threads ;
+        # les réponses déjà produites sont relues dans le cache disque
+        self.hypothesis_cache = HypothesisCache.from_config(self.config['ai'])
+        self.ai_scheduler = AIScheduler(
+            self.ai_manager,
+            workers=self.config['ai'].get('workers', DEFAULT_WORKERS),
+            wait_ready=AI_READY_WAIT_S,
+            cache=self.hypothesis_cache
+        )
+        self.ai_request = None
+        
+        # Rafraîchissement différé : toutes les mutations du graphe faites
+        # dans une même image sont affichées par une seule mise à jour
+        self.redraw = RedrawScheduler(
+            self.root.after,
+            self.graph_manager.update_display,
+            self._update_details_display,
+            self.config['interface'].get('redraw_interval_ms', REDRAW_INTERVAL_MS)
+        )
+        self.graph_manager.on_change = self._on_graph_change
         
         # Variables pour l'interface
         self.artifact_var = tk.StringVar()
@@ -43,6 +104,9 @@ class ChronosenseApp:
         # Configurer les événements
         self._setup_events()
         
+        # Appliquer les dispositions calculées hors du thread d'interface
+        self.root.after(LAYOUT_POLL_MS, self._poll_layout)
+        
         print("Application Chronosense initialisée avec succès")
     
     def _create_interface(self):
@@ -67,22 +131,32 @@ class ChronosenseApp:
         self.details_frame.configure(width=350)
         self.details_frame.pack_propagate(False)
         
-        # Zone de texte pour les détails
-        self.details_text = scrolledtext.ScrolledText(
-            self.details_frame, 
-            wrap=tk.WORD, 
+        # Zone de texte virtualisée pour les détails (seules les lignes
+        # visibles sont matérialisées dans le widget)
+        self.details_text = VirtualTextView(
+            self.details_frame,
             height=20,
             font=("Consolas", 10)
         )
         self.details_text.pack(fill=tk.BOTH, expand=True)
+        self.summary_source = GraphSummarySource(self.graph_manager)
         
-        # Bouton pour générer les hypothèses
+        # Boutons pour générer les hypothèses et annuler la génération
+        ai_buttons = ttk.Frame(self.details_frame)
+        ai_buttons.pack(fill=tk.X, pady=(10, 0))
         self.generate_btn = ttk.Button(
-            self.details_frame,
+            ai_buttons,
             text="🧠 Générer des Hypothèses",
-            command=self._generate_hypotheses_threaded
+            command=self._request_hypotheses
+        )
+        self.generate_btn.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.cancel_btn = ttk.Button(
+            ai_buttons,
+            text="⏹️ Annuler",
+            command=self._cancel_hypotheses,
+            state='disabled'
         )
-        self.generate_btn.pack(fill=tk.X, pady=(10, 0))
+        self.cancel_btn.pack(side=tk.LEFT, padx=(5, 0))
         
         # Frame inférieur pour les contrôles
         controls_frame = ttk.LabelFrame(main_frame, text="Contrôles", padding=10)
@@ -116,6 +190,27 @@ class ChronosenseApp:
         )
         self.link_btn.pack(side=tk.LEFT, padx=(0, 5))
         
+        self.import_btn = ttk.Button(
+            artifact_frame,
+            text="📂 Importer Logs",
+            command=self._import_logs
+        )
+        self.import_btn.pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.relayout_btn = ttk.Button(
+            artifact_frame,
+            text="🔄 Réorganiser",
+            command=self._relayout_graph
+        )
+        self.relayout_btn.pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.reset_view_btn = ttk.Button(
+            artifact_frame,
+            text="🔍 Vue d'ensemble",
+            command=self._reset_view
+        )
+        self.reset_view_btn.pack(side=tk.LEFT, padx=(0, 5))
+        
         self.clear_btn = ttk.Button(
             artifact_frame,
             text="🗑️ Effacer Graphe",
@@ -123,6 +218,22 @@ class ChronosenseApp:
         )
         self.clear_btn.pack(side=tk.LEFT)
         
+        # Recherche incrémentale : l'artéfact choisi est sélectionné et centré
+        search_frame = ttk.Frame(controls_frame)
+        search_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        ttk.Label(search_frame, text="Rechercher:").pack(side=tk.LEFT, padx=(0, 5))
+        self.search_box = ArtifactSearchBox(
+            search_frame,
+            self.graph_manager.search_artifacts,
+            on_choose=self._focus_artifact
+        )
+        self.search_box.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Dossiers d'investigation (rendus aussi par "python main.py export")
+        ttk.Button(search_frame, text="💾 Enregistrer", command=self._save_case).pack(side=tk.LEFT, padx=(10, 5))
+        ttk.Button(search_frame, text="📂 Ouvrir", command=self._open_case).pack(side=tk.LEFT)
+        
         # Barre de statut
         self.status_var = tk.StringVar()
         self.status_var.set("Prêt - Ajoutez des artéfacts pour commencer l'investigation")
@@ -136,10 +247,24 @@ class ChronosenseApp:
             relief=tk.SUNKEN,
             anchor=tk.W
         )
-        self.status_label.pack(fill=tk.X)
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Indicateur de l'état du modèle IA (recherche en arrière-plan)
+        self.ai_status_var = tk.StringVar()
+        self.ai_status_var.set("🧠 IA: en attente")
+        ttk.Label(
+            status_frame,
+            textvariable=self.ai_status_var,
+            relief=tk.SUNKEN,
+            anchor=tk.W,
+            width=28
+        ).pack(side=tk.RIGHT, padx=(5, 0))
         
-        # Initialiser l'affichage du graphe
-        self.graph_manager.setup_display(self.graph_frame)
+        # L'affichage du graphe (Matplotlib) est créé après le premier
+        # affichage de la fenêtre, voir _finish_startup
+        self.graph_placeholder = ttk.Label(self.graph_frame, text="Chargement de l'affichage du graphe...",
+                                           anchor=tk.CENTER)
+        self.graph_placeholder.pack(fill=tk.BOTH, expand=True)
         
         # Message d'accueil
         welcome_msg = """🔍 Bienvenue dans Chronosense v0.1
@@ -162,7 +287,7 @@ Assistant d'Investigation DFIR avec IA Locale
 🎯 L'objectif est de construire un graphe d'investigation
 et d'utiliser l'IA pour identifier des patterns d'attaque."""
         
-        self.details_text.insert(tk.END, welcome_msg)
+        self.details_text.set_text(welcome_msg)
     
     def _setup_events(self):
         """
@@ -171,6 +296,12 @@ et d'utiliser l'IA pour identifier des patterns d'attaque."""
         # Entrée sur Enter pour ajouter un artéfact
         self.artifact_entry.bind('<Return>', lambda e: self._add_artifact())
         
+        # Coller plusieurs lignes ajoute un artéfact par ligne
+        self.artifact_entry.bind('<<Paste>>', self._paste_artifacts)
+        
+        # Sélection de nœuds sur le graphe (clic, rectangle)
+        self.graph_manager.on_selection = self._on_graph_selection
+        
         # Événement de fermeture de fenêtre
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
     
@@ -185,69 +316,255 @@ et d'utiliser l'IA pour identifier des patterns d'attaque."""
             return
         
         try:
-            # Ajouter le nœud au graphe
+            # Ajouter le nœud au graphe (l'affichage suit en différé)
             node_id = self.graph_manager.add_node(artifact)
             
-            # Mettre à jour l'affichage
-            self.graph_manager.update_display()
-            
             # Effacer le champ de saisie
             self.artifact_var.set("")
             
             # Mettre à jour le statut
             self.status_var.set(f"Artéfact ajouté: {artifact} (ID: {node_id})")
             
-            # Mettre à jour les détails
-            self._update_details_display()
-            
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur lors de l'ajout de l'artéfact: {e}")
     
+    def _paste_artifacts(self, event):
+        """
+        Collage de plusieurs lignes : un artéfact par ligne, ajoutés en un
+        seul lot (un seul rafraîchissement)
+        """
+        try:
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            return None
+        artifacts = [line.strip() for line in text.splitlines() if line.strip()]
+        if len(artifacts) < 2:
+            # Collage ordinaire dans le champ
+            return None
+        
+        result = self.graph_manager.add_nodes_bulk(artifacts, ignore_duplicates=True)
+        self.status_var.set(
+            f"{len(result['added'])} artéfacts collés ajoutés, {result['skipped']} déjà présents"
+            + (f", {len(result['errors'])} erreurs" if result['errors'] else "")
+        )
+        return "break"
+    
+    def _on_graph_selection(self, artifacts):
+        """
+        Mémorise les artéfacts sélectionnés sur le graphe
+        """
+        self.selected_nodes = artifacts
+        if len(artifacts) == 1:
+            self.status_var.set(f"Sélection: {artifacts[0]}")
+        elif artifacts:
+            self.status_var.set(f"{len(artifacts)} artéfacts sélectionnés "
+                                f"(Maj/Ctrl + clic pour ajouter ou retirer)")
+        else:
+            self.status_var.set("Sélection vide")
+    
     def _link_selected_nodes(self):
         """
         Lie les nœuds sélectionnés dans le graphe
+        
+        Avec au moins deux nœuds sélectionnés sur le graphe, le premier
+        sélectionné est lié à chacun des autres ; sinon les deux nœuds sont
+        choisis dans un dialogue.
         """
-        # Pour la v0.1, on utilise une méthode simple de sélection
-        # Dans une version future, on pourrait implémenter une sélection graphique
+        # Les nœuds supprimés depuis la sélection sont ignorés
+        self.selected_nodes = self.graph_manager.get_selected_artifacts()
+        if len(self.selected_nodes) >= 2:
+            self._link_to_first(self.selected_nodes)
+            return
         
-        # Demander à l'utilisateur les IDs des nœuds à lier
-        dialog = NodeSelectionDialog(self.root, self.graph_manager.get_all_nodes())
+        dialog = NodeSelectionDialog(self.root, self.graph_manager, first=(self.selected_nodes or [None])[0])
         if dialog.result:
             node1, node2 = dialog.result
             try:
                 self.graph_manager.add_edge(node1, node2)
-                self.graph_manager.update_display()
                 self.status_var.set(f"Lien créé entre {node1} et {node2}")
-                self._update_details_display()
             except Exception as e:
                 messagebox.showerror("Erreur", f"Erreur lors de la création du lien: {e}")
     
+    def _focus_artifact(self, artifact):
+        """
+        Montre sur le graphe l'artéfact choisi dans la recherche
+        """
+        if artifact not in self.graph_manager.artifact_to_id:
+            self.status_var.set(f"Artéfact introuvable: {artifact}")
+            return
+        self.graph_manager.focus_artifact(artifact)
+    
+    def _link_to_first(self, artifacts):
+        """
+        Lie le premier artéfact à chacun des autres, puis vide la sélection
+        """
+        anchor, others = artifacts[0], artifacts[1:]
+        if len(others) > LINK_CONFIRM_THRESHOLD and not messagebox.askyesno(
+                "Confirmation", f"Créer {len(others)} liens depuis {anchor} ?"):
+            return
+        
+        result = self.graph_manager.add_edges_bulk((anchor, other) for other in others)
+        self.graph_manager.select_artifacts([])
+        self.status_var.set(f"{result['added']} lien(s) créé(s) depuis {anchor}")
+    
+    def _import_logs(self):
+        """
+        Importe un fichier de logs Sysmon/Zeek (JSONL) dans le graphe
+        
+        La lecture se fait dans un thread séparé ; les lots, de taille
+        réduite, sont insérés dans le graphe depuis la boucle Tk, un par
+        rappel, pour ne pas geler l'interface.
+        """
+        path = filedialog.askopenfilename(
+            title="Importer des logs Sysmon / Zeek",
+            filetypes=[("Logs JSONL", "*.jsonl *.json *.log"), ("Tous les fichiers", "*.*")]
+        )
+        if not path:
+            return
+        
+        self.import_btn.configure(state='disabled')
+        # Le graphe n'est redessiné qu'à la fin de l'import
+        self.redraw.hold()
+        self.status_var.set(f"Import de {path} en cours...")
+        
+        # File bornée : le lecteur attend si l'interface prend du retard
+        self.ingestion_queue = queue.Queue(maxsize=INGESTION_QUEUE_SIZE)
+        self.ingestor = LogIngestor(self.graph_manager, batch_size=INGESTION_SLICE_EVENTS)
+        
+        thread = threading.Thread(target=self._read_logs, args=(path,))
+        thread.daemon = True
+        thread.start()
+        
+        self.root.after(INGESTION_POLL_MS, self._poll_ingestion)
+    
+    def _read_logs(self, path):
+        """
+        Lit le fichier de logs et transmet les lots à l'interface
+        """
+        try:
+            for batch in self.ingestor.iter_batches(path):
+                self.ingestion_queue.put(batch)
+            self.ingestion_queue.put(None)
+        except Exception as e:
+            self.ingestion_queue.put(e)
+    
+    def _poll_ingestion(self):
+        """
+        Insère dans le graphe le prochain lot lu et met à jour la barre de statut
+        """
+        try:
+            item = self.ingestion_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(INGESTION_POLL_MS, self._poll_ingestion)
+            return
+        
+        if isinstance(item, Exception):
+            self.import_btn.configure(state='normal')
+            self.redraw.release()
+            messagebox.showerror("Erreur", f"Erreur lors de l'import des logs: {item}")
+            self.status_var.set("Erreur lors de l'import des logs")
+            return
+        
+        if item is None:
+            stats = self.ingestor.get_stats()
+            self.import_btn.configure(state='normal')
+            self.redraw.release()
+            self.status_var.set(
+                f"Import terminé: {stats['events']:,} événements, "
+                f"{stats['nodes_added']:,} artéfacts, {stats['edges_added']:,} liens"
+            )
+            return
+        
+        stats = self.ingestor.commit_batch(item)
+        self.status_var.set(
+            f"Import: {stats['events']:,} événements ({stats['progress']:.0%}) - "
+            f"{stats['events_per_second']:,.0f} év/s"
+        )
+        self.root.after(1, self._poll_ingestion)
+    
+    def _poll_layout(self):
+        """
+        Redessine le graphe quand une disposition calculée en arrière-plan est prête
+        """
+        if self.graph_manager.apply_finished_layout():
+            self.redraw.invalidate(details=False)
+        self.root.after(LAYOUT_POLL_MS, self._poll_layout)
+    
+    def _relayout_graph(self):
+        """
+        Recalcule entièrement la disposition du graphe
+        """
+        self.graph_manager.relayout()
+        self.status_var.set("Disposition du graphe recalculée")
+    
+    def _reset_view(self):
+        """
+        Revient à la vue d'ensemble du graphe (molette : zoom, clic droit
+        glissé : déplacement)
+        """
+        self.graph_manager.reset_view()
+        self.status_var.set("Vue d'ensemble du graphe")
+    
+    def _save_case(self):
+        """
+        Enregistre le graphe et sa disposition dans un dossier JSON
+        """
+        path = filedialog.asksaveasfilename(
+            title="Enregistrer le dossier d'investigation",
+            defaultextension=".json",
+            filetypes=[("Dossiers Chronosense", "*.json"), ("Tous les fichiers", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            self.graph_manager.save_case(path)
+            self.status_var.set(f"Dossier enregistré: {path}")
+        except OSError as e:
+            messagebox.showerror("Erreur", f"Erreur lors de l'enregistrement du dossier: {e}")
+    
+    def _open_case(self):
+        """
+        Remplace le graphe par un dossier JSON enregistré
+        """
+        path = filedialog.askopenfilename(
+            title="Ouvrir un dossier d'investigation",
+            filetypes=[("Dossiers Chronosense", "*.json"), ("Tous les fichiers", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            self.graph_manager.load_case(path)
+            self.selected_nodes = []
+            self.status_var.set(f"Dossier ouvert: {path}")
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Erreur", f"Erreur lors de l'ouverture du dossier: {e}")
+    
     def _clear_graph(self):
         """
         Efface complètement le graphe
         """
         if messagebox.askyesno("Confirmation", "Êtes-vous sûr de vouloir effacer tout le graphe ?"):
             self.graph_manager.clear_graph()
-            self.graph_manager.update_display()
+            self.selected_nodes = []
             self.status_var.set("Graphe effacé")
-            self._update_details_display()
     
     def _update_details_display(self):
         """
         Met à jour l'affichage des détails du graphe
         """
-        details = self.graph_manager.get_graph_summary()
-        
-        # Effacer le contenu actuel (sauf le message d'accueil si le graphe est vide)
-        if self.graph_manager.get_node_count() > 0:
-            self.details_text.delete(1.0, tk.END)
-            self.details_text.insert(tk.END, f"📊 Résumé du Graphe:\n\n{details}\n\n")
-            self.details_text.insert(tk.END, "💡 Cliquez sur 'Générer des Hypothèses' pour l'analyse IA")
+        # Le résumé est lu à la demande : seule la fenêtre visible est recalculée
+        # (le message d'accueil reste affiché tant que le graphe est vide)
+        if self.details_text.source is self.summary_source:
+            self.details_text.refresh()
+        elif self.graph_manager.get_node_count() > 0:
+            self.details_text.set_source(self.summary_source)
     
-    def _generate_hypotheses_threaded(self):
+    def _request_hypotheses(self):
         """
-        Lance la génération d'hypothèses dans un thread séparé
-        pour éviter de bloquer l'interface
+        Soumet une demande d'hypothèses au planificateur IA
+        
+        La description du graphe est lue ici, dans la boucle Tk ; la
+        génération se fait dans un thread du planificateur.
         """
         if self.graph_manager.get_node_count() == 0:
             messagebox.showwarning("Attention", "Ajoutez au moins un artéfact avant de générer des hypothèses")
@@ -255,50 +572,116 @@ et d'utiliser l'IA pour identifier des patterns d'attaque."""
         
         # Désactiver le bouton pendant le traitement
         self.generate_btn.configure(state='disabled', text="🔄 Génération en cours...")
-        self.status_var.set("Génération d'hypothèses en cours...")
-        
-        # Lancer dans un thread
-        thread = threading.Thread(target=self._generate_hypotheses)
-        thread.daemon = True
-        thread.start()
+        self.cancel_btn.configure(state='normal')
+        if self.ai_manager.get_model_info()['ready']:
+            self.status_var.set("Génération d'hypothèses en cours...")
+        else:
+            # Pendant le préchauffage, la demande attend le modèle, puis se
+            # rabat sur la simulation
+            self.status_var.set("En attente du modèle IA...")
+        
+        # Les morceaux de réponse arrivent par une file, vidée par lots
+        # depuis la boucle Tk
+        self.stream_queue = queue.Queue()
+        self.stream_source = TextLineSource("🤖 Analyse IA - Hypothèses d'Investigation:\n\n")
+        self.stream_first_chunk = False
+        self.details_text.set_source(self.stream_source)
+        
+        stream_queue = self.stream_queue
+        self.ai_request = self.ai_scheduler.submit(
+            self.graph_manager.get_graph_description(),
+            version=self.graph_manager.version,
+            on_chunk=stream_queue.put,
+            on_done=stream_queue.put
+        )
+        self.root.after(STREAM_POLL_MS, self._poll_stream)
     
-    def _generate_hypotheses(self):
+    def _cancel_hypotheses(self):
         """
-        Génère les hypothèses d'investigation avec l'IA
+        Abandonne la génération en cours (bouton Annuler)
         """
-        try:
-            # Obtenir la description du graphe
-            graph_description = self.graph_manager.get_graph_description()
-            
-            # Générer les hypothèses avec l'IA
-            hypotheses = self.ai_manager.generate_hypotheses(graph_description)
-            
-            # Mettre à jour l'interface dans le thread principal
-            self.root.after(0, self._display_hypotheses, hypotheses)
-            
-        except Exception as e:
-            self.root.after(0, self._display_error, str(e))
+        if self.ai_request is not None:
+            self.ai_scheduler.cancel(self.ai_request)
     
-    def _display_hypotheses(self, hypotheses):
+    def _on_graph_change(self):
         """
-        Affiche les hypothèses générées par l'IA
+        Mutation du graphe : rafraîchissement différé, et abandon de la
+        génération lancée sur l'état précédent du graphe
         """
-        # Réactiver le bouton
+        self.redraw.invalidate()
+        self.ai_scheduler.cancel_stale(self.graph_manager.version)
+    
+    def _poll_stream(self):
+        """
+        Ajoute au panneau de détails tous les morceaux reçus depuis le
+        dernier passage : un seul rafraîchissement par lot
+        """
+        chunks = []
+        request = None
+        while request is None:
+            try:
+                item = self.stream_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, str):
+                chunks.append(item)
+            else:
+                # Demande terminée, annulée ou en échec
+                request = item
+        
+        if chunks:
+            if request is not None and request.cached:
+                # Réponse relue dans le cache : signalée en tête
+                self.stream_first_chunk = True
+                chunks.insert(0, "💾 Réponse en cache (graphe déjà analysé avec ces réglages)\n\n")
+            if not self.stream_first_chunk:
+                self.stream_first_chunk = True
+                self.status_var.set(f"Génération en cours - premier token en {self.ai_request.ttft:.2f}s")
+            # La vue suit la fin du texte si elle y était déjà
+            view = self.details_text
+            following = view.first_line >= self.stream_source.line_count() - view.visible_rows()
+            self.stream_source.append("".join(chunks))
+            if following:
+                view.scroll_to(self.stream_source.line_count())
+            view.refresh()
+        
+        if request is None:
+            self.root.after(STREAM_POLL_MS, self._poll_stream)
+        elif request.status == STATUS_ERROR:
+            self._display_error(str(request.error))
+        elif request.status == STATUS_CANCELLED:
+            self._finish_stream()
+            self.stream_source.append("\n\n⏹️ Génération annulée")
+            self.details_text.refresh()
+            self.status_var.set("Génération d'hypothèses annulée")
+        elif request.cached:
+            self._finish_stream()
+            stats = self.hypothesis_cache.stats()
+            self.status_var.set(
+                f"Hypothèses servies depuis le cache ({stats['hits']} succès, {stats['misses']} échecs, "
+                f"{stats['entries']} entrées)"
+            )
+        else:
+            self._finish_stream()
+            self.status_var.set(
+                f"Hypothèses générées avec succès (premier token en {request.ttft or request.elapsed:.2f}s, "
+                f"total {request.elapsed:.1f}s)"
+            )
+    
+    def _finish_stream(self):
+        """
+        Fin de la génération en flux : boutons rétablis
+        """
+        self.ai_request = None
         self.generate_btn.configure(state='normal', text="🧠 Générer des Hypothèses")
-        
-        # Afficher les hypothèses
-        self.details_text.delete(1.0, tk.END)
-        self.details_text.insert(tk.END, "🤖 Analyse IA - Hypothèses d'Investigation:\n\n")
-        self.details_text.insert(tk.END, hypotheses)
-        
-        self.status_var.set("Hypothèses générées avec succès")
+        self.cancel_btn.configure(state='disabled')
     
     def _display_error(self, error_msg):
         """
         Affiche une erreur lors de la génération d'hypothèses
         """
         # Réactiver le bouton
-        self.generate_btn.configure(state='normal', text="🧠 Générer des Hypothèses")
+        self._finish_stream()
         
         messagebox.showerror("Erreur IA", f"Erreur lors de la génération d'hypothèses:\n{error_msg}")
         self.status_var.set("Erreur lors de la génération d'hypothèses")
@@ -308,32 +691,76 @@ et d'utiliser l'IA pour identifier des patterns d'attaque."""
         Gère la fermeture de l'application
         """
         if messagebox.askokcancel("Quitter", "Voulez-vous vraiment quitter Chronosense ?"):
+            self.layout_worker.shutdown()
+            self.ai_scheduler.shutdown()
+            self.ai_manager.client.close()
             self.root.destroy()
     
-    def run(self):
+    def _finish_startup(self):
+        """
+        Termine le démarrage une fois la fenêtre affichée : affichage du
+        graphe (import de Matplotlib) et recherche du modèle IA en arrière-plan
+        """
+        self.graph_placeholder.destroy()
+        self.graph_manager.setup_display(self.graph_frame)
+        
+        self.ai_status_var.set("🧠 IA: préchauffage...")
+        self.ai_manager.start_warmup(
+            on_update=lambda info: self.root.after(0, self._on_ai_update, info)
+        )
+    
+    def _on_ai_update(self, info):
+        """
+        Une tentative de préchauffage est terminée (appelé dans la boucle Tk)
+        """
+        if info['warming_up']:
+            self.ai_status_var.set(f"🧠 IA: {info['mode']} (préchauffage...)")
+        else:
+            self.ai_status_var.set(f"🧠 IA: {info['mode']} (prêt en {info['warmup_time']:.1f}s)")
+    
+    def run(self, started=None):
         """
         Lance l'application
+        
+        Args:
+            started (float): Instant du lancement (time.perf_counter), pour
+                             afficher le délai d'apparition de la fenêtre
         """
         print("Lancement de l'interface graphique...")
+        # Fenêtre dessinée avant les chargements longs
+        self.root.update()
+        if started is not None:
+            print(f"Fenêtre affichée en {time.perf_counter() - started:.2f}s")
+        self._finish_startup()
         self.root.mainloop()
 
 
 class NodeSelectionDialog:
     """
     Dialogue simple pour sélectionner deux nœuds à lier
+    
+    Chaque nœud est saisi dans un champ de recherche incrémentale : seules
+    les propositions de la page affichée sont lues dans l'index du graphe.
     """
     
-    def __init__(self, parent, nodes):
+    def __init__(self, parent, graph_manager, first=None):
+        """
+        Args:
+            parent: Fenêtre parente
+            graph_manager (GraphManager): Graphe où chercher les artéfacts
+            first (str): Artéfact proposé comme premier nœud
+        """
         self.result = None
+        self.graph_manager = graph_manager
         
-        if len(nodes) < 2:
+        if graph_manager.get_node_count() < 2:
             messagebox.showwarning("Attention", "Il faut au moins 2 nœuds pour créer un lien")
             return
         
         # Créer la fenêtre de dialogue
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Sélectionner les nœuds à lier")
-        self.dialog.geometry("400x300")
+        self.dialog.geometry("450x300")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
@@ -341,19 +768,23 @@ class NodeSelectionDialog:
         self.dialog.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
         
         # Interface
-        ttk.Label(self.dialog, text="Sélectionnez deux nœuds à lier:").pack(pady=10)
+        ttk.Label(self.dialog, text="Sélectionnez deux nœuds à lier (saisir le début de l'artéfact):").pack(pady=10)
         
         # Premier nœud
         ttk.Label(self.dialog, text="Premier nœud:").pack(anchor=tk.W, padx=20)
-        self.node1_var = tk.StringVar()
-        self.node1_combo = ttk.Combobox(self.dialog, textvariable=self.node1_var, values=nodes, state="readonly")
-        self.node1_combo.pack(fill=tk.X, padx=20, pady=5)
+        self.node1_box = ArtifactSearchBox(self.dialog, graph_manager.search_artifacts)
+        self.node1_box.pack(fill=tk.X, padx=20, pady=5)
         
         # Deuxième nœud
         ttk.Label(self.dialog, text="Deuxième nœud:").pack(anchor=tk.W, padx=20, pady=(10, 0))
-        self.node2_var = tk.StringVar()
-        self.node2_combo = ttk.Combobox(self.dialog, textvariable=self.node2_var, values=nodes, state="readonly")
-        self.node2_combo.pack(fill=tk.X, padx=20, pady=5)
+        self.node2_box = ArtifactSearchBox(self.dialog, graph_manager.search_artifacts)
+        self.node2_box.pack(fill=tk.X, padx=20, pady=5)
+        
+        if first:
+            self.node1_box.set(first)
+            self.node2_box.combo.focus_set()
+        else:
+            self.node1_box.combo.focus_set()
         
         # Boutons
         button_frame = ttk.Frame(self.dialog)
@@ -366,13 +797,18 @@ class NodeSelectionDialog:
         self.dialog.wait_window()
     
     def _ok(self):
-        node1 = self.node1_var.get()
-        node2 = self.node2_var.get()
+        node1 = self.node1_box.get()
+        node2 = self.node2_box.get()
         
         if not node1 or not node2:
             messagebox.showwarning("Attention", "Veuillez sélectionner les deux nœuds")
             return
         
+        for node in (node1, node2):
+            if node not in self.graph_manager.artifact_to_id:
+                messagebox.showwarning("Attention", f"Artéfact introuvable: {node}")
+                return
+        
         if node1 == node2:
             messagebox.showwarning("Attention", "Veuillez sélectionner deux nœuds différents")
             return
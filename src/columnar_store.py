@@ -0,0 +1,616 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Stockage colonnaire du graphe
+Conserve nœuds et arêtes dans des tableaux NumPy (identifiants entiers,
+types et relations internés, horodatages epoch int64) et expose une vue
+compatible avec l'API NetworkX utilisée par GraphManager
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+from collections.abc import Mapping
+from datetime import datetime
+
+import networkx as nx
+import numpy as np
+
+# Capacité initiale des colonnes (doublée à chaque dépassement)
+INITIAL_CAPACITY = 1024
+
+# Valeur d'une colonne entière pour une entrée supprimée
+DELETED = -1
+
+
+class GrowableArray:
+    """
+    Colonne NumPy à capacité croissante (ajout amorti en O(1))
+    """
+
+    def __init__(self, dtype, capacity=INITIAL_CAPACITY):
+        self._data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def append(self, value):
+        if self.size == len(self._data):
+            self._grow(self.size + 1)
+        self._data[self.size] = value
+        self.size += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._data.dtype)
+        end = self.size + len(values)
+        if end > len(self._data):
+            self._grow(end)
+        self._data[self.size:end] = values
+        self.size = end
+
+    def _grow(self, minimum):
+        capacity = max(len(self._data) * 2, minimum)
+        data = np.empty(capacity, dtype=self._data.dtype)
+        data[:self.size] = self._data[:self.size]
+        self._data = data
+
+    @property
+    def values(self):
+        """
+        Vue sur la partie remplie de la colonne (sans copie)
+        """
+        return self._data[:self.size]
+
+    def __getitem__(self, index):
+        return self._data[:self.size][index]
+
+    def __setitem__(self, index, value):
+        self._data[:self.size][index] = value
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes
+
+
+class InternTable:
+    """
+    Table d'internement chaîne <-> code entier
+    """
+
+    def __init__(self, names=()):
+        self.names = []
+        self.codes = {}
+        for name in names:
+            self.code(name)
+
+    def code(self, name):
+        code = self.codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self.codes[name] = code
+            self.names.append(name)
+        return code
+
+    def name(self, code):
+        return self.names[code]
+
+
+def to_epoch_us(timestamp):
+    """
+    Convertit un horodatage (datetime, chaîne ISO ou None) en microsecondes epoch
+    """
+    if timestamp is None:
+        timestamp = datetime.now()
+    elif isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    return int(timestamp.timestamp() * 1_000_000)
+
+
+def from_epoch_us(value):
+    """
+    Convertit des microsecondes epoch en chaîne ISO (heure locale)
+    """
+    return datetime.fromtimestamp(int(value) / 1_000_000).isoformat()
+
+
+class ColumnarGraph:
+    """
+    Graphe non orienté stocké en colonnes
+
+    Les nœuds sont identifiés par des entiers consécutifs (position dans
+    les colonnes). Une suppression marque la position comme libre sans
+    décaler les autres identifiants. Les descriptions ne sont pas stockées :
+    elles sont générées à la lecture.
+    """
+
+    def __init__(self, describe=None):
+        """
+        Initialise un graphe colonnaire vide
+
+        Args:
+            describe (callable): Génère la description d'un nœud à partir
+                                 de (artéfact, type)
+        """
+        self.describe = describe
+        self.clear()
+
+    def clear(self):
+        """
+        Supprime tous les nœuds et arêtes
+        """
+        # Colonnes des nœuds
+        self._artifacts = []
+        self._types = GrowableArray(np.int8)
+        self._timestamps = GrowableArray(np.int64)
+        self._tags = {}  # Étiquettes, stockées seulement si non vides
+        self._node_count = 0
+
+        # Colonnes des arêtes (src = DELETED pour une arête supprimée)
+        self._src = GrowableArray(np.int32)
+        self._dst = GrowableArray(np.int32)
+        self._relationships = GrowableArray(np.int16)
+        self._edge_timestamps = GrowableArray(np.int64)
+        self._edge_index = {}  # clé (min << 32 | max) -> position de l'arête
+
+        self.type_table = InternTable()
+        self.relationship_table = InternTable()
+
+        # Cache CSR des voisinages, reconstruit après mutation
+        self._csr = None
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def add_node(self, node_id, **attrs):
+        """
+        Ajoute un nœud ; les identifiants doivent être attribués dans l'ordre
+
+        Args:
+            node_id (int): Identifiant (égal au nombre de positions allouées)
+            **attrs: artifact, type, tags, timestamp (description ignorée)
+        """
+        self.add_nodes_from([(node_id, attrs)])
+
+    def add_nodes_from(self, nodes, **attr):
+        """
+        Ajoute des nœuds (node_id, attributs) en une seule mutation par colonne
+
+        Comme pour NetworkX, les attributs passés en mots-clés s'appliquent
+        à tous les nœuds, ceux de chaque nœud restant prioritaires.
+        """
+        nodes = nodes if isinstance(nodes, list) else list(nodes)
+        first = len(self._artifacts)
+        for expected, (node_id, _) in enumerate(nodes, first):
+            if node_id != expected:
+                raise ValueError(f"Identifiant de nœud inattendu: {node_id} (attendu {expected})")
+
+        type_code = self.type_table.code
+        default_type = attr.get('type', 'default')
+        default_tags = attr.get('tags')
+        types = [type_code(data.get('type', default_type)) for _, data in nodes]
+
+        # Les imports en masse partagent le même horodatage
+        default_timestamp = attr.get('timestamp')
+        last_timestamp = default_timestamp
+        last_epoch = to_epoch_us(default_timestamp)
+        timestamps = []
+        for _, data in nodes:
+            timestamp = data.get('timestamp', default_timestamp)
+            if timestamp is not last_timestamp:
+                last_timestamp = timestamp
+                last_epoch = to_epoch_us(timestamp)
+            timestamps.append(last_epoch)
+
+        for node_id, data in nodes:
+            tags = data.get('tags', default_tags)
+            if tags:
+                self._tags[node_id] = tuple(tags)
+
+        self._artifacts.extend(data['artifact'] for _, data in nodes)
+        self._types.extend(types)
+        self._timestamps.extend(timestamps)
+        self._node_count += len(types)
+        self._csr = None
+
+    def add_edge(self, u, v, **attrs):
+        """
+        Ajoute une arête (ou met à jour ses attributs si elle existe)
+        """
+        self.add_edges_from([(u, v)], **attrs)
+
+    def add_edges_from(self, edges, **attr):
+        """
+        Ajoute des arêtes (u, v) ou (u, v, attributs)
+
+        Comme pour NetworkX, les attributs passés en mots-clés s'appliquent
+        à toutes les arêtes, ceux de chaque arête restant prioritaires. Les
+        extrémités sont vérifiées et les clés calculées sur des tableaux
+        NumPy ; les nouvelles arêtes sont ajoutées aux colonnes en une seule
+        extension par colonne.
+        """
+        edges = edges if isinstance(edges, list) else list(edges)
+        if not edges:
+            return
+        u = np.array([edge[0] for edge in edges])
+        v = np.array([edge[1] for edge in edges])
+        valid = np.zeros(len(edges), dtype=bool)
+        if u.dtype.kind in 'iu' and v.dtype.kind in 'iu':
+            size = len(self._artifacts)
+            types = self._types.values
+            in_range = (u >= 0) & (u < size) & (v >= 0) & (v < size)
+            valid[in_range] = (types[u[in_range]] != DELETED) & (types[v[in_range]] != DELETED)
+        if not valid.all():
+            index = int(np.argmin(valid))
+            raise KeyError(f"Nœud inexistant pour l'arête ({edges[index][0]}, {edges[index][1]})")
+        u = u.astype(np.int64)
+        v = v.astype(np.int64)
+
+        # Attributs: une valeur commune, ou une par arête si certaines en ont
+        relationship_code = self.relationship_table.code
+        default_relationship = attr.get('relationship', 'connected')
+        default_timestamp = attr.get('timestamp')
+        if all(len(edge) == 2 for edge in edges):
+            relationships = np.full(len(edges), relationship_code(default_relationship), dtype=np.int64)
+            epochs = np.full(len(edges), to_epoch_us(default_timestamp), dtype=np.int64)
+        else:
+            last_timestamp = default_timestamp
+            last_epoch = to_epoch_us(default_timestamp)
+            relationships = []
+            epochs = []
+            for edge in edges:
+                data = edge[2] if len(edge) > 2 else {}
+                relationships.append(relationship_code(data.get('relationship', default_relationship)))
+                timestamp = data.get('timestamp', default_timestamp)
+                if timestamp is not last_timestamp:
+                    last_timestamp = timestamp
+                    last_epoch = to_epoch_us(timestamp)
+                epochs.append(last_epoch)
+            relationships = np.array(relationships, dtype=np.int64)
+            epochs = np.array(epochs, dtype=np.int64)
+
+        # Nouvelle arête: extrémités de sa première occurrence, attributs de
+        # la dernière ; arête existante: attributs mis à jour
+        edge_index = self._edge_index
+        base = len(self._src)
+        position = base
+        first_seen = []
+        last_seen = []
+        updated = {}
+        keys = ((np.minimum(u, v) << 32) | np.maximum(u, v)).tolist()
+        for index, key in enumerate(keys):
+            existing = edge_index.get(key)
+            if existing is None:
+                edge_index[key] = position
+                position += 1
+                first_seen.append(index)
+                last_seen.append(index)
+            elif existing < base:
+                updated[existing] = index
+            else:
+                # Arête répétée dans le même lot
+                last_seen[existing - base] = index
+
+        if updated:
+            existing = np.fromiter(updated.keys(), dtype=np.int64, count=len(updated))
+            sources = np.fromiter(updated.values(), dtype=np.int64, count=len(updated))
+            self._relationships[existing] = relationships[sources]
+            self._edge_timestamps[existing] = epochs[sources]
+        if first_seen:
+            self._src.extend(u[first_seen])
+            self._dst.extend(v[first_seen])
+            self._relationships.extend(relationships[last_seen])
+            self._edge_timestamps.extend(epochs[last_seen])
+        self._csr = None
+
+    def remove_node(self, node_id):
+        """
+        Supprime un nœud et ses arêtes
+        """
+        if not self.has_node(node_id):
+            raise nx.NetworkXError(f"The node {node_id} is not in the graph.")
+
+        # Une boucle (u == v) apparaît deux fois parmi les arêtes du nœud
+        for key in {self._edge_key(u, v) for u, v in self.edges(node_id)}:
+            position = self._edge_index.pop(key)
+            self._src[position] = DELETED
+            self._dst[position] = DELETED
+
+        self._artifacts[node_id] = None
+        self._types[node_id] = DELETED
+        self._tags.pop(node_id, None)
+        self._node_count -= 1
+        self._csr = None
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _edge_key(u, v):
+        if u > v:
+            u, v = v, u
+        return (u << 32) | v
+
+    def has_node(self, node_id):
+        return (isinstance(node_id, (int, np.integer)) and 0 <= node_id < len(self._artifacts)
+                and self._artifacts[node_id] is not None)
+
+    def has_edge(self, u, v):
+        return self._edge_key(u, v) in self._edge_index
+
+    def number_of_nodes(self):
+        return self._node_count
+
+    def number_of_edges(self):
+        return len(self._edge_index)
+
+    def __len__(self):
+        return self._node_count
+
+    def __contains__(self, node_id):
+        return self.has_node(node_id)
+
+    def __iter__(self):
+        return iter(self.node_ids())
+
+    def node_ids(self):
+        """
+        Identifiants des nœuds présents (tableau NumPy)
+        """
+        return np.flatnonzero(self._types.values != DELETED)
+
+    def edge_array(self):
+        """
+        Arêtes présentes sous forme de tableau (n, 2)
+        """
+        src = self._src.values
+        alive = src != DELETED
+        return np.column_stack((src[alive], self._dst.values[alive]))
+
+    def artifact(self, node_id):
+        return self._artifacts[node_id]
+
+    def node_type(self, node_id):
+        return self.type_table.name(int(self._types[node_id]))
+
+    def node_attributes(self, node_id):
+        if not self.has_node(node_id):
+            raise KeyError(node_id)
+        return NodeAttributes(self, int(node_id))
+
+    def edge_attributes(self, u, v):
+        position = self._edge_index.get(self._edge_key(u, v))
+        if position is None:
+            raise KeyError((u, v))
+        return EdgeAttributes(self, position)
+
+    def _adjacency(self):
+        """
+        Voisinages au format CSR (indptr, indices), reconstruits à la demande
+        """
+        if self._csr is None:
+            edges = self.edge_array()
+            size = len(self._artifacts)
+            sources = np.concatenate((edges[:, 0], edges[:, 1]))
+            targets = np.concatenate((edges[:, 1], edges[:, 0]))
+            order = np.argsort(sources, kind='stable')
+            indptr = np.zeros(size + 1, dtype=np.int64)
+            np.cumsum(np.bincount(sources, minlength=size), out=indptr[1:])
+            self._csr = (indptr, targets[order])
+        return self._csr
+
+    def neighbors(self, node_id):
+        if not self.has_node(node_id):
+            raise nx.NetworkXError(f"The node {node_id} is not in the graph.")
+        indptr, indices = self._adjacency()
+        return iter(indices[indptr[node_id]:indptr[node_id + 1]].tolist())
+
+    def degree_array(self):
+        """
+        Degré de chaque position (0 pour les positions libres)
+        """
+        indptr, _ = self._adjacency()
+        return np.diff(indptr)
+
+    @property
+    def nodes(self):
+        return NodeView(self)
+
+    @property
+    def edges(self):
+        return EdgeView(self)
+
+    @property
+    def degree(self):
+        return DegreeView(self)
+
+    def to_networkx(self, with_attributes=False):
+        """
+        Construit un nx.Graph équivalent (pour les algorithmes NetworkX)
+
+        Args:
+            with_attributes (bool): Copier aussi les attributs des nœuds et arêtes
+        """
+        graph = nx.Graph()
+        if with_attributes:
+            graph.add_nodes_from((node_id, dict(self.node_attributes(node_id)))
+                                 for node_id in self.node_ids().tolist())
+            graph.add_edges_from((u, v, dict(self.edge_attributes(u, v)))
+                                 for u, v in self.edge_array().tolist())
+        else:
+            graph.add_nodes_from(self.node_ids().tolist())
+            graph.add_edges_from(self.edge_array().tolist())
+        return graph
+
+    def memory_usage(self):
+        """
+        Estimation des octets occupés par les colonnes NumPy
+        """
+        columns = (self._types, self._timestamps, self._src, self._dst,
+                   self._relationships, self._edge_timestamps)
+        return sum(column.nbytes for column in columns)
+
+
+class NodeAttributes(Mapping):
+    """
+    Attributs d'un nœud, calculés à la lecture depuis les colonnes
+    """
+
+    KEYS = ('artifact', 'type', 'tags', 'timestamp', 'description')
+
+    def __init__(self, store, node_id):
+        self._store = store
+        self._node_id = node_id
+
+    def __getitem__(self, key):
+        store = self._store
+        node_id = self._node_id
+        if key == 'artifact':
+            return store.artifact(node_id)
+        if key == 'type':
+            return store.node_type(node_id)
+        if key == 'tags':
+            return store._tags.get(node_id, ())
+        if key == 'timestamp':
+            return from_epoch_us(store._timestamps[node_id])
+        if key == 'description':
+            if store.describe is None:
+                return f"Artéfact: {store.artifact(node_id)}"
+            return store.describe(store.artifact(node_id), store.node_type(node_id))
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+
+class EdgeAttributes(Mapping):
+    """
+    Attributs d'une arête, calculés à la lecture depuis les colonnes
+    """
+
+    KEYS = ('relationship', 'timestamp')
+
+    def __init__(self, store, position):
+        self._store = store
+        self._position = position
+
+    def __getitem__(self, key):
+        if key == 'relationship':
+            return self._store.relationship_table.name(int(self._store._relationships[self._position]))
+        if key == 'timestamp':
+            return from_epoch_us(self._store._edge_timestamps[self._position])
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+
+class NodeView:
+    """
+    Équivalent de G.nodes pour ColumnarGraph
+    """
+
+    def __init__(self, store):
+        self._store = store
+
+    def __call__(self, data=False):
+        if data:
+            return [(node_id, self._store.node_attributes(node_id))
+                    for node_id in self._store.node_ids().tolist()]
+        return self
+
+    def __iter__(self):
+        return iter(self._store.node_ids().tolist())
+
+    def __len__(self):
+        return self._store.number_of_nodes()
+
+    def __contains__(self, node_id):
+        return self._store.has_node(node_id)
+
+    def __getitem__(self, node_id):
+        return self._store.node_attributes(node_id)
+
+
+class EdgeView:
+    """
+    Équivalent de G.edges pour ColumnarGraph
+    """
+
+    def __init__(self, store):
+        self._store = store
+
+    def __call__(self, nbunch=None, data=False):
+        if nbunch is None:
+            edges = [tuple(edge) for edge in self._store.edge_array().tolist()]
+        else:
+            if not isinstance(nbunch, (list, tuple, set)):
+                nbunch = [nbunch]
+            edges = [(node_id, neighbor) for node_id in nbunch
+                     for neighbor in self._store.neighbors(node_id)]
+        if data:
+            return [(u, v, self._store.edge_attributes(u, v)) for u, v in edges]
+        return edges
+
+    def __iter__(self):
+        return iter(self())
+
+    def __len__(self):
+        return self._store.number_of_edges()
+
+    def __contains__(self, edge):
+        return self._store.has_edge(*edge)
+
+    def __getitem__(self, edge):
+        return self._store.edge_attributes(*edge)
+
+
+class DegreeView:
+    """
+    Équivalent de G.degree pour ColumnarGraph
+    """
+
+    def __init__(self, store):
+        self._store = store
+
+    def __getitem__(self, node_id):
+        if not self._store.has_node(node_id):
+            raise KeyError(node_id)
+        return int(self._store.degree_array()[node_id])
+
+    def __iter__(self):
+        degrees = self._store.degree_array()
+        return ((node_id, int(degrees[node_id])) for node_id in self._store.node_ids().tolist())
+
+    def __call__(self):
+        return self
+
+
+class ArtifactIdView(Mapping):
+    """
+    Vue ID -> artéfact sur les colonnes, sans dupliquer les chaînes
+    """
+
+    def __init__(self, store):
+        self._store = store
+
+    def __getitem__(self, node_id):
+        if not self._store.has_node(node_id):
+            raise KeyError(node_id)
+        return self._store.artifact(node_id)
+
+    def __iter__(self):
+        return iter(self._store.node_ids().tolist())
+
+    def __len__(self):
+        return self._store.number_of_nodes()
+
+    def __contains__(self, node_id):
+        return self._store.has_node(node_id)
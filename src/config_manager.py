@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Configuration
+Charge config.json (voir config.json.example) par-dessus les valeurs par
+défaut de l'application
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import copy
+import json
+import os
+
+# Fichier de configuration à la racine du projet
+DEFAULT_CONFIG_FILE = os.path.join(os.path.dirname(__file__), '..', 'config.json')
+
+DEFAULT_CONFIG = {
+    "ai": {
+        "model_name": "microsoft/Phi-3-mini-4k-instruct",
+        "mode": "simulation",
+        "max_tokens": 512,
+        "temperature": 0.7,
+        "api_url": "http://localhost:11434/api/generate",
+        "timeout": 60,
+        "checkpoint_dir": "models",
+        "quantization": "none",
+        "cpu_threads": 0,
+        "max_concurrency": 4,
+        "retries": 3,
+        "retry_backoff": 0.5,
+        "workers": 2,
+        "cache_enabled": True,
+        "cache_dir": "cache/hypotheses",
+        "cache_max_mb": 50
+    },
+    "interface": {
+        "window_size": "1200x800",
+        "theme": "default",
+        "font_size": 10,
+        "graph_layout": "auto",
+        "layout_threshold": 10,
+        "barnes_hut_threshold": 500,
+        "layout_iterations": 50,
+        "lod_threshold": 1000,
+        "label_top_k": 50,
+        "aggregate_by": "type",
+        "redraw_interval_ms": 40
+    },
+    "graph": {
+        "node_colors": {
+            "ip": "#FF6B6B",
+            "hash": "#4ECDC4",
+            "file": "#45B7D1",
+            "process": "#96CEB4",
+            "domain": "#FFEAA7",
+            "default": "#DDA0DD"
+        },
+        "node_size": 1000,
+        "edge_width": 2
+    },
+    "logging": {
+        "level": "INFO",
+        "file": "logs/chronosense.log",
+        "max_size": "10MB",
+        "backup_count": 5
+    }
+}
+
+
+def load_config(path=None):
+    """
+    Charge la configuration
+
+    Les clés absentes du fichier gardent leur valeur par défaut ; sans
+    fichier, la configuration par défaut est retournée.
+
+    Args:
+        path (str): Chemin du fichier (config.json à la racine par défaut)
+
+    Returns:
+        dict: Configuration complète
+    """
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    path = path or DEFAULT_CONFIG_FILE
+    if not os.path.exists(path):
+        return config
+
+    try:
+        with open(path, 'r', encoding='utf-8') as config_file:
+            user_config = json.load(config_file)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Configuration ignorée ({path}): {e}")
+        return config
+
+    _merge(config, user_config)
+    return config
+
+
+def _merge(base, override):
+    """
+    Fusionne récursivement override dans base
+    """
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = value
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Inférence sur CPU
+Quantification dynamique int8 des couches linéaires et réglage du nombre
+de threads de calcul, pour faire tourner Phi-3 sur des postes sans GPU
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import os
+
+# Modes de quantification (clé "quantization" de la section "ai")
+QUANTIZATION_NONE = "none"   # Poids dans le type du modèle, placement automatique
+QUANTIZATION_INT8 = "int8"   # Couches linéaires quantifiées en int8 (CPU)
+QUANTIZATION_MODES = (QUANTIZATION_NONE, QUANTIZATION_INT8)
+
+
+def default_thread_count():
+    """
+    Cœurs utilisables par le processus
+
+    Les multiplications de matrices du décodage sont limitées par la bande
+    passante mémoire : au-delà des cœurs disponibles, les threads se
+    concurrencent sans gain.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def configure_threads(threads=0):
+    """
+    Fixe le nombre de threads de calcul de torch
+
+    Args:
+        threads (int): Nombre de threads (0 : cœurs disponibles)
+
+    Returns:
+        int: Nombre de threads retenu
+    """
+    import torch
+
+    threads = threads or default_thread_count()
+    torch.set_num_threads(threads)
+    return threads
+
+
+def quantize_int8(model):
+    """
+    Quantification dynamique int8 des couches linéaires
+
+    Les poids des nn.Linear sont stockés en int8 ; les activations sont
+    quantifiées à la volée à chaque appel. Le reste du modèle (embeddings,
+    normalisations) passe en float32, seul type accepté par ces couches
+    sur CPU.
+
+    Args:
+        model: Modèle torch chargé sur CPU
+
+    Returns:
+        Modèle quantifié (en mode évaluation)
+    """
+    import torch
+
+    model = model.to(torch.float32).eval()
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def prepare_model(model, quantization=QUANTIZATION_NONE, threads=0):
+    """
+    Prépare un modèle chargé pour l'inférence sur CPU
+
+    Args:
+        model: Modèle torch
+        quantization (str): "none" ou "int8"
+        threads (int): Threads de calcul (0 : cœurs disponibles)
+
+    Returns:
+        tuple: (modèle, nombre de threads retenu)
+    """
+    if quantization not in QUANTIZATION_MODES:
+        raise ValueError(f"Mode de quantification inconnu: {quantization}")
+    threads = configure_threads(threads)
+    if quantization == QUANTIZATION_INT8:
+        model = quantize_int8(model)
+    return model, threads
@@ -0,0 +1,733 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Disposition incrémentale du graphe
+Conserve les positions des nœuds d'un affichage à l'autre : les nouveaux
+nœuds sont placés près de leurs voisins puis affinés localement, au lieu
+de recalculer toute la disposition à chaque ajout. Les moteurs de
+disposition (spring, circulaire, Barnes-Hut/ForceAtlas2) travaillent sur
+des tableaux NumPy et se choisissent dans la configuration
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import importlib.util
+from itertools import chain
+
+import networkx as nx
+import numpy as np
+
+# Jusqu'à ce nombre de nœuds, disposition circulaire (calcul immédiat)
+CIRCULAR_THRESHOLD = 10
+
+# À partir de ce nombre de nœuds, le mode "auto" passe à Barnes-Hut (au-delà,
+# spring_layout exige scipy et coûte O(n²) par itération)
+BARNES_HUT_THRESHOLD = 500
+
+# À partir de ce nombre de nœuds, spring_layout passe par scipy ; sans scipy,
+# le moteur Barnes-Hut prend le relais
+SPRING_SCIPY_THRESHOLD = 500
+SCIPY_AVAILABLE = importlib.util.find_spec("scipy") is not None
+
+# Itérations d'une disposition complète et d'un affinage local
+FULL_ITERATIONS = 50
+WARM_ITERATIONS = 10
+
+# Distance idéale entre nœuds (paramètre k de spring_layout)
+SPRING_K = 1
+
+# Écart du placement initial d'un nouveau nœud, relatif à l'espacement moyen
+PLACEMENT_JITTER = 0.1
+
+# Profondeur maximale de la grille hiérarchique (4^10 cellules au plus)
+MAX_GRID_DEPTH = 10
+
+# Nombre moyen de paires exactes par nœud au-delà duquel la grille est affinée
+NEAR_PAIRS_PER_NODE = 32
+
+LAYOUT_AUTO = "auto"
+
+
+def _interaction_offsets():
+    """
+    Décalages des cellules bien séparées pour chaque position d'enfant
+
+    Pour une cellule d'indices pairs/impairs (px, py) dans son parent, les
+    enfants des 3x3 voisines du parent couvrent les décalages
+    [-2 - px, 3 - px] ; on retire les 3x3 voisines de la cellule elle-même.
+    """
+    offsets = []
+    for parity_x in (0, 1):
+        for parity_y in (0, 1):
+            pairs = [(dx, dy)
+                     for dx in range(-2 - parity_x, 4 - parity_x)
+                     for dy in range(-2 - parity_y, 4 - parity_y)
+                     if abs(dx) > 1 or abs(dy) > 1]
+            offsets.append((np.array([dx for dx, _ in pairs]), np.array([dy for _, dy in pairs])))
+    return offsets
+
+
+INTERACTION_OFFSETS = _interaction_offsets()
+
+
+class CircularLayoutEngine:
+    """
+    Nœuds répartis sur un cercle (déterministe, sans itération)
+    """
+
+    name = "circular"
+
+    def initial_positions(self, node_count, rng):
+        """
+        Voir SpringLayoutEngine.initial_positions
+        """
+        return self.run(node_count, None)[0]
+
+    def run(self, node_count, edges, positions=None, fixed=None, iterations=FULL_ITERATIONS, seed=None,
+            should_stop=None):
+        """
+        Voir SpringLayoutEngine.run
+        """
+        if node_count == 1:
+            return np.zeros((1, 2)), 0
+        angles = np.linspace(0, 2 * np.pi, node_count, endpoint=False)
+        circle = np.column_stack([np.cos(angles), np.sin(angles)])
+        if positions is not None and fixed is not None:
+            circle[fixed] = positions[fixed]
+        return circle, 0
+
+
+class SpringLayoutEngine:
+    """
+    Fruchterman-Reingold de NetworkX (O(n²) par itération)
+    """
+
+    name = "spring"
+
+    def initial_positions(self, node_count, rng):
+        """
+        Placement de départ d'une disposition complète (celui de spring_layout)
+        """
+        return rng.uniform(0, 1, (node_count, 2))
+
+    def run(self, node_count, edges, positions=None, fixed=None, iterations=FULL_ITERATIONS, seed=None,
+            should_stop=None):
+        """
+        Calcule une disposition
+
+        Args:
+            node_count (int): Nombre de nœuds (indices 0..n-1)
+            edges (np.ndarray): Arêtes (m, 2) en indices de nœuds
+            positions (np.ndarray): Positions de départ (n, 2), aléatoires si None
+            fixed (np.ndarray): Masque booléen des nœuds immobiles
+            iterations (int): Budget d'itérations
+            seed (int): Graine du placement aléatoire
+            should_stop (callable): Interroge entre deux itérations ; un
+                                    retour vrai interrompt le calcul
+
+        Returns:
+            tuple: (positions (n, 2), itérations effectuées)
+        """
+        graph = nx.Graph()
+        graph.add_nodes_from(range(node_count))
+        graph.add_edges_from(edges.tolist())
+
+        # spring_layout n'est pas interruptible : should_stop est ignoré
+        pos = None if positions is None else dict(enumerate(positions))
+        fixed_nodes = None
+        if positions is not None and fixed is not None:
+            # Avec des nœuds fixes, spring_layout ne recentre pas le résultat
+            fixed_nodes = np.flatnonzero(fixed).tolist()
+
+        layout = nx.spring_layout(graph, k=SPRING_K, pos=pos, fixed=fixed_nodes,
+                                  iterations=iterations, seed=seed)
+        return np.array([layout[node] for node in range(node_count)]), iterations
+
+
+class BarnesHutLayoutEngine:
+    """
+    ForceAtlas2 avec répulsion approchée par grille hiérarchique (Barnes-Hut)
+
+    Les nœuds sont rangés dans une grille de 2^L x 2^L cellules à chaque
+    niveau L (un quadtree complet). Un nœud subit la répulsion exacte des
+    nœuds des cellules voisines au niveau le plus fin, et celle des centres
+    de masse des cellules bien séparées (enfants des voisines de sa cellule
+    parente) à chaque niveau : chaque paire de nœuds est comptée une seule
+    fois, pour un coût O(n log n) entièrement vectorisé. La vitesse suit le
+    schéma adaptatif de ForceAtlas2 (oscillation / traction) et le calcul
+    s'arrête dès que le déplacement moyen devient négligeable.
+    """
+
+    name = "barnes_hut"
+
+    def __init__(self, repulsion=2.0, gravity=1.0, tolerance=1e-3, jitter_tolerance=1.0,
+                 max_step=0.1, leaf_size=2):
+        """
+        Args:
+            repulsion (float): Coefficient de répulsion (kr de ForceAtlas2)
+            gravity (float): Attraction vers le centre (évite la dérive des composantes)
+            tolerance (float): Arrêt quand le déplacement moyen, relatif à
+                               l'étendue de la disposition, passe sous ce seuil
+            jitter_tolerance (float): Oscillation tolérée (vitesse globale)
+            max_step (float): Déplacement maximal d'un nœud par itération,
+                              relatif à l'étendue de la disposition
+            leaf_size (int): Nombre moyen visé de nœuds par cellule la plus fine
+        """
+        self.repulsion = repulsion
+        self.gravity = gravity
+        self.tolerance = tolerance
+        self.jitter_tolerance = jitter_tolerance
+        self.max_step = max_step
+        self.leaf_size = leaf_size
+
+    def initial_positions(self, node_count, rng):
+        """
+        Placement de départ d'une disposition complète
+        """
+        return rng.uniform(-1, 1, (node_count, 2)) * np.sqrt(max(node_count, 1))
+
+    def run(self, node_count, edges, positions=None, fixed=None, iterations=FULL_ITERATIONS, seed=None,
+            should_stop=None):
+        """
+        Voir SpringLayoutEngine.run ; s'arrête avant le budget une fois convergé
+        """
+        rng = np.random.default_rng(seed)
+        if positions is None:
+            positions = self.initial_positions(node_count, rng)
+        pos = np.array(positions, dtype=float)
+        if node_count < 2:
+            return pos, 0
+
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        mass = np.bincount(edges.ravel(), minlength=node_count).astype(float) + 1.0
+        movable = np.ones(node_count, dtype=bool) if fixed is None else ~np.asarray(fixed, dtype=bool)
+        if not movable.any():
+            return pos, 0
+
+        # Nœuds superposés : sans écart, la répulsion ne peut pas les séparer
+        pos[movable] += rng.normal(scale=1e-6, size=(movable.sum(), 2))
+
+        speed = 1.0
+        previous = np.zeros_like(pos)
+        extent = np.ptp(pos, axis=0).max()
+        for iteration in range(1, iterations + 1):
+            if should_stop is not None and should_stop():
+                return pos, iteration - 1
+
+            forces = self._repulsion(pos, mass)
+            forces += self._attraction(pos, edges)
+            forces += self._gravity(pos, mass)
+            forces[~movable] = 0.0
+
+            # Vitesse adaptative de ForceAtlas2
+            swing = np.linalg.norm(forces - previous, axis=1)
+            traction = np.linalg.norm(forces + previous, axis=1) / 2
+            global_swing = np.dot(mass, swing)
+            global_traction = np.dot(mass, traction)
+            if global_swing > 0:
+                estimated = 0.05 * np.sqrt(node_count)
+                jitter = max(np.sqrt(estimated), min(10.0, estimated * global_traction / node_count ** 2))
+                target = self.jitter_tolerance * jitter * global_traction / global_swing
+                speed += min(target - speed, 0.5 * speed)
+            previous = forces
+
+            node_speed = speed / (1.0 + np.sqrt(speed * swing))
+            magnitude = np.linalg.norm(forces, axis=1)
+            with np.errstate(divide='ignore'):
+                node_speed = np.minimum(node_speed, self.max_step * max(extent, 1.0) / magnitude)
+            displacement = forces * node_speed[:, None]
+            pos += displacement
+
+            step = np.linalg.norm(displacement[movable], axis=1).mean()
+            extent = np.ptp(pos, axis=0).max()
+            if extent > 0 and step / extent < self.tolerance:
+                return pos, iteration
+
+        return pos, iterations
+
+    def _repulsion(self, pos, mass):
+        """
+        Répulsion kr * m_i * m_j / d approchée par la grille hiérarchique
+        """
+        node_count = len(pos)
+        low = pos.min(axis=0)
+        size = max(np.ptp(pos, axis=0).max(), 1e-9) * (1 + 1e-9)
+        depth, grid = self._grid(pos, low, size)
+        softening = (size / (1 << depth) * 1e-3) ** 2
+
+        forces = np.zeros_like(pos)
+        for level in range(2, depth + 1):
+            side = 1 << level
+            coords = grid >> (depth - level)
+            cell_ids = coords[:, 0] * side + coords[:, 1]
+            cell_mass = np.bincount(cell_ids, mass, minlength=side * side)
+            occupied = cell_mass > 0
+            safe_mass = np.where(occupied, cell_mass, 1.0)
+            center_x = np.bincount(cell_ids, mass * pos[:, 0], minlength=side * side) / safe_mass
+            center_y = np.bincount(cell_ids, mass * pos[:, 1], minlength=side * side) / safe_mass
+
+            # Cellules bien séparées : enfants des voisines du parent, hors
+            # voisines ; la liste (27 cellules) ne dépend que de la position
+            # de la cellule dans son parent
+            parity = (coords[:, 0] & 1) * 2 + (coords[:, 1] & 1)
+            for child, (offset_x, offset_y) in enumerate(INTERACTION_OFFSETS):
+                members = np.flatnonzero(parity == child)
+                if len(members) == 0:
+                    continue
+                qx = coords[members, 0, None] + offset_x
+                qy = coords[members, 1, None] + offset_y
+                inside = (qx >= 0) & (qx < side) & (qy >= 0) & (qy < side)
+                ids = np.where(inside, qx * side + qy, 0)
+                other_mass = np.where(inside, cell_mass[ids], 0.0)
+                delta_x = pos[members, 0, None] - center_x[ids]
+                delta_y = pos[members, 1, None] - center_y[ids]
+                weight = other_mass / (delta_x * delta_x + delta_y * delta_y + softening)
+                weight *= (self.repulsion * mass[members])[:, None]
+                forces[members, 0] += (delta_x * weight).sum(axis=1)
+                forces[members, 1] += (delta_y * weight).sum(axis=1)
+
+        # Champ proche : interactions exactes avec les nœuds des cellules voisines
+        side = 1 << depth
+        for source, target in self._near_pairs(grid, side):
+            delta = pos[source] - pos[target]
+            weight = self.repulsion * mass[source] * mass[target] / ((delta ** 2).sum(axis=1) + softening)
+            forces[:, 0] += np.bincount(source, delta[:, 0] * weight, minlength=node_count)
+            forces[:, 1] += np.bincount(source, delta[:, 1] * weight, minlength=node_count)
+
+        return forces
+
+    def _grid(self, pos, low, size):
+        """
+        Choisit la profondeur de la grille et retourne les coordonnées des nœuds
+
+        La profondeur part d'environ leaf_size nœuds par cellule et augmente
+        tant que le champ proche dépasse NEAR_PAIRS_PER_NODE paires par nœud
+        (graphes très regroupés).
+        """
+        node_count = len(pos)
+        depth = int(np.clip(np.ceil(np.log2(max(node_count / self.leaf_size, 1)) / 2), 2, MAX_GRID_DEPTH))
+        while True:
+            cells = 1 << depth
+            grid = np.minimum(((pos - low) / size * cells).astype(np.int64), cells - 1)
+            if depth == MAX_GRID_DEPTH:
+                return depth, grid
+            occupancy = np.zeros((cells + 2, cells + 2))
+            np.add.at(occupancy, (grid[:, 0] + 1, grid[:, 1] + 1), 1.0)
+            block = sum(np.roll(np.roll(occupancy, dx, 0), dy, 1) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+            if (occupancy * block).sum() <= NEAR_PAIRS_PER_NODE * node_count:
+                return depth, grid
+            depth += 1
+
+    @staticmethod
+    def _near_pairs(grid, side):
+        """
+        Paires (i, j), i != j, de nœuds situés dans des cellules voisines
+
+        Les nœuds sont triés par cellule ; pour chacune des 9 cellules voisines,
+        les paires sont énumérées par répétition d'indices, sans boucle Python
+        sur les nœuds.
+        """
+        node_count = len(grid)
+        cell_ids = grid[:, 0] * side + grid[:, 1]
+        order = np.argsort(cell_ids, kind='stable')
+        counts = np.bincount(cell_ids, minlength=side * side)
+        starts = np.cumsum(counts) - counts
+        nodes = np.arange(node_count)
+
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                qx = grid[:, 0] + dx
+                qy = grid[:, 1] + dy
+                valid = (qx >= 0) & (qx < side) & (qy >= 0) & (qy < side)
+                neighbor = np.where(valid, qx * side + qy, 0)
+                pair_counts = np.where(valid, counts[neighbor], 0)
+                total = pair_counts.sum()
+                if total == 0:
+                    continue
+                source = np.repeat(nodes, pair_counts)
+                offsets = np.arange(total) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+                target = order[np.repeat(starts[neighbor], pair_counts) + offsets]
+                distinct = source != target
+                yield source[distinct], target[distinct]
+
+    @staticmethod
+    def _attraction(pos, edges):
+        """
+        Attraction linéaire le long des arêtes
+        """
+        forces = np.zeros_like(pos)
+        if len(edges) == 0:
+            return forces
+        source, target = edges[:, 0], edges[:, 1]
+        delta = pos[source] - pos[target]
+        for axis in (0, 1):
+            forces[:, axis] = (np.bincount(target, delta[:, axis], minlength=len(pos))
+                               - np.bincount(source, delta[:, axis], minlength=len(pos)))
+        return forces
+
+    def _gravity(self, pos, mass):
+        """
+        Gravité vers l'origine, proportionnelle à la masse
+        """
+        distance = np.linalg.norm(pos, axis=1)
+        distance[distance == 0] = 1.0
+        return -self.gravity * (mass / distance)[:, None] * pos
+
+
+LAYOUT_ENGINES = {
+    CircularLayoutEngine.name: CircularLayoutEngine,
+    SpringLayoutEngine.name: SpringLayoutEngine,
+    BarnesHutLayoutEngine.name: BarnesHutLayoutEngine,
+    "forceatlas2": BarnesHutLayoutEngine
+}
+
+
+def graph_snapshot(graph):
+    """
+    Vue compacte d'un graphe pour les moteurs de disposition
+
+    En stockage colonnaire, les arêtes sont lues directement dans les
+    colonnes, sans parcourir le graphe en Python.
+
+    Args:
+        graph: Graphe NetworkX ou ColumnarGraph
+
+    Returns:
+        tuple: (liste des IDs de nœuds, arêtes (m, 2) en indices)
+    """
+    if hasattr(graph, 'edge_array'):
+        node_ids = graph.node_ids()
+        return node_ids.tolist(), np.searchsorted(node_ids, graph.edge_array())
+
+    # Parcours direct des dictionnaires d'adjacence (bien plus rapide que
+    # graph.edges()) : chaque arête y figure deux fois, on garde source < cible
+    adjacency = graph._adj
+    nodes = list(adjacency)
+    index = {node: position for position, node in enumerate(nodes)}
+    degrees = np.fromiter(map(len, adjacency.values()), dtype=np.int64, count=len(nodes))
+    targets = np.fromiter(map(index.__getitem__, chain.from_iterable(adjacency.values())),
+                          dtype=np.int64, count=int(degrees.sum()))
+    sources = np.repeat(np.arange(len(nodes), dtype=np.int64), degrees)
+    keep = sources < targets
+    return nodes, np.column_stack((sources[keep], targets[keep]))
+
+
+def compute_layout(engine_name, node_count, edges, positions=None, fixed=None,
+                   iterations=FULL_ITERATIONS, seed=None, should_stop=None):
+    """
+    Exécute un moteur de disposition sur un instantané (voir LayoutJob.payload)
+
+    Fonction de module, donc utilisable dans un processus séparé.
+
+    Returns:
+        tuple: (positions (n, 2), itérations effectuées)
+    """
+    engine = LAYOUT_ENGINES[engine_name]()
+    return engine.run(node_count, edges, positions=positions, fixed=fixed,
+                      iterations=iterations, seed=seed, should_stop=should_stop)
+
+
+class LayoutJob:
+    """
+    Calcul de disposition préparé par PositionCache.prepare()
+
+    Ne contient que des tableaux et des valeurs simples : payload() est
+    transmis tel quel à un processus de calcul.
+    """
+
+    def __init__(self, engine_name, nodes, edges, start, fixed, iterations, seed, active):
+        """
+        Args:
+            engine_name (str): Moteur à utiliser
+            nodes (list): IDs des nœuds, dans l'ordre des indices
+            edges (np.ndarray): Arêtes (m, 2) en indices
+            start (np.ndarray): Positions de départ (n, 2)
+            fixed (np.ndarray): Masque des nœuds immobiles, None pour une disposition complète
+            iterations (int): Budget d'itérations
+            seed (int): Graine
+            active (set): Nœuds à l'origine de l'affinage (remis en attente si abandonné)
+        """
+        self.engine_name = engine_name
+        self.nodes = nodes
+        self.edges = edges
+        self.start = start
+        self.fixed = fixed
+        self.iterations = iterations
+        self.seed = seed
+        self.active = active
+
+        # Version du graphe de l'instantané (renseignée par le GraphManager)
+        self.version = None
+
+    @property
+    def full(self):
+        return self.fixed is None
+
+    @property
+    def node_count(self):
+        return len(self.nodes)
+
+    def payload(self):
+        """
+        Arguments de compute_layout, sous forme compacte
+        """
+        edges = self.edges.astype(np.int32) if self.node_count < 2 ** 31 else self.edges
+        return (self.engine_name, self.node_count, edges, self.start, self.fixed, self.iterations, self.seed)
+
+
+class PositionCache:
+    """
+    Cache des positions des nœuds avec mise à jour incrémentale
+
+    Le GraphManager signale les mutations (touch, remove, clear) ; prepare()
+    ne recalcule alors que le voisinage des nœuds concernés, les autres
+    restant fixes. Une disposition complète n'a lieu qu'au premier
+    affichage, après invalidate() ou quand le mode "auto" change de moteur.
+
+    Le calcul se fait en trois temps pour pouvoir être déporté : prepare()
+    place provisoirement les nouveaux nœuds et retourne un LayoutJob,
+    compute_layout() l'exécute (ici ou dans un autre processus), puis
+    apply() ou discard() selon que l'instantané est toujours valide.
+    update() enchaîne les trois de façon synchrone.
+    """
+
+    def __init__(self, algorithm=LAYOUT_AUTO, threshold=CIRCULAR_THRESHOLD,
+                 barnes_hut_threshold=BARNES_HUT_THRESHOLD, iterations=FULL_ITERATIONS,
+                 warm_iterations=WARM_ITERATIONS, seed=None):
+        """
+        Initialise un cache vide
+
+        Args:
+            algorithm (str): "auto", "spring", "barnes_hut" (ou "forceatlas2") ou "circular"
+            threshold (int): Nombre de nœuds jusqu'auquel la disposition est circulaire
+            barnes_hut_threshold (int): Nombre de nœuds à partir duquel "auto" utilise Barnes-Hut
+            iterations (int): Budget d'itérations d'une disposition complète
+            warm_iterations (int): Budget d'itérations d'un affinage local
+            seed (int): Graine pour des dispositions reproductibles
+        """
+        if algorithm != LAYOUT_AUTO and algorithm not in LAYOUT_ENGINES:
+            raise ValueError(f"Algorithme de disposition inconnu: {algorithm}")
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self.barnes_hut_threshold = barnes_hut_threshold
+        self.iterations = iterations
+        self.warm_iterations = warm_iterations
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
+        self._engines = {}
+        self.clear()
+
+    @classmethod
+    def from_config(cls, interface_config, seed=None):
+        """
+        Crée un cache à partir de la section "interface" de la configuration
+        """
+        return cls(
+            algorithm=interface_config.get("graph_layout", LAYOUT_AUTO),
+            threshold=interface_config.get("layout_threshold", CIRCULAR_THRESHOLD),
+            barnes_hut_threshold=interface_config.get("barnes_hut_threshold", BARNES_HUT_THRESHOLD),
+            iterations=interface_config.get("layout_iterations", FULL_ITERATIONS),
+            seed=seed
+        )
+
+    def clear(self):
+        """
+        Oublie toutes les positions (graphe effacé)
+        """
+        self.positions = {}
+        self._dirty = set()
+        self._full = True
+        self._engine_name = None
+        self.last_run = None
+
+    def restore(self, positions):
+        """
+        Reprend des positions enregistrées (dossier rechargé) : rien n'est
+        recalculé pour ces nœuds tant que le graphe ne change pas
+
+        Args:
+            positions (dict): ID de nœud -> position (x, y)
+        """
+        self.positions = dict(positions)
+        self._dirty.clear()
+        self._full = not self.positions
+        self._engine_name = self.engine_for(len(self.positions)).name if self.positions else None
+
+    def invalidate(self):
+        """
+        Demande une disposition complète au prochain update()
+        """
+        self._full = True
+
+    def touch(self, *nodes):
+        """
+        Marque des nœuds à affiner (arête ajoutée, voisin supprimé)
+        """
+        self._dirty.update(nodes)
+
+    def remove(self, node_id, neighbors=()):
+        """
+        Retire un nœud du cache et marque ses anciens voisins à affiner
+        """
+        self.positions.pop(node_id, None)
+        self._dirty.discard(node_id)
+        self._dirty.update(neighbors)
+
+    def engine_for(self, node_count):
+        """
+        Moteur de disposition à utiliser pour un graphe de cette taille
+        """
+        if node_count <= self.threshold:
+            name = CircularLayoutEngine.name
+        elif self.algorithm != LAYOUT_AUTO:
+            name = self.algorithm
+        elif node_count >= self.barnes_hut_threshold:
+            name = BarnesHutLayoutEngine.name
+        else:
+            name = SpringLayoutEngine.name
+        if name == SpringLayoutEngine.name and node_count >= SPRING_SCIPY_THRESHOLD and not SCIPY_AVAILABLE:
+            name = BarnesHutLayoutEngine.name
+
+        engine = self._engines.get(name)
+        if engine is None:
+            engine = self._engines[name] = LAYOUT_ENGINES[name]()
+        return engine
+
+    def update(self, graph, snapshot=None):
+        """
+        Met à jour les positions pour l'état courant du graphe (synchrone)
+
+        Args:
+            graph: Graphe à disposer (NetworkX ou ColumnarGraph)
+            snapshot (tuple): graph_snapshot(graph) déjà calculé, le cas échéant
+
+        Returns:
+            dict: ID de nœud -> position (x, y)
+        """
+        job = self.prepare(graph, snapshot)
+        if job is not None:
+            self.apply(job, *compute_layout(*job.payload()))
+        return self.current(graph)
+
+    def current(self, graph):
+        """
+        Positions actuelles (éventuellement provisoires) des nœuds du graphe
+        """
+        return {node: self.positions[node] for node in graph}
+
+    def prepare(self, graph, snapshot=None):
+        """
+        Prépare la mise à jour des positions
+
+        Les nouveaux nœuds reçoivent immédiatement une position provisoire,
+        si bien que current() est utilisable avant la fin du calcul.
+
+        Args:
+            graph: Graphe à disposer (NetworkX ou ColumnarGraph)
+            snapshot (tuple): graph_snapshot(graph) déjà calculé, le cas échéant
+
+        Returns:
+            LayoutJob: Calcul à exécuter, ou None si les positions sont à jour
+        """
+        node_count = graph.number_of_nodes()
+        if node_count == 0:
+            self.clear()
+            return None
+
+        engine = self.engine_for(node_count)
+        if engine.name != self._engine_name:
+            # Les moteurs n'ont pas la même échelle : on repart de zéro
+            self._full = True
+            self._engine_name = engine.name
+
+        nodes, edges = snapshot if snapshot is not None else graph_snapshot(graph)
+        known = sum(map(self.positions.__contains__, nodes))
+        if known != len(self.positions):
+            # Nettoyer les positions de nœuds disparus hors de remove()
+            self.positions = {node: self.positions[node] for node in nodes if node in self.positions}
+
+        if self._full or not self.positions or engine.name == CircularLayoutEngine.name:
+            return self._prepare_full(engine, graph, nodes, edges)
+        return self._prepare_incremental(engine, graph, nodes, edges)
+
+    def apply(self, job, positions, iterations):
+        """
+        Enregistre le résultat d'un calcul
+        """
+        if job.full:
+            self.positions = dict(zip(job.nodes, positions))
+            moved = job.node_count
+        else:
+            indices = np.flatnonzero(~job.fixed)
+            for index in indices:
+                self.positions[job.nodes[index]] = positions[index]
+            moved = len(indices)
+        self.last_run = {'engine': job.engine_name, 'nodes': job.node_count, 'moved': moved,
+                         'iterations': iterations}
+
+    def discard(self, job):
+        """
+        Abandonne un calcul dont l'instantané est périmé : ses nœuds seront
+        repris par le prochain prepare()
+        """
+        if job.full:
+            self._full = True
+        else:
+            self._dirty.update(job.active)
+
+    def _prepare_full(self, engine, graph, nodes, edges):
+        """
+        Disposition complète depuis un placement aléatoire
+        """
+        start = engine.initial_positions(len(nodes), self._rng)
+        self._place_new_nodes(graph, [(index, node) for index, node in enumerate(nodes)
+                                      if node not in self.positions], start)
+        self._dirty.clear()
+        self._full = False
+        return LayoutJob(engine.name, nodes, edges, start, None, self.iterations, self.seed, set())
+
+    def _prepare_incremental(self, engine, graph, nodes, edges):
+        """
+        Place les nouveaux nœuds puis affine leur voisinage, le reste étant fixe
+        """
+        new_nodes = [node for node in nodes if node not in self.positions]
+        self._place_new_nodes(graph, list(enumerate(new_nodes)), None)
+
+        active = set(new_nodes)
+        active.update(node for node in self._dirty if node in graph)
+        self._dirty.clear()
+        if not active:
+            return None
+
+        region = set(active)
+        for node in active:
+            region.update(graph.neighbors(node))
+        fixed = np.fromiter((node not in region for node in nodes), dtype=bool, count=len(nodes))
+        start = np.array(list(map(self.positions.__getitem__, nodes)))
+        return LayoutJob(engine.name, nodes, edges, start, fixed, self.warm_iterations, self.seed, active)
+
+    def _place_new_nodes(self, graph, new_nodes, fallback):
+        """
+        Donne une position provisoire aux nœuds (index, ID) sans position
+
+        Barycentre des voisins déjà placés, ou point aléatoire dans l'emprise
+        du graphe ; sans aucune position existante, fallback[index].
+        """
+        if not new_nodes:
+            return
+        if not self.positions:
+            for index, node in new_nodes:
+                self.positions[node] = fallback[index]
+            return
+
+        coordinates = np.array(list(self.positions.values()))
+        low, high = coordinates.min(axis=0), coordinates.max(axis=0)
+        jitter = PLACEMENT_JITTER * max(np.ptp(coordinates, axis=0).max(), 1e-9) / np.sqrt(len(coordinates))
+        for _, node in new_nodes:
+            placed = [self.positions[neighbor] for neighbor in graph.neighbors(node)
+                      if neighbor in self.positions]
+            if placed:
+                center = np.mean(placed, axis=0)
+            else:
+                center = self._rng.uniform(low, high)
+            self.positions[node] = center + self._rng.normal(scale=jitter, size=2)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Niveau de détail du rendu
+Regroupe les nœuds en super-nœuds (par type ou par communauté, dans une
+grille liée à la vue) et choisit les étiquettes à afficher ; tout est
+calculé sur des tableaux NumPy
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+# Critères de regroupement
+AGGREGATE_BY_TYPE = "type"
+AGGREGATE_BY_COMMUNITY = "community"
+AGGREGATE_MODES = (AGGREGATE_BY_TYPE, AGGREGATE_BY_COMMUNITY)
+
+# Cellules de la grille de regroupement sur le plus grand côté de la vue
+GRID_CELLS = 24
+
+# Cellules de la grille des étiquettes de super-nœuds (une au plus par cellule)
+LABEL_CELLS = 8
+
+# Itérations de la propagation d'étiquettes
+COMMUNITY_ITERATIONS = 10
+
+# Super-nœuds : centres (k, 2), effectifs (k,), groupe de chacun (k,),
+# super-nœud de chaque nœud regroupé, arêtes entre super-nœuds (p, 2) et
+# nombre d'arêtes qu'elles représentent (p,)
+Aggregation = namedtuple('Aggregation', 'centers counts groups members edges edge_counts')
+
+
+def detect_communities(node_count, edges, iterations=COMMUNITY_ITERATIONS, seed=0):
+    """
+    Détection de communautés par propagation d'étiquettes
+
+    À chaque itération, une moitié des nœuds tirée au hasard adopte
+    l'étiquette la plus fréquente parmi ses voisins et lui-même (la mise à
+    jour partielle évite les oscillations de la version synchrone).
+
+    Args:
+        node_count (int): Nombre de nœuds
+        edges (np.ndarray): Arêtes (m, 2) en indices
+
+    Returns:
+        np.ndarray: Communauté de chaque nœud, numérotées à partir de 0
+    """
+    labels = np.arange(node_count, dtype=np.int64)
+    if node_count == 0 or len(edges) == 0:
+        return labels
+
+    edges = np.asarray(edges, dtype=np.int64)
+    nodes = np.arange(node_count, dtype=np.int64)
+    sources = np.concatenate((edges[:, 0], edges[:, 1], nodes))
+    targets = np.concatenate((edges[:, 1], edges[:, 0], nodes))
+    rng = np.random.default_rng(seed)
+
+    for _ in range(iterations):
+        keys, counts = np.unique(sources * node_count + labels[targets], return_counts=True)
+        owners, candidates = np.divmod(keys, node_count)
+        # Ex æquo départagés au hasard
+        order = np.lexsort((counts + rng.random(len(counts)) * 0.5, owners))
+        last = np.r_[owners[order][1:] != owners[order][:-1], True]
+        best = candidates[order][last]
+
+        update = rng.random(node_count) < 0.5
+        changed = update & (best != labels)
+        if not changed.any():
+            if (best == labels).all():
+                break
+            continue
+        labels[changed] = best[changed]
+
+    return np.unique(labels, return_inverse=True)[1]
+
+
+def main_groups(groups, limit):
+    """
+    Garde les limit - 1 groupes les plus peuplés ; les autres sont réunis
+    dans un dernier groupe (numéro limit - 1)
+
+    Args:
+        groups (np.ndarray): Groupe de chaque nœud, numérotés à partir de 0
+        limit (int): Nombre de groupes après réunion
+
+    Returns:
+        tuple: (groupe de chaque nœud renuméroté, numéro d'origine de
+                chaque groupe conservé, du plus peuplé au moins peuplé)
+    """
+    groups = np.asarray(groups, dtype=np.int64)
+    sizes = np.bincount(groups)
+    kept = top_k_by_degree(sizes, np.flatnonzero(sizes), limit - 1)
+    renumber = np.full(len(sizes), limit - 1, dtype=np.int64)
+    renumber[kept] = np.arange(len(kept))
+    return renumber[groups], kept
+
+
+def top_k_by_degree(degrees, candidates, k):
+    """
+    Les k nœuds de plus haut degré parmi des candidats
+
+    Args:
+        degrees (np.ndarray): Degré de chaque nœud
+        candidates (np.ndarray): Indices des nœuds candidats
+        k (int): Nombre de nœuds à retenir
+
+    Returns:
+        np.ndarray: Indices retenus, du plus connecté au moins connecté
+    """
+    candidates = np.asarray(candidates, dtype=np.int64)
+    if len(candidates) > k:
+        candidates = candidates[np.argpartition(-degrees[candidates], k - 1)[:k]]
+    return candidates[np.argsort(-degrees[candidates], kind='stable')]
+
+
+def spread_labels(positions, ranking, view, k, cells=LABEL_CELLS):
+    """
+    Choisit au plus k éléments à étiqueter, un seul par cellule d'une
+    grille grossière de la vue, pour que les étiquettes ne se chevauchent pas
+
+    Args:
+        positions (np.ndarray): Positions (n, 2) des éléments
+        ranking (np.ndarray): Indices des éléments par priorité décroissante
+        view (tuple): ((x0, x1), (y0, y1)) limites de la vue
+        k (int): Nombre maximal d'étiquettes
+
+    Returns:
+        np.ndarray: Indices retenus, par priorité décroissante
+    """
+    (x0, x1), (y0, y1) = view
+    cell_size = max(abs(x1 - x0), abs(y1 - y0), 1e-9) / cells
+    grid = np.floor(positions[ranking] / cell_size).astype(np.int64)
+    # np.unique garde la première occurrence, donc la plus prioritaire
+    _, first = np.unique(grid, axis=0, return_index=True)
+    return ranking[np.sort(first)][:k]
+
+
+def aggregate(positions, groups, edges, selection, view, cells=GRID_CELLS):
+    """
+    Regroupe les nœuds sélectionnés par (groupe, cellule de la grille)
+
+    La taille des cellules suit la vue : en zoomant, les cellules
+    rétrécissent et les super-nœuds se scindent. La grille est alignée sur
+    l'origine et sa taille arrondie à une puissance de 2 : un déplacement
+    de la vue ne redécoupe pas les super-nœuds, un zoom ne le fait qu'à
+    chaque doublement.
+
+    Args:
+        positions (np.ndarray): Positions (n, 2) de tous les nœuds
+        groups (np.ndarray): Groupe (type ou communauté) de chaque nœud
+        edges (np.ndarray): Arêtes (m, 2) en indices
+        selection (np.ndarray): Indices des nœuds à regrouper
+        view (tuple): ((x0, x1), (y0, y1)) limites de la vue
+        cells (int): Nombre maximal de cellules sur le plus grand côté de la vue
+
+    Returns:
+        Aggregation: Super-nœuds ; members[i] est le super-nœud de
+                     selection[i]. Seules les arêtes entre nœuds
+                     sélectionnés sont regroupées.
+    """
+    (x0, x1), (y0, y1) = view
+    cell_size = 2.0 ** np.ceil(np.log2(max(abs(x1 - x0), abs(y1 - y0), 1e-9) / cells))
+    points = positions[selection]
+    grid = np.floor(points / cell_size).astype(np.int64)
+
+    # Clé entière unique par (groupe, cellule)
+    grid -= grid.min(axis=0)
+    width, height = grid.max(axis=0) + 1
+    keys = (np.asarray(groups)[selection].astype(np.int64) * height + grid[:, 1]) * width + grid[:, 0]
+    keys, members, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    members = members.reshape(-1)
+    centers = np.column_stack([np.bincount(members, weights=points[:, axis], minlength=len(keys))
+                               for axis in range(2)]) / counts[:, None]
+
+    # Arêtes entre super-nœuds (hors arêtes internes), comptées
+    lookup = np.full(len(positions), -1, dtype=np.int64)
+    lookup[selection] = members
+    ends = lookup[np.asarray(edges, dtype=np.int64).reshape(-1, 2)]
+    ends = ends[(ends >= 0).all(axis=1) & (ends[:, 0] != ends[:, 1])]
+    ends.sort(axis=1)
+    pairs, edge_counts = np.unique(ends[:, 0] * len(keys) + ends[:, 1], return_counts=True)
+    aggregated_edges = np.column_stack(np.divmod(pairs, len(keys)))
+
+    return Aggregation(centers, counts, keys // (width * height), members, aggregated_edges, edge_counts)
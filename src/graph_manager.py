@@ -7,13 +7,63 @@ Auteur: Généré automatiquement
 Version: 0.1 (Preuve de Concept)
 """
 
+import gc
+import json
 import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkinter
-from matplotlib.figure import Figure
-import tkinter as tk
+from contextlib import contextmanager
+import numpy as np
 from datetime import datetime
-import re
+from artifact_classifier import ArtifactClassifier
+from columnar_store import ColumnarGraph, ArtifactIdView
+from graph_stats import GraphStatistics
+from graph_layout import PositionCache, CircularLayoutEngine, compute_layout, graph_snapshot
+from graph_lod import detect_communities
+
+# Taille par défaut des lots pour l'ingestion en masse
+DEFAULT_BATCH_SIZE = 10000
+
+# Taille par défaut d'une page du résumé (en lignes)
+SUMMARY_PAGE_SIZE = 200
+
+# Taille par défaut d'une page de résultats de recherche d'artéfacts
+SEARCH_PAGE_SIZE = 20
+
+# Format des dossiers d'investigation enregistrés (save_case / load_case)
+CASE_FORMAT = "chronosense-case"
+CASE_VERSION = 1
+
+# Modes de stockage du graphe
+STORAGE_NETWORKX = "networkx"   # nx.Graph, attributs en dictionnaires
+STORAGE_COLUMNAR = "columnar"   # Colonnes NumPy, identifiants entiers
+
+# Début de la description d'un nœud, par type d'artéfact
+NODE_DESCRIPTION_PREFIXES = {
+    'ip': "Adresse IP: ",
+    'hash': "Hash cryptographique: ",
+    'file': "Fichier: ",
+    'process': "Processus: ",
+    'domain': "Domaine: ",
+    'default': "Artéfact: "
+}
+
+
+@contextmanager
+def gc_paused():
+    """
+    Suspend le ramasse-miettes cyclique le temps d'un import en masse
+
+    Les centaines de milliers de dictionnaires et tuples créés déclenchent
+    sinon des collectes complètes répétées, alors qu'ils ne forment aucun
+    cycle.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
 
 class GraphManager:
     """
@@ -21,24 +71,71 @@ class GraphManager:
     Utilise NetworkX pour la structure et Matplotlib pour la visualisation
     """
     
-    def __init__(self):
+    def __init__(self, storage=STORAGE_NETWORKX, layout=None, layout_worker=None, display_config=None,
+                 verbose=False):
         """
         Initialise le gestionnaire de graphe
+        
+        Args:
+            storage (str): "networkx" (par défaut) ou "columnar" pour un
+                           stockage compact en colonnes NumPy, adapté aux
+                           graphes de plusieurs millions de nœuds
+            layout (PositionCache): Disposition à utiliser (voir
+                                    PositionCache.from_config), "auto" par défaut
+            layout_worker (LayoutWorker): Processus de calcul des dispositions ;
+                                          sans lui, le calcul est synchrone
+            display_config (dict): Section "interface" de la configuration
+                                   (niveau de détail du rendu, voir GraphRenderer)
+            verbose (bool): Annoncer chaque nœud et chaque arête ajoutés un à un
         """
-        # Créer un graphe NetworkX vide
-        self.graph = nx.Graph()
+        if storage not in (STORAGE_NETWORKX, STORAGE_COLUMNAR):
+            raise ValueError(f"Mode de stockage inconnu: {storage}")
+        self.storage = storage
+        self.verbose = verbose
+        
+        # Créer un graphe vide (NetworkX ou colonnaire avec une vue compatible)
+        if storage == STORAGE_COLUMNAR:
+            self.graph = ColumnarGraph(describe=self._generate_node_description)
+        else:
+            self.graph = nx.Graph()
         
         # Compteur pour les IDs uniques des nœuds
         self.node_counter = 0
         
-        # Mapping entre les artéfacts et leurs IDs
+        # Classifieur des types d'artéfacts
+        self.classifier = ArtifactClassifier()
+        
+        # Statistiques maintenues à chaque mutation (résumé, index trié)
+        self.stats = GraphStatistics()
+        self._summary_cache = None
+        self._snapshot_cache = None
+        self._communities_cache = None
+        
+        # Positions des nœuds conservées d'un affichage à l'autre
+        self.layout = layout if layout is not None else PositionCache()
+        self.layout_worker = layout_worker
+        
+        # Mapping entre les artéfacts et leurs IDs (en mode colonnaire,
+        # id_to_artifact est une vue sur les colonnes)
         self.artifact_to_id = {}
-        self.id_to_artifact = {}
+        if storage == STORAGE_COLUMNAR:
+            self.id_to_artifact = ArtifactIdView(self.graph)
+        else:
+            self.id_to_artifact = {}
         
         # Configuration de la visualisation
+        self.display_config = display_config or {}
         self.figure = None
         self.canvas = None
         self.ax = None
+        self.renderer = None
+        
+        # Appelé avec la liste des artéfacts sélectionnés sur le graphe
+        self.on_selection = None
+        
+        # Appelé sans argument après chaque mutation du graphe (voir
+        # RedrawScheduler : l'affichage est alors mis à jour en différé)
+        self.on_change = None
         
         # Couleurs pour différents types d'artéfacts
         self.node_colors = {
@@ -59,19 +156,100 @@ class GraphManager:
         Args:
             parent_frame: Frame Tkinter parent pour l'affichage
         """
+        # Tk n'est chargé que pour l'affichage interactif (le rendu sans
+        # interface passe par attach_canvas avec un canvas Agg)
+        import tkinter as tk
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+        
         # Créer la figure Matplotlib
-        self.figure = Figure(figsize=(8, 6), dpi=100, facecolor='white')
-        self.ax = self.figure.add_subplot(111)
+        figure = Figure(figsize=(8, 6), dpi=100, facecolor='white')
         
         # Créer le canvas Tkinter
-        self.canvas = FigureCanvasTkinter(self.figure, parent_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas = FigureCanvasTkAgg(figure, parent_frame)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         # Affichage initial
-        self._draw_empty_graph()
+        self.attach_canvas(figure, canvas)
         
         print("Affichage du graphe configuré")
     
+    def attach_canvas(self, figure, canvas):
+        """
+        Associe une figure et son canvas au graphe (Tk ou Agg sans interface)
+        
+        Args:
+            figure: Figure Matplotlib
+            canvas: Canvas de la figure
+        """
+        # Matplotlib n'est chargé qu'à la création de l'affichage
+        from graph_navigation import ViewNavigator
+        from graph_renderer import GraphRenderer
+        from graph_selection import SelectionTool
+        
+        self.figure = figure
+        self.ax = figure.add_subplot(111)
+        self.canvas = canvas
+        self.renderer = GraphRenderer.from_config(figure, self.ax, canvas, self.display_config)
+        self.navigator = ViewNavigator(self.renderer)
+        self.selection = SelectionTool(self.renderer, self._selection_changed)
+        self.update_display()
+
+    def reset_view(self):
+        """
+        Annule le zoom et le déplacement : cadre tout le graphe
+        """
+        if self.renderer is not None:
+            self.navigator.reset()
+    
+    def get_selected_artifacts(self):
+        """
+        Artéfacts sélectionnés sur le graphe, dans l'ordre de sélection
+        """
+        if self.renderer is None:
+            return []
+        return [self.id_to_artifact[node_id] for node_id in self.renderer.selected
+                if node_id in self.id_to_artifact]
+    
+    def select_artifacts(self, artifacts):
+        """
+        Remplace la sélection du graphe (artéfacts inconnus ignorés)
+        
+        Args:
+            artifacts (list): Artéfacts à sélectionner
+        """
+        if self.renderer is not None:
+            self.selection.select([self.artifact_to_id[artifact] for artifact in artifacts
+                                   if artifact in self.artifact_to_id])
+    
+    def focus_artifact(self, artifact):
+        """
+        Sélectionne un artéfact et centre la vue sur lui
+        
+        Args:
+            artifact (str): L'artéfact à montrer
+        """
+        if self.renderer is None or artifact not in self.artifact_to_id:
+            return
+        node_id = self.artifact_to_id[artifact]
+        self.select_artifacts([artifact])
+        if node_id in self.layout.positions:
+            self.navigator.center_on(self.layout.positions[node_id])
+    
+    def _changed(self):
+        """
+        Prévient on_change d'une mutation du graphe
+        """
+        if self.on_change is not None:
+            self.on_change()
+    
+    def _selection_changed(self, node_ids):
+        """
+        Transmet la nouvelle sélection (en artéfacts) à on_selection
+        """
+        if self.on_selection is not None:
+            self.on_selection([self.id_to_artifact[node_id] for node_id in node_ids])
+    
     def add_node(self, artifact):
         """
         Ajoute un nœud (artéfact) au graphe
@@ -87,26 +265,28 @@ class GraphManager:
             raise ValueError(f"L'artéfact '{artifact}' existe déjà dans le graphe")
         
         # Créer un ID unique
-        self.node_counter += 1
-        node_id = f"node_{self.node_counter}"
+        node_id = self._next_node_id()
         
-        # Déterminer le type d'artéfact
-        artifact_type = self._detect_artifact_type(artifact)
+        # Déterminer le type d'artéfact et ses étiquettes (LOLBin, outil...)
+        artifact_type, tags = self.classifier.analyze(artifact)
         
         # Ajouter au graphe NetworkX
         self.graph.add_node(
             node_id,
             artifact=artifact,
             type=artifact_type,
+            tags=tuple(sorted(tags)),
             timestamp=datetime.now().isoformat(),
             description=self._generate_node_description(artifact, artifact_type)
         )
         
-        # Mettre à jour les mappings
-        self.artifact_to_id[artifact] = node_id
-        self.id_to_artifact[node_id] = artifact
+        # Mettre à jour les mappings et les statistiques
+        self._map_artifact(artifact, node_id)
+        self.stats.node_added(artifact, artifact_type)
         
-        print(f"Nœud ajouté: {artifact} -> {node_id} (type: {artifact_type})")
+        self._changed()
+        if self.verbose:
+            print(f"Nœud ajouté: {artifact} -> {node_id} (type: {artifact_type})")
         return node_id
     
     def add_edge(self, artifact1, artifact2, relationship="connected"):
@@ -134,9 +314,170 @@ class GraphManager:
             relationship=relationship,
             timestamp=datetime.now().isoformat()
         )
+        self.stats.edge_added(node1_id, node2_id, artifact1, artifact2, relationship)
+        self.layout.touch(node1_id, node2_id)
         
-        print(f"Arête ajoutée: {artifact1} <-> {artifact2} ({relationship})")
-    
+        self._changed()
+        if self.verbose:
+            print(f"Arête ajoutée: {artifact1} <-> {artifact2} ({relationship})")
+
+    def add_nodes_bulk(self, artifacts, batch_size=DEFAULT_BATCH_SIZE, ignore_duplicates=False):
+        """
+        Ajoute un grand nombre d'artéfacts au graphe en une seule passe
+
+        Les artéfacts sont classifiés puis insérés par lots avec un seul
+        appel à add_nodes_from par lot. Une erreur sur un artéfact n'interrompt
+        pas le traitement des autres.
+
+        Args:
+            artifacts (iterable): Les artéfacts à ajouter, sous forme de chaînes
+                                  ou de tuples (artéfact, type) lorsque le type
+                                  est déjà connu (la détection est alors sautée)
+            batch_size (int): Nombre de nœuds insérés par mutation du graphe
+            ignore_duplicates (bool): Ignorer silencieusement les artéfacts déjà présents
+
+        Returns:
+            dict: IDs des nœuds créés ('added'), nombre de doublons ignorés
+                  ('skipped') et erreurs par artéfact ('errors')
+        """
+        with gc_paused():
+            errors = []
+            skipped = 0
+            pending = []
+            pending_set = set()
+
+            # Première passe: validation et dédoublonnage contre le graphe existant
+            # et contre les artéfacts déjà retenus dans cet appel
+            for item in artifacts:
+                if isinstance(item, tuple):
+                    try:
+                        artifact, artifact_type = item
+                    except ValueError:
+                        errors.append((item, f"Artéfact invalide: {item!r}"))
+                        continue
+                else:
+                    artifact, artifact_type = item, None
+
+                if not isinstance(artifact, str) or not artifact:
+                    errors.append((artifact, f"Artéfact invalide: {artifact!r}"))
+                    continue
+
+                if artifact in self.artifact_to_id or artifact in pending_set:
+                    if ignore_duplicates:
+                        skipped += 1
+                    else:
+                        errors.append((artifact, f"L'artéfact '{artifact}' existe déjà dans le graphe"))
+                    continue
+
+                pending.append((artifact, artifact_type))
+                pending_set.add(artifact)
+
+            # Classification et étiquetage en une passe ; un type fourni par
+            # l'appelant reste prioritaire sur le type détecté
+            detected, detected_tags = self.classifier.classify_many(
+                [artifact for artifact, _ in pending], return_tags=True
+            )
+
+            # Seconde passe: identifiants attribués d'un bloc, un seul horodatage
+            # pour tout l'import, étiquettes triées une fois par combinaison
+            timestamp = datetime.now().isoformat()
+            artifacts = [artifact for artifact, _ in pending]
+            types = [artifact_type or detected_type
+                     for (_, artifact_type), detected_type in zip(pending, detected.tolist())]
+            added = self._next_node_ids(len(pending))
+            sorted_tags = {}
+            describe = self.storage == STORAGE_NETWORKX  # Colonnaire: descriptions générées à la lecture
+
+            nodes = []
+            for node_id, artifact, artifact_type, tags in zip(added, artifacts, types, detected_tags):
+                tag_tuple = sorted_tags.get(tags)
+                if tag_tuple is None:
+                    tag_tuple = sorted_tags[tags] = tuple(sorted(tags))
+                attributes = {
+                    'artifact': artifact,
+                    'type': artifact_type,
+                    'tags': tag_tuple
+                }
+                if describe:
+                    attributes['description'] = self._generate_node_description(artifact, artifact_type)
+                nodes.append((node_id, attributes))
+
+            for start in range(0, len(nodes), batch_size):
+                self.graph.add_nodes_from(nodes[start:start + batch_size], timestamp=timestamp)
+            self._map_artifacts(artifacts, added)
+            self.stats.nodes_added(list(zip(artifacts, types)))
+
+            self._changed()
+            print(f"Import en masse: {len(added)} nœuds ajoutés, {skipped} ignorés, {len(errors)} erreurs")
+            return {'added': added, 'skipped': skipped, 'errors': errors}
+
+    def add_edges_bulk(self, edges, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Ajoute un grand nombre d'arêtes au graphe en une seule passe
+
+        Args:
+            edges (iterable): Tuples (artefact1, artefact2) ou
+                              (artefact1, artefact2, relation)
+            batch_size (int): Nombre d'arêtes insérées par mutation du graphe
+
+        Returns:
+            dict: Nombre d'arêtes nouvelles ('added' : une arête déjà
+                  présente ou répétée dans le lot n'est que mise à jour)
+                  et erreurs par élément ('errors')
+        """
+        with gc_paused():
+            errors = []
+            pairs = []
+            relationships = []
+            rows = []
+            artifact_to_id = self.artifact_to_id
+
+            timestamp = datetime.now().isoformat()
+
+            for edge in edges:
+                try:
+                    if len(edge) == 2:
+                        artifact1, artifact2 = edge
+                        relationship = "connected"
+                    else:
+                        artifact1, artifact2, relationship = edge
+                except (TypeError, ValueError):
+                    errors.append((edge, f"Arête invalide: {edge!r}"))
+                    continue
+
+                node1_id = artifact_to_id.get(artifact1)
+                if node1_id is None:
+                    errors.append((edge, f"L'artéfact '{artifact1}' n'existe pas dans le graphe"))
+                    continue
+                node2_id = artifact_to_id.get(artifact2)
+                if node2_id is None:
+                    errors.append((edge, f"L'artéfact '{artifact2}' n'existe pas dans le graphe"))
+                    continue
+
+                pairs.append((node1_id, node2_id))
+                relationships.append(relationship)
+                # Clé de GraphStatistics.edge_key, calculée sur place
+                key = (node1_id, node2_id) if node1_id <= node2_id else (node2_id, node1_id)
+                rows.append((key, artifact1, artifact2, relationship))
+
+            # Les arêtes consécutives de même relation partagent leurs attributs :
+            # pas de dictionnaire par arête
+            for start in range(0, len(pairs), batch_size):
+                stop = min(start + batch_size, len(pairs))
+                run_start = start
+                for position in range(start + 1, stop + 1):
+                    if position == stop or relationships[position] != relationships[run_start]:
+                        self.graph.add_edges_from(pairs[run_start:position],
+                                                  relationship=relationships[run_start],
+                                                  timestamp=timestamp)
+                        run_start = position
+            added = self.stats.edges_added(rows)
+            self.layout.touch(*{node_id for pair in pairs for node_id in pair})
+
+            self._changed()
+            print(f"Import en masse: {added} arêtes ajoutées, {len(errors)} erreurs")
+            return {'added': added, 'errors': errors}
+
     def remove_node(self, artifact):
         """
         Supprime un nœud du graphe
@@ -148,14 +489,20 @@ class GraphManager:
             raise ValueError(f"L'artéfact '{artifact}' n'existe pas dans le graphe")
         
         node_id = self.artifact_to_id[artifact]
+        node_type = self.graph.nodes[node_id].get('type', 'unknown')
+        incident_edges = list(self.graph.edges(node_id))
         
         # Supprimer du graphe
         self.graph.remove_node(node_id)
+        self.stats.node_removed(artifact, node_type, incident_edges)
+        self.layout.remove(node_id, [neighbor for _, neighbor in incident_edges])
         
         # Nettoyer les mappings
         del self.artifact_to_id[artifact]
-        del self.id_to_artifact[node_id]
+        if self.storage == STORAGE_NETWORKX:
+            del self.id_to_artifact[node_id]
         
+        self._changed()
         print(f"Nœud supprimé: {artifact}")
     
     def clear_graph(self):
@@ -163,11 +510,136 @@ class GraphManager:
         Efface complètement le graphe
         """
         self.graph.clear()
+        self.stats.clear()
+        self.layout.clear()
+        if self.layout_worker is not None:
+            self.layout_worker.cancel()
         self.artifact_to_id.clear()
-        self.id_to_artifact.clear()
+        if self.storage == STORAGE_NETWORKX:
+            self.id_to_artifact.clear()
         self.node_counter = 0
+        self._changed()
         print("Graphe effacé")
     
+    def save_case(self, path):
+        """
+        Enregistre le dossier d'investigation (artéfacts, liens, positions)
+        dans un fichier JSON
+        
+        Args:
+            path (str): Fichier de destination
+        """
+        artifacts = list(self.artifact_to_id.items())
+        positions = self.layout.positions
+        case = {
+            'format': CASE_FORMAT,
+            'version': CASE_VERSION,
+            'artifacts': [[artifact, self.graph.nodes[node_id].get('type', 'default')]
+                          for artifact, node_id in artifacts],
+            'edges': [list(edge) for edge in self.stats.edges()],
+            # Positions alignées sur les artéfacts (None : jamais disposé)
+            'positions': [positions[node_id].tolist() if node_id in positions else None
+                          for _, node_id in artifacts]
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(case, f, ensure_ascii=False)
+        print(f"Dossier enregistré: {path} ({len(artifacts)} artéfacts)")
+    
+    def load_case(self, path):
+        """
+        Remplace le graphe par un dossier enregistré avec save_case ; les
+        positions enregistrées sont reprises telles quelles
+        
+        Args:
+            path (str): Fichier du dossier
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            case = json.load(f)
+        if case.get('format') != CASE_FORMAT:
+            raise ValueError(f"Fichier de dossier Chronosense invalide: {path}")
+        if case.get('version', 0) > CASE_VERSION:
+            raise ValueError(f"Version de dossier non prise en charge: {case.get('version')}")
+        
+        self.clear_graph()
+        artifacts = [tuple(item) for item in case.get('artifacts', [])]
+        self.add_nodes_bulk(artifacts)
+        self.add_edges_bulk(tuple(edge) for edge in case.get('edges', []))
+        
+        positions = {}
+        for (artifact, _), position in zip(artifacts, case.get('positions', [])):
+            if position is not None and artifact in self.artifact_to_id:
+                positions[self.artifact_to_id[artifact]] = np.array(position, dtype=float)
+        self.layout.restore(positions)
+        print(f"Dossier chargé: {path} ({len(artifacts)} artéfacts)")
+    
+    def _next_node_id(self):
+        """
+        Attribue l'identifiant du prochain nœud
+        
+        Returns:
+            str ou int: "node_N" en mode NetworkX, entier consécutif à partir
+                        de 0 en mode colonnaire
+        """
+        self.node_counter += 1
+        if self.storage == STORAGE_COLUMNAR:
+            return self.node_counter - 1
+        return f"node_{self.node_counter}"
+    
+    def _next_node_ids(self, count):
+        """
+        Attribue les identifiants des count prochains nœuds
+        
+        Returns:
+            list: Identifiants, comme _next_node_id
+        """
+        first = self.node_counter
+        self.node_counter += count
+        if self.storage == STORAGE_COLUMNAR:
+            return list(range(first, self.node_counter))
+        return [f"node_{number}" for number in range(first + 1, self.node_counter + 1)]
+    
+    def _map_artifact(self, artifact, node_id):
+        """
+        Enregistre la correspondance artéfact <-> ID
+        """
+        self.artifact_to_id[artifact] = node_id
+        if self.storage == STORAGE_NETWORKX:
+            self.id_to_artifact[node_id] = artifact
+    
+    def _map_artifacts(self, artifacts, node_ids):
+        """
+        Enregistre les correspondances artéfact <-> ID d'un lot
+        """
+        self.artifact_to_id.update(zip(artifacts, node_ids))
+        if self.storage == STORAGE_NETWORKX:
+            self.id_to_artifact.update(zip(node_ids, artifacts))
+    
+    def _networkx_graph(self):
+        """
+        Retourne un nx.Graph utilisable par les fonctions NetworkX
+        (le graphe lui-même, ou sa conversion en mode colonnaire)
+        """
+        if self.storage == STORAGE_COLUMNAR:
+            return self.graph.to_networkx()
+        return self.graph
+    
+    def reload_keywords(self, keyword_file=None):
+        """
+        Recharge le dictionnaire de mots-clés du classifieur
+        
+        Les nœuds existants conservent leur type ; seuls les artéfacts
+        ajoutés ensuite utilisent le nouveau dictionnaire.
+        
+        Args:
+            keyword_file (str): Dictionnaire à charger (le dernier utilisé si None)
+            
+        Returns:
+            int: Nombre de mots-clés chargés
+        """
+        count = self.classifier.reload_keywords(keyword_file=keyword_file)
+        print(f"Dictionnaire de mots-clés rechargé: {count} mots-clés")
+        return count
+    
     def get_node_count(self):
         """
         Retourne le nombre de nœuds dans le graphe
@@ -180,59 +652,201 @@ class GraphManager:
         """
         return self.graph.number_of_edges()
     
+    def search_artifacts(self, prefix, start=0, count=SEARCH_PAGE_SIZE):
+        """
+        Recherche incrémentale : artéfacts commençant par un préfixe
+        (insensible à la casse), par pages
+        
+        Args:
+            prefix (str): Début de l'artéfact
+            start (int): Rang de la première correspondance
+            count (int): Taille de la page
+            
+        Returns:
+            tuple: (artéfacts de la page, nombre total de correspondances)
+        """
+        return self.stats.search(prefix, start, count)
+    
     def get_all_nodes(self):
         """
         Retourne la liste de tous les artéfacts
         """
         return list(self.artifact_to_id.keys())
     
-    def get_graph_summary(self):
+    @property
+    def version(self):
+        """
+        Version du graphe, incrémentée à chaque mutation
+        """
+        return self.stats.version
+    
+    def get_graph_summary(self, page=None, page_size=SUMMARY_PAGE_SIZE, top_k=None):
         """
         Génère un résumé textuel du graphe
         
+        Le résumé est lu depuis les statistiques incrémentales : seules les
+        lignes demandées sont produites.
+        
+        Args:
+            page (int): Numéro de page (à partir de 0), tout le résumé si None
+            page_size (int): Nombre de lignes par page
+            top_k (int): Nombre maximal d'artéfacts et de connexions listés
+            
         Returns:
             str: Résumé du graphe
         """
-        if self.get_node_count() == 0:
-            return "Graphe vide - Aucun artéfact ajouté"
+        cache_key = (self.version, page, page_size, top_k)
+        if self._summary_cache is not None and self._summary_cache[0] == cache_key:
+            return self._summary_cache[1]
         
-        summary = []
-        summary.append(f"📊 Statistiques:")
-        summary.append(f"   • Nœuds (artéfacts): {self.get_node_count()}")
-        summary.append(f"   • Liens: {self.get_edge_count()}")
-        summary.append("")
+        if page is None:
+            lines = self.get_summary_lines(top_k=top_k)
+        else:
+            lines = self.get_summary_lines(page * page_size, page_size, top_k=top_k)
         
-        # Grouper par type
-        types_count = {}
-        for node_id in self.graph.nodes():
-            node_type = self.graph.nodes[node_id].get('type', 'unknown')
-            types_count[node_type] = types_count.get(node_type, 0) + 1
+        summary = "\n".join(lines)
+        self._summary_cache = (cache_key, summary)
+        return summary
+    
+    def get_summary_line_count(self, top_k=None):
+        """
+        Retourne le nombre de lignes du résumé
+        
+        Args:
+            top_k (int): Nombre maximal d'artéfacts et de connexions listés
+        """
+        return sum(section[0] for section in self._summary_sections(top_k))
+    
+    def get_summary_lines(self, start=0, count=None, top_k=None):
+        """
+        Retourne une plage de lignes du résumé
+        
+        Args:
+            start (int): Index de la première ligne
+            count (int): Nombre de lignes, jusqu'à la fin si None
+            top_k (int): Nombre maximal d'artéfacts et de connexions listés
+            
+        Returns:
+            list: Lignes du résumé
+        """
+        stop = None if count is None else start + count
+        lines = []
+        offset = 0
+        for length, produce, _ in self._summary_sections(top_k):
+            section_start = max(start - offset, 0)
+            section_stop = length if stop is None else min(stop - offset, length)
+            if section_start < section_stop:
+                lines.extend(produce(section_start, section_stop))
+            offset += length
+            if stop is not None and offset >= stop:
+                break
+        return lines
+    
+    def find_summary_line(self, query, start=0, top_k=None):
+        """
+        Recherche la prochaine ligne du résumé contenant un texte
+        
+        La recherche parcourt directement les index (artéfacts triés,
+        connexions) sans formater les lignes intermédiaires.
+        
+        Args:
+            query (str): Texte recherché (insensible à la casse)
+            start (int): Index de la ligne à partir de laquelle chercher
+            top_k (int): Nombre maximal d'artéfacts et de connexions listés
+            
+        Returns:
+            int: Index de la ligne trouvée, ou -1
+        """
+        query = query.lower()
+        offset = 0
+        for length, _, search in self._summary_sections(top_k):
+            if start < offset + length:
+                found = search(query, max(start - offset, 0), length)
+                if found >= 0:
+                    return offset + found
+            offset += length
+        return -1
+    
+    def _summary_sections(self, top_k=None):
+        """
+        Découpe le résumé en sections (nombre de lignes, producteur, recherche)
+        
+        Chaque producteur reçoit une plage [début, fin) relative à sa section ;
+        chaque fonction de recherche reçoit (texte en minuscules, début, fin)
+        et retourne l'index relatif trouvé ou -1.
+        """
+        if self.get_node_count() == 0:
+            return [self._static_section(["Graphe vide - Aucun artéfact ajouté"])]
         
-        summary.append("📋 Types d'artéfacts:")
-        for artifact_type, count in types_count.items():
+        header = [
+            "📊 Statistiques:",
+            f"   • Nœuds (artéfacts): {self.get_node_count()}",
+            f"   • Liens: {self.get_edge_count()}",
+            "",
+            "📋 Types d'artéfacts:"
+        ]
+        for artifact_type, count in self.stats.type_counts.items():
             emoji = self._get_type_emoji(artifact_type)
-            summary.append(f"   {emoji} {artifact_type.title()}: {count}")
-        summary.append("")
+            header.append(f"   {emoji} {self._get_type_label(artifact_type)}: {count}")
+        header.append("")
+        header.append("🔍 Artéfacts détectés:")
         
-        # Lister les artéfacts
-        summary.append("🔍 Artéfacts détectés:")
-        for artifact in sorted(self.artifact_to_id.keys()):
-            node_id = self.artifact_to_id[artifact]
-            node_type = self.graph.nodes[node_id].get('type', 'unknown')
-            emoji = self._get_type_emoji(node_type)
-            summary.append(f"   {emoji} {artifact}")
+        sections = [self._static_section(header)]
         
-        # Lister les connexions
-        if self.get_edge_count() > 0:
-            summary.append("")
-            summary.append("🔗 Connexions:")
-            for edge in self.graph.edges():
-                artifact1 = self.id_to_artifact[edge[0]]
-                artifact2 = self.id_to_artifact[edge[1]]
-                relationship = self.graph.edges[edge].get('relationship', 'connected')
-                summary.append(f"   • {artifact1} <-> {artifact2} ({relationship})")
+        def artifact_lines(a, b):
+            lines = []
+            for artifact in self.stats.artifacts(a, b):
+                node_type = self.graph.nodes[self.artifact_to_id[artifact]].get('type', 'unknown')
+                lines.append(f"   {self._get_type_emoji(node_type)} {artifact}")
+            return lines
+        
+        def artifact_search(query, a, b):
+            for index, artifact in enumerate(self.stats.artifacts(a, b), a):
+                if query in artifact.lower():
+                    return index
+            return -1
+        
+        sections.extend(self._listing_sections(
+            self.stats.artifact_count, top_k, artifact_lines, artifact_search))
+        
+        if self.stats.edge_count > 0:
+            sections.append(self._static_section(["", "🔗 Connexions:"]))
+            
+            def edge_lines(a, b):
+                return [f"   • {artifact1} <-> {artifact2} ({relationship})"
+                        for artifact1, artifact2, relationship in self.stats.edges(a, b)]
+            
+            def edge_search(query, a, b):
+                for index, edge in enumerate(self.stats.edges(a, b), a):
+                    if any(query in field.lower() for field in edge):
+                        return index
+                return -1
+            
+            sections.extend(self._listing_sections(self.stats.edge_count, top_k, edge_lines, edge_search))
+        
+        return sections
+    
+    @staticmethod
+    def _static_section(lines):
+        """
+        Section formée de lignes déjà calculées
+        """
+        def search(query, a, b):
+            for index in range(a, b):
+                if query in lines[index].lower():
+                    return index
+            return -1
         
-        return "\n".join(summary)
+        return (len(lines), lambda a, b: lines[a:b], search)
+    
+    @classmethod
+    def _listing_sections(cls, total, top_k, produce, search):
+        """
+        Section d'une liste, tronquée à top_k éléments avec une ligne de renvoi
+        """
+        if top_k is None or total <= top_k:
+            return [(total, produce, search)]
+        return [(top_k, produce, search), cls._static_section([f"   … et {total - top_k} autres"])]
     
     def get_graph_description(self):
         """
@@ -272,102 +886,145 @@ class GraphManager:
         
         return "\n".join(description)
     
-    def update_display(self):
+    def graph_snapshot(self):
         """
-        Met à jour l'affichage du graphe
+        Instantané (IDs de nœuds, arêtes en indices) du graphe, partagé par
+        la disposition et le rendu tant que le graphe ne change pas
+        
+        Returns:
+            tuple: (liste des IDs de nœuds, arêtes (m, 2)) ; à ne pas modifier
         """
-        if self.ax is None:
-            return
+        if self._snapshot_cache is None or self._snapshot_cache[0] != self.version:
+            self._snapshot_cache = (self.version, graph_snapshot(self.graph))
+        return self._snapshot_cache[1]
+    
+    def graph_communities(self):
+        """
+        Communauté de chaque nœud, dans l'ordre de graph_snapshot()
+        (calculée à la demande, une fois par version du graphe)
         
-        # Effacer l'affichage précédent
-        self.ax.clear()
+        Returns:
+            np.ndarray: Numéro de communauté de chaque nœud
+        """
+        if self._communities_cache is None or self._communities_cache[0] != self.version:
+            nodes, edges = self.graph_snapshot()
+            self._communities_cache = (self.version, detect_communities(len(nodes), edges))
+        return self._communities_cache[1]
+    
+    def request_layout(self):
+        """
+        Lance la mise à jour de la disposition dans le processus de calcul
         
-        if self.get_node_count() == 0:
-            self._draw_empty_graph()
-        else:
-            self._draw_graph()
+        Les nouveaux nœuds ont aussitôt une position provisoire ; un calcul
+        en cours sur une version antérieure du graphe est abandonné. Sans
+        processus de calcul (ou pour la disposition circulaire, immédiate),
+        le calcul est fait sur place.
+        
+        Returns:
+            bool: True si un calcul est en cours
+        """
+        if self.layout_worker is None:
+            self.layout.update(self.graph, self.graph_snapshot())
+            return False
+        
+        pending = self.layout_worker.pending
+        if pending is not None:
+            if pending.version == self.version:
+                return True
+            self.layout.discard(self.layout_worker.cancel())
+        
+        job = self.layout.prepare(self.graph, self.graph_snapshot())
+        if job is None:
+            return False
+        if job.engine_name == CircularLayoutEngine.name:
+            self.layout.apply(job, *compute_layout(*job.payload()))
+            return False
+        
+        job.version = self.version
+        self.layout_worker.submit(job)
+        return True
+    
+    def apply_finished_layout(self):
+        """
+        Applique la disposition calculée en arrière-plan, si elle est prête
+        et correspond toujours à la version courante du graphe
+        
+        Returns:
+            bool: True si des positions ont changé (l'affichage est à refaire)
+        """
+        if self.layout_worker is None:
+            return False
+        try:
+            finished = self.layout_worker.poll()
+        except Exception as e:
+            print(f"❌ Erreur lors du calcul de la disposition: {e}")
+            return False
+        if finished is None:
+            return False
         
-        # Rafraîchir le canvas
-        self.canvas.draw()
+        job, (positions, iterations) = finished
+        if job.version != self.version:
+            self.layout.discard(job)
+            return False
+        self.layout.apply(job, positions, iterations)
+        return True
     
-    def _draw_empty_graph(self):
+    def relayout(self):
         """
-        Dessine un graphe vide avec un message d'accueil
+        Recalcule entièrement la disposition du graphe (sur demande explicite)
         """
-        self.ax.text(0.5, 0.5, 
-                    "🔍 Chronosense v0.1\n\nGraphe d'Investigation Vide\n\nAjoutez des artéfacts pour commencer",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    transform=self.ax.transAxes,
-                    fontsize=12,
-                    bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.7))
+        if self.layout_worker is not None and self.layout_worker.pending is not None:
+            self.layout.discard(self.layout_worker.cancel())
+        self.layout.invalidate()
+        self.update_display()
+    
+    def update_display(self):
+        """
+        Met à jour l'affichage du graphe
+        """
+        if self.renderer is None:
+            return
         
-        self.ax.set_xlim(0, 1)
-        self.ax.set_ylim(0, 1)
-        self.ax.axis('off')
-        self.ax.set_title("Graphe d'Investigation DFIR", fontsize=14, fontweight='bold')
+        if self.get_node_count() == 0:
+            self.renderer.show_empty()
+        else:
+            self._draw_graph()
     
     def _draw_graph(self):
         """
-        Dessine le graphe avec NetworkX et Matplotlib
+        Transmet l'état du graphe au rendu retenu (artistes mis à jour sur place)
         """
-        # Calculer la disposition des nœuds
-        if self.get_node_count() == 1:
-            # Un seul nœud au centre
-            pos = {list(self.graph.nodes())[0]: (0.5, 0.5)}
-        elif self.get_node_count() <= 10:
-            # Disposition circulaire pour les petits graphes
-            pos = nx.circular_layout(self.graph)
-        else:
-            # Disposition spring pour les graphes plus grands
-            pos = nx.spring_layout(self.graph, k=1, iterations=50)
-        
-        # Préparer les couleurs des nœuds
-        node_colors = []
-        for node_id in self.graph.nodes():
-            node_type = self.graph.nodes[node_id].get('type', 'default')
-            color = self.node_colors.get(node_type, self.node_colors['default'])
-            node_colors.append(color)
-        
-        # Dessiner les arêtes
-        nx.draw_networkx_edges(
-            self.graph, pos, ax=self.ax,
-            edge_color='gray',
-            width=2,
-            alpha=0.6
-        )
+        # Disposition incrémentale : seuls les nœuds nouveaux ou modifiés
+        # bougent ; en arrière-plan, les positions provisoires sont affichées
+        # en attendant le résultat
+        self.request_layout()
+        nodes, edges = self.graph_snapshot()
+        positions = self.layout.positions
         
-        # Dessiner les nœuds
-        nx.draw_networkx_nodes(
-            self.graph, pos, ax=self.ax,
-            node_color=node_colors,
-            node_size=1000,
-            alpha=0.8
-        )
-        
-        # Ajouter les labels (artéfacts)
-        labels = {}
-        for node_id in self.graph.nodes():
-            artifact = self.id_to_artifact[node_id]
-            # Tronquer les labels longs
-            if len(artifact) > 15:
-                labels[node_id] = artifact[:12] + "..."
-            else:
-                labels[node_id] = artifact
-        
-        nx.draw_networkx_labels(
-            self.graph, pos, labels, ax=self.ax,
-            font_size=8,
-            font_weight='bold'
+        self.renderer.update(
+            nodes,
+            np.array(list(map(positions.__getitem__, nodes))),
+            edges,
+            self._node_style,
+            f"Graphe d'Investigation - {self.get_node_count()} artéfacts, {self.stats.edge_count} liens",
+            communities=self.graph_communities
         )
+    
+    def _node_style(self, node_id):
+        """
+        Couleur, étiquette et type (libellé) affichés pour un nœud
         
-        # Configuration de l'affichage
-        self.ax.set_title(f"Graphe d'Investigation - {self.get_node_count()} artéfacts, {self.get_edge_count()} liens", 
-                         fontsize=12, fontweight='bold')
-        self.ax.axis('off')
+        Returns:
+            tuple: (couleur, étiquette, libellé du type)
+        """
+        node_type = self.graph.nodes[node_id].get('type', 'default')
+        color = self.node_colors.get(node_type, self.node_colors['default'])
         
-        # Ajuster les marges
-        self.figure.tight_layout()
+        # Tronquer les labels longs
+        artifact = self.id_to_artifact[node_id]
+        if len(artifact) > 15:
+            artifact = artifact[:12] + "..."
+        return color, artifact, self._get_type_label(node_type)
     
     def _detect_artifact_type(self, artifact):
         """
@@ -379,25 +1036,7 @@ class GraphManager:
         Returns:
             str: Le type détecté
         """
-        artifact_lower = artifact.lower()
-        
-        # Patterns pour différents types
-        ip_pattern = r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-        hash_pattern = r'^[a-fA-F0-9]{32,128}$'  # MD5, SHA1, SHA256, etc.
-        domain_pattern = r'^[a-zA-Z0-9][a-zA-Z0-9-]{1,61}[a-zA-Z0-9]\.[a-zA-Z]{2,}$'
-        
-        if re.match(ip_pattern, artifact):
-            return 'ip'
-        elif re.match(hash_pattern, artifact):
-            return 'hash'
-        elif re.match(domain_pattern, artifact):
-            return 'domain'
-        elif '.' in artifact and any(ext in artifact_lower for ext in ['.exe', '.dll', '.bat', '.ps1', '.doc', '.pdf']):
-            return 'file'
-        elif any(proc in artifact_lower for proc in ['powershell', 'cmd', 'rundll32', 'regsvr32', 'svchost']):
-            return 'process'
-        else:
-            return 'default'
+        return self.classifier.classify(artifact)
     
     def _generate_node_description(self, artifact, artifact_type):
         """
@@ -410,16 +1049,23 @@ class GraphManager:
         Returns:
             str: Description du nœud
         """
-        descriptions = {
-            'ip': f"Adresse IP: {artifact}",
-            'hash': f"Hash cryptographique: {artifact}",
-            'file': f"Fichier: {artifact}",
-            'process': f"Processus: {artifact}",
-            'domain': f"Domaine: {artifact}",
-            'default': f"Artéfact: {artifact}"
+        return f"{NODE_DESCRIPTION_PREFIXES.get(artifact_type, 'Artéfact: ')}{artifact}"
+    
+    def _get_type_label(self, artifact_type):
+        """
+        Retourne le libellé affiché pour un type d'artéfact
+        
+        Args:
+            artifact_type (str): Le type d'artéfact
+            
+        Returns:
+            str: Le libellé (ex: "IP", "Hash")
+        """
+        labels = {
+            'ip': 'IP'
         }
         
-        return descriptions.get(artifact_type, f"Artéfact: {artifact}")
+        return labels.get(artifact_type, artifact_type.title())
     
     def _get_type_emoji(self, artifact_type):
         """
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Navigation dans le graphe
+Zoom à la molette (centré sur le curseur) et déplacement en glissant avec
+le bouton droit ou central ; le bouton gauche reste libre pour la sélection
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+from matplotlib.backend_bases import MouseButton
+
+# Facteur de zoom par cran de molette
+ZOOM_STEP = 1.25
+
+# Boutons qui déplacent la vue en glissant
+PAN_BUTTONS = (MouseButton.RIGHT, MouseButton.MIDDLE)
+
+
+class ViewNavigator:
+    """
+    Pilote la vue d'un GraphRenderer à partir des événements souris
+
+    Chaque changement passe par GraphRenderer.set_view : le niveau de
+    détail est réévalué et seuls les éléments visibles sont redessinés.
+    """
+
+    def __init__(self, renderer, zoom_step=ZOOM_STEP):
+        """
+        Branche les événements du canvas du rendu
+
+        Args:
+            renderer: GraphRenderer à piloter
+            zoom_step (float): Facteur de zoom par cran de molette
+        """
+        self.renderer = renderer
+        self.zoom_step = zoom_step
+        # Glissement en cours : (position en pixels, vue) au départ
+        self._drag = None
+
+        canvas = renderer.canvas
+        canvas.mpl_connect('scroll_event', self._on_scroll)
+        canvas.mpl_connect('button_press_event', self._on_press)
+        canvas.mpl_connect('motion_notify_event', self._on_motion)
+        canvas.mpl_connect('button_release_event', self._on_release)
+
+    def view(self):
+        """
+        Limites actuelles de la vue ((x0, x1), (y0, y1))
+        """
+        ax = self.renderer.ax
+        return ax.get_xlim(), ax.get_ylim()
+
+    def zoom(self, factor, center):
+        """
+        Zoome autour d'un point
+
+        Args:
+            factor (float): > 1 pour rapprocher, < 1 pour éloigner
+            center (tuple): (x, y) point fixe, en coordonnées du graphe
+        """
+        limits = [tuple(c + (limit - c) / factor for limit in limits)
+                  for c, limits in zip(center, self.view())]
+        self.renderer.set_view(*limits)
+
+    def pan(self, dx, dy, view=None):
+        """
+        Déplace la vue (d'une vue de départ, ou de la vue actuelle)
+
+        Args:
+            dx (float), dy (float): Déplacement, en coordonnées du graphe
+        """
+        (x0, x1), (y0, y1) = view or self.view()
+        self.renderer.set_view((x0 + dx, x1 + dx), (y0 + dy, y1 + dy))
+
+    def center_on(self, point):
+        """
+        Centre la vue sur un point sans changer l'échelle
+        """
+        (x0, x1), (y0, y1) = self.view()
+        self.pan(point[0] - (x0 + x1) / 2, point[1] - (y0 + y1) / 2)
+
+    def reset(self):
+        """
+        Revient au cadrage automatique sur tout le graphe
+        """
+        self.renderer.set_view()
+
+    def _on_scroll(self, event):
+        """
+        Molette : zoom centré sur le curseur
+        """
+        if event.inaxes is not self.renderer.ax or not self.renderer.mode:
+            return
+        self.zoom(self.zoom_step ** event.step, (event.xdata, event.ydata))
+
+    def _on_press(self, event):
+        """
+        Début d'un glissement avec un bouton de déplacement
+        """
+        if event.inaxes is self.renderer.ax and event.button in PAN_BUTTONS and self.renderer.mode:
+            self._drag = ((event.x, event.y), self.view())
+
+    def _on_motion(self, event):
+        """
+        Glissement : la vue suit le curseur
+        """
+        if self._drag is None:
+            return
+        (x, y), view = self._drag
+        (x0, x1), (y0, y1) = view
+        # Déplacement en pixels converti à l'échelle de la vue de départ
+        box = self.renderer.ax.bbox
+        dx = (x - event.x) * (x1 - x0) / box.width
+        dy = (y - event.y) * (y1 - y0) / box.height
+        self.pan(dx, dy, view)
+
+    def _on_release(self, event):
+        """
+        Fin du glissement
+        """
+        if event.button in PAN_BUTTONS:
+            self._drag = None
@@ -0,0 +1,697 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Rendu du graphe en mode retenu
+Conserve les artistes Matplotlib (nœuds, arêtes, étiquettes) d'un
+affichage à l'autre et les met à jour sur place ; un ajout qui ne
+déplace rien n'est peint que par-dessus l'image précédente (blitting).
+Au-delà d'un certain nombre de nœuds visibles, les nœuds sont regroupés
+en super-nœuds (niveau de détail). Seuls les nœuds et arêtes qui
+touchent la vue sont transmis à Matplotlib (index spatial)
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import numpy as np
+from matplotlib import colormaps
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+
+from graph_lod import (AGGREGATE_BY_COMMUNITY, AGGREGATE_BY_TYPE, AGGREGATE_MODES,
+                       aggregate, main_groups, spread_labels, top_k_by_degree)
+from spatial_index import EdgeIndex, GridIndex
+
+# Apparence (identique à l'ancien rendu nx.draw_networkx_*)
+NODE_SIZE = 1000
+NODE_ALPHA = 0.8
+EDGE_COLOR = 'gray'
+EDGE_WIDTH = 2
+EDGE_ALPHA = 0.6
+LABEL_FONT_SIZE = 8
+
+# Niveau de détail : nœuds visibles au-delà desquels ils sont regroupés,
+# et nombre d'étiquettes affichées (nœuds de plus haut degré)
+LOD_THRESHOLD = 1000
+LABEL_TOP_K = 50
+
+# Jusqu'à ce nombre de nœuds visibles, les nœuds gardent leur taille
+# pleine ; au-delà elle diminue, sans descendre sous MIN_NODE_SIZE
+NODE_SIZE_REFERENCE = 50
+MIN_NODE_SIZE = 30
+
+# Taille d'un super-nœud d'un seul membre (croît en racine de l'effectif)
+AGGREGATE_SIZE = 60
+
+# Arêtes entre super-nœuds affichées au plus (les plus fournies)
+AGGREGATE_EDGE_LIMIT = 2000
+
+# Sélection : anneau autour des nœuds sélectionnés, plus grand que le nœud
+SELECTION_COLOR = '#1F1F1F'
+SELECTION_WIDTH = 2.5
+SELECTION_SCALE = 1.8
+
+# Couleurs des communautés
+COMMUNITY_COLORS = colormaps['tab20'].colors
+
+# Marge autour du graphe, en fraction de son étendue
+VIEW_MARGIN = 0.1
+
+EMPTY_MESSAGE = "🔍 Chronosense v0.1\n\nGraphe d'Investigation Vide\n\nAjoutez des artéfacts pour commencer"
+EMPTY_TITLE = "Graphe d'Investigation DFIR"
+
+# Mode du dernier rendu (voir GraphRenderer.last_update)
+UPDATE_FULL = "full"
+UPDATE_BLIT = "blit"
+UPDATE_NONE = "none"
+
+# Niveau de détail affiché (voir GraphRenderer.mode)
+MODE_DETAIL = "detail"
+MODE_AGGREGATE = "aggregate"
+
+
+def _edge_keys(edges):
+    """
+    Clés entières triées des arêtes (non orientées)
+    """
+    if len(edges) == 0:
+        return np.empty(0, dtype=np.int64)
+    edges = np.asarray(edges, dtype=np.int64)
+    return np.sort(np.minimum(edges[:, 0], edges[:, 1]) << 32 | np.maximum(edges[:, 0], edges[:, 1]))
+
+
+def node_size_for(visible):
+    """
+    Taille des nœuds selon le nombre de nœuds visibles
+    """
+    return float(np.clip(NODE_SIZE * NODE_SIZE_REFERENCE / max(visible, 1), MIN_NODE_SIZE, NODE_SIZE))
+
+
+class GraphRenderer:
+    """
+    Rendu retenu d'un graphe dans un axe Matplotlib
+
+    Les nœuds forment une seule PathCollection, les arêtes une seule
+    LineCollection et les étiquettes sont puisées dans une réserve de
+    Text réutilisés. Quand un affichage ne fait qu'ajouter des nœuds et
+    des arêtes sans rien déplacer, seuls les nouveaux éléments sont
+    dessinés sur l'image précédente puis copiés à l'écran ; sinon les
+    artistes sont mis à jour sur place et le canvas est redessiné
+    (draw_idle).
+
+    Niveau de détail : si plus de lod_threshold nœuds sont visibles, les
+    nœuds sont regroupés par type ou par communauté dans une grille liée à
+    la vue (les super-nœuds se scindent en zoomant), et seules les
+    label_top_k plus grosses étiquettes sont affichées. Le coût du rendu
+    dépend de ce qui est visible, pas de la taille du graphe : les nœuds
+    et arêtes qui touchent la vue sont retrouvés par un index spatial
+    (construit au premier rendu qui en a besoin, complété à chaque ajout).
+    """
+
+    def __init__(self, figure, ax, canvas, lod_threshold=LOD_THRESHOLD,
+                 label_top_k=LABEL_TOP_K, aggregate_by=AGGREGATE_BY_TYPE):
+        """
+        Crée les artistes (une seule fois)
+
+        Args:
+            figure: Figure Matplotlib
+            ax: Axe de dessin
+            canvas: Canvas de la figure (TkAgg, ou Agg sans interface)
+            lod_threshold (int): Nœuds visibles au-delà desquels ils sont regroupés
+            label_top_k (int): Nombre maximal d'étiquettes affichées
+            aggregate_by (str): "type" ou "community"
+        """
+        if aggregate_by not in AGGREGATE_MODES:
+            raise ValueError(f"Critère de regroupement inconnu: {aggregate_by}")
+        self.figure = figure
+        self.ax = ax
+        self.canvas = canvas
+        self.lod_threshold = lod_threshold
+        self.label_top_k = label_top_k
+        self.aggregate_by = aggregate_by
+
+        ax.axis('off')
+        self.edges = LineCollection([], colors=EDGE_COLOR, linewidths=EDGE_WIDTH,
+                                    alpha=EDGE_ALPHA, zorder=1)
+        ax.add_collection(self.edges)
+        self.nodes = ax.scatter([], [], s=NODE_SIZE, alpha=NODE_ALPHA, zorder=2)
+        self.empty_text = ax.text(0.5, 0.5, EMPTY_MESSAGE,
+                                  horizontalalignment='center',
+                                  verticalalignment='center',
+                                  transform=ax.transAxes,
+                                  fontsize=12,
+                                  bbox=dict(boxstyle="round,pad=0.3", facecolor="lightblue", alpha=0.7))
+
+        # Éléments ajoutés depuis le dernier rendu complet : copiés dans de
+        # petites collections, pour ne pas reconstruire les grandes à chaque
+        # ajout (le prochain rendu complet les fusionne)
+        self.recent_edges = LineCollection([], colors=EDGE_COLOR, linewidths=EDGE_WIDTH,
+                                           alpha=EDGE_ALPHA, zorder=1)
+        ax.add_collection(self.recent_edges)
+        self.recent_nodes = ax.scatter([], [], s=NODE_SIZE, alpha=NODE_ALPHA, zorder=2)
+
+        # Anneaux des nœuds sélectionnés (seulement ceux de la vue)
+        self.selection = ax.scatter([], [], s=NODE_SIZE, facecolors='none', edgecolors=SELECTION_COLOR,
+                                    linewidths=SELECTION_WIDTH, zorder=2.5)
+
+        # Éléments du dernier ajout seulement : animés, donc jamais dessinés
+        # par canvas.draw(), uniquement peints par _blit()
+        self._new_edges = LineCollection([], colors=EDGE_COLOR, linewidths=EDGE_WIDTH,
+                                         alpha=EDGE_ALPHA, animated=True)
+        ax.add_collection(self._new_edges)
+        self._new_nodes = ax.scatter([], [], s=NODE_SIZE, alpha=NODE_ALPHA, animated=True)
+
+        # Le titre change à chaque ajout : il est animé, l'image de fond
+        # ne le contient pas
+        self.title = ax.set_title(EMPTY_TITLE, fontsize=14, fontweight='bold')
+        self.title.set_animated(True)
+
+        # Étiquettes affichées (clé -> Text) et réserve de Text masqués
+        self.labels = {}
+        self._spare_labels = []
+
+        # Groupes par type : nom -> numéro, et couleur de chaque numéro
+        self._type_ids = {}
+        self._type_names = []
+        self._type_colors = []
+
+        # Vue imposée ((x0, x1), (y0, y1)), ou None pour cadrer le graphe
+        self.view = None
+
+        # Indices des nœuds affichés individuellement par le dernier rendu
+        self.shown = np.empty(0, dtype=np.int64)
+
+        # IDs des nœuds sélectionnés, dans l'ordre de sélection
+        self.selected = []
+
+        # Image de la figure sans le titre, capturée après chaque rendu
+        self._background = None
+        self.last_update = UPDATE_NONE
+
+        # Marges fixées une fois pour toutes (plus de tight_layout à chaque ajout)
+        figure.tight_layout()
+        canvas.mpl_connect('draw_event', self._on_draw)
+
+        self.show_empty()
+
+    @classmethod
+    def from_config(cls, figure, ax, canvas, interface_config):
+        """
+        Crée un rendu à partir de la section "interface" de la configuration
+        """
+        return cls(
+            figure, ax, canvas,
+            lod_threshold=interface_config.get("lod_threshold", LOD_THRESHOLD),
+            label_top_k=interface_config.get("label_top_k", LABEL_TOP_K),
+            aggregate_by=interface_config.get("aggregate_by", AGGREGATE_BY_TYPE)
+        )
+
+    def show_empty(self):
+        """
+        Affiche le message d'accueil du graphe vide
+        """
+        self._styles = {}           # ID de nœud -> (couleur RGBA, étiquette, type)
+        self._communities = None
+        self.view = None
+        self.selected = []
+        self._store([], np.empty((0, 2)), np.empty((0, 2), dtype=np.int64))
+        self._reset_recent()
+        self._set_labels([])
+        self.mode = None
+        self.aggregation = None
+        self.shown = np.empty(0, dtype=np.int64)
+        self._update_selection()
+        self.nodes.set_visible(False)
+        self.edges.set_visible(False)
+        self.empty_text.set_visible(True)
+        self.title.set_text(EMPTY_TITLE)
+        self.title.set_fontsize(14)
+        self.ax.set_xlim(0, 1)
+        self.ax.set_ylim(0, 1)
+        self._redraw()
+
+    def update(self, nodes, positions, edges, style, title, communities=None):
+        """
+        Affiche l'état courant du graphe
+
+        Args:
+            nodes (list): IDs des nœuds
+            positions (np.ndarray): Positions (n, 2), dans l'ordre de nodes
+            edges (np.ndarray): Arêtes (m, 2) en indices dans nodes
+            style (callable): ID de nœud -> (couleur, étiquette, type) ;
+                              appelé seulement pour les nœuds pas encore affichés
+            title (str): Titre du graphe
+            communities (callable): Retourne la communauté de chaque nœud
+                                    (regroupement "community" seulement)
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        for node in nodes[len(self._nodes):]:
+            if node not in self._styles:
+                self._styles[node] = self._style(style, node)
+
+        self.title.set_text(title)
+        self.title.set_fontsize(12)
+        self._communities = communities
+        added = self._added_since_last(nodes, positions, edges)
+        if added is not None and self._can_blit(positions[len(self._nodes):]):
+            self._blit(nodes, positions, added)
+            return
+
+        for node in nodes:
+            if node not in self._styles:
+                self._styles[node] = self._style(style, node)
+        current = set(nodes)
+        for node in [node for node in self._styles if node not in current]:
+            del self._styles[node]
+        self.selected = [node for node in self.selected if node in current]
+        self._store(nodes, positions, edges)
+        if self.view is None:
+            self._fit_view(positions)
+        self._render()
+
+    def set_view(self, xlim=None, ylim=None):
+        """
+        Impose les limites de la vue (zoom), ou recadre sur le graphe si
+        elles sont omises ; le niveau de détail est réévalué
+        """
+        self.view = None if xlim is None or ylim is None else (tuple(xlim), tuple(ylim))
+        if not self._nodes:
+            return
+        if self.view is None:
+            self._fit_view(self._positions)
+        else:
+            self.ax.set_xlim(*self.view[0])
+            self.ax.set_ylim(*self.view[1])
+        self._render()
+
+    def hit_test(self, x, y):
+        """
+        Nœud affiché sous un point (clic), en mode détail seulement
+
+        Args:
+            x (float), y (float): Position en coordonnées du graphe
+
+        Returns:
+            ID du nœud, ou None
+        """
+        if self.mode != MODE_DETAIL:
+            return None
+        # Rayon du disque du nœud (taille en points²) converti en unités du graphe
+        radius_pixels = np.sqrt(self._node_size) / 2 * self.figure.dpi / 72
+        (x0, x1), _ = self._view_limits()
+        radius = radius_pixels * abs(x1 - x0) / self.ax.bbox.width
+        node_index, _ = self._indexes()
+        index = node_index.nearest((x, y), radius)
+        return None if index is None else self._nodes[index]
+
+    def nodes_in(self, xlim, ylim):
+        """
+        IDs des nœuds compris dans un rectangle (sélection au lasso)
+        """
+        if not self.mode:
+            return []
+        node_index, _ = self._indexes()
+        return [self._nodes[index] for index in node_index.query(xlim, ylim).tolist()]
+
+    def set_selection(self, nodes):
+        """
+        Remplace la sélection et redessine les anneaux
+
+        Args:
+            nodes (list): IDs des nœuds sélectionnés
+        """
+        self.selected = list(nodes)
+        self._update_selection()
+        self._redraw()
+
+    def save(self, path, **savefig_options):
+        """
+        Enregistre l'image du graphe (PNG, SVG, PDF... selon l'extension)
+
+        Le titre, animé pour le blitting, serait absent de l'image : il est
+        rendu ordinaire le temps de l'enregistrement.
+
+        Args:
+            path (str): Fichier de destination
+            savefig_options: Options de Figure.savefig (dpi...)
+        """
+        self.title.set_animated(False)
+        try:
+            self.figure.savefig(path, **savefig_options)
+        finally:
+            self.title.set_animated(True)
+
+    def draw_overlay(self, *artists):
+        """
+        Peint des artistes animés (rectangle de sélection...) sur l'image
+        du dernier rendu, sans redessiner le graphe
+        """
+        if self._background is None:
+            return
+        self.canvas.restore_region(self._background)
+        for artist in artists:
+            self.ax.draw_artist(artist)
+        self.ax.draw_artist(self.title)
+        self.canvas.blit(self.figure.bbox)
+
+    def _update_selection(self):
+        """
+        Place les anneaux de sélection sur les nœuds sélectionnés visibles
+        """
+        if not self.mode:
+            self.selection.set_offsets(np.empty((0, 2)))
+            return
+        if self._rows is None:
+            self._rows = {node: index for index, node in enumerate(self._nodes)}
+        rows = np.array([self._rows[node] for node in self.selected if node in self._rows], dtype=np.int64)
+        positions = self._positions[rows]
+        self.selection.set_offsets(positions[self._in_view(positions)])
+        size = self._node_size if self.mode == MODE_DETAIL else AGGREGATE_SIZE
+        self.selection.set_sizes([size * SELECTION_SCALE])
+
+    def _style(self, style, node):
+        """
+        Style d'un nœud, couleur convertie une fois pour toutes en RGBA et
+        type numéroté
+        """
+        color, label, node_type = style(node)
+        color = to_rgba(color)
+        if node_type not in self._type_ids:
+            self._type_ids[node_type] = len(self._type_names)
+            self._type_names.append(node_type)
+            self._type_colors.append(color)
+        return color, label, self._type_ids[node_type]
+
+    def _store(self, nodes, positions, edges):
+        """
+        Mémorise l'état affiché ; index et tableaux de styles seront
+        reconstruits à la demande
+        """
+        self._nodes = list(nodes)
+        self._positions = positions
+        self._edges = edges
+        self._edge_keys = _edge_keys(edges)
+        self._degrees = np.bincount(edges.ravel(), minlength=len(nodes))
+        self._node_index = None
+        self._edge_index = None
+        self._colors = None
+        self._type_groups = None
+        self._rows = None
+
+    def _extend(self, nodes, positions, added_edges):
+        """
+        Mémorise un état qui ne fait qu'ajouter des nœuds et des arêtes ;
+        les index et tableaux déjà construits sont complétés. Les arêtes
+        ajoutées sont placées après les anciennes, qui gardent leur rang.
+        """
+        known = len(self._nodes)
+        added_nodes = nodes[known:]
+        self._nodes = list(nodes)
+        self._positions = positions
+        self._edges = np.concatenate((self._edges, added_edges))
+        self._edge_keys = _edge_keys(self._edges)
+        self._degrees = np.bincount(self._edges.ravel(), minlength=len(nodes))
+        if self._rows is not None:
+            self._rows.update((node, known + offset) for offset, node in enumerate(added_nodes))
+        if self._node_index is not None:
+            self._node_index.extend(positions[known:])
+            self._edge_index.extend(positions, added_edges)
+        if self._colors is not None:
+            self._colors = np.concatenate((self._colors, self._node_colors(added_nodes)))
+        if self._type_groups is not None:
+            added_groups = np.array([self._styles[node][2] for node in added_nodes], dtype=np.int64)
+            self._type_groups = np.concatenate((self._type_groups, added_groups))
+
+    def _indexes(self):
+        """
+        Index spatiaux des nœuds et des arêtes, construits au besoin
+        """
+        if self._node_index is None:
+            self._node_index = GridIndex(self._positions)
+            self._edge_index = EdgeIndex(self._positions, self._edges)
+        return self._node_index, self._edge_index
+
+    def _node_colors(self, nodes):
+        """
+        Couleurs RGBA (n, 4) de nœuds
+        """
+        return np.array([self._styles[node][0] for node in nodes]).reshape(-1, 4)
+
+    def _view_limits(self):
+        """
+        Limites actuelles de l'axe ((x0, x1), (y0, y1))
+        """
+        return self.ax.get_xlim(), self.ax.get_ylim()
+
+    def _added_since_last(self, nodes, positions, edges):
+        """
+        Arêtes ajoutées si le nouvel état ne fait qu'étendre le précédent
+        (aucun nœud retiré ni déplacé, aucune arête retirée), None sinon
+        """
+        known = len(self._nodes)
+        if known == 0 or len(nodes) < known or nodes[:known] != self._nodes:
+            return None
+        if not np.array_equal(positions[:known], self._positions):
+            return None
+        keys = _edge_keys(edges)
+        if len(np.setdiff1d(self._edge_keys, keys, assume_unique=True)):
+            return None
+        new_keys = np.setdiff1d(keys, self._edge_keys, assume_unique=True)
+        return np.column_stack((new_keys >> 32, new_keys & 0xFFFFFFFF))
+
+    def _can_blit(self, added_positions):
+        """
+        Vrai si les nouveaux nœuds peuvent être peints sur l'image précédente :
+        même niveau de détail, même taille de nœuds et, en cadrage
+        automatique, pas de nœud hors du cadre
+        """
+        if self._background is None or self.mode != MODE_DETAIL:
+            return False
+        in_view = self._in_view(added_positions)
+        if self.view is None and not in_view.all():
+            return False
+        visible = self._visible_count + int(in_view.sum())
+        return visible <= self.lod_threshold and node_size_for(visible) == self._node_size
+
+    def _in_view(self, positions):
+        """
+        Masque des positions comprises dans les limites actuelles de l'axe
+        """
+        (x0, x1), (y0, y1) = sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim())
+        return ((positions[:, 0] >= x0) & (positions[:, 0] <= x1) &
+                (positions[:, 1] >= y0) & (positions[:, 1] <= y1))
+
+    def _render(self):
+        """
+        Rendu complet au niveau de détail adapté à la vue
+        """
+        self._reset_recent()
+        self.empty_text.set_visible(False)
+        self.nodes.set_visible(True)
+        self.edges.set_visible(True)
+
+        node_index, _ = self._indexes()
+        visible = node_index.query(*self._view_limits())
+        self._visible_count = len(visible)
+        if len(visible) > self.lod_threshold:
+            self._render_aggregates(visible)
+        else:
+            self._render_detail(visible)
+        self._update_selection()
+        self._redraw()
+
+    def _render_detail(self, visible):
+        """
+        Un point par nœud visible, les arêtes qui traversent la vue ;
+        étiquettes des nœuds visibles de plus haut degré
+        """
+        self.mode = MODE_DETAIL
+        self.aggregation = None
+        self.shown = visible
+        self._node_size = node_size_for(len(visible))
+        positions = self._positions
+        if self._colors is None:
+            self._colors = self._node_colors(self._nodes)
+        _, edge_index = self._indexes()
+
+        self.nodes.set_offsets(positions[visible])
+        self.nodes.set_facecolors(self._colors[visible])
+        self.nodes.set_sizes([self._node_size])
+        self.edges.set_segments(positions[self._edges[edge_index.query(*self._view_limits())]])
+        self.edges.set_linewidths(EDGE_WIDTH)
+
+        top = top_k_by_degree(self._degrees, visible, self.label_top_k)
+        self._set_labels([(self._nodes[index], positions[index], self._styles[self._nodes[index]][1])
+                          for index in top.tolist()])
+
+    def _render_aggregates(self, visible):
+        """
+        Super-nœuds des nœuds visibles (et des extrémités de leurs arêtes) ;
+        étiquettes des plus gros
+        """
+        self.mode = MODE_AGGREGATE
+        self.shown = np.empty(0, dtype=np.int64)
+        if self.aggregate_by == AGGREGATE_BY_COMMUNITY and self._communities is not None:
+            # Une couleur par communauté : les plus petites sont réunies
+            groups, _ = main_groups(self._communities(), len(COMMUNITY_COLORS))
+            palette = np.array([to_rgba(color) for color in COMMUNITY_COLORS])
+            colors_of = lambda ids: palette[ids]
+            name_of = lambda group: f"Communauté {group + 1}"
+            other_group = len(palette) - 1
+        else:
+            if self._type_groups is None:
+                self._type_groups = np.array([self._styles[node][2] for node in self._nodes], dtype=np.int64)
+            groups = self._type_groups
+            colors_of = lambda ids: np.array(self._type_colors)[ids]
+            name_of = lambda group: self._type_names[group]
+            other_group = -1
+
+        # Les arêtes qui traversent la vue restent visibles : leurs
+        # extrémités hors de la vue sont regroupées aussi
+        view = self._view_limits()
+        _, edge_index = self._indexes()
+        crossing = self._edges[edge_index.query(*view)]
+        selection = np.union1d(visible, crossing.ravel())
+
+        self.aggregation = aggregation = aggregate(self._positions, groups, crossing, selection, view)
+        counts = aggregation.counts
+
+        self.nodes.set_offsets(aggregation.centers)
+        self.nodes.set_facecolors(colors_of(aggregation.groups))
+        self.nodes.set_sizes(np.minimum(AGGREGATE_SIZE * np.sqrt(counts), NODE_SIZE))
+        strongest = top_k_by_degree(aggregation.edge_counts, np.arange(len(aggregation.edges)),
+                                    AGGREGATE_EDGE_LIMIT)
+        self.edges.set_segments(aggregation.centers[aggregation.edges[strongest]])
+        self.edges.set_linewidths(np.minimum(EDGE_WIDTH * (1 + np.log10(aggregation.edge_counts[strongest])),
+                                             4 * EDGE_WIDTH))
+
+        # Étiquettes des plus gros super-nœuds (hors groupe "autres"),
+        # un seul par zone de la vue
+        named = np.flatnonzero(aggregation.groups != other_group)
+        ranking = named[np.argsort(-counts[named], kind='stable')]
+        top = spread_labels(aggregation.centers, ranking, view, self.label_top_k)
+        self._set_labels([(('aggregate', index), aggregation.centers[index],
+                           f"{name_of(aggregation.groups[index])} ({counts[index]})")
+                          for index in top.tolist()])
+
+    def _set_labels(self, items):
+        """
+        Affiche les étiquettes (clé, position, texte) en réutilisant les Text
+        existants ; les autres sont masqués et mis en réserve
+        """
+        keys = {key for key, _, _ in items}
+        for key in [key for key in self.labels if key not in keys]:
+            text = self.labels.pop(key)
+            text.set_visible(False)
+            self._spare_labels.append(text)
+
+        for key, (x, y), label in items:
+            text = self.labels.get(key)
+            if text is None:
+                text = self._take_label()
+                self.labels[key] = text
+            text.set_text(label)
+            text.set_position((x, y))
+
+    def _take_label(self):
+        """
+        Text d'étiquette, repris de la réserve ou créé
+        """
+        if self._spare_labels:
+            text = self._spare_labels.pop()
+            text.set_visible(True)
+            return text
+        return self.ax.text(0, 0, "", fontsize=LABEL_FONT_SIZE,
+                            fontweight='bold', horizontalalignment='center',
+                            verticalalignment='center', clip_on=True, zorder=3)
+
+    def _reset_recent(self):
+        """
+        Vide les collections des ajouts peints depuis le dernier rendu complet
+        """
+        self._recent_nodes = 0
+        self._recent_segments = np.empty((0, 2, 2))
+        self.recent_nodes.set_offsets(np.empty((0, 2)))
+        self.recent_edges.set_segments([])
+
+    def _fit_view(self, positions):
+        """
+        Cadre l'axe sur le graphe, avec une marge
+        """
+        low, high = positions.min(axis=0), positions.max(axis=0)
+        span = np.maximum(high - low, 1e-3)
+        low, high = low - VIEW_MARGIN * span - 0.1, high + VIEW_MARGIN * span + 0.1
+        self.ax.set_xlim(low[0], high[0])
+        self.ax.set_ylim(low[1], high[1])
+
+    def _redraw(self):
+        """
+        Demande un rendu complet ; l'image de fond est recapturée à la fin
+        """
+        self._background = None
+        self.last_update = UPDATE_FULL
+        self.canvas.draw_idle()
+
+    def _blit(self, nodes, positions, added_edges):
+        """
+        Dessine uniquement les nouveaux nœuds, arêtes et étiquettes sur
+        l'image précédente
+        """
+        known = len(self._nodes)
+        added_nodes = nodes[known:]
+        added_positions = positions[known:]
+        added_segments = positions[added_edges].reshape(-1, 2, 2)
+        added_colors = self._node_colors(added_nodes)
+        in_view = self._in_view(added_positions)
+
+        self._new_edges.set_segments(added_segments)
+        self._new_nodes.set_offsets(added_positions)
+        self._new_nodes.set_facecolors(added_colors)
+        self._new_nodes.set_sizes([self._node_size])
+
+        # Tant que tous les nœuds visibles sont étiquetés, les nouveaux le
+        # sont aussi ; sinon le classement par degré attend le rendu complet
+        labels = []
+        if len(self.labels) == self._visible_count:
+            room = self.label_top_k - len(self.labels)
+            for index in np.flatnonzero(in_view)[:max(room, 0)].tolist():
+                text = self._take_label()
+                text.set_text(self._styles[added_nodes[index]][1])
+                text.set_position(tuple(added_positions[index]))
+                text.set_animated(True)
+                labels.append((added_nodes[index], text))
+
+        # Les collections "récentes" gardent les ajouts pour les rendus
+        # complets (redimensionnement de la fenêtre...)
+        self._recent_nodes += len(added_nodes)
+        self._recent_segments = np.concatenate((self._recent_segments, added_segments))
+        self.recent_nodes.set_offsets(positions[len(nodes) - self._recent_nodes:])
+        self.recent_nodes.set_facecolors(self._node_colors(nodes[len(nodes) - self._recent_nodes:]))
+        self.recent_nodes.set_sizes([self._node_size])
+        self.recent_edges.set_segments(self._recent_segments)
+
+        self.canvas.restore_region(self._background)
+        self.ax.draw_artist(self._new_edges)
+        self.ax.draw_artist(self._new_nodes)
+        for node, text in labels:
+            self.ax.draw_artist(text)
+            text.set_animated(False)
+            self.labels[node] = text
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.ax.draw_artist(self.title)
+        self.canvas.blit(self.figure.bbox)
+
+        self._extend(nodes, positions, added_edges)
+        self.shown = np.concatenate((self.shown, known + np.flatnonzero(in_view)))
+        self._visible_count += int(in_view.sum())
+        self.last_update = UPDATE_BLIT
+
+    def _on_draw(self, event):
+        """
+        Après un rendu complet : capture le fond puis dessine le titre
+        """
+        if event.canvas is not self.canvas or not self.title.get_animated():
+            # Enregistrement d'une image (save) : rien à capturer
+            return
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.ax.draw_artist(self.title)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Sélection de nœuds sur le graphe
+Clic gauche sur un nœud, ou rectangle tracé en glissant ; Maj ou Ctrl
+ajoute à la sélection au lieu de la remplacer
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+from matplotlib.backend_bases import MouseButton
+from matplotlib.patches import Rectangle
+
+# En dessous de ce déplacement (pixels), un glissement est un simple clic
+CLICK_TOLERANCE = 4
+
+# Touches qui ajoutent à la sélection (clic : ajoute ou retire le nœud)
+ADD_MODIFIERS = ('shift', 'control', 'ctrl')
+
+
+class SelectionTool:
+    """
+    Sélection à la souris sur un GraphRenderer
+
+    Le clic teste le nœud sous le curseur et le rectangle interroge l'index
+    spatial du rendu : le coût ne dépend pas de la taille du graphe. Le
+    rectangle est peint par-dessus l'image du dernier rendu pendant le
+    glissement, sans redessiner le graphe.
+    """
+
+    def __init__(self, renderer, on_change=None):
+        """
+        Branche les événements du canvas du rendu
+
+        Args:
+            renderer: GraphRenderer
+            on_change (callable): Appelé avec la liste des IDs sélectionnés
+                                  après chaque changement
+        """
+        self.renderer = renderer
+        self.on_change = on_change
+        # Glissement en cours : (pixels, coordonnées du graphe) au départ
+        self._press = None
+
+        self.band = Rectangle((0, 0), 0, 0, fill=False, linestyle='--', linewidth=1,
+                              edgecolor='black', animated=True, visible=False)
+        renderer.ax.add_patch(self.band)
+
+        canvas = renderer.canvas
+        canvas.mpl_connect('button_press_event', self._on_press)
+        canvas.mpl_connect('motion_notify_event', self._on_motion)
+        canvas.mpl_connect('button_release_event', self._on_release)
+
+    def click(self, x, y, add=False):
+        """
+        Sélectionne le nœud sous un point (rien sous le point : sélection vidée)
+
+        Args:
+            x (float), y (float): Position en coordonnées du graphe
+            add (bool): Ajoute (ou retire) le nœud au lieu de remplacer la sélection
+        """
+        node = self.renderer.hit_test(x, y)
+        selected = list(self.renderer.selected) if add else []
+        if node is not None:
+            if node in selected:
+                selected.remove(node)
+            else:
+                selected.append(node)
+        self.select(selected)
+
+    def select_rect(self, xlim, ylim, add=False):
+        """
+        Sélectionne les nœuds d'un rectangle
+
+        Args:
+            xlim (tuple), ylim (tuple): Limites du rectangle
+            add (bool): Ajoute à la sélection au lieu de la remplacer
+        """
+        selected = list(self.renderer.selected) if add else []
+        known = set(selected)
+        selected.extend(node for node in self.renderer.nodes_in(xlim, ylim) if node not in known)
+        self.select(selected)
+
+    def select(self, nodes):
+        """
+        Remplace la sélection et prévient on_change
+        """
+        self.renderer.set_selection(nodes)
+        if self.on_change is not None:
+            self.on_change(list(nodes))
+
+    def _on_press(self, event):
+        """
+        Début d'un clic ou d'un rectangle
+        """
+        if event.inaxes is self.renderer.ax and event.button == MouseButton.LEFT and self.renderer.mode:
+            self._press = ((event.x, event.y), (event.xdata, event.ydata))
+
+    def _on_motion(self, event):
+        """
+        Glissement : le rectangle suit le curseur
+        """
+        if self._press is None or event.xdata is None:
+            return
+        _, (x0, y0) = self._press
+        self.band.set_bounds(min(x0, event.xdata), min(y0, event.ydata),
+                             abs(event.xdata - x0), abs(event.ydata - y0))
+        self.band.set_visible(True)
+        self.renderer.draw_overlay(self.band)
+
+    def _on_release(self, event):
+        """
+        Fin : clic si le curseur n'a presque pas bougé, rectangle sinon
+        """
+        if self._press is None or event.button != MouseButton.LEFT:
+            return
+        (px, py), (x0, y0) = self._press
+        self._press = None
+        self.band.set_visible(False)
+        add = event.key is not None and any(key in event.key for key in ADD_MODIFIERS)
+
+        if abs(event.x - px) <= CLICK_TOLERANCE and abs(event.y - py) <= CLICK_TOLERANCE:
+            self.click(x0, y0, add)
+        elif event.xdata is not None:
+            self.select_rect((x0, event.xdata), (y0, event.ydata), add)
+        else:
+            # Relâché hors du graphe : le rectangle est abandonné
+            self.renderer.draw_overlay()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Statistiques incrémentales du graphe
+Maintient les compteurs par type, l'index trié des artéfacts et la liste
+des connexions au fil des mutations, pour un résumé lisible sans parcourir
+tout le graphe
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import bisect
+from collections import Counter
+
+
+class GraphStatistics:
+    """
+    Index incrémental alimenté par GraphManager
+
+    Chaque mutation du graphe (ajout, suppression, effacement) met à jour
+    les structures en O(log n) ou O(n) mémoire déplacée au pire, au lieu
+    d'un recalcul complet à chaque lecture du résumé. Les artéfacts ajoutés
+    ne sont triés qu'à la lecture suivante, en un seul tri pour tout le lot.
+    """
+
+    def __init__(self):
+        """
+        Initialise des statistiques vides
+        """
+        self.clear()
+
+    def clear(self):
+        """
+        Remet toutes les statistiques à zéro
+        """
+        # Nombre de nœuds par type, dans l'ordre d'apparition des types
+        self.type_counts = {}
+
+        # Artéfacts triés (index de préfixes et pagination du résumé)
+        self._sorted_artifacts = []
+
+        # Clés de recherche triées, insensibles à la casse (voir search_key)
+        self._search_keys = []
+
+        # Artéfacts ajoutés depuis la dernière lecture, pas encore rangés dans
+        # les deux index ci-dessus : un ajout coûte O(1), le tri est fait en
+        # une fois à la lecture suivante
+        self._unsorted = []
+
+        # Connexions: liste positionnelle + index clé -> position
+        # (None marque une connexion supprimée jusqu'au prochain compactage)
+        self._edges = []
+        self._edge_positions = {}
+        self._removed_edges = 0
+
+        # Incrémenté à chaque mutation, y compris l'effacement (invalidation
+        # des caches) ; jamais remis à zéro
+        self.version = getattr(self, 'version', -1) + 1
+
+    @staticmethod
+    def edge_key(node1_id, node2_id):
+        """
+        Clé d'une arête non orientée
+        """
+        return (node1_id, node2_id) if node1_id <= node2_id else (node2_id, node1_id)
+
+    @staticmethod
+    def search_key(artifact):
+        """
+        Clé de recherche d'un artéfact : forme sans casse, puis l'artéfact
+        lui-même s'il en diffère (séparés par un caractère nul, qui se
+        trie avant tous les autres)
+        """
+        folded = artifact.casefold()
+        return f"{folded}\0{artifact}" if folded != artifact else f"{folded}\0"
+
+    # ------------------------------------------------------------------
+    # Mises à jour
+    # ------------------------------------------------------------------
+
+    def node_added(self, artifact, artifact_type):
+        """
+        Enregistre l'ajout d'un nœud
+        """
+        self.type_counts[artifact_type] = self.type_counts.get(artifact_type, 0) + 1
+        self._unsorted.append(artifact)
+        self.version += 1
+
+    def nodes_added(self, nodes):
+        """
+        Enregistre l'ajout d'un lot de nœuds (artéfact, type)
+        """
+        if not nodes:
+            return
+        type_counts = self.type_counts
+        for artifact_type, count in Counter(artifact_type for _, artifact_type in nodes).items():
+            type_counts[artifact_type] = type_counts.get(artifact_type, 0) + count
+        self._unsorted.extend(artifact for artifact, _ in nodes)
+        self.version += 1
+
+    def _sort_pending(self):
+        """
+        Range dans les index triés les artéfacts ajoutés depuis la dernière lecture
+        """
+        if not self._unsorted:
+            return
+        pending, self._unsorted = self._unsorted, []
+        pending.sort()
+        if self._sorted_artifacts:
+            # Deux séquences triées concaténées: le tri fusionne en temps linéaire
+            self._sorted_artifacts.extend(pending)
+            self._sorted_artifacts.sort()
+        else:
+            self._sorted_artifacts = pending
+        keys = sorted(map(self.search_key, pending))
+        if self._search_keys:
+            self._search_keys.extend(keys)
+            self._search_keys.sort()
+        else:
+            self._search_keys = keys
+
+    def node_removed(self, artifact, artifact_type, edges):
+        """
+        Enregistre la suppression d'un nœud et de ses arêtes
+
+        Args:
+            artifact (str): L'artéfact supprimé
+            artifact_type (str): Son type
+            edges (iterable): Arêtes (id1, id2) incidentes au nœud
+        """
+        count = self.type_counts.get(artifact_type, 0) - 1
+        if count > 0:
+            self.type_counts[artifact_type] = count
+        else:
+            self.type_counts.pop(artifact_type, None)
+
+        self._sort_pending()
+        index = bisect.bisect_left(self._sorted_artifacts, artifact)
+        if index < len(self._sorted_artifacts) and self._sorted_artifacts[index] == artifact:
+            del self._sorted_artifacts[index]
+        key = self.search_key(artifact)
+        index = bisect.bisect_left(self._search_keys, key)
+        if index < len(self._search_keys) and self._search_keys[index] == key:
+            del self._search_keys[index]
+
+        for node1_id, node2_id in edges:
+            position = self._edge_positions.pop(self.edge_key(node1_id, node2_id), None)
+            if position is not None:
+                self._edges[position] = None
+                self._removed_edges += 1
+        self.version += 1
+
+    def edge_added(self, node1_id, node2_id, artifact1, artifact2, relationship):
+        """
+        Enregistre l'ajout (ou la mise à jour) d'une arête
+        """
+        key = self.edge_key(node1_id, node2_id)
+        position = self._edge_positions.get(key)
+        if position is None:
+            self._edge_positions[key] = len(self._edges)
+            self._edges.append((key, artifact1, artifact2, relationship))
+        else:
+            self._edges[position] = (key, artifact1, artifact2, relationship)
+        self.version += 1
+
+    def edges_added(self, edges):
+        """
+        Enregistre l'ajout (ou la mise à jour) d'un lot d'arêtes
+
+        Args:
+            edges (iterable): Tuples (clé edge_key, artéfact1, artéfact2, relation)
+
+        Returns:
+            int: Nombre d'arêtes nouvelles (ni déjà présentes, ni répétées
+                 plus tôt dans le lot)
+        """
+        # Dernière occurrence de chaque clé, dans l'ordre des premières
+        last = {edge[0]: edge for edge in edges}
+        positions = self._edge_positions
+        rows = self._edges
+        new_rows = []
+        for key, edge in last.items():
+            position = positions.get(key)
+            if position is None:
+                new_rows.append(edge)
+            else:
+                rows[position] = edge
+        positions.update(zip([edge[0] for edge in new_rows], range(len(rows), len(rows) + len(new_rows))))
+        rows.extend(new_rows)
+        added = len(new_rows)
+        self.version += 1
+        return added
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+
+    @property
+    def sorted_artifacts(self):
+        """
+        Tous les artéfacts, triés
+        """
+        self._sort_pending()
+        return self._sorted_artifacts
+
+    @property
+    def artifact_count(self):
+        return len(self._sorted_artifacts) + len(self._unsorted)
+
+    @property
+    def edge_count(self):
+        return len(self._edge_positions)
+
+    def edges(self, start=0, stop=None):
+        """
+        Connexions (artéfact1, artéfact2, relation) dans l'ordre d'ajout
+
+        Args:
+            start (int): Première position
+            stop (int): Position de fin (exclue), toutes si None
+
+        Returns:
+            list: Connexions de la plage demandée
+        """
+        self._compact_edges()
+        return [edge[1:] for edge in self._edges[start:stop]]
+
+    def artifacts(self, start=0, stop=None):
+        """
+        Artéfacts triés de la plage demandée
+        """
+        self._sort_pending()
+        return self._sorted_artifacts[start:stop]
+
+    def search(self, prefix, start=0, count=None):
+        """
+        Artéfacts commençant par un préfixe (insensible à la casse)
+
+        Deux recherches dichotomiques bornent les correspondances : le coût
+        ne dépend que de la taille de la page demandée.
+
+        Args:
+            prefix (str): Début de l'artéfact
+            start (int): Rang de la première correspondance retournée
+            count (int): Nombre de correspondances, toutes si None
+
+        Returns:
+            tuple: (correspondances de la page, dans l'ordre sans casse,
+                    nombre total de correspondances)
+        """
+        self._sort_pending()
+        folded = prefix.casefold()
+        low = bisect.bisect_left(self._search_keys, folded)
+        high = bisect.bisect_left(self._search_keys, folded + '\U0010ffff', low)
+        first = min(low + start, high)
+        last = high if count is None else min(first + count, high)
+        matches = []
+        for key in self._search_keys[first:last]:
+            folded_artifact, _, artifact = key.partition('\0')
+            matches.append(artifact or folded_artifact)
+        return matches, high - low
+
+    def _compact_edges(self):
+        """
+        Retire les connexions supprimées et renumérote l'index
+        """
+        if not self._removed_edges:
+            return
+        self._edges = [edge for edge in self._edges if edge is not None]
+        self._edge_positions = {edge[0]: position for position, edge in enumerate(self._edges)}
+        self._removed_edges = 0
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Cache des hypothèses générées
+Conserve sur disque les réponses de l'IA, adressées par une empreinte du
+graphe décrit (indépendante de l'ordre des artéfacts et des liens) et des
+réglages de génération ; taille bornée, les entrées les moins récemment
+utilisées étant évincées
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Répertoire du cache (relatif à la racine du projet) et taille maximale
+PROJECT_DIR = os.path.join(os.path.dirname(__file__), '..')
+DEFAULT_CACHE_DIR = os.path.join("cache", "hypotheses")
+DEFAULT_MAX_MB = 50
+
+# Les réponses simulées, instantanées et horodatées, ne sont pas conservées
+UNCACHED_MODES = ("simulation",)
+
+# Séparateurs de get_graph_description
+ITEM_SEPARATOR = ", "
+LINK_SEPARATOR = " est lié à "
+
+ENTRY_FORMAT = "chronosense-hypotheses"
+
+
+def canonical_description(description):
+    """
+    Forme canonique d'une description de graphe (GraphManager.get_graph_description)
+
+    Les artéfacts de chaque type, les extrémités de chaque lien et les
+    lignes elles-mêmes sont triés : deux graphes identiques construits dans
+    un ordre différent ont la même forme canonique.
+
+    Returns:
+        str: Lignes canoniques, triées
+    """
+    lines = []
+    for line in description.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("- ") and LINK_SEPARATOR in line:
+            # "- a est lié à b (relation)" : liens non orientés
+            first, rest = line[2:].split(LINK_SEPARATOR, 1)
+            second, _, relationship = rest.rpartition(" (")
+            first, second = sorted((first, second or rest))
+            lines.append(f"- {first}{LINK_SEPARATOR}{second} ({relationship}")
+        elif line.startswith("- ") and ": " in line:
+            # "- Type: a, b, c"
+            artifact_type, artifacts = line[2:].split(": ", 1)
+            lines.append(f"- {artifact_type}: {ITEM_SEPARATOR.join(sorted(artifacts.split(ITEM_SEPARATOR)))}")
+        else:
+            lines.append(line)
+    return "\n".join(sorted(lines))
+
+
+def cache_key(description, model_name, mode, temperature, max_tokens):
+    """
+    Empreinte SHA-256 d'une demande de génération
+
+    Returns:
+        str: Clé hexadécimale, ou None si le mode n'est pas mis en cache
+    """
+    if mode in UNCACHED_MODES:
+        return None
+    payload = json.dumps([canonical_description(description), model_name, mode, temperature, max_tokens],
+                         ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class HypothesisCache:
+    """
+    Cache disque des hypothèses, un fichier JSON par clé
+
+    Un index en mémoire (clé -> taille), rangé de la moins à la plus
+    récemment utilisée, est reconstruit au démarrage à partir des dates de
+    modification des fichiers ; une lecture réussie rafraîchit la date du
+    fichier. Au-delà de max_bytes, les entrées les plus anciennes sont
+    supprimées.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        """
+        Ouvre (ou crée) le cache
+
+        Args:
+            directory (str): Répertoire du cache, relatif à la racine du projet
+            max_bytes (int): Taille maximale des entrées
+        """
+        self.directory = os.path.join(PROJECT_DIR, directory or DEFAULT_CACHE_DIR)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = OrderedDict()
+        self.size = 0
+
+        # Compteurs
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._load_index()
+
+    @classmethod
+    def from_config(cls, ai_config):
+        """
+        Crée le cache à partir de la section "ai" de la configuration
+
+        Returns:
+            HypothesisCache: Cache, ou None s'il est désactivé
+        """
+        if not ai_config.get("cache_enabled", True):
+            return None
+        return cls(ai_config.get("cache_dir"), int(ai_config.get("cache_max_mb", DEFAULT_MAX_MB) * 1024 * 1024))
+
+    def _path(self, key):
+        # Sous-répertoires par préfixe : pas de répertoire géant
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def _load_index(self):
+        entries = []
+        if os.path.isdir(self.directory):
+            for prefix in os.scandir(self.directory):
+                if not prefix.is_dir():
+                    continue
+                for entry in os.scandir(prefix.path):
+                    if entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self.size += size
+
+    def get(self, key):
+        """
+        Lit une entrée
+
+        Returns:
+            dict: {"response", "created", "model_name", "mode"}, ou None
+        """
+        with self._lock:
+            if key is None or key not in self._index:
+                self.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                os.utime(path)
+            except (OSError, ValueError):
+                # Fichier supprimé ou abîmé hors de l'application
+                self._forget(key)
+                self.misses += 1
+                return None
+            self._index.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, response, model_name=None, mode=None):
+        """
+        Enregistre une réponse (écriture atomique), puis évince au besoin
+        """
+        if key is None:
+            return
+        data = json.dumps({
+            "format": ENTRY_FORMAT,
+            "response": response,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "model_name": model_name,
+            "mode": mode
+        }, ensure_ascii=False).encode("utf-8")
+
+        with self._lock:
+            path = self._path(key)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            self.size -= self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self.size += len(data)
+            while self.size > self.max_bytes and len(self._index) > 1:
+                oldest = next(iter(self._index))
+                self._forget(oldest)
+                self.evictions += 1
+
+    def _forget(self, key):
+        self.size -= self._index.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Vide le cache
+        """
+        with self._lock:
+            for key in list(self._index):
+                self._forget(key)
+
+    def __len__(self):
+        return len(self._index)
+
+    def stats(self):
+        """
+        Compteurs du cache
+
+        Returns:
+            dict: entries, size_bytes, hits, misses, evictions
+        """
+        with self._lock:
+            return {
+                "entries": len(self._index),
+                "size_bytes": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Moteur de mots-clés
+Automate d'Aho-Corasick pour rechercher en une seule passe des milliers
+de mots-clés (LOLBins, outils, extensions suspectes) dans un artéfact
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import os
+
+import numpy as np
+
+# Taille maximale de la table de transitions de match_many (états x
+# caractères) ; au-delà, match_many parcourt l'automate texte par texte
+MAX_TABLE_CELLS = 1 << 23
+
+# Caractères (textes x longueur) traités ensemble par match_many
+BLOCK_CELLS = 1 << 22
+
+
+class KeywordMatcher:
+    """
+    Recherche multi-motifs par automate d'Aho-Corasick
+
+    L'automate est construit une fois pour un jeu de mots-clés ; la
+    recherche parcourt ensuite chaque caractère du texte une seule fois,
+    quel que soit le nombre de mots-clés. La recherche est insensible à
+    la casse.
+    """
+
+    def __init__(self, keywords):
+        """
+        Construit l'automate
+
+        Args:
+            keywords (dict): Catégorie -> liste de mots-clés
+        """
+        # Transitions, lien d'échec et sorties (catégories) de chaque état
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [frozenset()]
+
+        self.keyword_count = 0
+        self.categories = frozenset(keywords)
+
+        # Transitions complètes (liens d'échec déjà suivis), calculées à la
+        # demande lors des recherches
+        self._delta = None
+
+        # Table de transitions dense et sorties en bits (voir match_many),
+        # construites au premier appel ; False si trop grande
+        self._table = None
+
+        for category, words in keywords.items():
+            for word in words:
+                word = word.strip().lower()
+                if word:
+                    self._insert(word, category)
+
+        self._build_failure_links()
+
+    def _insert(self, word, category):
+        """
+        Ajoute un mot-clé dans le trie
+        """
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(frozenset())
+            state = next_state
+
+        if category not in self._outputs[state]:
+            self._outputs[state] = self._outputs[state] | {category}
+            self.keyword_count += 1
+
+    def _build_failure_links(self):
+        """
+        Calcule les liens d'échec par parcours en largeur et fusionne les sorties
+        """
+        queue = list(self._goto[0].values())
+        position = 0
+        while position < len(queue):
+            state = queue[position]
+            position += 1
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state] = self._outputs[next_state] | self._outputs[self._fail[next_state]]
+
+        self._delta = [dict(transitions) for transitions in self._goto]
+
+    def _transition(self, state, char):
+        """
+        Transition de l'automate en suivant les liens d'échec, mémorisée
+        dans la table des transitions complètes
+        """
+        current = state
+        while current and char not in self._goto[current]:
+            current = self._fail[current]
+        next_state = self._goto[current].get(char, 0)
+        self._delta[state][char] = next_state
+        return next_state
+
+    def match_categories(self, text):
+        """
+        Retourne les catégories de tous les mots-clés présents dans le texte
+
+        Args:
+            text (str): Texte à analyser
+
+        Returns:
+            frozenset: Catégories trouvées
+        """
+        return self._match_lowered(text.lower())
+
+    def _match_lowered(self, text):
+        """
+        Parcours de l'automate sur un texte déjà en minuscules
+        """
+        delta = self._delta
+        outputs = self._outputs
+
+        found = frozenset()
+        state = 0
+        for char in text:
+            next_state = delta[state].get(char)
+            state = self._transition(state, char) if next_state is None else next_state
+            if outputs[state]:
+                found = found | outputs[state]
+        return found
+
+    def match_many(self, texts):
+        """
+        Catégories des mots-clés présents dans chacun des textes
+
+        Même résultat que match_categories appliqué à chaque texte, mais
+        l'automate avance d'un caractère dans tous les textes à la fois :
+        les textes, regroupés par longueurs voisines, deviennent une matrice
+        de codes de caractères, et chaque pas est une indexation NumPy dans
+        la table de transitions complète. Le coût reste proportionnel au
+        nombre de caractères, indépendant du nombre de mots-clés.
+
+        Args:
+            texts (list): Textes à analyser
+
+        Returns:
+            list: frozenset des catégories trouvées, dans l'ordre des textes
+        """
+        if self._table is None:
+            self._build_table()
+        lowered = [text.lower() for text in texts]
+        if self._table is False:
+            return [self._match_lowered(text) for text in lowered]
+
+        table, width, columns, output_bits, bit_categories = self._table
+        found = [frozenset()] * len(lowered)
+        if not lowered or width == 1:
+            return found
+
+        lengths = np.fromiter(map(len, lowered), dtype=np.int64, count=len(lowered))
+        order = np.argsort(lengths, kind='stable')
+        sorted_lengths = lengths[order]
+        decoded = {0: frozenset()}
+
+        start = 0
+        while start < len(order):
+            # Bloc de textes de longueurs voisines (au plus du simple au double)
+            shortest = max(int(sorted_lengths[start]), 1)
+            stop = int(np.searchsorted(sorted_lengths, 2 * shortest, side='right'))
+            stop = max(min(stop, start + BLOCK_CELLS // (2 * shortest)), start + 1)
+            indexes = order[start:stop]
+            start = stop
+
+            longest = int(sorted_lengths[stop - 1])
+            if longest == 0:
+                continue
+            block = np.array([lowered[index] for index in indexes.tolist()], dtype=f'<U{longest}')
+            codepoints = block.view(np.uint32).reshape(len(indexes), longest).T
+            # Caractère absent des mots-clés (et bourrage) : colonne 0
+            codes = columns[np.minimum(codepoints, len(columns) - 1)]
+
+            state = np.zeros(len(indexes), dtype=np.int32)
+            bits = np.zeros(len(indexes), dtype=np.int64)
+            for column in codes:
+                state = table[state * width + column]
+                bits |= output_bits[state]
+
+            for index, mask in zip(indexes.tolist(), bits.tolist()):
+                if mask:
+                    categories = decoded.get(mask)
+                    if categories is None:
+                        categories = decoded[mask] = frozenset(
+                            category for bit, category in bit_categories if mask & bit)
+                    found[index] = categories
+        return found
+
+    def _build_table(self):
+        """
+        Construit la table de transitions complète de match_many
+
+        Parcourue en largeur, chaque ligne recopie celle de l'état vers
+        lequel pointe son lien d'échec (déjà complète, car moins profonde),
+        puis y reporte ses propres transitions.
+        """
+        characters = sorted({char for transitions in self._goto for char in transitions})
+        width = len(characters) + 1
+        categories = sorted(self.categories)
+        if len(self._goto) * width > MAX_TABLE_CELLS or len(categories) > 62:
+            self._table = False
+            return
+
+        columns = {char: column for column, char in enumerate(characters, 1)}
+        # Code de caractère -> colonne ; la dernière case reçoit les codes
+        # au-delà du plus grand caractère des mots-clés
+        column_of = np.zeros(ord(characters[-1]) + 2 if characters else 1, dtype=np.int32)
+        for char, column in columns.items():
+            column_of[ord(char)] = column
+        table = np.zeros((len(self._goto), width), dtype=np.int32)
+        queue = [0]
+        position = 0
+        while position < len(queue):
+            state = queue[position]
+            position += 1
+            if state:
+                table[state] = table[self._fail[state]]
+            for char, next_state in self._goto[state].items():
+                table[state, columns[char]] = next_state
+                queue.append(next_state)
+
+        bit_categories = [(1 << bit, category) for bit, category in enumerate(categories)]
+        output_bits = np.array([sum(bit for bit, category in bit_categories if category in outputs)
+                                for outputs in self._outputs], dtype=np.int64)
+        self._table = (table.ravel(), width, column_of, output_bits, bit_categories)
+
+    def __len__(self):
+        return self.keyword_count
+
+
+def load_keyword_file(path):
+    """
+    Charge un dictionnaire de mots-clés
+
+    Format: une section [catégorie] suivie d'un mot-clé par ligne ;
+    les lignes vides et celles commençant par # sont ignorées.
+
+    Args:
+        path (str): Chemin du fichier
+
+    Returns:
+        dict: Catégorie -> liste de mots-clés
+    """
+    keywords = {}
+    category = None
+    with open(path, 'r', encoding='utf-8') as keyword_file:
+        for line_number, line in enumerate(keyword_file, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('[') and line.endswith(']'):
+                category = line[1:-1].strip().lower()
+                keywords.setdefault(category, [])
+                continue
+            if category is None:
+                raise ValueError(f"{os.path.basename(path)}:{line_number}: mot-clé hors section")
+            keywords[category].append(line)
+    return keywords
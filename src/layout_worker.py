@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Calcul de la disposition hors du thread d'interface
+Exécute les LayoutJob dans un processus séparé ; un calcul remplacé par
+un plus récent est abandonné
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from graph_layout import compute_layout
+
+# Génération courante, partagée avec le processus de calcul
+_generation = None
+
+
+def _init_worker(generation):
+    """
+    Initialise le processus de calcul
+    """
+    global _generation
+    _generation = generation
+
+
+def _run_job(generation, payload):
+    """
+    Exécute un calcul ; il s'interrompt entre deux itérations dès qu'un
+    calcul plus récent a été demandé
+    """
+    def should_stop():
+        return _generation is not None and _generation.value != generation
+
+    return compute_layout(*payload, should_stop=should_stop)
+
+
+class LayoutWorker:
+    """
+    Processus de calcul des dispositions
+
+    Un seul calcul est suivi à la fois. submit() ou cancel() incrémentent
+    la génération partagée : un calcul en attente est annulé, un calcul en
+    cours s'arrête à l'itération suivante et son résultat est ignoré.
+
+    Si le processus de calcul meurt (pool cassé), le calcul concerné est
+    exécuté dans le processus courant et le calcul suivant démarre un
+    nouveau processus.
+    """
+
+    def __init__(self):
+        """
+        Initialise le calculateur (le processus démarre au premier calcul)
+        """
+        # "spawn" : le processus fils ne copie pas l'état Tk du parent
+        self._context = multiprocessing.get_context("spawn")
+        self._generation = self._context.Value('q', 0)
+        self._executor = None
+        self._job = None
+        self._future = None
+
+    @property
+    def pending(self):
+        """
+        Calcul en attente ou en cours, None sinon
+        """
+        return self._job
+
+    def submit(self, job):
+        """
+        Lance un calcul, en abandonnant le précédent
+
+        Args:
+            job (LayoutJob): Calcul préparé par PositionCache.prepare()
+        """
+        self.cancel()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=1, mp_context=self._context,
+                                                 initializer=_init_worker,
+                                                 initargs=(self._generation,))
+        self._job = job
+        try:
+            self._future = self._executor.submit(_run_job, self._generation.value, job.payload())
+        except BrokenProcessPool as e:
+            self._future = Future()
+            self._future.set_result(self._run_in_process(job, e))
+
+    def cancel(self):
+        """
+        Abandonne le calcul suivi
+
+        Returns:
+            LayoutJob: Calcul abandonné, None s'il n'y en avait pas
+        """
+        job, future = self._job, self._future
+        self._job = self._future = None
+        if future is not None:
+            with self._generation.get_lock():
+                self._generation.value += 1
+            future.cancel()
+        return job
+
+    def poll(self):
+        """
+        Récupère le calcul terminé, sans bloquer
+
+        Returns:
+            tuple: (job, (positions, itérations)) ou None si rien n'est prêt ;
+                   une erreur du calcul est relevée ici
+        """
+        if self._future is None or not self._future.done():
+            return None
+        job, future = self._job, self._future
+        self._job = self._future = None
+        try:
+            return job, future.result()
+        except BrokenProcessPool as e:
+            return job, self._run_in_process(job, e)
+
+    def _run_in_process(self, job, error):
+        """
+        Exécute un calcul dans le processus courant après la mort du
+        processus de calcul ; le suivant démarrera un nouveau processus
+        """
+        print(f"⚠️ Processus de disposition interrompu ({error}), calcul local")
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        return compute_layout(*job.payload())
+
+    def shutdown(self):
+        """
+        Arrête le processus de calcul
+        """
+        self.cancel()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Ingestion de logs
+Lit en flux des journaux Sysmon et Zeek (conn/dns) exportés en JSONL
+et les transforme en nœuds et relations du graphe d'investigation
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import json
+import ntpath
+import os
+import time
+
+from artifact_classifier import IP_PATTERN
+from graph_manager import DEFAULT_BATCH_SIZE
+
+# Formats de logs reconnus
+FORMAT_SYSMON = "sysmon"
+FORMAT_ZEEK_CONN = "zeek_conn"
+FORMAT_ZEEK_DNS = "zeek_dns"
+
+# Algorithmes retenus dans le champ Hashes de Sysmon
+SYSMON_HASH_ALGORITHMS = ('MD5', 'SHA1', 'SHA256')
+
+
+class IngestionBatch:
+    """
+    Lot borné d'artéfacts et de relations extraits d'un fichier de logs
+    """
+
+    def __init__(self):
+        self.artifacts = {}  # artéfact -> type (dédoublonné dans le lot)
+        self.edges = []
+        self.events = 0
+        self.bytes_read = 0
+        self.total_bytes = 0
+        self.elapsed = 0.0
+
+    def add_event(self, artifacts, edges):
+        """
+        Ajoute au lot les artéfacts et relations d'un événement
+        """
+        for artifact, artifact_type in artifacts:
+            self.artifacts.setdefault(artifact, artifact_type)
+        self.edges.extend(edges)
+        self.events += 1
+
+    @property
+    def progress(self):
+        """
+        Avancement de la lecture du fichier (entre 0 et 1)
+        """
+        if not self.total_bytes:
+            return 1.0
+        return min(self.bytes_read / self.total_bytes, 1.0)
+
+
+class LogIngestor:
+    """
+    Pipeline d'ingestion à base de générateurs
+
+    Le fichier est lu ligne par ligne et les événements sont regroupés en
+    lots de taille bornée : la mémoire utilisée ne dépend pas de la taille
+    du fichier.
+    """
+
+    def __init__(self, graph_manager, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        Initialise le pipeline d'ingestion
+
+        Args:
+            graph_manager (GraphManager): Graphe recevant les artéfacts
+            batch_size (int): Nombre maximal d'événements par lot
+        """
+        self.graph_manager = graph_manager
+        self.batch_size = batch_size
+
+        # Statistiques cumulées
+        self.events = 0
+        self.invalid_lines = 0
+        self.nodes_added = 0
+        self.edges_added = 0
+
+    def iter_records(self, path):
+        """
+        Lit un fichier JSONL en flux
+
+        Args:
+            path (str): Chemin du fichier
+
+        Yields:
+            tuple: (enregistrement, octets lus depuis le début du fichier)
+        """
+        bytes_read = 0
+        with open(path, 'rb') as log_file:
+            for raw_line in log_file:
+                bytes_read += len(raw_line)
+                if not raw_line.strip():
+                    continue
+                try:
+                    record = json.loads(raw_line)
+                except ValueError:
+                    self.invalid_lines += 1
+                    continue
+                if isinstance(record, dict):
+                    yield record, bytes_read
+                else:
+                    self.invalid_lines += 1
+
+    def iter_events(self, path, log_format=None):
+        """
+        Transforme chaque enregistrement en artéfacts et relations
+
+        Args:
+            path (str): Chemin du fichier JSONL
+            log_format (str): Format imposé, détecté par enregistrement si None
+
+        Les enregistrements de format inconnu ou malformés (champ attendu
+        d'un autre type) sont comptés dans invalid_lines.
+
+        Yields:
+            tuple: (artéfacts [(valeur, type)], relations [(a1, a2, relation)],
+                    octets lus)
+        """
+        for record, bytes_read in self.iter_records(path):
+            record_format = log_format or detect_log_format(record)
+            if record_format == FORMAT_SYSMON:
+                event = map_sysmon_event(record)
+            elif record_format == FORMAT_ZEEK_CONN:
+                event = map_zeek_conn(record)
+            elif record_format == FORMAT_ZEEK_DNS:
+                event = map_zeek_dns(record)
+            else:
+                event = None
+            if event is None:
+                self.invalid_lines += 1
+                continue
+            artifacts, edges = event
+            yield artifacts, edges, bytes_read
+
+    def iter_batches(self, path, log_format=None):
+        """
+        Regroupe les événements d'un fichier en lots bornés
+
+        Args:
+            path (str): Chemin du fichier JSONL
+            log_format (str): Format imposé, détecté par enregistrement si None
+
+        Yields:
+            IngestionBatch: Lots d'au plus batch_size événements
+        """
+        total_bytes = os.path.getsize(path)
+        start = time.perf_counter()
+
+        batch = IngestionBatch()
+        for artifacts, edges, bytes_read in self.iter_events(path, log_format):
+            batch.add_event(artifacts, edges)
+            batch.bytes_read = bytes_read
+            if batch.events >= self.batch_size:
+                batch.total_bytes = total_bytes
+                batch.elapsed = time.perf_counter() - start
+                yield batch
+                batch = IngestionBatch()
+                batch.bytes_read = bytes_read
+
+        batch.total_bytes = total_bytes
+        batch.bytes_read = total_bytes
+        batch.elapsed = time.perf_counter() - start
+        yield batch
+
+    def commit_batch(self, batch):
+        """
+        Insère un lot dans le graphe (une mutation pour les nœuds, une pour les arêtes)
+
+        Args:
+            batch (IngestionBatch): Le lot à insérer
+
+        Returns:
+            dict: Statistiques cumulées de l'ingestion
+        """
+        nodes_result = self.graph_manager.add_nodes_bulk(
+            batch.artifacts.items(), ignore_duplicates=True
+        )
+        edges_result = self.graph_manager.add_edges_bulk(batch.edges)
+
+        self.events += batch.events
+        self.nodes_added += len(nodes_result['added'])
+        self.edges_added += edges_result['added']
+
+        return self.get_stats(batch)
+
+    def ingest(self, path, log_format=None, progress_callback=None):
+        """
+        Ingère un fichier complet dans le graphe
+
+        Args:
+            path (str): Chemin du fichier JSONL
+            log_format (str): Format imposé, détecté par enregistrement si None
+            progress_callback (callable): Appelé avec les statistiques après chaque lot
+
+        Returns:
+            dict: Statistiques finales de l'ingestion
+        """
+        stats = self.get_stats()
+        for batch in self.iter_batches(path, log_format):
+            stats = self.commit_batch(batch)
+            if progress_callback:
+                progress_callback(stats)
+        return stats
+
+    def get_stats(self, batch=None):
+        """
+        Retourne les statistiques cumulées de l'ingestion
+
+        Args:
+            batch (IngestionBatch): Dernier lot traité (avancement et débit)
+
+        Returns:
+            dict: Statistiques de l'ingestion
+        """
+        elapsed = batch.elapsed if batch else 0.0
+        return {
+            "events": self.events,
+            "nodes_added": self.nodes_added,
+            "edges_added": self.edges_added,
+            "invalid_lines": self.invalid_lines,
+            "progress": batch.progress if batch else 0.0,
+            "elapsed": elapsed,
+            "events_per_second": self.events / elapsed if elapsed > 0 else 0.0
+        }
+
+
+def detect_log_format(record):
+    """
+    Détermine le format d'un enregistrement à partir de ses champs
+
+    Args:
+        record (dict): Enregistrement JSON
+
+    Returns:
+        str: Format détecté ou None
+    """
+    if 'EventID' in record or 'winlog' in record:
+        return FORMAT_SYSMON
+    if 'id.orig_h' in record:
+        if 'query' in record:
+            return FORMAT_ZEEK_DNS
+        return FORMAT_ZEEK_CONN
+    return None
+
+
+def map_sysmon_event(record):
+    """
+    Convertit un événement Sysmon en artéfacts et relations
+
+    Les exports à plat (EventID, Image...) et au format Winlogbeat
+    (winlog.event_id, winlog.event_data) sont acceptés.
+
+    Args:
+        record (dict): Événement Sysmon
+
+    Returns:
+        tuple: (artéfacts [(valeur, type)], relations [(a1, a2, relation)]),
+        ou None si l'événement est malformé
+    """
+    winlog = record.get('winlog')
+    if isinstance(winlog, dict):
+        event_id = winlog.get('event_id')
+        data = winlog.get('event_data') or {}
+    else:
+        event_id = record.get('EventID')
+        data = record.get('EventData') or record
+    if not isinstance(data, dict):
+        return None
+
+    try:
+        event_id = int(event_id)
+    except (TypeError, ValueError):
+        return [], []
+
+    artifacts = []
+    edges = []
+
+    process = _process_name(data.get('Image'))
+    if process:
+        artifacts.append((process, 'process'))
+
+    if event_id == 1:
+        # Création de processus
+        parent = _process_name(data.get('ParentImage'))
+        if parent:
+            artifacts.append((parent, 'process'))
+            if process:
+                edges.append((parent, process, "spawned"))
+        _add_hashes(data.get('Hashes'), process, artifacts, edges)
+
+    elif event_id == 3:
+        # Connexion réseau
+        destination_ip = data.get('DestinationIp')
+        if destination_ip:
+            artifacts.append((destination_ip, 'ip'))
+            if process:
+                edges.append((process, destination_ip, "connected_to"))
+        hostname = data.get('DestinationHostname')
+        if hostname and destination_ip:
+            artifacts.append((hostname, 'domain'))
+            edges.append((hostname, destination_ip, "resolved_to"))
+
+    elif event_id == 7:
+        # Chargement d'image (DLL)
+        loaded = data.get('ImageLoaded')
+        if loaded:
+            artifacts.append((loaded, 'file'))
+            if process:
+                edges.append((process, loaded, "loaded"))
+            _add_hashes(data.get('Hashes'), loaded, artifacts, edges)
+
+    elif event_id in (11, 15):
+        # Création de fichier / flux alternatif
+        target = data.get('TargetFilename')
+        if target:
+            artifacts.append((target, 'file'))
+            if process:
+                edges.append((process, target, "created"))
+            _add_hashes(data.get('Hash'), target, artifacts, edges)
+
+    elif event_id == 22:
+        # Requête DNS
+        query = data.get('QueryName')
+        if query:
+            artifacts.append((query, 'domain'))
+            if process:
+                edges.append((process, query, "queried"))
+            results = data.get('QueryResults') or ''
+            if not isinstance(results, str):
+                return None
+            for answer in results.split(';'):
+                answer = answer.strip()
+                if answer.startswith('::ffff:'):
+                    answer = answer[7:]
+                if IP_PATTERN.match(answer):
+                    artifacts.append((answer, 'ip'))
+                    edges.append((query, answer, "resolved_to"))
+
+    return _checked_event(artifacts, edges)
+
+
+def map_zeek_conn(record):
+    """
+    Convertit une entrée Zeek conn.log en artéfacts et relations
+
+    Args:
+        record (dict): Entrée conn.log
+
+    Returns:
+        tuple: (artéfacts [(valeur, type)], relations [(a1, a2, relation)]),
+        ou None si l'entrée est malformée
+    """
+    source = record.get('id.orig_h')
+    destination = record.get('id.resp_h')
+    artifacts = [(ip, 'ip') for ip in (source, destination) if ip]
+    edges = []
+    if source and destination:
+        edges.append((source, destination, "connected_to"))
+    return _checked_event(artifacts, edges)
+
+
+def map_zeek_dns(record):
+    """
+    Convertit une entrée Zeek dns.log en artéfacts et relations
+
+    Args:
+        record (dict): Entrée dns.log
+
+    Returns:
+        tuple: (artéfacts [(valeur, type)], relations [(a1, a2, relation)]),
+        ou None si l'entrée est malformée
+    """
+    source = record.get('id.orig_h')
+    query = record.get('query')
+    artifacts = []
+    edges = []
+    if source:
+        artifacts.append((source, 'ip'))
+    if query:
+        artifacts.append((query, 'domain'))
+        if source:
+            edges.append((source, query, "queried"))
+        for answer in record.get('answers') or []:
+            if isinstance(answer, str) and IP_PATTERN.match(answer):
+                artifacts.append((answer, 'ip'))
+                edges.append((query, answer, "resolved_to"))
+    return _checked_event(artifacts, edges)
+
+
+def _checked_event(artifacts, edges):
+    """
+    Rejette un événement dont un artéfact n'est pas une chaîne (liste ou
+    objet JSON à la place d'une adresse, d'un domaine...) : les relations
+    ne portent que sur ses artéfacts
+    """
+    for artifact, _ in artifacts:
+        if not isinstance(artifact, str):
+            return None
+    return artifacts, edges
+
+
+def _process_name(image):
+    """
+    Réduit un chemin d'exécutable Windows à son nom (ex: powershell.exe)
+    """
+    if not image or not isinstance(image, str):
+        return None
+    return ntpath.basename(image).lower() or None
+
+
+def _add_hashes(hashes, owner, artifacts, edges):
+    """
+    Extrait les empreintes d'un champ Sysmon "MD5=...,SHA256=..."
+    """
+    if not hashes or not isinstance(hashes, str):
+        return
+    for entry in hashes.split(','):
+        algorithm, _, value = entry.partition('=')
+        if algorithm.strip().upper() in SYSMON_HASH_ALGORITHMS and value:
+            value = value.strip().lower()
+            artifacts.append((value, 'hash'))
+            if owner:
+                edges.append((owner, value, "has_hash"))
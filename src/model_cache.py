@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Checkpoints locaux du modèle
+Convertit une fois pour toutes le modèle Hugging Face (Phi-3) en un
+checkpoint local safetensors accompagné de son tokenizer, rechargé ensuite
+par projection mémoire (mmap) sans passer par le Hub
+
+Usage: python main.py convert-model [--model NOM] [--output RÉPERTOIRE]
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import argparse
+import json
+import os
+import time
+
+from config_manager import load_config
+
+# Répertoire des checkpoints convertis (relatif à la racine du projet)
+PROJECT_DIR = os.path.join(os.path.dirname(__file__), '..')
+DEFAULT_CHECKPOINT_DIR = "models"
+
+# Fichier décrivant un checkpoint converti ; sa présence marque une
+# conversion terminée
+MANIFEST_FILE = "chronosense.json"
+MANIFEST_FORMAT = "chronosense-checkpoint"
+MANIFEST_VERSION = 1
+
+# Taille maximale d'un fichier de poids
+MAX_SHARD_SIZE = "2GB"
+
+
+def checkpoint_path(model_name, checkpoint_dir=None):
+    """
+    Répertoire du checkpoint converti d'un modèle
+
+    Args:
+        model_name (str): Nom du modèle sur le Hub ("microsoft/Phi-3-mini-4k-instruct")
+        checkpoint_dir (str): Répertoire des checkpoints, relatif à la racine
+                              du projet (models/ par défaut)
+
+    Returns:
+        str: Chemin du checkpoint
+    """
+    return os.path.join(PROJECT_DIR, checkpoint_dir or DEFAULT_CHECKPOINT_DIR, model_name.replace("/", "--"))
+
+
+def read_manifest(path):
+    """
+    Description d'un checkpoint converti
+
+    Returns:
+        dict: Contenu du manifeste, ou None si la conversion est absente,
+        incomplète ou d'une autre version
+    """
+    try:
+        with open(os.path.join(path, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("format") != MANIFEST_FORMAT or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def write_manifest(path, model_name, dtype):
+    """
+    Écrit le manifeste, en dernier : un checkpoint interrompu n'est pas utilisé
+    """
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "version": MANIFEST_VERSION,
+        "model_name": model_name,
+        "dtype": dtype,
+        "converted_at": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+    tmp_path = os.path.join(path, MANIFEST_FILE + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(path, MANIFEST_FILE))
+    return manifest
+
+
+def convert_model(model_name, checkpoint_dir=None):
+    """
+    Télécharge (ou lit dans le cache du Hub) le modèle et l'écrit en
+    checkpoint local safetensors, tokenizer compris
+
+    Les poids sont conservés dans le type choisi par le modèle
+    (torch_dtype="auto") : le chargement les projette alors en mémoire
+    sans conversion.
+
+    Args:
+        model_name (str): Nom du modèle sur le Hub
+        checkpoint_dir (str): Répertoire des checkpoints
+
+    Returns:
+        str: Chemin du checkpoint
+    """
+    from transformers import AutoTokenizer, AutoModelForCausalLM
+
+    path = checkpoint_path(model_name, checkpoint_dir)
+    os.makedirs(path, exist_ok=True)
+
+    print(f"🔄 Chargement de {model_name}...")
+    tokenizer = AutoTokenizer.from_pretrained(model_name, trust_remote_code=True)
+    model = AutoModelForCausalLM.from_pretrained(
+        model_name,
+        trust_remote_code=True,
+        torch_dtype="auto",
+        low_cpu_mem_usage=True
+    )
+
+    print(f"💾 Écriture du checkpoint dans {path}...")
+    model.save_pretrained(path, safe_serialization=True, max_shard_size=MAX_SHARD_SIZE)
+    tokenizer.save_pretrained(path)
+    dtype = str(model.dtype).replace("torch.", "")
+    write_manifest(path, model_name, dtype)
+    print(f"✅ Checkpoint converti ({dtype})")
+    return path
+
+
+def load_model(path):
+    """
+    Charge un checkpoint converti, sans accès réseau
+
+    Les fichiers safetensors sont projetés en mémoire (mmap) ; dans le
+    type d'origine et sans placement automatique (device_map), les
+    tenseurs ne sont pas recopiés.
+
+    Args:
+        path (str): Checkpoint produit par convert_model
+
+    Returns:
+        tuple: (tokenizer, modèle)
+    """
+    import torch
+    from transformers import AutoTokenizer, AutoModelForCausalLM
+
+    manifest = read_manifest(path)
+    if manifest is None:
+        raise FileNotFoundError(f"Checkpoint converti introuvable: {path}")
+
+    tokenizer = AutoTokenizer.from_pretrained(path, local_files_only=True)
+    model = AutoModelForCausalLM.from_pretrained(
+        path,
+        local_files_only=True,
+        trust_remote_code=True,
+        torch_dtype=getattr(torch, manifest["dtype"]),
+        low_cpu_mem_usage=True,
+        use_safetensors=True
+    )
+    model.eval()
+    return tokenizer, model
+
+
+def main(argv=None):
+    """
+    Point d'entrée de la commande de conversion
+
+    Returns:
+        int: Code de sortie
+    """
+    ai_config = load_config()['ai']
+    parser = argparse.ArgumentParser(
+        prog="chronosense convert-model",
+        description="Convertit le modèle en checkpoint local safetensors (chargement rapide)"
+    )
+    parser.add_argument("--model", default=ai_config['model_name'], help="Modèle du Hub")
+    parser.add_argument("--output", default=ai_config.get('checkpoint_dir'),
+                        help="Répertoire des checkpoints")
+    args = parser.parse_args(argv)
+
+    try:
+        convert_model(args.model, args.output)
+    except ImportError as e:
+        print(f"❌ Transformers requis pour la conversion: {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Client HTTP de l'API Ollama
+Session partagée (connexions maintenues ouvertes), nombre de requêtes
+simultanées borné, délais issus de la configuration et nouvelles tentatives
+avec attente croissante
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import json
+import queue
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Valeurs par défaut (section "ai" de la configuration)
+DEFAULT_TIMEOUT = 60          # Délai d'une requête (s), clé "timeout"
+DEFAULT_MAX_CONCURRENCY = 4   # Requêtes simultanées, clé "max_concurrency"
+DEFAULT_RETRIES = 3           # Nouvelles tentatives, clé "retries"
+DEFAULT_BACKOFF = 0.5         # Attente avant la 2e tentative (s), doublée ensuite, clé "retry_backoff"
+
+# Délai de la détection de l'API au démarrage (s)
+PROBE_TIMEOUT = 5
+
+# Réponses HTTP pour lesquelles la requête est retentée (serveur occupé,
+# modèle en cours de chargement...)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Intervalle de vérification de l'annulation d'un flux (s)
+CANCEL_POLL_INTERVAL = 0.05
+
+# Fin du flux lu par le thread de lecture
+_END = object()
+
+
+class OllamaError(Exception):
+    """
+    Réponse d'erreur de l'API Ollama
+    """
+
+
+class OllamaClient:
+    """
+    Client de l'API Ollama partagé par toutes les générations
+
+    Les requêtes passent par une même session requests : les connexions
+    TCP sont réutilisées (keep-alive) au lieu d'être rétablies à chaque
+    appel. Un sémaphore borne le nombre de requêtes en cours, un flux
+    occupant sa place jusqu'à sa fermeture. Les échecs de connexion et les
+    réponses 429/5xx sont retentés avec une attente croissante ; une
+    génération dont la réponse a commencé n'est jamais relancée.
+    """
+
+    def __init__(self, base_url="http://localhost:11434", timeout=DEFAULT_TIMEOUT,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY, retries=DEFAULT_RETRIES,
+                 backoff=DEFAULT_BACKOFF):
+        """
+        Initialise le client (aucune connexion n'est ouverte ici)
+
+        Args:
+            base_url (str): Adresse de l'API ("http://hôte:port")
+            timeout (float): Délai de connexion et d'attente de chaque lecture (s)
+            max_concurrency (int): Requêtes simultanées au plus
+            retries (int): Nouvelles tentatives après un échec
+            backoff (float): Attente avant la deuxième tentative (s)
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency doit être positif: {max_concurrency}")
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.retries = retries
+        self.backoff = backoff
+
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, ai_config):
+        """
+        Crée un client à partir de la section "ai" de la configuration
+
+        L'adresse de base est déduite de api_url (".../api/generate").
+        """
+        api_url = ai_config.get("api_url", "http://localhost:11434/api/generate")
+        return cls(
+            base_url=api_url.split("/api/", 1)[0],
+            timeout=ai_config.get("timeout", DEFAULT_TIMEOUT),
+            max_concurrency=ai_config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+            retries=ai_config.get("retries", DEFAULT_RETRIES),
+            backoff=ai_config.get("retry_backoff", DEFAULT_BACKOFF)
+        )
+
+    @property
+    def session(self):
+        """
+        Session partagée, créée à la première requête (import de requests
+        différé)
+        """
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def _create_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # read=0 : une génération interrompue en cours de réponse n'est pas
+        # relancée (elle a déjà consommé du temps de calcul)
+        retry = Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=0,
+            status=self.retries,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=None,
+            backoff_factor=self.backoff,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency,
+                              pool_block=True, max_retries=retry)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self):
+        """
+        Ferme les connexions ouvertes
+        """
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def is_available(self, timeout=PROBE_TIMEOUT):
+        """
+        Vérifie que l'API répond (liste des modèles)
+
+        Requête unique, hors de la session : sans les nouvelles tentatives
+        de celle-ci, une API absente est constatée immédiatement et ne
+        retarde pas la fin du préchauffage.
+
+        Returns:
+            bool: True si l'API répond
+        """
+        import requests
+
+        try:
+            with self._slots:
+                response = requests.get(f"{self.base_url}/api/tags", timeout=timeout)
+        except requests.RequestException as e:
+            print(f"❌ API locale non disponible: {e}")
+            return False
+        return response.status_code == 200
+
+    def generate(self, prompt, model, options=None, timeout=None):
+        """
+        Génère une réponse complète
+
+        Args:
+            prompt (str): Prompt
+            model (str): Modèle Ollama ("phi3")
+            options (dict): Options de génération (temperature, num_predict...)
+            timeout (float): Délai de la requête (s), timeout du client par défaut
+
+        Returns:
+            str: Texte généré
+
+        Raises:
+            OllamaError: Réponse d'erreur de l'API
+            requests.RequestException: Échec réseau après les nouvelles tentatives
+        """
+        payload = {"model": model, "prompt": prompt, "stream": False, "options": options or {}}
+        with self._slots:
+            response = self.session.post(f"{self.base_url}/api/generate", json=payload,
+                                         timeout=timeout or self.timeout)
+            self._check(response)
+            return response.json().get("response", "")
+
+    def generate_stream(self, prompt, model, options=None, timeout=None, cancel=None):
+        """
+        Génère une réponse en flux NDJSON (un objet JSON par ligne)
+
+        La place de la requête parmi les requêtes simultanées est libérée à
+        la fin du flux ou à la fermeture du générateur.
+
+        Args:
+            cancel (threading.Event): Interrompt le flux une fois levé, y
+                                      compris avant le premier morceau
+                                      (évaluation du prompt)
+
+        Yields:
+            str: Morceaux de texte, dans l'ordre d'émission
+
+        Raises:
+            OllamaError: Réponse d'erreur de l'API
+            requests.RequestException: Échec réseau
+        """
+        payload = {"model": model, "prompt": prompt, "stream": True, "options": options or {}}
+        if cancel is None:
+            yield from self._read_stream(payload, timeout)
+        else:
+            yield from self._read_stream_cancellable(payload, timeout, cancel)
+
+    def _read_stream_cancellable(self, payload, timeout, cancel):
+        """
+        Flux lu par un thread, l'appelant surveillant l'annulation
+
+        Ollama n'envoie les en-têtes qu'avec le premier token : jusque-là,
+        la requête bloque sans réponse à fermer. L'appelant rend donc la
+        main dès l'annulation ; la connexion est coupée (ce qui arrête la
+        génération côté Ollama) dès que la réponse est disponible.
+        """
+        items = queue.Queue()
+        lock = threading.Lock()
+        responses = []
+        state = {"stopped": False, "finished": False}
+
+        def on_response(response):
+            with lock:
+                responses.append(response)
+                if state["stopped"]:
+                    self._abort(response)
+
+        def read():
+            try:
+                for chunk in self._read_stream(payload, timeout, on_response):
+                    items.put(chunk)
+            except Exception as e:
+                items.put(e)
+            items.put(_END)
+
+        threading.Thread(target=read, name="ollama-stream", daemon=True).start()
+        try:
+            while not cancel.is_set():
+                try:
+                    item = items.get(timeout=CANCEL_POLL_INTERVAL)
+                except queue.Empty:
+                    continue
+                if item is _END:
+                    state["finished"] = True
+                    return
+                if isinstance(item, Exception):
+                    state["finished"] = True
+                    raise item
+                yield item
+        finally:
+            # Annulation ou générateur fermé avant la fin : lecture interrompue
+            if not state["finished"]:
+                with lock:
+                    state["stopped"] = True
+                    for response in responses:
+                        self._abort(response)
+
+    def _read_stream(self, payload, timeout, on_response=None):
+        with self._slots:
+            with self.session.post(f"{self.base_url}/api/generate", json=payload,
+                                   timeout=timeout or self.timeout, stream=True) as response:
+                if on_response is not None:
+                    on_response(response)
+                self._check(response)
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    message = json.loads(line)
+                    if message.get("error"):
+                        raise OllamaError(message["error"])
+                    if message.get("response"):
+                        yield message["response"]
+                    if message.get("done"):
+                        return
+
+    def generate_many(self, prompts, model, options=None):
+        """
+        Génère plusieurs réponses en parallèle, au plus max_concurrency à la fois
+
+        Returns:
+            list: Textes générés, ou exceptions, dans l'ordre des prompts
+        """
+        def run(prompt):
+            try:
+                return self.generate(prompt, model, options)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            return list(executor.map(run, prompts))
+
+    @staticmethod
+    def _abort(response):
+        # Coupe la connexion : débloque la lecture en cours dans un autre
+        # thread (fermer la réponse attendrait la fin de cette lecture)
+        try:
+            response.raw.connection.sock.shutdown(socket.SHUT_RDWR)
+        except (AttributeError, OSError):
+            pass
+
+    @staticmethod
+    def _check(response):
+        if response.status_code != 200:
+            raise OllamaError(f"Erreur API: {response.status_code} - {response.text}")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Planificateur de rafraîchissement
+Regroupe les demandes de rafraîchissement (graphe, panneau de détails) en
+une seule mise à jour par image, déclenchée par la boucle Tk (root.after)
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import time
+
+# Intervalle minimal entre deux rafraîchissements (ms)
+REDRAW_INTERVAL_MS = 40
+
+
+class RedrawScheduler:
+    """
+    Rafraîchissement différé à indicateurs "sale"
+
+    invalidate() ne fait que marquer le graphe et/ou le panneau de détails
+    comme à redessiner et programme, s'il n'y en a pas déjà une, une mise à
+    jour dans la boucle Tk. Toutes les mutations faites d'ici là (un collage
+    de 500 artéfacts, un lot d'import...) sont couvertes par cette seule
+    mise à jour ; deux mises à jour sont espacées d'au moins interval_ms.
+    """
+
+    def __init__(self, after, draw_canvas, draw_details, interval_ms=REDRAW_INTERVAL_MS):
+        """
+        Initialise le planificateur
+
+        Args:
+            after (callable): (délai en ms, fonction) -> programme un appel,
+                              typiquement root.after
+            draw_canvas (callable): Disposition et rendu du graphe
+            draw_details (callable): Rafraîchissement du panneau de détails
+            interval_ms (int): Intervalle minimal entre deux rafraîchissements
+        """
+        self.after = after
+        self.draw_canvas = draw_canvas
+        self.draw_details = draw_details
+        self.interval_ms = interval_ms
+
+        self.canvas_dirty = False
+        self.details_dirty = False
+        self._pending = False
+        self._held = False
+        self._last_frame = None
+
+        # Compteurs (tests, benchmarks)
+        self.frames = 0
+        self.canvas_draws = 0
+        self.details_draws = 0
+
+    def invalidate(self, canvas=True, details=True):
+        """
+        Marque des zones à redessiner et programme une mise à jour
+
+        Args:
+            canvas (bool): Le graphe est à redessiner
+            details (bool): Le panneau de détails est à rafraîchir
+        """
+        self.canvas_dirty |= canvas
+        self.details_dirty |= details
+        if self._pending or self._held or not (self.canvas_dirty or self.details_dirty):
+            return
+        self._pending = True
+        delay = 0
+        if self._last_frame is not None:
+            elapsed = (time.monotonic() - self._last_frame) * 1000
+            delay = max(0, int(self.interval_ms - elapsed))
+        self.after(delay, self.flush)
+
+    def hold(self):
+        """
+        Suspend les rafraîchissements (import en cours...) ; les demandes
+        sont mémorisées
+        """
+        self._held = True
+
+    def release(self):
+        """
+        Reprend les rafraîchissements ; ce qui a été marqué entre-temps est
+        redessiné en une fois
+        """
+        self._held = False
+        self.invalidate(canvas=False, details=False)
+
+    def flush(self):
+        """
+        Redessine immédiatement ce qui est marqué
+        """
+        self._pending = False
+        if self._held:
+            return
+        canvas, details = self.canvas_dirty, self.details_dirty
+        self.canvas_dirty = self.details_dirty = False
+        if not (canvas or details):
+            return
+
+        # Les indicateurs sont remis à zéro avant de dessiner : une mutation
+        # faite pendant le rendu programme une nouvelle mise à jour
+        self.frames += 1
+        try:
+            if canvas:
+                self.canvas_draws += 1
+                self.draw_canvas()
+            if details:
+                self.details_draws += 1
+                self.draw_details()
+        finally:
+            self._last_frame = time.monotonic()
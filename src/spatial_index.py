@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Index spatial des positions
+Grille régulière sur les positions des nœuds (et les milieux des arêtes)
+pour retrouver ce qui intersecte la vue sans parcourir tout le graphe
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import numpy as np
+
+# Nombre moyen de points par cellule de la grille
+POINTS_PER_CELL = 8
+
+# Une arête est "longue" si sa demi-emprise dépasse ce nombre de cellules ;
+# les arêtes longues sont testées une à une plutôt qu'indexées
+LONG_EDGE_CELLS = 4
+
+
+def grid_shape(points, points_per_cell=POINTS_PER_CELL):
+    """
+    Grille carrée couvrant des points
+
+    Returns:
+        tuple: (coin inférieur, taille (2,) d'une cellule, cellules par côté)
+    """
+    if len(points) == 0:
+        return np.zeros(2), np.ones(2), 1
+    low = points.min(axis=0)
+    span = np.maximum(points.max(axis=0) - low, 1e-9)
+    side = max(int(np.ceil(np.sqrt(len(points) / points_per_cell))), 1)
+    return low, span / side, side
+
+
+class GridIndex:
+    """
+    Index en grille d'un nuage de points
+
+    Les points sont triés par cellule (ordre ligne par ligne) : une
+    requête rectangulaire lit, pour chaque rangée de cellules couverte,
+    une tranche contiguë du tableau trié, puis filtre exactement. Les
+    points ajoutés après la construction (extend) sont testés un à un.
+    """
+
+    def __init__(self, points, points_per_cell=POINTS_PER_CELL):
+        """
+        Construit l'index
+
+        Args:
+            points (np.ndarray): Points (n, 2)
+            points_per_cell (int): Densité visée
+        """
+        self.points = np.asarray(points, dtype=float).reshape(-1, 2)
+        self._extra = np.empty(0, dtype=np.int64)
+        self.low, self.cell_size, side = grid_shape(self.points, points_per_cell)
+        self.shape = (side, side)
+
+        columns, rows = self._cells(self.points).T
+        cell_ids = rows * side + columns
+        self._order = np.argsort(cell_ids, kind='stable')
+        self._starts = np.searchsorted(cell_ids[self._order], np.arange(side * side + 1))
+
+    def __len__(self):
+        return len(self.points)
+
+    def _cells(self, points):
+        """
+        Coordonnées de cellule (colonne, rangée) de points, bornées à la grille
+        """
+        cells = np.floor((points - self.low) / self.cell_size).astype(np.int64)
+        return np.clip(cells, 0, np.array(self.shape) - 1)
+
+    def extend(self, points):
+        """
+        Ajoute des points sans reconstruire l'index
+
+        Returns:
+            np.ndarray: Indices attribués aux nouveaux points
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        indices = np.arange(len(self.points), len(self.points) + len(points))
+        self.points = np.concatenate((self.points, points))
+        self._extra = np.concatenate((self._extra, indices))
+        return indices
+
+    def candidates(self, xlim, ylim):
+        """
+        Indices des points des cellules couvertes par le rectangle (sans
+        filtre exact), plus les points ajoutés depuis la construction
+        """
+        x0, x1 = sorted(xlim)
+        y0, y1 = sorted(ylim)
+        (c0, r0), (c1, r1) = self._cells(np.array([[x0, y0], [x1, y1]]))
+        side = self.shape[0]
+        low, high = self.low, self.low + self.cell_size * side
+        if x1 < low[0] or y1 < low[1] or x0 > high[0] or y0 > high[1]:
+            slices = []
+        else:
+            starts = self._starts
+            slices = [self._order[starts[row * side + c0]:starts[row * side + c1 + 1]]
+                      for row in range(r0, r1 + 1)]
+        return np.concatenate(slices + [self._extra])
+
+    def query(self, xlim, ylim):
+        """
+        Indices des points compris dans le rectangle
+
+        Args:
+            xlim (tuple): (x0, x1)
+            ylim (tuple): (y0, y1)
+
+        Returns:
+            np.ndarray: Indices triés
+        """
+        x0, x1 = sorted(xlim)
+        y0, y1 = sorted(ylim)
+        candidates = self.candidates(xlim, ylim)
+        points = self.points[candidates]
+        inside = ((points[:, 0] >= x0) & (points[:, 0] <= x1) &
+                  (points[:, 1] >= y0) & (points[:, 1] <= y1))
+        return np.sort(candidates[inside])
+
+    def nearest(self, point, radius):
+        """
+        Point le plus proche d'une position, à moins de radius
+
+        Seules les cellules couvertes par le carré de côté 2 * radius sont
+        examinées : le coût ne dépend pas du nombre de points.
+
+        Args:
+            point (tuple): (x, y)
+            radius (float): Distance maximale
+
+        Returns:
+            int: Indice du point, ou None
+        """
+        x, y = point
+        candidates = self.query((x - radius, x + radius), (y - radius, y + radius))
+        if len(candidates) == 0:
+            return None
+        distances = np.hypot(*(self.points[candidates] - (x, y)).T)
+        best = int(np.argmin(distances))
+        return int(candidates[best]) if distances[best] <= radius else None
+
+
+class EdgeIndex:
+    """
+    Index des arêtes (segments) intersectant un rectangle
+
+    Les arêtes courtes sont indexées par leur milieu ; la requête élargit
+    le rectangle de la plus grande demi-emprise indexée. Les arêtes
+    longues, et celles ajoutées après la construction, sont testées une à
+    une. Le test final compare les boîtes englobantes (un segment dont la
+    boîte touche la vue sans la traverser est conservé, ce qui est sans
+    conséquence pour l'affichage).
+    """
+
+    def __init__(self, positions, edges):
+        """
+        Construit l'index
+
+        Args:
+            positions (np.ndarray): Positions (n, 2) des nœuds
+            edges (np.ndarray): Arêtes (m, 2) en indices
+        """
+        self.positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        self.edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        starts, ends = self.positions[self.edges[:, 0]], self.positions[self.edges[:, 1]]
+        self._low = np.minimum(starts, ends)
+        self._high = np.maximum(starts, ends)
+
+        half = (self._high - self._low) / 2
+        _, cell_size, _ = grid_shape(self.positions)
+        short = (half <= LONG_EDGE_CELLS * cell_size).all(axis=1)
+        self._short = np.flatnonzero(short)
+        self._long = np.flatnonzero(~short)
+        self._margin = half[short].max(axis=0) if short.any() else np.zeros(2)
+        self._midpoints = GridIndex((self._low[short] + self._high[short]) / 2)
+
+    def extend(self, positions, edges):
+        """
+        Ajoute des arêtes (et les positions des nouveaux nœuds) sans
+        reconstruire l'index
+
+        Args:
+            positions (np.ndarray): Positions de tous les nœuds
+            edges (np.ndarray): Arêtes ajoutées (k, 2)
+        """
+        self.positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        indices = np.arange(len(self.edges), len(self.edges) + len(edges))
+        starts, ends = self.positions[edges[:, 0]], self.positions[edges[:, 1]]
+        self.edges = np.concatenate((self.edges, edges))
+        self._low = np.concatenate((self._low, np.minimum(starts, ends)))
+        self._high = np.concatenate((self._high, np.maximum(starts, ends)))
+        self._long = np.concatenate((self._long, indices))
+
+    def query(self, xlim, ylim):
+        """
+        Indices des arêtes dont la boîte englobante touche le rectangle
+
+        Returns:
+            np.ndarray: Indices triés (lignes de edges)
+        """
+        x0, x1 = sorted(xlim)
+        y0, y1 = sorted(ylim)
+        mx, my = self._margin
+        near = self._short[self._midpoints.candidates((x0 - mx, x1 + mx), (y0 - my, y1 + my))]
+        candidates = np.concatenate((near, self._long))
+        low, high = self._low[candidates], self._high[candidates]
+        overlap = ((low[:, 0] <= x1) & (high[:, 0] >= x0) &
+                   (low[:, 1] <= y1) & (high[:, 1] >= y0))
+        return np.sort(candidates[overlap])
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Chronosense v0.1 - Vue texte virtualisée
+Affiche de très longs contenus (résumé du graphe, hypothèses) en ne
+matérialisant dans le widget Tk que les lignes visibles, récupérées à la
+demande auprès d'une source de lignes
+
+Auteur: Généré automatiquement
+Version: 0.1 (Preuve de Concept)
+"""
+
+import textwrap
+import tkinter as tk
+from tkinter import ttk
+import tkinter.font as tkfont
+
+# Largeur de repli (colonnes) tant que le widget n'est pas dimensionné
+DEFAULT_WRAP_WIDTH = 48
+
+# Lignes parcourues par cran de molette
+WHEEL_LINES = 3
+
+
+class TextLineSource:
+    """
+    Source de lignes pour un texte libre, découpé à la largeur de la vue
+
+    Une source expose line_count(), lines(start, count) et
+    find(query, start) ; set_width(columns) est optionnel.
+    """
+
+    def __init__(self, text=""):
+        """
+        Initialise la source
+
+        Args:
+            text (str): Texte initial
+        """
+        self._paragraphs = []
+        self._paragraph_starts = []
+        self._lines = []
+        self._width = DEFAULT_WRAP_WIDTH
+        self.append(text)
+
+    def append(self, text):
+        """
+        Ajoute du texte à la fin (sans retour à la ligne implicite)
+
+        Seul le dernier paragraphe est redécoupé, ce qui permet d'alimenter
+        la source au fil de l'eau.
+        """
+        if not text:
+            return
+        parts = text.split("\n")
+        start = len(self._paragraphs)
+        if self._paragraphs:
+            # Le premier morceau prolonge le dernier paragraphe
+            start -= 1
+            self._paragraphs[-1] += parts.pop(0)
+            del self._lines[self._paragraph_starts[start]:]
+            del self._paragraph_starts[start:]
+        self._paragraphs.extend(parts)
+        self._wrap_from(start)
+
+    def set_width(self, columns):
+        """
+        Redécoupe le texte pour une nouvelle largeur
+        """
+        columns = max(int(columns), 10)
+        if columns == self._width:
+            return
+        self._width = columns
+        self._lines = []
+        self._paragraph_starts = []
+        self._wrap_from(0)
+
+    def _wrap_from(self, start):
+        for paragraph in self._paragraphs[start:]:
+            self._paragraph_starts.append(len(self._lines))
+            self._lines.extend(self._wrap(paragraph))
+
+    def _wrap(self, paragraph):
+        return textwrap.wrap(paragraph, self._width, replace_whitespace=False,
+                             drop_whitespace=True) or [""]
+
+    def line_count(self):
+        return len(self._lines)
+
+    def lines(self, start, count):
+        return self._lines[start:start + count]
+
+    def find(self, query, start=0):
+        query = query.lower()
+        for index in range(max(start, 0), len(self._lines)):
+            if query in self._lines[index].lower():
+                return index
+        return -1
+
+
+class GraphSummarySource:
+    """
+    Source de lignes adossée au résumé incrémental du GraphManager
+
+    Les lignes sont produites à la demande à partir des index du graphe,
+    sans jamais construire le résumé complet.
+    """
+
+    HEADER = ["📊 Résumé du Graphe:", ""]
+    FOOTER = ["", "💡 Cliquez sur 'Générer des Hypothèses' pour l'analyse IA"]
+
+    def __init__(self, graph_manager):
+        """
+        Initialise la source
+
+        Args:
+            graph_manager (GraphManager): Gestionnaire de graphe à afficher
+        """
+        self.graph_manager = graph_manager
+
+    def line_count(self):
+        return len(self.HEADER) + self.graph_manager.get_summary_line_count() + len(self.FOOTER)
+
+    def lines(self, start, count):
+        header_size = len(self.HEADER)
+        summary_size = self.graph_manager.get_summary_line_count()
+        stop = start + count
+
+        lines = self.HEADER[start:stop]
+        summary_start = max(start - header_size, 0)
+        summary_stop = min(stop - header_size, summary_size)
+        if summary_start < summary_stop:
+            lines.extend(self.graph_manager.get_summary_lines(summary_start, summary_stop - summary_start))
+        footer_start = max(start - header_size - summary_size, 0)
+        footer_stop = stop - header_size - summary_size
+        if footer_stop > 0:
+            lines.extend(self.FOOTER[footer_start:footer_stop])
+        return lines
+
+    def find(self, query, start=0):
+        query = query.lower()
+        header_size = len(self.HEADER)
+        for index in range(max(start, 0), header_size):
+            if query in self.HEADER[index].lower():
+                return index
+
+        found = self.graph_manager.find_summary_line(query, max(start - header_size, 0))
+        if found >= 0:
+            return header_size + found
+
+        footer_offset = header_size + self.graph_manager.get_summary_line_count()
+        for index in range(max(start - footer_offset, 0), len(self.FOOTER)):
+            if query in self.FOOTER[index].lower():
+                return footer_offset + index
+        return -1
+
+
+class VirtualTextView(ttk.Frame):
+    """
+    Zone de texte virtualisée avec barre de défilement et recherche
+
+    Le widget Text ne contient jamais plus que les lignes visibles : le
+    défilement et la recherche s'appuient sur la source, ce qui garde
+    l'affichage instantané quel que soit le nombre de lignes.
+    """
+
+    def __init__(self, parent, source=None, font=("Consolas", 10), height=20):
+        """
+        Initialise la vue
+
+        Args:
+            parent: Widget parent
+            source: Source de lignes (TextLineSource par défaut)
+            font (tuple): Police du texte
+            height (int): Hauteur initiale en lignes
+        """
+        super().__init__(parent)
+        self.source = source if source is not None else TextLineSource()
+        self.first_line = 0
+        self.match_line = -1
+        self.search_var = tk.StringVar()
+
+        # Barre de recherche
+        search_frame = ttk.Frame(self)
+        search_frame.pack(side=tk.TOP, fill=tk.X, pady=(0, 5))
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
+        ttk.Button(search_frame, text="🔍", width=3, command=self.find_next).pack(side=tk.LEFT)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Les lignes du résumé (empreintes, URL, liens) ne sont pas découpées :
+        # le défilement horizontal est confié au widget Text
+        self.xscrollbar = ttk.Scrollbar(self, orient=tk.HORIZONTAL)
+        self.xscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+
+        self._font = tkfont.Font(font=font)
+        self.text = tk.Text(self, wrap=tk.NONE, height=height, font=self._font, state='disabled',
+                            xscrollcommand=self.xscrollbar.set)
+        self.xscrollbar.configure(command=self.text.xview)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.text.tag_configure('match', background='#fff59d')
+
+        self._bind_events()
+
+    def _bind_events(self):
+        """
+        Configure le défilement à la molette, au clavier et la recherche
+        """
+        self.text.bind('<Configure>', lambda e: self._on_resize())
+        self.text.bind('<MouseWheel>', lambda e: self.scroll(-WHEEL_LINES if e.delta > 0 else WHEEL_LINES))
+        self.text.bind('<Button-4>', lambda e: self.scroll(-WHEEL_LINES))
+        self.text.bind('<Button-5>', lambda e: self.scroll(WHEEL_LINES))
+        self.text.bind('<Shift-MouseWheel>', lambda e: self.scroll_x(-WHEEL_LINES if e.delta > 0 else WHEEL_LINES))
+        self.text.bind('<Shift-Button-4>', lambda e: self.scroll_x(-WHEEL_LINES))
+        self.text.bind('<Shift-Button-5>', lambda e: self.scroll_x(WHEEL_LINES))
+        self.text.bind('<Left>', lambda e: self.scroll_x(-1))
+        self.text.bind('<Right>', lambda e: self.scroll_x(1))
+        self.text.bind('<Button-1>', lambda e: self.text.focus_set())
+        self.text.bind('<Up>', lambda e: self.scroll(-1))
+        self.text.bind('<Down>', lambda e: self.scroll(1))
+        self.text.bind('<Prior>', lambda e: self.scroll(-self.visible_rows()))
+        self.text.bind('<Next>', lambda e: self.scroll(self.visible_rows()))
+        self.text.bind('<Home>', lambda e: self.scroll_to(0))
+        self.text.bind('<End>', lambda e: self.scroll_to(self.source.line_count()))
+        self.search_entry.bind('<Return>', lambda e: self.find_next())
+        self.search_var.trace_add('write', lambda *args: self._reset_search())
+
+    # ------------------------------------------------------------------
+    # Contenu
+    # ------------------------------------------------------------------
+
+    def set_source(self, source):
+        """
+        Remplace la source affichée et revient en haut
+        """
+        self.source = source
+        self.first_line = 0
+        self.match_line = -1
+        self._apply_width()
+        self.refresh()
+
+    def set_text(self, text):
+        """
+        Affiche un texte libre
+        """
+        self.set_source(TextLineSource(text))
+
+    def refresh(self):
+        """
+        Redessine les lignes visibles (à appeler après un changement de la source)
+        """
+        self.first_line = self._clamp(self.first_line)
+        self._render()
+
+    # ------------------------------------------------------------------
+    # Défilement
+    # ------------------------------------------------------------------
+
+    def visible_rows(self):
+        """
+        Nombre de lignes qui tiennent dans la hauteur du widget
+        """
+        height = self.text.winfo_height()
+        if height <= 1:
+            return int(self.text.cget('height'))
+        return max(height // self._font.metrics('linespace'), 1)
+
+    def scroll(self, lines):
+        """
+        Fait défiler la vue d'un nombre de lignes (négatif vers le haut)
+        """
+        self.scroll_to(self.first_line + lines)
+        return "break"
+
+    def scroll_to(self, line):
+        """
+        Place la ligne demandée en haut de la vue
+        """
+        line = self._clamp(line)
+        if line != self.first_line:
+            self.first_line = line
+            self._render()
+        return "break"
+
+    def scroll_x(self, columns):
+        """
+        Fait défiler la vue horizontalement (négatif vers la gauche)
+        """
+        self.text.xview_scroll(columns, tk.UNITS)
+        return "break"
+
+    def _clamp(self, line):
+        return max(0, min(int(line), self.source.line_count() - self.visible_rows()))
+
+    def _on_scrollbar(self, action, value, unit=None):
+        """
+        Traduit les commandes de la barre de défilement en positions de ligne
+        """
+        if action == tk.MOVETO:
+            self.scroll_to(float(value) * self.source.line_count())
+        elif action == tk.SCROLL:
+            step = self.visible_rows() if unit == tk.PAGES else 1
+            self.scroll(int(value) * step)
+
+    def _on_resize(self):
+        self._apply_width()
+        self.refresh()
+
+    def _apply_width(self):
+        set_width = getattr(self.source, 'set_width', None)
+        width = self.text.winfo_width()
+        if set_width is not None and width > 1:
+            set_width(width // max(self._font.measure('0'), 1) - 1)
+
+    def _render(self):
+        """
+        Remplace le contenu du widget par les seules lignes visibles
+        """
+        rows = self.visible_rows()
+        total = self.source.line_count()
+        lines = self.source.lines(self.first_line, rows)
+
+        self.text.configure(state='normal')
+        self.text.delete('1.0', tk.END)
+        self.text.insert('1.0', "\n".join(lines))
+        if self.first_line <= self.match_line < self.first_line + len(lines):
+            row = self.match_line - self.first_line + 1
+            self.text.tag_add('match', f"{row}.0", f"{row}.end")
+        self.text.configure(state='disabled')
+
+        if total:
+            self.scrollbar.set(self.first_line / total, min((self.first_line + rows) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    # ------------------------------------------------------------------
+    # Recherche
+    # ------------------------------------------------------------------
+
+    def find_next(self):
+        """
+        Va à la prochaine ligne contenant le texte recherché (avec bouclage)
+        """
+        query = self.search_var.get().strip()
+        if not query:
+            return False
+        found = self.source.find(query, self.match_line + 1)
+        if found < 0 and self.match_line >= 0:
+            found = self.source.find(query, 0)
+        self.match_line = found
+        if found >= 0:
+            self.first_line = self._clamp(found - self.visible_rows() // 3)
+        self._render()
+        return found >= 0
+
+    def _reset_search(self):
+        if self.match_line >= 0:
+            self.match_line = -1
+            self._render()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour AIManager et le démarrage de l'application
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+# Ajouter le répertoire src au path
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+import ai_manager as ai_module
+from ai_manager import AIManager
+
+# Modules lents à importer, chargés seulement à la demande
+HEAVY_MODULES = ("matplotlib", "pandas", "requests", "transformers", "torch")
+
+
+class FakeOllamaHandler(BaseHTTPRequestHandler):
+    """
+    API Ollama minimale : /api/tags et /api/generate (flux NDJSON)
+    """
+
+    tokens = ["Hypothèse", " 1", ": exfiltration", "\n"]
+
+    def do_GET(self):
+        self._send_json({"models": [{"name": "phi3"}]})
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if not request.get("stream"):
+            self._send_json({"response": "".join(self.tokens), "done": True})
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        for token in self.tokens:
+            self.wfile.write(json.dumps({"response": token, "done": False}).encode() + b"\n")
+            self.wfile.flush()
+        self.wfile.write(json.dumps({"response": "", "done": True}).encode() + b"\n")
+
+    def _send_json(self, body):
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FailingOllamaHandler(FakeOllamaHandler):
+    """
+    API Ollama en échec : /api/generate répond par une erreur
+    """
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        data = json.dumps({"error": "model 'phi3' not found"}).encode()
+        self.send_response(404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start_server(test, handler):
+    """
+    Démarre un serveur local de substitution, arrêté à la fin du test
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    test.addCleanup(server.server_close)
+    test.addCleanup(server.shutdown)
+    return f"http://127.0.0.1:{server.server_port}/api/generate"
+
+
+class TestAIManager(unittest.TestCase):
+    """
+    Tests unitaires pour AIManager
+    """
+
+    def test_background_warmup(self):
+        """
+        Test du préchauffage en arrière-plan
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            ai_manager = AIManager(discover=False)
+            self.assertEqual(ai_manager.mode, "simulation")
+            self.assertFalse(ai_manager.get_model_info()["ready"])
+
+            # Génération possible avant le préchauffage
+            self.assertIn("HYPOTHÈSES", ai_manager.generate_hypotheses("IP: 10.0.0.1"))
+
+            updates = []
+            for thread in ai_manager.start_warmup(on_update=updates.append):
+                thread.join(timeout=30)
+
+        info = ai_manager.get_model_info()
+        self.assertTrue(info["ready"])
+        self.assertFalse(info["warming_up"])
+        self.assertEqual(updates[-1]["mode"], ai_manager.mode)
+        self.assertGreaterEqual(info["warmup_time"], info["ready_time"])
+        self.assertIn("api", info["backend_times"])
+
+    def test_parallel_backends(self):
+        """
+        Test des tentatives parallèles : l'API sert en attendant Transformers
+        """
+        ai_manager = AIManager(discover=False)
+        transformers_loading = threading.Event()
+
+        def load_transformers():
+            transformers_loading.wait(10)
+            return True
+
+        ai_manager._load_transformers = load_transformers
+        ai_manager._probe_api = lambda: True
+
+        updates = []
+        with mock.patch.object(ai_module, "TRANSFORMERS_AVAILABLE", True):
+            threads = ai_manager.start_warmup(on_update=updates.append)
+
+        # Les requêtes émises avant qu'un moteur soit prêt attendent
+        self.assertTrue(ai_manager.wait_ready(10))
+        self.assertEqual(ai_manager.mode, "api")
+        self.assertTrue(ai_manager.get_model_info()["warming_up"])
+
+        transformers_loading.set()
+        for thread in threads:
+            thread.join(timeout=10)
+        self.assertEqual(ai_manager.mode, "transformers")
+        self.assertEqual([update["mode"] for update in updates], ["api", "transformers"])
+        self.assertLessEqual(ai_manager.ready_time, ai_manager.warmup_time)
+
+    def test_cpu_inference_config(self):
+        """
+        Test du mode d'inférence CPU lu dans la configuration
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            ai_manager = AIManager(discover=False, ai_config={"quantization": "int8", "cpu_threads": 2})
+            default = AIManager(discover=False)
+
+        info = ai_manager.get_model_info()
+        self.assertEqual(info["quantization"], "int8")
+        self.assertEqual(info["cpu_threads"], 2)
+        self.assertEqual(default.get_model_info()["quantization"], "none")
+        self.assertGreaterEqual(default.get_model_info()["cpu_threads"], 1)
+
+        with self.assertRaises(ValueError):
+            AIManager(discover=False, ai_config={"quantization": "int3"})
+
+    def test_stream_simulation(self):
+        """
+        Test du flux en mode simulation : même texte, morceau par morceau
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            ai_manager = AIManager(discover=False)
+            chunks = list(ai_manager.generate_hypotheses_stream("IP: 10.0.0.1"))
+
+        self.assertGreater(len(chunks), 10)
+        self.assertIn("HYPOTHÈSES", "".join(chunks))
+        info = ai_manager.get_model_info()
+        self.assertLessEqual(info["last_ttft"], info["last_generation_time"])
+
+    def test_stream_api(self):
+        """
+        Test du flux NDJSON d'Ollama contre un serveur local de substitution
+        """
+        api_url = start_server(self, FakeOllamaHandler)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ai_manager = AIManager(discover=False, ai_config={"api_url": api_url})
+            ai_manager.mode = "api"
+            started = []
+            stream = ai_manager.generate_hypotheses_stream("IP: 10.0.0.1", on_start=started.append)
+            chunks = [next(stream)]
+            # Le préchauffage bascule de moteur pendant le flux
+            ai_manager.mode = "transformers"
+            chunks.extend(stream)
+
+        self.assertEqual(chunks[:4], FakeOllamaHandler.tokens)
+        self.assertEqual(started, [ai_manager.generation_settings("api")])
+        self.assertIn("Analyse générée le", chunks[-1])
+        self.assertIsNotNone(ai_manager.last_ttft)
+
+    def test_stream_api_error(self):
+        """
+        Test d'un échec de l'API : propagé par le flux, restitué comme texte
+        par la génération complète
+        """
+        api_url = start_server(self, FailingOllamaHandler)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ai_manager = AIManager(discover=False, ai_config={"api_url": api_url})
+            ai_manager.mode = "api"
+            chunks = []
+            with self.assertRaises(ai_module.OllamaError):
+                for chunk in ai_manager.generate_hypotheses_stream("IP: 10.0.0.1"):
+                    chunks.append(chunk)
+            self.assertIn("not found", ai_manager.generate_hypotheses("IP: 10.0.0.1"))
+
+        # Ni texte d'erreur ni horodatage dans le flux
+        self.assertEqual(chunks, [])
+
+    def test_cancel_warmup_wait(self):
+        """
+        Test de l'annulation d'une génération en attente du préchauffage
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            ai_manager = AIManager(discover=False)
+            ai_manager.warming_up = True
+            cancel = threading.Event()
+            threading.Timer(0.1, cancel.set).start()
+            started = time.perf_counter()
+            chunks = list(ai_manager.generate_hypotheses_stream("IP: 10.0.0.1", wait_ready=30, cancel=cancel))
+
+        self.assertEqual(chunks, [])
+        self.assertLess(time.perf_counter() - started, 1)
+
+    def test_lazy_imports(self):
+        """
+        Test de l'import de l'application sans les modules lents
+        """
+        code = ("import sys, chronosense_app; "
+                f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+        result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
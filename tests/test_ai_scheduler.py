@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le planificateur des requêtes IA
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ai_scheduler import (AIScheduler, PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, STATUS_CANCELLED,
+                          STATUS_DONE, STATUS_ERROR)
+
+# Attente maximale dans les tests (s)
+TIMEOUT = 5
+
+
+class GatedAIManager:
+    """
+    Remplace AIManager : chaque génération émet les mots de la description,
+    un par un, quand le test ouvre sa barrière
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = []
+        self.closed = []
+        self.gates = {}
+        self.running = 0
+        self.max_running = 0
+        self.started_event = threading.Event()
+
+    def gate(self, description):
+        with self.lock:
+            return self.gates.setdefault(description, threading.Event())
+
+    def generate_hypotheses_stream(self, description, wait_ready=None, cancel=None, on_start=None):
+        with self.lock:
+            self.started.append(description)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        self.started_event.set()
+        try:
+            for word in description.split():
+                self.gate(description).wait(TIMEOUT)
+                if cancel.is_set():
+                    return
+                if word == "boom":
+                    raise RuntimeError("échec")
+                yield word
+        finally:
+            with self.lock:
+                self.running -= 1
+                self.closed.append(description)
+
+
+class Collector:
+    """
+    Reçoit les morceaux et la fin d'une demande
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.done = threading.Event()
+        self.request = None
+
+    def on_chunk(self, chunk):
+        self.chunks.append(chunk)
+
+    def on_done(self, request):
+        self.request = request
+        self.done.set()
+
+
+class TestAIScheduler(unittest.TestCase):
+    """
+    Tests unitaires pour AIScheduler
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.ai_manager = GatedAIManager()
+
+    def make_scheduler(self, workers):
+        scheduler = AIScheduler(self.ai_manager, workers=workers)
+        self.addCleanup(scheduler.shutdown)
+        return scheduler
+
+    def submit(self, scheduler, description, **options):
+        collector = Collector()
+        request = scheduler.submit(description, on_chunk=collector.on_chunk, on_done=collector.on_done, **options)
+        return request, collector
+
+    def test_coalesce_identical(self):
+        """
+        Test du regroupement : une seule génération pour deux demandes identiques
+        """
+        scheduler = self.make_scheduler(workers=2)
+        first, first_out = self.submit(scheduler, "a b c")
+        self.ai_manager.started_event.wait(TIMEOUT)
+        second, second_out = self.submit(scheduler, "a b c")
+        self.ai_manager.gate("a b c").set()
+
+        self.assertTrue(first_out.done.wait(TIMEOUT))
+        self.assertTrue(second_out.done.wait(TIMEOUT))
+        self.assertEqual(self.ai_manager.started, ["a b c"])
+        self.assertEqual(first_out.chunks, ["a", "b", "c"])
+        self.assertEqual(second_out.chunks, ["a", "b", "c"])
+        self.assertTrue(second.coalesced)
+        self.assertEqual(second.status, STATUS_DONE)
+        self.assertEqual(scheduler.coalesced, 1)
+        self.assertEqual(scheduler.pending_count(), 0)
+
+    def test_priority_and_bounded_pool(self):
+        """
+        Test de la file à priorités servie par un nombre fixe de threads
+        """
+        scheduler = self.make_scheduler(workers=1)
+        _, blocker = self.submit(scheduler, "blocker")
+        self.ai_manager.started_event.wait(TIMEOUT)
+        outputs = [self.submit(scheduler, "background job", priority=PRIORITY_BACKGROUND)[1],
+                   self.submit(scheduler, "interactive job", priority=PRIORITY_INTERACTIVE)[1]]
+        for description in ("blocker", "background job", "interactive job"):
+            self.ai_manager.gate(description).set()
+
+        for output in [blocker] + outputs:
+            self.assertTrue(output.done.wait(TIMEOUT))
+        self.assertEqual(self.ai_manager.started, ["blocker", "interactive job", "background job"])
+        self.assertEqual(self.ai_manager.max_running, 1)
+
+    def test_cancel_stale(self):
+        """
+        Test de l'annulation des générations d'une ancienne version du graphe
+        """
+        scheduler = self.make_scheduler(workers=1)
+        request, output = self.submit(scheduler, "old graph", version=1)
+        pending, pending_output = self.submit(scheduler, "queued graph", version=1)
+        current, current_output = self.submit(scheduler, "new graph", version=2)
+        self.ai_manager.started_event.wait(TIMEOUT)
+
+        self.assertEqual(scheduler.cancel_stale(2), 2)
+        self.assertTrue(output.done.wait(TIMEOUT))
+        self.assertEqual(request.status, STATUS_CANCELLED)
+        self.assertEqual(pending.status, STATUS_CANCELLED)
+
+        # La génération en cours voit l'annulation et son flux est fermé
+        self.ai_manager.gate("old graph").set()
+        self.ai_manager.gate("new graph").set()
+        self.assertTrue(current_output.done.wait(TIMEOUT))
+        self.assertEqual(current.status, STATUS_DONE)
+        self.assertIn("old graph", self.ai_manager.closed)
+        self.assertNotIn("queued graph", self.ai_manager.started)
+
+    def test_cancel_one_subscriber(self):
+        """
+        Test de l'abandon d'une des deux demandes d'une génération partagée
+        """
+        scheduler = self.make_scheduler(workers=1)
+        first, first_out = self.submit(scheduler, "x y")
+        second, second_out = self.submit(scheduler, "x y")
+
+        self.assertTrue(scheduler.cancel(first))
+        self.assertFalse(scheduler.cancel(first))
+        self.ai_manager.gate("x y").set()
+        self.assertTrue(second_out.done.wait(TIMEOUT))
+        self.assertEqual(second.status, STATUS_DONE)
+        self.assertEqual(second_out.chunks, ["x", "y"])
+        self.assertEqual(first_out.request.status, STATUS_CANCELLED)
+
+    def test_error(self):
+        """
+        Test d'une génération en échec
+        """
+        scheduler = self.make_scheduler(workers=1)
+        request, output = self.submit(scheduler, "ok boom")
+        self.ai_manager.gate("ok boom").set()
+        self.assertTrue(output.done.wait(TIMEOUT))
+        self.assertEqual(request.status, STATUS_ERROR)
+        self.assertEqual(str(request.error), "échec")
+        self.assertEqual(output.chunks, ["ok"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour ArtifactClassifier
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from artifact_classifier import ArtifactClassifier, classify_artifacts
+import keyword_matcher
+from keyword_matcher import KeywordMatcher, load_keyword_file
+
+TEST_CASES = [
+    ("192.168.1.1", "ip"),
+    ("256.1.1.1", "default"),
+    ("d41d8cd98f00b204e9800998ecf8427e", "hash"),
+    ("D41D8CD98F00B204E9800998ECF8427E", "hash"),
+    ("malware.exe", "file"),
+    ("C:\\Users\\Public\\REPORT.PDF", "file"),
+    ("powershell.exe", "process"),
+    ("RunDll32", "process"),
+    ("malicious-site.com", "domain"),
+    ("cmdb.example.com", "domain"),
+    ("powershellgallery.com", "domain"),
+    ("psexec-docs.example.org", "domain"),
+    ("unknown_artifact", "default")
+]
+
+
+class TestArtifactClassifier(unittest.TestCase):
+    """
+    Tests unitaires pour la classification unitaire et par colonne
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.classifier = ArtifactClassifier()
+        self.artifacts = [artifact for artifact, _ in TEST_CASES]
+        self.expected = [artifact_type for _, artifact_type in TEST_CASES]
+
+    def test_classify(self):
+        """
+        Test de la classification unitaire
+        """
+        for artifact, expected_type in TEST_CASES:
+            self.assertEqual(self.classifier.classify(artifact), expected_type,
+                             f"Type incorrect pour {artifact}")
+
+    def test_classify_many_inputs(self):
+        """
+        Test de la classification par colonne (liste, NumPy, pandas)
+        """
+        for column in (self.artifacts, np.array(self.artifacts), pd.Series(self.artifacts)):
+            types = self.classifier.classify_many(column)
+            self.assertIsInstance(types, np.ndarray)
+            self.assertEqual(types.tolist(), self.expected)
+
+    def test_classify_many_duplicates_and_missing(self):
+        """
+        Test des doublons et valeurs manquantes dans une colonne
+        """
+        column = pd.Series(["8.8.8.8", None, "8.8.8.8", 42, "evil.exe"])
+        types = classify_artifacts(column)
+        self.assertEqual(types.tolist(), ["ip", "default", "ip", "default", "file"])
+
+        self.assertEqual(len(self.classifier.classify_many([])), 0)
+        self.assertEqual(self.classifier.classify_many([None]).tolist(), ["default"])
+
+    def test_custom_keywords(self):
+        """
+        Test d'un classifieur construit avec d'autres mots-clés
+        """
+        classifier = ArtifactClassifier(keywords={'tool': ["mimikatz"], 'extension': [".lnk"]})
+        self.assertEqual(classifier.classify("mimikatz.exe"), "process")
+        self.assertEqual(classifier.classify("invoice.lnk"), "file")
+        self.assertEqual(classifier.classify("powershell"), "default")
+
+    def test_tags(self):
+        """
+        Test de l'étiquetage par catégories de mots-clés
+        """
+        artifact_type, tags = self.classifier.analyze("C:\\Windows\\System32\\certutil.exe")
+        self.assertEqual(artifact_type, "process")
+        self.assertIn("lolbin", tags)
+
+        # Les labels d'un nom d'hôte ne portent pas de mots-clés
+        self.assertEqual(self.classifier.analyze("https://powershellgallery.com/packages")[1], frozenset())
+
+        types, tags = self.classifier.classify_many(["mimikatz.exe", "8.8.8.8"], return_tags=True)
+        self.assertEqual(types.tolist(), ["process", "ip"])
+        self.assertIn("tool", tags[0])
+        self.assertEqual(tags[1], frozenset())
+
+    def test_reload_keywords(self):
+        """
+        Test du rechargement à chaud du dictionnaire de mots-clés
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "keywords.txt")
+            with open(path, 'w', encoding='utf-8') as keyword_file:
+                keyword_file.write("# test\n[tool]\nevilgrab\n\n[extension]\n.xyz\n")
+
+            self.assertEqual(self.classifier.classify("evilgrab"), "default")
+            count = self.classifier.reload_keywords(keyword_file=path)
+
+            self.assertEqual(count, 2)
+            self.assertEqual(self.classifier.classify("EvilGrab"), "process")
+            self.assertEqual(self.classifier.classify("dump.xyz"), "file")
+            self.assertEqual(self.classifier.classify("malware.exe"), "domain")
+
+        with self.assertRaises(FileNotFoundError):
+            self.classifier.reload_keywords(keyword_file="/nonexistent/keywords.txt")
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """
+    Tests unitaires pour l'automate d'Aho-Corasick
+    """
+
+    def test_overlapping_keywords(self):
+        """
+        Test de mots-clés imbriqués et chevauchants
+        """
+        matcher = KeywordMatcher({'a': ["he", "hers"], 'b': ["she"], 'c': ["his"], 'd': ["xyz"]})
+        self.assertEqual(len(matcher), 5)
+        self.assertEqual(matcher.match_categories("USHERS"), frozenset({'a', 'b'}))
+        self.assertEqual(matcher.match_categories("this"), frozenset({'c'}))
+        self.assertEqual(matcher.match_categories("nothing"), frozenset())
+
+    def test_match_many(self):
+        """
+        Test de la recherche par lots : mêmes catégories qu'à l'unité
+        """
+        matcher = KeywordMatcher({'a': ["he", "hers"], 'b': ["she"], 'c': ["his"], 'd': ["xyz"]})
+        texts = ["USHERS", "this", "nothing", "", "he\0rs", "xyzhe", "Ørsted Hİs", "x" * 5000 + "she"]
+        expected = [matcher.match_categories(text) for text in texts]
+        self.assertEqual(matcher.match_many(texts), expected)
+        self.assertEqual(matcher.match_many([]), [])
+        self.assertEqual(KeywordMatcher({}).match_many(texts), [frozenset()] * len(texts))
+
+        # Table de transitions trop grande : parcours texte par texte
+        with mock.patch.object(keyword_matcher, "MAX_TABLE_CELLS", 0):
+            self.assertEqual(KeywordMatcher({'a': ["he", "hers"], 'b': ["she"], 'c': ["his"], 'd': ["xyz"]})
+                             .match_many(texts), expected)
+
+    def test_load_keyword_file_errors(self):
+        """
+        Test d'un dictionnaire avec un mot-clé hors section
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "keywords.txt")
+            with open(path, 'w', encoding='utf-8') as keyword_file:
+                keyword_file.write("orphelin\n")
+            with self.assertRaises(ValueError):
+                load_keyword_file(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'enregistrement des dossiers et l'export sans interface
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Ajouter le répertoire src au path
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from batch_export import export_cases, render_case
+from graph_manager import GraphManager
+
+
+def build_case(path, size=30, layout=True):
+    """
+    Enregistre un dossier en étoile de size artéfacts
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        graph_manager = GraphManager()
+        artifacts = [f"host-{i}.example.com" for i in range(size)]
+        graph_manager.add_nodes_bulk(artifacts)
+        graph_manager.add_edges_bulk((artifacts[0], artifact) for artifact in artifacts[1:])
+        if layout:
+            graph_manager.layout.update(graph_manager.graph)
+        graph_manager.save_case(path)
+    return graph_manager
+
+
+class TestCaseFiles(unittest.TestCase):
+    """
+    Tests de save_case / load_case
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "case.json")
+
+    def tearDown(self):
+        """
+        Nettoyage après chaque test
+        """
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """
+        Test de la relecture : artéfacts, liens et disposition conservés
+        """
+        original = build_case(self.path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            loaded = GraphManager()
+            loaded.load_case(self.path)
+
+        self.assertEqual(loaded.get_node_count(), 30)
+        self.assertEqual(loaded.get_edge_count(), 29)
+        self.assertEqual(sorted(loaded.stats.edges()), sorted(original.stats.edges()))
+        self.assertEqual(loaded.layout.positions.keys(), original.layout.positions.keys())
+        for artifact, position in original.layout.positions.items():
+            self.assertEqual(tuple(loaded.layout.positions[artifact]), tuple(position))
+
+    def test_invalid_case(self):
+        """
+        Test du rejet d'un fichier qui n'est pas un dossier
+        """
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{"format": "autre"}')
+        with contextlib.redirect_stdout(io.StringIO()):
+            graph_manager = GraphManager()
+            with self.assertRaises(ValueError):
+                graph_manager.load_case(self.path)
+
+
+class TestBatchExport(unittest.TestCase):
+    """
+    Tests du rendu Agg et de l'export par lots
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cases = os.path.join(self.tmp.name, "cases")
+        self.output = os.path.join(self.tmp.name, "images")
+        os.makedirs(self.cases)
+
+    def tearDown(self):
+        """
+        Nettoyage après chaque test
+        """
+        self.tmp.cleanup()
+
+    def test_render_png_svg(self):
+        """
+        Test du rendu d'un dossier en PNG et SVG, titre compris
+        """
+        case_path = os.path.join(self.cases, "case.json")
+        build_case(case_path, layout=False)
+        png = os.path.join(self.tmp.name, "case.png")
+        svg = os.path.join(self.tmp.name, "case.svg")
+        with contextlib.redirect_stdout(io.StringIO()):
+            render_case(case_path, [png, svg], figsize=(4, 3), dpi=50)
+
+        with open(png, 'rb') as f:
+            self.assertEqual(f.read(8), b'\x89PNG\r\n\x1a\n')
+        with open(svg, encoding='utf-8') as f:
+            # Le titre (animé à l'écran) doit figurer dans l'image
+            self.assertIn("30 artéfacts, 29 liens", f.read())
+
+    def test_export_cases(self):
+        """
+        Test de l'export d'un répertoire, dans le processus courant et en parallèle
+        """
+        for i in range(3):
+            build_case(os.path.join(self.cases, f"case{i}.json"), size=10 + i)
+        with open(os.path.join(self.cases, "broken.json"), 'w', encoding='utf-8') as f:
+            f.write("{")
+
+        for workers in (1, 2):
+            progress = []
+            results = export_cases(self.cases, self.output, ("png",), workers=workers,
+                                   dpi=30, progress=lambda done, total: progress.append(done))
+            self.assertEqual(len(results), 4)
+            self.assertEqual(progress, [1, 2, 3, 4])
+            failures = [case_path for case_path, _, error in results if error is not None]
+            self.assertEqual([os.path.basename(case_path) for case_path in failures], ["broken.json"])
+            for i in range(3):
+                self.assertTrue(os.path.exists(os.path.join(self.output, f"case{i}.png")))
+
+    def test_no_tkinter(self):
+        """
+        Test de l'export sans que tkinter soit importé
+        """
+        code = ("import sys; import batch_export, graph_manager; "
+                "sys.exit(1 if 'tkinter' in sys.modules else 0)")
+        result = subprocess.run([sys.executable, "-c", code], cwd=SRC_DIR)
+        self.assertEqual(result.returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour la disposition incrémentale du graphe
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+import networkx as nx
+import numpy as np
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from config_manager import load_config
+import graph_layout
+from graph_layout import BarnesHutLayoutEngine, PositionCache, graph_snapshot
+from graph_manager import GraphManager
+
+
+class TestPositionCache(unittest.TestCase):
+    """
+    Tests unitaires pour le cache de positions
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.graph = nx.path_graph(30)
+        self.cache = PositionCache(seed=42)
+        self.initial = self.cache.update(self.graph)
+
+    def test_new_node_moves_only_its_neighborhood(self):
+        """
+        Test d'un ajout : le reste du graphe ne bouge pas
+        """
+        self.graph.add_edge(29, 30)
+        positions = self.cache.update(self.graph)
+
+        self.assertIn(30, positions)
+        for node in range(29):
+            np.testing.assert_array_equal(positions[node], self.initial[node])
+
+        distance = np.linalg.norm(positions[30] - positions[29])
+        extent = np.ptp(np.array(list(self.initial.values())), axis=0).max()
+        self.assertLess(distance, extent / 2)
+
+    def test_update_without_change_is_stable(self):
+        """
+        Test de deux affichages successifs sans mutation
+        """
+        positions = self.cache.update(self.graph)
+        for node in self.graph:
+            np.testing.assert_array_equal(positions[node], self.initial[node])
+
+    def test_remove_and_invalidate(self):
+        """
+        Test de la suppression d'un nœud puis d'une disposition complète
+        """
+        neighbors = list(self.graph.neighbors(15))
+        self.graph.remove_node(15)
+        self.cache.remove(15, neighbors)
+        positions = self.cache.update(self.graph)
+
+        self.assertNotIn(15, positions)
+        self.assertNotIn(15, self.cache.positions)
+        np.testing.assert_array_equal(positions[0], self.initial[0])
+
+        self.cache.invalidate()
+        positions = self.cache.update(self.graph)
+        self.assertEqual(set(positions), set(self.graph))
+        self.assertFalse(np.array_equal(positions[0], self.initial[0]))
+
+
+class TestBarnesHutLayoutEngine(unittest.TestCase):
+    """
+    Tests unitaires pour le moteur Barnes-Hut / ForceAtlas2
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.engine = BarnesHutLayoutEngine()
+
+    def test_repulsion_matches_exact_forces(self):
+        """
+        Test de l'approximation hiérarchique face au calcul exact O(n²)
+        """
+        rng = np.random.default_rng(0)
+        pos = rng.normal(size=(600, 2)) * 10
+        pos[:300] *= 0.01
+        mass = rng.integers(1, 5, 600).astype(float)
+
+        delta = pos[:, None, :] - pos[None, :, :]
+        squared = (delta ** 2).sum(axis=2)
+        np.fill_diagonal(squared, np.inf)
+        weight = self.engine.repulsion * mass[:, None] * mass[None, :] / squared
+        exact = (delta * weight[..., None]).sum(axis=1)
+
+        error = np.linalg.norm(self.engine._repulsion(pos, mass) - exact, axis=1) / np.linalg.norm(exact, axis=1)
+        self.assertLess(np.median(error), 0.02)
+
+    def test_layout_groups_neighbors(self):
+        """
+        Test d'une disposition complète : arêtes courtes, arrêt anticipé
+        """
+        graph = nx.connected_caveman_graph(20, 10)
+        nodes, edges = graph_snapshot(graph)
+        positions, iterations = self.engine.run(len(nodes), edges, iterations=500, seed=0)
+
+        self.assertTrue(np.isfinite(positions).all())
+        self.assertLess(iterations, 500)
+        edge_length = np.linalg.norm(positions[edges[:, 0]] - positions[edges[:, 1]], axis=1).mean()
+        pairs = np.random.default_rng(0).integers(0, len(nodes), (2000, 2))
+        random_length = np.linalg.norm(positions[pairs[:, 0]] - positions[pairs[:, 1]], axis=1).mean()
+        self.assertLess(edge_length, random_length / 3)
+
+    def test_fixed_nodes(self):
+        """
+        Test des nœuds immobiles lors d'un affinage
+        """
+        graph = nx.path_graph(50)
+        nodes, edges = graph_snapshot(graph)
+        start = np.random.default_rng(0).normal(size=(50, 2))
+        fixed = np.ones(50, dtype=bool)
+        fixed[10:15] = False
+
+        positions, _ = self.engine.run(50, edges, positions=start, fixed=fixed, iterations=10, seed=0)
+        np.testing.assert_array_equal(positions[fixed], start[fixed])
+        self.assertFalse(np.allclose(positions[~fixed], start[~fixed]))
+
+
+class TestLayoutSelection(unittest.TestCase):
+    """
+    Tests du choix du moteur selon la taille et la configuration
+    """
+
+    def test_engine_for(self):
+        """
+        Test des seuils du mode automatique et d'un algorithme imposé
+        """
+        cache = PositionCache(threshold=10, barnes_hut_threshold=500)
+        self.assertEqual(cache.engine_for(5).name, "circular")
+        self.assertEqual(cache.engine_for(100).name, "spring")
+        self.assertEqual(cache.engine_for(5000).name, "barnes_hut")
+
+        cache = PositionCache(algorithm="forceatlas2", threshold=0)
+        self.assertEqual(cache.engine_for(5).name, "barnes_hut")
+
+        with self.assertRaises(ValueError):
+            PositionCache(algorithm="inconnu")
+
+    def test_spring_without_scipy(self):
+        """
+        Test d'un "spring" imposé sur un grand graphe, scipy absent
+        """
+        with mock.patch.object(graph_layout, "SCIPY_AVAILABLE", False):
+            cache = PositionCache(algorithm="spring")
+            self.assertEqual(cache.engine_for(100).name, "spring")
+            self.assertEqual(cache.engine_for(600).name, "barnes_hut")
+
+            positions = cache.update(nx.path_graph(600))
+        self.assertEqual(len(positions), 600)
+
+    def test_from_config(self):
+        """
+        Test de la lecture de interface.graph_layout dans config.json
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "config.json")
+            with open(path, 'w', encoding='utf-8') as config_file:
+                json.dump({"interface": {"graph_layout": "barnes_hut", "layout_iterations": 20}}, config_file)
+            config = load_config(path)
+
+        self.assertEqual(config["interface"]["layout_threshold"], 10)
+        self.assertEqual(config["ai"]["mode"], "simulation")
+
+        cache = PositionCache.from_config(config["interface"], seed=0)
+        graph = nx.path_graph(30)
+        cache.update(graph)
+        self.assertEqual(cache.last_run['engine'], "barnes_hut")
+        self.assertLessEqual(cache.last_run['iterations'], 20)
+
+
+class TestGraphManagerLayout(unittest.TestCase):
+    """
+    Tests de l'invalidation du cache par le GraphManager
+    """
+
+    def test_cache_follows_mutations(self):
+        """
+        Test de l'invalidation sur remove_node et clear_graph
+        """
+        graph_manager = GraphManager()
+        artifacts = [f"10.0.0.{i}" for i in range(20)]
+        graph_manager.add_nodes_bulk(artifacts)
+        graph_manager.add_edges_bulk(zip(artifacts, artifacts[1:]))
+        graph_manager.layout.update(graph_manager.graph)
+
+        node_id = graph_manager.artifact_to_id["10.0.0.5"]
+        graph_manager.remove_node("10.0.0.5")
+        self.assertNotIn(node_id, graph_manager.layout.positions)
+
+        graph_manager.clear_graph()
+        self.assertEqual(graph_manager.layout.positions, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
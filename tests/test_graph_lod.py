@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le niveau de détail du rendu
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import unittest
+
+import networkx as nx
+import numpy as np
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_layout import graph_snapshot
+from graph_lod import aggregate, detect_communities, main_groups, spread_labels, top_k_by_degree
+
+
+class TestGraphLod(unittest.TestCase):
+    """
+    Tests unitaires pour les regroupements et le choix des étiquettes
+    """
+
+    def test_detect_communities(self):
+        """
+        Test de la propagation d'étiquettes sur des cliques reliées en anneau
+        """
+        graph = nx.connected_caveman_graph(6, 8)
+        nodes, edges = graph_snapshot(graph)
+        communities = detect_communities(len(nodes), edges)
+
+        self.assertEqual(len(communities), 48)
+        for cave in range(6):
+            members = communities[[nodes.index(node) for node in range(cave * 8, cave * 8 + 8)]]
+            # Au plus un nœud de liaison change de communauté
+            self.assertGreaterEqual(np.bincount(members).max(), 7)
+        self.assertLessEqual(communities.max() + 1, 12)
+
+    def test_top_k_and_main_groups(self):
+        """
+        Test du classement par degré et de la réunion des petits groupes
+        """
+        degrees = np.array([5, 1, 9, 3, 7])
+        self.assertEqual(top_k_by_degree(degrees, [0, 1, 3, 4], 2).tolist(), [4, 0])
+        self.assertEqual(top_k_by_degree(degrees, [1, 3], 5).tolist(), [3, 1])
+
+        groups, kept = main_groups([0, 0, 0, 1, 2, 2, 3], 3)
+        self.assertEqual(kept.tolist(), [0, 2])
+        self.assertEqual(groups.tolist(), [0, 0, 0, 2, 1, 1, 2])
+
+    def test_aggregate_follows_view(self):
+        """
+        Test du regroupement par (groupe, cellule) : il se scinde en zoomant
+        """
+        positions = np.array([[0.0, 0.0], [0.1, 0.1], [0.2, 0.0], [9.0, 9.0], [9.1, 9.0]])
+        groups = np.array([0, 0, 1, 0, 0])
+        edges = np.array([[0, 1], [1, 2], [2, 3], [3, 4], [0, 3], [1, 4]])
+        selection = np.arange(5)
+
+        wide = aggregate(positions, groups, edges, selection, ((0, 10), (0, 10)), cells=2)
+        self.assertEqual(sorted(wide.counts.tolist()), [1, 2, 2])
+        self.assertEqual(wide.counts.sum(), 5)
+        # Arêtes internes ignorées, arêtes parallèles comptées
+        self.assertEqual(sorted(wide.edge_counts.tolist()), [1, 1, 2])
+        np.testing.assert_allclose(wide.centers[wide.members[0]], [0.05, 0.05])
+
+        close = aggregate(positions, groups, edges, selection, ((0, 0.1), (0, 0.1)), cells=2)
+        self.assertEqual(len(close.counts), 5)
+
+        # Grille alignée sur l'origine : un déplacement de la vue ne
+        # redécoupe pas les super-nœuds
+        shifted = aggregate(positions, groups, edges, selection, ((9.05, 19.05), (9.05, 19.05)), cells=2)
+        self.assertEqual(shifted.counts.tolist(), wide.counts.tolist())
+
+    def test_spread_labels(self):
+        """
+        Test d'une étiquette au plus par zone de la vue
+        """
+        positions = np.array([[0.0, 0.0], [0.1, 0.0], [5.0, 5.0], [9.0, 0.0]])
+        chosen = spread_labels(positions, np.array([1, 0, 2, 3]), ((0, 10), (0, 10)), 10, cells=2)
+        self.assertEqual(chosen.tolist(), [1, 2, 3])
+        self.assertEqual(spread_labels(positions, np.array([1, 0, 2, 3]), ((0, 10), (0, 10)), 2,
+                                       cells=2).tolist(), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ Auteur: Généré automatiquement
 Version: 0.1
 """
 
+import gc
 import unittest
 import sys
 import os
@@ -97,6 +98,17 @@ class TestGraphManager(unittest.TestCase):
             self.assertEqual(detected_type, expected_type, 
                            f"Type incorrect pour {artifact}: attendu {expected_type}, obtenu {detected_type}")
     
+    def test_node_tags(self):
+        """
+        Test de l'étiquetage des nœuds par le dictionnaire de mots-clés
+        """
+        node_id = self.graph_manager.add_node("certutil.exe")
+        result = self.graph_manager.add_nodes_bulk(["mimikatz.exe"])
+
+        self.assertEqual(self.graph_manager.graph.nodes[node_id]['type'], 'process')
+        self.assertIn('lolbin', self.graph_manager.graph.nodes[node_id]['tags'])
+        self.assertIn('tool', self.graph_manager.graph.nodes[result['added'][0]]['tags'])
+    
     def test_add_edge(self):
         """
         Test d'ajout d'arêtes entre nœuds
@@ -110,6 +122,78 @@ class TestGraphManager(unittest.TestCase):
         
         self.assertEqual(self.graph_manager.get_edge_count(), 1)
     
+    def test_add_nodes_bulk(self):
+        """
+        Test d'ajout en masse avec doublons et artéfacts invalides
+        """
+        self.graph_manager.add_node("192.168.1.1")
+
+        result = self.graph_manager.add_nodes_bulk(
+            ["192.168.1.1", "malware.exe", "", "malware.exe", "8.8.8.8"]
+        )
+
+        self.assertEqual(len(result['added']), 2)
+        self.assertEqual(len(result['errors']), 3)
+        self.assertEqual(self.graph_manager.get_node_count(), 3)
+
+        for node_id in result['added']:
+            artifact = self.graph_manager.id_to_artifact[node_id]
+            self.assertEqual(self.graph_manager.artifact_to_id[artifact], node_id)
+            self.assertEqual(self.graph_manager.graph.nodes[node_id]['artifact'], artifact)
+
+    def test_add_nodes_bulk_ignore_duplicates(self):
+        """
+        Test d'ajout en masse en ignorant les doublons
+        """
+        result = self.graph_manager.add_nodes_bulk(
+            ["8.8.8.8", "8.8.8.8", "evil.exe"], ignore_duplicates=True
+        )
+
+        self.assertEqual(len(result['added']), 2)
+        self.assertEqual(result['skipped'], 1)
+        self.assertEqual(result['errors'], [])
+
+    def test_add_edges_bulk(self):
+        """
+        Test d'ajout d'arêtes en masse avec erreurs par élément
+        """
+        self.graph_manager.add_nodes_bulk(["192.168.1.1", "malware.exe", "cmd.exe"])
+
+        result = self.graph_manager.add_edges_bulk([
+            ("192.168.1.1", "malware.exe"),
+            ("malware.exe", "cmd.exe", "spawned"),
+            ("malware.exe", "nonexistent"),
+            "invalide"
+        ])
+
+        self.assertEqual(result['added'], 2)
+        self.assertEqual(len(result['errors']), 2)
+        self.assertEqual(self.graph_manager.get_edge_count(), 2)
+
+        node1 = self.graph_manager.artifact_to_id["malware.exe"]
+        node2 = self.graph_manager.artifact_to_id["cmd.exe"]
+        self.assertEqual(self.graph_manager.graph.edges[node1, node2]['relationship'], "spawned")
+
+    def test_add_edges_bulk_counts_new_edges(self):
+        """
+        Test du nombre d'arêtes ajoutées : doublons et arêtes existantes exclus
+        """
+        self.graph_manager.add_nodes_bulk(["a.exe", "b.exe", "c.exe"])
+
+        result = self.graph_manager.add_edges_bulk([("a.exe", "b.exe"), ("b.exe", "a.exe"),
+                                                    ("a.exe", "b.exe", "beacon")])
+        self.assertEqual(result['added'], 1)
+        self.assertEqual(self.graph_manager.get_edge_count(), 1)
+        node1 = self.graph_manager.artifact_to_id["a.exe"]
+        node2 = self.graph_manager.artifact_to_id["b.exe"]
+        self.assertEqual(self.graph_manager.graph.edges[node1, node2]['relationship'], "beacon")
+
+        result = self.graph_manager.add_edges_bulk([("b.exe", "a.exe"), ("b.exe", "c.exe")])
+        self.assertEqual(result['added'], 1)
+        self.assertEqual(self.graph_manager.get_edge_count(), 2)
+        self.assertEqual(self.graph_manager.graph.edges[node1, node2]['relationship'], "connected")
+        self.assertTrue(gc.isenabled())
+
     def test_add_edge_nonexistent_nodes(self):
         """
         Test d'ajout d'arête avec des nœuds inexistants
@@ -195,6 +279,89 @@ class TestGraphManager(unittest.TestCase):
         self.assertIn("Types d'artéfacts", summary)
         self.assertIn("Artéfacts détectés", summary)
     
+    def test_graph_summary_incremental(self):
+        """
+        Test du résumé maintenu au fil des ajouts, suppressions et effacements
+        """
+        self.graph_manager.add_nodes_bulk(["192.168.1.1", "malware.exe", "8.8.8.8"])
+        self.graph_manager.add_node("cmd.exe")
+        self.graph_manager.add_edge("192.168.1.1", "malware.exe", "downloaded")
+        self.graph_manager.add_edge("malware.exe", "cmd.exe", "spawned")
+        
+        summary = self.graph_manager.get_graph_summary()
+        self.assertIn("IP: 2", summary)
+        self.assertIn("malware.exe <-> cmd.exe (spawned)", summary)
+        
+        self.graph_manager.remove_node("malware.exe")
+        summary = self.graph_manager.get_graph_summary()
+        self.assertNotIn("malware.exe", summary)
+        self.assertNotIn("Connexions", summary)
+        self.assertNotIn("File", summary)
+        self.assertEqual(self.graph_manager.stats.sorted_artifacts, ["192.168.1.1", "8.8.8.8", "cmd.exe"])
+        
+        version = self.graph_manager.version
+        self.graph_manager.clear_graph()
+        self.assertGreater(self.graph_manager.version, version)
+        self.assertIn("Graphe vide", self.graph_manager.get_graph_summary())
+    
+    def test_graph_summary_pages_and_top_k(self):
+        """
+        Test de la pagination et de la troncature du résumé
+        """
+        artifacts = [f"artifact_{i:03d}" for i in range(50)]
+        self.graph_manager.add_nodes_bulk(artifacts)
+        self.graph_manager.add_edges_bulk(zip(artifacts, artifacts[1:]))
+        
+        full_lines = self.graph_manager.get_summary_lines()
+        self.assertEqual(len(full_lines), self.graph_manager.get_summary_line_count())
+        self.assertEqual(self.graph_manager.get_summary_lines(10, 5), full_lines[10:15])
+        self.assertEqual(self.graph_manager.get_graph_summary(page=1, page_size=20),
+                         "\n".join(full_lines[20:40]))
+        
+        summary = self.graph_manager.get_graph_summary(top_k=5)
+        self.assertIn("artifact_004", summary)
+        self.assertNotIn("🔍 artifact_005", summary)
+        self.assertNotIn("artifact_006", summary)
+        self.assertIn("… et 45 autres", summary)
+        self.assertIn("… et 44 autres", summary)
+
+    def test_find_summary_line(self):
+        """
+        Test de la recherche dans le résumé sans le construire
+        """
+        artifacts = [f"artifact_{i:03d}" for i in range(50)]
+        self.graph_manager.add_nodes_bulk(artifacts)
+        self.graph_manager.add_edges_bulk([("artifact_010", "artifact_042", "beacon")])
+
+        lines = self.graph_manager.get_summary_lines()
+        index = self.graph_manager.find_summary_line("ARTIFACT_042")
+        self.assertTrue(lines[index].endswith("artifact_042"))
+
+        index = self.graph_manager.find_summary_line("artifact_042", index + 1)
+        self.assertIn("<-> artifact_042 (beacon)", lines[index])
+        self.assertEqual(self.graph_manager.find_summary_line("artifact_042", index + 1), -1)
+
+        index = self.graph_manager.find_summary_line("beacon", top_k=5)
+        self.assertIn("(beacon)", self.graph_manager.get_summary_lines(index, 1, top_k=5)[0])
+        self.assertEqual(self.graph_manager.find_summary_line("artifact_041", top_k=5), -1)
+
+    def test_search_artifacts(self):
+        """
+        Test de la recherche par préfixe, insensible à la casse et paginée
+        """
+        self.graph_manager.add_nodes_bulk(["Evil.exe", "evil.dll", "explorer.exe", "8.8.8.8"])
+        self.graph_manager.add_node("EVIL-HOST")
+        
+        self.assertEqual(self.graph_manager.search_artifacts("ev"), (["EVIL-HOST", "evil.dll", "Evil.exe"], 3))
+        self.assertEqual(self.graph_manager.search_artifacts("EVIL", 1, 1), (["evil.dll"], 3))
+        self.assertEqual(self.graph_manager.search_artifacts("zz"), ([], 0))
+        self.assertEqual(self.graph_manager.search_artifacts("")[1], 5)
+        
+        self.graph_manager.remove_node("Evil.exe")
+        self.assertEqual(self.graph_manager.search_artifacts("evil."), (["evil.dll"], 1))
+        self.graph_manager.clear_graph()
+        self.assertEqual(self.graph_manager.search_artifacts("e"), ([], 0))
+    
     def test_graph_description(self):
         """
         Test de génération de la description pour l'IA
@@ -259,6 +426,75 @@ class TestGraphManager(unittest.TestCase):
             description = self.graph_manager._generate_node_description(artifact, artifact_type)
             self.assertEqual(description, expected_desc)
 
+class TestGraphManagerColumnar(TestGraphManager):
+    """
+    Rejoue les tests unitaires avec le stockage colonnaire
+    """
+    
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.graph_manager = GraphManager(storage="columnar")
+    
+    def test_integer_ids_and_lazy_attributes(self):
+        """
+        Test des identifiants entiers et des attributs générés à la lecture
+        """
+        node_id = self.graph_manager.add_node("192.168.1.1")
+        self.graph_manager.add_node("evil.exe")
+        self.graph_manager.add_edge("192.168.1.1", "evil.exe", "downloaded")
+        
+        self.assertEqual(node_id, 0)
+        attributes = self.graph_manager.graph.nodes[node_id]
+        self.assertEqual(attributes['type'], 'ip')
+        self.assertEqual(attributes['description'], "Adresse IP: 192.168.1.1")
+        self.assertIn('T', attributes['timestamp'])
+        self.assertEqual(self.graph_manager.graph.degree[node_id], 1)
+        self.assertEqual(list(self.graph_manager.graph.neighbors(node_id)), [1])
+        
+        graph = self.graph_manager.graph.to_networkx(with_attributes=True)
+        self.assertEqual(graph.edges[0, 1]['relationship'], "downloaded")
+    
+    def test_remove_node_with_edges(self):
+        """
+        Test de suppression d'un nœud relié (identifiants non réutilisés)
+        """
+        self.graph_manager.add_nodes_bulk(["192.168.1.1", "evil.exe", "cmd.exe"])
+        self.graph_manager.add_edges_bulk([("192.168.1.1", "evil.exe"), ("evil.exe", "cmd.exe")])
+        
+        self.graph_manager.remove_node("evil.exe")
+        
+        self.assertEqual(self.graph_manager.get_node_count(), 2)
+        self.assertEqual(self.graph_manager.get_edge_count(), 0)
+        self.assertEqual(sorted(self.graph_manager.id_to_artifact), [0, 2])
+        self.assertEqual(self.graph_manager.add_node("evil.exe"), 3)
+    
+    def test_remove_node_with_self_loop(self):
+        """
+        Test de suppression d'un nœud relié à lui-même (cmd.exe lançant cmd.exe)
+        """
+        self.graph_manager.add_nodes_bulk(["cmd.exe", "evil.exe"])
+        self.graph_manager.add_edge("cmd.exe", "cmd.exe", "spawned")
+        self.graph_manager.add_edge("cmd.exe", "evil.exe", "spawned")
+        self.assertEqual(self.graph_manager.get_edge_count(), 2)
+        
+        self.graph_manager.remove_node("cmd.exe")
+        
+        self.assertEqual(self.graph_manager.get_node_count(), 1)
+        self.assertEqual(self.graph_manager.get_edge_count(), 0)
+        self.assertEqual(self.graph_manager.graph.number_of_edges(), 0)
+        self.assertEqual(self.graph_manager.graph.degree[1], 0)
+        self.graph_manager.add_edge("evil.exe", "evil.exe", "spawned")
+        self.assertEqual(self.graph_manager.get_edge_count(), 1)
+    
+    def test_invalid_storage(self):
+        """
+        Test d'un mode de stockage inconnu
+        """
+        with self.assertRaises(ValueError):
+            GraphManager(storage="inconnu")
+
 class TestGraphManagerIntegration(unittest.TestCase):
     """
     Tests d'intégration pour GraphManager
@@ -331,6 +567,7 @@ if __name__ == '__main__':
     
     # Ajouter les tests
     suite.addTests(loader.loadTestsFromTestCase(TestGraphManager))
+    suite.addTests(loader.loadTestsFromTestCase(TestGraphManagerColumnar))
     suite.addTests(loader.loadTestsFromTestCase(TestGraphManagerIntegration))
     
     # Lancer les tests avec un runner verbeux
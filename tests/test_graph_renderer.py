@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le rendu retenu du graphe
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import unittest
+import warnings
+
+import numpy as np
+from matplotlib.backend_bases import MouseEvent
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_manager import GraphManager
+from graph_navigation import ViewNavigator
+from graph_selection import SelectionTool
+from graph_renderer import GraphRenderer, MODE_AGGREGATE, MODE_DETAIL, UPDATE_BLIT, UPDATE_FULL
+
+
+def style(node):
+    """
+    Style de test : couleur fixe, étiquette = ID, type selon la parité
+    """
+    return '#FF6B6B', str(node), "pair" if node % 2 == 0 else "impair"
+
+
+def make_canvas():
+    """
+    Figure et canvas Agg (sans interface)
+    """
+    figure = Figure(figsize=(4, 3), dpi=50)
+    return figure, FigureCanvasAgg(figure)
+
+
+class TestGraphRenderer(unittest.TestCase):
+    """
+    Tests unitaires pour GraphRenderer
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        # Les emojis du message d'accueil manquent dans la police par défaut
+        warnings.filterwarnings("ignore", message="Glyph")
+        self.figure, self.canvas = make_canvas()
+        self.renderer = GraphRenderer(self.figure, self.figure.add_subplot(111), self.canvas)
+        self.nodes = list(range(10))
+        self.positions = np.column_stack((np.arange(10.0), np.arange(10.0) % 3))
+        self.edges = np.array([[i, i + 1] for i in range(9)])
+        self.renderer.update(self.nodes, self.positions, self.edges, style, "Titre")
+
+    def test_full_update_reuses_artists(self):
+        """
+        Test d'un rendu complet : mêmes artistes, mis à jour sur place
+        """
+        self.assertEqual(self.renderer.last_update, UPDATE_FULL)
+        self.assertEqual(len(self.renderer.nodes.get_offsets()), 10)
+        self.assertEqual(len(self.renderer.edges.get_segments()), 9)
+        self.assertEqual(len(self.renderer.labels), 10)
+        self.assertFalse(self.renderer.empty_text.get_visible())
+
+        artists = len(self.renderer.ax.get_children())
+        label = self.renderer.labels[3]
+        self.renderer.update(self.nodes, self.positions * 2, self.edges, style, "Titre")
+        self.assertEqual(self.renderer.last_update, UPDATE_FULL)
+        self.assertIs(self.renderer.labels[3], label)
+        self.assertEqual(label.get_position(), (6.0, 0.0))
+        self.assertEqual(len(self.renderer.ax.get_children()), artists)
+
+    def test_addition_is_blitted(self):
+        """
+        Test d'un ajout sans déplacement : seuls les nouveaux éléments sont peints
+        """
+        positions = np.vstack((self.positions, [[4.5, 1.0]]))
+        edges = np.vstack((self.edges, [[4, 10]]))
+        self.renderer.update(self.nodes + [10], positions, edges, style, "Titre 2")
+
+        self.assertEqual(self.renderer.last_update, UPDATE_BLIT)
+        self.assertEqual(len(self.renderer.labels), 11)
+        self.assertEqual(len(self.renderer.recent_nodes.get_offsets()), 1)
+        self.assertEqual(len(self.renderer.recent_edges.get_segments()), 1)
+        # Les grandes collections ne sont pas reconstruites
+        self.assertEqual(len(self.renderer.nodes.get_offsets()), 10)
+        self.assertEqual(self.renderer.title.get_text(), "Titre 2")
+
+        # Un nœud hors du cadre impose un rendu complet, qui fusionne les ajouts
+        positions = np.vstack((positions, [[100.0, 100.0]]))
+        self.renderer.update(self.nodes + [10, 11], positions, edges, style, "Titre 3")
+        self.assertEqual(self.renderer.last_update, UPDATE_FULL)
+        self.assertEqual(len(self.renderer.nodes.get_offsets()), 12)
+        self.assertEqual(len(self.renderer.recent_nodes.get_offsets()), 0)
+
+    def test_removal_and_empty(self):
+        """
+        Test d'une suppression puis du retour au graphe vide
+        """
+        self.renderer.update(self.nodes[:5], self.positions[:5], self.edges[:4], style, "Titre")
+        self.assertEqual(self.renderer.last_update, UPDATE_FULL)
+        self.assertEqual(sorted(self.renderer.labels), self.nodes[:5])
+
+        self.renderer.show_empty()
+        self.assertEqual(self.renderer.labels, {})
+        self.assertTrue(self.renderer.empty_text.get_visible())
+        self.assertFalse(self.renderer.nodes.get_visible())
+
+
+class TestLevelOfDetail(unittest.TestCase):
+    """
+    Tests du regroupement en super-nœuds et de la limite d'étiquettes
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test : une grille de 40 x 40 nœuds
+        """
+        warnings.filterwarnings("ignore", message="Glyph")
+        self.figure, self.canvas = make_canvas()
+        self.nodes = list(range(1600))
+        grid = np.arange(1600)
+        self.positions = np.column_stack((grid % 40, grid // 40)).astype(float)
+        # Étoile autour du nœud 410, en (10, 10), en plus d'une chaîne
+        self.edges = np.array([[i, i + 1] for i in range(1599)] +
+                              [[410, i] for i in range(0, 1600, 7) if i != 410])
+
+    def make_renderer(self, **options):
+        """
+        Rendu avec un seuil bas pour déclencher le regroupement
+        """
+        renderer = GraphRenderer(self.figure, self.figure.add_subplot(111), self.canvas,
+                                 lod_threshold=100, label_top_k=5, **options)
+        renderer.update(self.nodes, self.positions, self.edges, style, "Titre",
+                        communities=lambda: np.arange(1600) // 400)
+        return renderer
+
+    def test_zoomed_out_aggregates(self):
+        """
+        Test du graphe entier : super-nœuds par type et étiquettes limitées
+        """
+        renderer = self.make_renderer()
+        self.assertEqual(renderer.mode, MODE_AGGREGATE)
+        self.assertEqual(renderer.aggregation.counts.sum(), 1600)
+        self.assertLess(len(renderer.nodes.get_offsets()), 1600)
+        self.assertEqual(set(renderer.aggregation.groups.tolist()), {0, 1})
+        self.assertLessEqual(len(renderer.labels), 5)
+        self.assertTrue(all(text.get_text().endswith(")") for text in renderer.labels.values()))
+
+    def test_zoom_expands_aggregates(self):
+        """
+        Test du zoom : retour au détail, étiquettes des nœuds les plus connectés
+        """
+        renderer = self.make_renderer()
+        renderer.set_view((5.5, 14.5), (5.5, 14.5))
+        self.assertEqual(renderer.mode, MODE_DETAIL)
+        self.assertEqual(len(renderer.labels), 5)
+        self.assertIn(410, renderer.labels)
+        # Seuls les 9 x 9 nœuds de la vue et les arêtes qui la touchent sont transmis
+        self.assertEqual(len(renderer.nodes.get_offsets()), 81)
+        self.assertEqual(sorted(renderer.shown.tolist()),
+                         [y * 40 + x for y in range(6, 15) for x in range(6, 15)])
+        self.assertLess(len(renderer.edges.get_segments()), len(self.edges) // 2)
+
+        renderer.set_view()
+        self.assertEqual(renderer.mode, MODE_AGGREGATE)
+
+    def test_community_aggregation(self):
+        """
+        Test du regroupement par communauté
+        """
+        renderer = self.make_renderer(aggregate_by="community")
+        self.assertEqual(renderer.mode, MODE_AGGREGATE)
+        self.assertEqual(set(renderer.aggregation.groups.tolist()), {0, 1, 2, 3})
+
+        with self.assertRaises(ValueError):
+            self.make_renderer(aggregate_by="inconnu")
+
+
+class TestViewNavigator(unittest.TestCase):
+    """
+    Tests du zoom et du déplacement de la vue
+    """
+
+    def test_zoom_pan_reset(self):
+        """
+        Test du zoom autour d'un point, du déplacement et du retour à l'ensemble
+        """
+        warnings.filterwarnings("ignore", message="Glyph")
+        figure, canvas = make_canvas()
+        renderer = GraphRenderer(figure, figure.add_subplot(111), canvas)
+        navigator = ViewNavigator(renderer)
+        positions = np.column_stack((np.arange(10.0), np.zeros(10)))
+        renderer.update(list(range(10)), positions, np.array([[i, i + 1] for i in range(9)]), style, "Titre")
+
+        renderer.set_view((0, 8), (-4, 4))
+        navigator.zoom(2.0, (2.0, 0.0))
+        self.assertEqual(renderer.view, ((1.0, 5.0), (-2.0, 2.0)))
+        self.assertEqual(renderer.shown.tolist(), [1, 2, 3, 4, 5])
+
+        navigator.pan(3.0, 0.0)
+        self.assertEqual(renderer.view, ((4.0, 8.0), (-2.0, 2.0)))
+        self.assertEqual(renderer.shown.tolist(), [4, 5, 6, 7, 8])
+
+        navigator.reset()
+        self.assertIsNone(renderer.view)
+        self.assertEqual(len(renderer.nodes.get_offsets()), 10)
+
+
+class TestSelection(unittest.TestCase):
+    """
+    Tests de la sélection de nœuds à la souris
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test : dix nœuds alignés
+        """
+        warnings.filterwarnings("ignore", message="Glyph")
+        self.figure = Figure(figsize=(8, 6), dpi=100)
+        self.canvas = FigureCanvasAgg(self.figure)
+        self.renderer = GraphRenderer(self.figure, self.figure.add_subplot(111), self.canvas)
+        self.changes = []
+        self.tool = SelectionTool(self.renderer, self.changes.append)
+        positions = np.column_stack((np.arange(10.0) * 10, np.zeros(10)))
+        self.renderer.update(list(range(10)), positions, np.empty((0, 2)), style, "Titre")
+        self.renderer.set_view((-10, 100), (-40, 40))
+
+    def mouse(self, name, x, y, key=None):
+        """
+        Envoie un événement souris (bouton gauche) aux coordonnées du graphe
+        """
+        px, py = self.renderer.ax.transData.transform((x, y))
+        MouseEvent(name, self.canvas, px, py, button=1, key=key)._process()
+
+    def test_click_and_toggle(self):
+        """
+        Test du clic : nœud sous le curseur, ajout avec Maj, vide ailleurs
+        """
+        self.assertEqual(self.renderer.hit_test(30.5, 0.0), 3)
+        self.assertIsNone(self.renderer.hit_test(35.0, 0.0))
+
+        self.mouse('button_press_event', 30.0, 0.0)
+        self.mouse('button_release_event', 30.0, 0.0)
+        self.assertEqual(self.renderer.selected, [3])
+
+        self.mouse('button_press_event', 70.0, 0.0, key='shift')
+        self.mouse('button_release_event', 70.0, 0.0, key='shift')
+        self.assertEqual(self.renderer.selected, [3, 7])
+        self.assertEqual(len(self.renderer.selection.get_offsets()), 2)
+
+        self.tool.click(30.0, 0.0, add=True)
+        self.assertEqual(self.renderer.selected, [7])
+        self.tool.click(35.0, 0.0)
+        self.assertEqual(self.changes[-1], [])
+
+    def test_rubber_band(self):
+        """
+        Test du rectangle tracé en glissant
+        """
+        self.mouse('button_press_event', 15.0, -1.0)
+        self.mouse('motion_notify_event', 35.0, 1.0)
+        self.assertTrue(self.tool.band.get_visible())
+        self.mouse('button_release_event', 55.0, 1.0)
+        self.assertFalse(self.tool.band.get_visible())
+        self.assertEqual(self.changes[-1], [2, 3, 4, 5])
+
+        self.tool.select_rect((75, 95), (-1, 1), add=True)
+        self.assertEqual(self.renderer.selected, [2, 3, 4, 5, 8, 9])
+
+        # Un nœud retiré du graphe quitte la sélection
+        self.renderer.update(list(range(9)), np.column_stack((np.arange(9.0) * 10, np.zeros(9))),
+                             np.empty((0, 2)), style, "Titre")
+        self.assertEqual(self.renderer.selected, [2, 3, 4, 5, 8])
+
+
+class TestGraphManagerDisplay(unittest.TestCase):
+    """
+    Tests de l'affichage du GraphManager sur un canvas Agg
+    """
+
+    def test_update_display(self):
+        """
+        Test de l'affichage après ajouts et suppression d'artéfacts
+        """
+        warnings.filterwarnings("ignore", message="Glyph")
+        graph_manager = GraphManager()
+        graph_manager.attach_canvas(*make_canvas())
+        self.assertTrue(graph_manager.renderer.empty_text.get_visible())
+
+        graph_manager.add_node("192.168.1.100")
+        graph_manager.add_node("malicious-domain-name.com")
+        graph_manager.add_edge("192.168.1.100", "malicious-domain-name.com")
+        graph_manager.update_display()
+
+        renderer = graph_manager.renderer
+        labels = sorted(text.get_text() for text in renderer.labels.values())
+        self.assertEqual(labels, ["192.168.1.100", "malicious-do..."])
+        self.assertIn("2 artéfacts, 1 liens", renderer.title.get_text())
+
+        selections = []
+        graph_manager.on_selection = selections.append
+        graph_manager.select_artifacts(["malicious-domain-name.com", "inconnu"])
+        self.assertEqual(selections, [["malicious-domain-name.com"]])
+        self.assertEqual(graph_manager.get_selected_artifacts(), ["malicious-domain-name.com"])
+
+        graph_manager.remove_node("192.168.1.100")
+        graph_manager.update_display()
+        self.assertEqual(len(renderer.labels), 1)
+        self.assertEqual(len(renderer.edges.get_segments()), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
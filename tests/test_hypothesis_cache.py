@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le cache des hypothèses générées
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ai_manager import AIManager
+from ai_scheduler import AIScheduler, STATUS_DONE, STATUS_ERROR
+from graph_manager import GraphManager
+from hypothesis_cache import HypothesisCache, cache_key, canonical_description
+
+# Attente maximale dans les tests (s)
+TIMEOUT = 5
+
+SETTINGS = {"model_name": "phi3", "mode": "api", "temperature": 0.7, "max_tokens": 512}
+
+
+def build_graph(artifacts, edges):
+    """
+    Construit un graphe et retourne sa description
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        graph = GraphManager()
+        for artifact in artifacts:
+            graph.add_node(artifact)
+        for first, second in edges:
+            graph.add_edge(first, second, "communique")
+    return graph.get_graph_description()
+
+
+class CountingAIManager:
+    """
+    Remplace AIManager : compte les générations, mode "api"
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.settings = dict(SETTINGS)
+
+    def generation_settings(self):
+        return dict(self.settings)
+
+    def generate_hypotheses_stream(self, description, wait_ready=None, cancel=None, on_start=None):
+        self.calls += 1
+        if on_start is not None:
+            on_start(self.generation_settings())
+        yield "Hypothèse 1"
+        yield " / Hypothèse 2"
+
+
+class WarmingAIManager(CountingAIManager):
+    """
+    Répond par l'API pendant que le préchauffage bascule sur Transformers
+    """
+
+    def generate_hypotheses_stream(self, description, wait_ready=None, cancel=None, on_start=None):
+        self.calls += 1
+        if on_start is not None:
+            on_start(self.generation_settings())
+        self.settings.update(model_name="microsoft/phi-2", mode="transformers")
+        yield "Hypothèse 1"
+
+
+class ReadOnlyCache(HypothesisCache):
+    """
+    Cache dont l'écriture échoue (répertoire en lecture seule)
+    """
+
+    def put(self, key, response, model_name=None, mode=None):
+        raise PermissionError(13, "Permission denied", self.directory)
+
+
+class FailingOllamaHandler(BaseHTTPRequestHandler):
+    """
+    API Ollama qui échoue en cours de flux (modèle déchargé...)
+    """
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        self.wfile.write(json.dumps({"response": "Hypothèse", "done": False}).encode() + b"\n")
+        self.wfile.write(json.dumps({"error": "model runner has unexpectedly stopped"}).encode() + b"\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHypothesisCache(unittest.TestCase):
+    """
+    Tests unitaires pour HypothesisCache
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        Nettoyage après chaque test
+        """
+        self.tmp.cleanup()
+
+    def test_key_order_independent(self):
+        """
+        Test que l'ordre de saisie n'influe pas sur la clé
+        """
+        artifacts = ["192.168.1.10", "10.0.0.5", "evil.com", "malware.exe", "d41d8cd98f00b204e9800998ecf8427e"]
+        edges = [("192.168.1.10", "evil.com"), ("malware.exe", "10.0.0.5")]
+        first = build_graph(artifacts, edges)
+        second = build_graph(list(reversed(artifacts)), [(b, a) for a, b in reversed(edges)])
+
+        self.assertNotEqual(first, second)
+        self.assertEqual(canonical_description(first), canonical_description(second))
+        self.assertEqual(cache_key(first, **SETTINGS), cache_key(second, **SETTINGS))
+
+        # Un autre graphe ou d'autres réglages changent la clé
+        other = build_graph(artifacts, edges[:1])
+        self.assertNotEqual(cache_key(first, **SETTINGS), cache_key(other, **SETTINGS))
+        for name, value in (("model_name", "llama3"), ("mode", "transformers"),
+                            ("temperature", 0.2), ("max_tokens", 256)):
+            self.assertNotEqual(cache_key(first, **SETTINGS), cache_key(first, **dict(SETTINGS, **{name: value})))
+
+        # Les réponses simulées ne sont pas mises en cache
+        self.assertIsNone(cache_key(first, **dict(SETTINGS, mode="simulation")))
+
+    def test_persistence_and_counters(self):
+        """
+        Test de la relecture depuis le disque et des compteurs
+        """
+        cache = HypothesisCache(self.tmp.name)
+        key = cache_key("- IP: 10.0.0.1", **SETTINGS)
+        self.assertIsNone(cache.get(key))
+        cache.put(key, "Réponse", "phi3", "api")
+        self.assertEqual(cache.get(key)["response"], "Réponse")
+
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+
+        # Un nouveau cache sur le même répertoire retrouve l'entrée
+        reopened = HypothesisCache(self.tmp.name)
+        self.assertEqual(len(reopened), 1)
+        self.assertEqual(reopened.size, cache.size)
+        self.assertEqual(reopened.get(key)["mode"], "api")
+
+    def test_lru_eviction(self):
+        """
+        Test de l'éviction des entrées les moins récemment utilisées
+        """
+        keys = [cache_key(f"- IP: 10.0.0.{i}", **SETTINGS) for i in range(4)]
+        probe = HypothesisCache(os.path.join(self.tmp.name, "probe"))
+        probe.put(keys[0], "x" * 100)
+        entry_size = probe.size
+
+        # Place pour trois entrées
+        cache = HypothesisCache(self.tmp.name, max_bytes=entry_size * 3)
+        for key in keys[:3]:
+            cache.put(key, "x" * 100)
+        cache.get(keys[0])           # keys[0] redevient la plus récente
+        cache.put(keys[3], "x" * 100)
+
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertLessEqual(cache.size, entry_size * 3)
+        self.assertIsNone(cache.get(keys[1]))
+        for key in (keys[0], keys[2], keys[3]):
+            self.assertIsNotNone(cache.get(key))
+        self.assertEqual(len(HypothesisCache(self.tmp.name)), 3)
+
+    def test_scheduler_serves_cached(self):
+        """
+        Test qu'une demande déjà traitée est servie depuis le cache
+        """
+        ai_manager = CountingAIManager()
+        cache = HypothesisCache(self.tmp.name)
+        scheduler = AIScheduler(ai_manager, workers=1, cache=cache)
+        description = build_graph(["10.0.0.1", "evil.com"], [("10.0.0.1", "evil.com")])
+
+        done = threading.Event()
+        first = scheduler.submit(description, on_done=lambda request: done.set())
+        self.assertTrue(done.wait(TIMEOUT))
+        self.assertFalse(first.cached)
+        self.assertEqual(len(cache), 1)
+
+        # Réponse immédiate, sans nouvelle génération
+        chunks = []
+        second = scheduler.submit(description, on_chunk=chunks.append)
+        self.assertEqual(second.status, STATUS_DONE)
+        self.assertTrue(second.cached)
+        self.assertEqual(chunks, ["Hypothèse 1 / Hypothèse 2"])
+        self.assertEqual(ai_manager.calls, 1)
+
+        # D'autres réglages relancent la génération
+        ai_manager.settings["temperature"] = 0.1
+        done.clear()
+        third = scheduler.submit(description, on_done=lambda request: done.set())
+        self.assertTrue(done.wait(TIMEOUT))
+        self.assertFalse(third.cached)
+        self.assertEqual(ai_manager.calls, 2)
+        scheduler.shutdown()
+
+    def test_cached_under_streaming_mode(self):
+        """
+        Test que la réponse est mise en cache sous le moteur qui l'a produite,
+        même si le préchauffage change de mode pendant le flux
+        """
+        ai_manager = WarmingAIManager()
+        cache = HypothesisCache(self.tmp.name)
+        scheduler = AIScheduler(ai_manager, workers=1, cache=cache)
+        self.addCleanup(scheduler.shutdown)
+        description = build_graph(["10.0.0.1", "evil.com"], [("10.0.0.1", "evil.com")])
+
+        done = threading.Event()
+        scheduler.submit(description, on_done=lambda request: done.set())
+        self.assertTrue(done.wait(TIMEOUT))
+
+        transformers_key = cache_key(description, **ai_manager.generation_settings())
+        self.assertIsNone(cache.get(transformers_key))
+        self.assertIsNotNone(cache.get(cache_key(description, **SETTINGS)))
+
+    def test_failure_not_cached(self):
+        """
+        Test qu'une génération en échec n'est pas mise en cache
+        """
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FailingOllamaHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ai_manager = AIManager(discover=False, ai_config={
+                "api_url": f"http://127.0.0.1:{server.server_port}/api/generate", "retries": 0})
+        ai_manager.mode = "api"
+        cache = HypothesisCache(self.tmp.name)
+        scheduler = AIScheduler(ai_manager, workers=1, cache=cache)
+        self.addCleanup(scheduler.shutdown)
+
+        for _ in range(2):
+            done = threading.Event()
+            with contextlib.redirect_stdout(io.StringIO()):
+                request = scheduler.submit("- IP: 10.0.0.1", on_done=lambda request: done.set())
+                self.assertTrue(done.wait(TIMEOUT))
+            self.assertEqual(request.status, STATUS_ERROR)
+            self.assertFalse(request.cached)
+            self.assertIn("unexpectedly stopped", str(request.error))
+
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["hits"]), (0, 0))
+
+    def test_cache_write_failure(self):
+        """
+        Test qu'un cache impossible à écrire ne bloque pas les demandes
+        """
+        ai_manager = CountingAIManager()
+        scheduler = AIScheduler(ai_manager, workers=1, cache=ReadOnlyCache(self.tmp.name))
+        self.addCleanup(scheduler.shutdown)
+
+        for calls in (1, 2):
+            done = threading.Event()
+            chunks = []
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                request = scheduler.submit("- IP: 10.0.0.1", on_chunk=chunks.append,
+                                           on_done=lambda request: done.set())
+                self.assertTrue(done.wait(TIMEOUT))
+            self.assertEqual(request.status, STATUS_DONE)
+            self.assertEqual("".join(chunks), "Hypothèse 1 / Hypothèse 2")
+            self.assertIn("Permission denied", output.getvalue())
+            self.assertEqual(ai_manager.calls, calls)
+        self.assertEqual(scheduler.pending_count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le calcul de disposition en arrière-plan
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+import unittest
+
+import numpy as np
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_layout import PositionCache, compute_layout
+from graph_manager import GraphManager
+from layout_worker import LayoutWorker
+
+# Délai maximal d'attente d'un calcul (démarrage du processus compris)
+TIMEOUT = 60
+
+
+class TestLayoutWorker(unittest.TestCase):
+    """
+    Tests du calcul dans un processus séparé et de l'abandon des calculs périmés
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.worker = LayoutWorker()
+        self.graph_manager = GraphManager(layout=PositionCache(seed=0), layout_worker=self.worker)
+        artifacts = [f"10.0.{i // 250}.{i % 250}" for i in range(600)]
+        self.graph_manager.add_nodes_bulk(artifacts)
+        self.graph_manager.add_edges_bulk(zip(artifacts, artifacts[1:]))
+
+    def tearDown(self):
+        """
+        Nettoyage après chaque test
+        """
+        self.worker.shutdown()
+
+    def wait_for_worker(self):
+        """
+        Scrute le calcul jusqu'à sa fin ; retourne les valeurs de apply_finished_layout
+        """
+        results = []
+        deadline = time.monotonic() + TIMEOUT
+        while self.worker.pending is not None:
+            self.assertLess(time.monotonic(), deadline, "Calcul de disposition trop long")
+            results.append(self.graph_manager.apply_finished_layout())
+            time.sleep(0.05)
+        return results
+
+    def test_background_layout(self):
+        """
+        Test d'un calcul en arrière-plan puis de son application
+        """
+        self.assertTrue(self.graph_manager.request_layout())
+        provisional = self.graph_manager.layout.current(self.graph_manager.graph)
+        self.assertEqual(len(provisional), 600)
+
+        self.assertIn(True, self.wait_for_worker())
+        self.assertEqual(self.graph_manager.layout.last_run['engine'], "barnes_hut")
+        self.assertFalse(self.graph_manager.request_layout())
+
+    def test_stale_layout_is_discarded(self):
+        """
+        Test de l'abandon d'un résultat calculé sur une version périmée
+        """
+        self.graph_manager.request_layout()
+        self.wait_for_worker()
+
+        self.graph_manager.add_node("evil.exe")
+        self.graph_manager.add_edge("evil.exe", "10.0.0.5")
+        self.assertTrue(self.graph_manager.request_layout())
+        self.graph_manager.add_node("dropper.exe")
+
+        self.assertNotIn(True, self.wait_for_worker())
+
+        # Le calcul abandonné est repris avec la nouvelle version
+        self.assertTrue(self.graph_manager.request_layout())
+        self.assertIn(True, self.wait_for_worker())
+        self.assertEqual(self.graph_manager.layout.last_run['nodes'], 602)
+
+    def test_broken_pool_falls_back_in_process(self):
+        """
+        Test de la reprise locale d'un calcul quand le processus meurt, puis
+        du redémarrage du processus au calcul suivant
+        """
+        self.assertTrue(self.graph_manager.request_layout())
+        executor = self.worker._executor
+        for process in list(executor._processes.values()):
+            process.kill()
+
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.assertIn(True, self.wait_for_worker())
+        self.assertIn("calcul local", output.getvalue())
+        self.assertIsNone(self.worker._executor)
+
+        self.graph_manager.add_node("evil.exe")
+        self.assertTrue(self.graph_manager.request_layout())
+        self.assertIsNot(self.worker._executor, executor)
+        self.assertIn(True, self.wait_for_worker())
+        self.assertEqual(self.graph_manager.layout.last_run['nodes'], 601)
+
+    def test_should_stop_interrupts_engine(self):
+        """
+        Test de l'interruption d'un calcul entre deux itérations
+        """
+        edges = np.array([[0, 1], [1, 2]])
+        _, iterations = compute_layout("barnes_hut", 3, edges, iterations=100, should_stop=lambda: True)
+        self.assertEqual(iterations, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'ingestion de logs Sysmon/Zeek
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_manager import GraphManager
+from log_ingestion import (LogIngestor, detect_log_format, map_sysmon_event,
+                           map_zeek_dns, FORMAT_SYSMON, FORMAT_ZEEK_CONN, FORMAT_ZEEK_DNS)
+
+SYSMON_EVENTS = [
+    {
+        "EventID": 1,
+        "Image": "C:\\Windows\\System32\\WindowsPowerShell\\v1.0\\powershell.exe",
+        "ParentImage": "C:\\Windows\\System32\\cmd.exe",
+        "Hashes": "MD5=D41D8CD98F00B204E9800998ECF8427E,IMPHASH=0000"
+    },
+    {
+        "EventID": 3,
+        "Image": "C:\\Windows\\System32\\WindowsPowerShell\\v1.0\\powershell.exe",
+        "DestinationIp": "203.0.113.7",
+        "DestinationHostname": "c2-server.com"
+    },
+    {
+        "winlog": {
+            "event_id": 22,
+            "event_data": {
+                "Image": "C:\\Windows\\System32\\WindowsPowerShell\\v1.0\\powershell.exe",
+                "QueryName": "c2-server.com",
+                "QueryResults": "::ffff:203.0.113.7;"
+            }
+        }
+    }
+]
+
+ZEEK_EVENTS = [
+    {"id.orig_h": "10.0.0.5", "id.resp_h": "203.0.113.7", "proto": "tcp"},
+    {"id.orig_h": "10.0.0.5", "query": "c2-server.com", "answers": ["203.0.113.7", "alias.example"]}
+]
+
+
+class TestLogIngestion(unittest.TestCase):
+    """
+    Tests unitaires pour LogIngestor et les fonctions de correspondance
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.graph_manager = GraphManager()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """
+        Nettoyage après chaque test
+        """
+        self.temp_dir.cleanup()
+
+    def _write_jsonl(self, records, extra_lines=()):
+        path = os.path.join(self.temp_dir.name, "events.jsonl")
+        with open(path, 'w', encoding='utf-8') as log_file:
+            for record in records:
+                log_file.write(json.dumps(record) + "\n")
+            for line in extra_lines:
+                log_file.write(line + "\n")
+        return path
+
+    def test_detect_log_format(self):
+        """
+        Test de la détection du format par enregistrement
+        """
+        self.assertEqual(detect_log_format(SYSMON_EVENTS[0]), FORMAT_SYSMON)
+        self.assertEqual(detect_log_format(SYSMON_EVENTS[2]), FORMAT_SYSMON)
+        self.assertEqual(detect_log_format(ZEEK_EVENTS[0]), FORMAT_ZEEK_CONN)
+        self.assertEqual(detect_log_format(ZEEK_EVENTS[1]), FORMAT_ZEEK_DNS)
+        self.assertIsNone(detect_log_format({"foo": "bar"}))
+
+    def test_map_sysmon_process_create(self):
+        """
+        Test de la correspondance d'une création de processus Sysmon
+        """
+        artifacts, edges = map_sysmon_event(SYSMON_EVENTS[0])
+
+        self.assertIn(("powershell.exe", "process"), artifacts)
+        self.assertIn(("cmd.exe", "process"), artifacts)
+        self.assertIn(("d41d8cd98f00b204e9800998ecf8427e", "hash"), artifacts)
+        self.assertIn(("cmd.exe", "powershell.exe", "spawned"), edges)
+        self.assertEqual(len([a for a in artifacts if a[1] == 'hash']), 1)
+
+    def test_map_zeek_dns(self):
+        """
+        Test de la correspondance d'une requête DNS Zeek
+        """
+        artifacts, edges = map_zeek_dns(ZEEK_EVENTS[1])
+
+        self.assertIn(("c2-server.com", "domain"), artifacts)
+        self.assertIn(("10.0.0.5", "c2-server.com", "queried"), edges)
+        self.assertIn(("c2-server.com", "203.0.113.7", "resolved_to"), edges)
+        self.assertNotIn(("alias.example", "ip"), artifacts)
+
+    def test_ingest_mixed_file_in_batches(self):
+        """
+        Test d'ingestion complète d'un fichier mixte par petits lots
+        """
+        path = self._write_jsonl(SYSMON_EVENTS + ZEEK_EVENTS, extra_lines=["pas du json", ""])
+        ingestor = LogIngestor(self.graph_manager, batch_size=2)
+
+        progress = []
+        stats = ingestor.ingest(path, progress_callback=progress.append)
+
+        self.assertEqual(stats['events'], 5)
+        self.assertEqual(stats['invalid_lines'], 1)
+        self.assertEqual(progress[-1]['progress'], 1.0)
+        self.assertGreaterEqual(len(progress), 3)
+
+        # Les artéfacts partagés entre événements ne sont créés qu'une fois
+        nodes = self.graph_manager.get_all_nodes()
+        self.assertEqual(len(nodes), len(set(nodes)))
+        self.assertEqual(stats['nodes_added'], self.graph_manager.get_node_count())
+
+        node_id = self.graph_manager.artifact_to_id["c2-server.com"]
+        self.assertEqual(self.graph_manager.graph.nodes[node_id]['type'], 'domain')
+        self.assertGreater(self.graph_manager.get_edge_count(), 0)
+
+    def test_malformed_records_counted_invalid(self):
+        """
+        Test que les enregistrements aux champs d'un type inattendu sont
+        ignorés et comptés comme lignes invalides
+        """
+        malformed = [
+            {"EventID": 1, "EventData": ["Image", "cmd.exe"]},
+            {"winlog": {"event_id": 3, "event_data": "DestinationIp=203.0.113.7"}},
+            {"EventID": 3, "Image": "cmd.exe", "DestinationIp": ["203.0.113.7"]},
+            {"EventID": 22, "QueryName": "c2-server.com", "QueryResults": ["203.0.113.7"]},
+            {"id.orig_h": {"ip": "10.0.0.5"}, "id.resp_h": "203.0.113.7"},
+            {"id.orig_h": "10.0.0.5", "query": ["c2-server.com"]}
+        ]
+        self.assertIsNone(map_sysmon_event(malformed[0]))
+        self.assertIsNone(map_zeek_dns(malformed[5]))
+
+        path = self._write_jsonl(malformed + ZEEK_EVENTS[:1])
+        stats = LogIngestor(self.graph_manager).ingest(path)
+
+        self.assertEqual(stats['events'], 1)
+        self.assertEqual(stats['invalid_lines'], len(malformed))
+        self.assertEqual(self.graph_manager.get_node_count(), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
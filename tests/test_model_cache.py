@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour les checkpoints locaux du modèle
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ai_manager import AIManager
+from model_cache import MANIFEST_FILE, checkpoint_path, read_manifest, write_manifest
+
+
+class TestModelCache(unittest.TestCase):
+    """
+    Tests unitaires pour model_cache
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.tmp = tempfile.TemporaryDirectory()
+        self.model_name = "microsoft/Phi-3-mini-4k-instruct"
+        self.path = checkpoint_path(self.model_name, self.tmp.name)
+
+    def tearDown(self):
+        """
+        Nettoyage après chaque test
+        """
+        self.tmp.cleanup()
+
+    def test_checkpoint_path(self):
+        """
+        Test du répertoire de checkpoint : un sous-répertoire par modèle
+        """
+        self.assertEqual(self.path, os.path.join(self.tmp.name, "microsoft--Phi-3-mini-4k-instruct"))
+        default = checkpoint_path(self.model_name)
+        self.assertEqual(os.path.basename(os.path.dirname(default)), "models")
+
+    def test_manifest(self):
+        """
+        Test du manifeste : seule une conversion terminée est reconnue
+        """
+        self.assertIsNone(read_manifest(self.path))
+
+        os.makedirs(self.path)
+        write_manifest(self.path, self.model_name, "bfloat16")
+        manifest = read_manifest(self.path)
+        self.assertEqual(manifest["model_name"], self.model_name)
+        self.assertEqual(manifest["dtype"], "bfloat16")
+
+        # Manifeste d'une autre version : conversion à refaire
+        manifest["version"] += 1
+        with open(os.path.join(self.path, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        self.assertIsNone(read_manifest(self.path))
+
+    def test_model_info(self):
+        """
+        Test du checkpoint signalé par get_model_info
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            ai_manager = AIManager(discover=False, ai_config={"checkpoint_dir": self.tmp.name})
+        self.assertIsNone(ai_manager.get_model_info()["checkpoint"])
+
+        os.makedirs(self.path)
+        write_manifest(self.path, self.model_name, "bfloat16")
+        self.assertEqual(ai_manager.get_model_info()["checkpoint"], self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
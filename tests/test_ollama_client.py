@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le client de l'API Ollama, contre un serveur HTTP
+local de substitution
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ollama_client import OllamaClient, OllamaError
+
+
+class StandInOllama(ThreadingHTTPServer):
+    """
+    Serveur imitant /api/tags et /api/generate
+
+    failures: nombre de réponses 503 à renvoyer d'abord
+    delay: durée de chaque génération avant la réponse (s)
+    token_delay: attente entre deux morceaux d'un flux (s)
+    """
+
+    daemon_threads = True
+
+    def __init__(self, failures=0, delay=0.0, token_delay=0.0):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.failures = failures
+        self.delay = delay
+        self.token_delay = token_delay
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_port}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Gestionnaire HTTP/1.1 (connexions maintenues) du serveur de substitution
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._send(200, {"models": [{"name": "phi3"}]})
+
+    def do_POST(self):
+        server = self.server
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with server.lock:
+            server.requests += 1
+            server.connections.add(self.client_address)
+            fail = server.failures > 0
+            server.failures -= fail
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            if fail:
+                self._send(503, {"error": "model loading"})
+                return
+            time.sleep(server.delay)
+            words = request["prompt"].split()
+            if not request.get("stream"):
+                self._send(200, {"response": " ".join(reversed(words)), "done": True})
+                return
+            # Comme Ollama : un bloc HTTP (chunked) par ligne NDJSON
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i, word in enumerate(reversed(words)):
+                if i:
+                    time.sleep(server.token_delay)
+                self._send_chunk({"response": word, "done": False})
+            self._send_chunk({"response": "", "done": True})
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client parti (flux annulé)
+            self.close_connection = True
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _send_chunk(self, message):
+        line = json.dumps(message).encode() + b"\n"
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+        self.wfile.flush()
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestOllamaClient(unittest.TestCase):
+    """
+    Tests unitaires pour OllamaClient
+    """
+
+    def start_server(self, **options):
+        """
+        Démarre un serveur de substitution, arrêté en fin de test
+        """
+        server = StandInOllama(**options)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def make_client(self, server, **options):
+        client = OllamaClient(server.url, **options)
+        self.addCleanup(client.close)
+        return client
+
+    def test_keep_alive(self):
+        """
+        Test de la réutilisation de la connexion entre requêtes successives
+        """
+        server = self.start_server()
+        client = self.make_client(server)
+
+        self.assertTrue(client.is_available())
+        for i in range(10):
+            self.assertEqual(client.generate(f"a b {i}", "phi3"), f"{i} b a")
+        self.assertEqual(server.requests, 10)
+        self.assertEqual(len(server.connections), 1)
+
+    def test_bounded_concurrency(self):
+        """
+        Test de plusieurs générations en vol, dans la limite fixée
+        """
+        server = self.start_server(delay=0.1)
+        client = self.make_client(server, max_concurrency=3)
+
+        results = client.generate_many([f"prompt {i}" for i in range(9)], "phi3")
+        self.assertEqual(results, [f"{i} prompt" for i in range(9)])
+        self.assertEqual(server.max_in_flight, 3)
+
+    def test_retries(self):
+        """
+        Test des nouvelles tentatives sur réponse 503
+        """
+        server = self.start_server(failures=2)
+        client = self.make_client(server, retries=3, backoff=0)
+        self.assertEqual(client.generate("x y", "phi3"), "y x")
+        self.assertEqual(server.requests, 3)
+
+        server.failures = 5
+        client = self.make_client(server, retries=1, backoff=0)
+        with self.assertRaises(OllamaError):
+            client.generate("x y", "phi3")
+
+    def test_probe_without_retries(self):
+        """
+        Test de la détection d'une API absente : immédiate, sans nouvelle tentative
+        """
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        client = OllamaClient(f"http://127.0.0.1:{port}", retries=3, backoff=0.5)
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertFalse(client.is_available())
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+    def test_timeout(self):
+        """
+        Test du délai de requête : une génération trop longue n'est pas relancée
+        """
+        server = self.start_server(delay=0.5)
+        client = self.make_client(server, timeout=0.1)
+        with self.assertRaises(requests.RequestException):
+            client.generate("x", "phi3")
+        self.assertEqual(server.requests, 1)
+
+    def test_stream(self):
+        """
+        Test du flux NDJSON et de la libération de la place en fin de flux
+        """
+        server = self.start_server()
+        client = self.make_client(server, max_concurrency=1)
+        self.assertEqual(list(client.generate_stream("a b c", "phi3")), ["c", "b", "a"])
+
+        # Flux abandonné : la place est rendue à la fermeture du générateur
+        stream = client.generate_stream("a b c", "phi3")
+        next(stream)
+        stream.close()
+        self.assertEqual(client.generate("a b", "phi3"), "b a")
+
+    def test_stream_cancel(self):
+        """
+        Test de l'annulation d'un flux, avant et après le premier morceau
+        """
+        for options, expected in (({"delay": 2}, []), ({"token_delay": 2}, ["c"])):
+            server = self.start_server(**options)
+            client = self.make_client(server)
+            cancel = threading.Event()
+            chunks = []
+            started = time.perf_counter()
+            threading.Timer(0.2, cancel.set).start()
+            for chunk in client.generate_stream("a b c", "phi3", cancel=cancel):
+                chunks.append(chunk)
+            self.assertEqual(chunks, expected)
+            self.assertLess(time.perf_counter() - started, 1)
+
+    def test_from_config(self):
+        """
+        Test de la création depuis la section "ai" de la configuration
+        """
+        client = OllamaClient.from_config({"api_url": "http://10.0.0.5:11434/api/generate",
+                                           "timeout": 12, "max_concurrency": 2})
+        self.assertEqual(client.base_url, "http://10.0.0.5:11434")
+        self.assertEqual(client.timeout, 12)
+        self.assertEqual(client.max_concurrency, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
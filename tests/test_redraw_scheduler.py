@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le planificateur de rafraîchissement
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import unittest
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_manager import GraphManager
+from redraw_scheduler import RedrawScheduler
+
+
+class FakeLoop:
+    """
+    Remplace root.after : les appels programmés sont exécutés par run()
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def after(self, delay, callback):
+        self.calls.append((delay, callback))
+
+    def run(self):
+        calls, self.calls = self.calls, []
+        for _, callback in calls:
+            callback()
+
+
+class TestRedrawScheduler(unittest.TestCase):
+    """
+    Tests unitaires pour RedrawScheduler
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test
+        """
+        self.loop = FakeLoop()
+        self.drawn = []
+        self.scheduler = RedrawScheduler(self.loop.after,
+                                         lambda: self.drawn.append("canvas"),
+                                         lambda: self.drawn.append("details"))
+
+    def test_paste_coalesced(self):
+        """
+        Test du collage de 500 artéfacts : un seul rafraîchissement
+        """
+        graph_manager = GraphManager()
+        graph_manager.on_change = self.scheduler.invalidate
+        for i in range(500):
+            graph_manager.add_node(f"host-{i}.example.com")
+
+        self.assertEqual(len(self.loop.calls), 1)
+        self.assertEqual(self.drawn, [])
+        self.loop.run()
+        self.assertEqual(self.drawn, ["canvas", "details"])
+        self.assertEqual(self.scheduler.frames, 1)
+
+        # Rien de neuf : aucune image de plus
+        self.loop.run()
+        self.assertEqual(self.scheduler.frames, 1)
+
+    def test_separate_dirty_flags(self):
+        """
+        Test des indicateurs séparés et de l'intervalle entre deux images
+        """
+        self.scheduler.invalidate(details=False)
+        self.scheduler.invalidate(details=False)
+        self.loop.run()
+        self.assertEqual(self.drawn, ["canvas"])
+
+        self.scheduler.invalidate(canvas=False)
+        delay, _ = self.loop.calls[0]
+        self.assertGreater(delay, 0)
+        self.loop.run()
+        self.assertEqual(self.drawn, ["canvas", "details"])
+
+    def test_hold_and_release(self):
+        """
+        Test de la suspension pendant un import
+        """
+        self.scheduler.invalidate()
+        self.scheduler.hold()
+        self.scheduler.invalidate()
+        self.loop.run()
+        self.assertEqual(self.drawn, [])
+
+        self.scheduler.release()
+        self.loop.run()
+        self.assertEqual(self.drawn, ["canvas", "details"])
+        self.assertEqual(self.scheduler.frames, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
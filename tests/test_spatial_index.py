@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'index spatial
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from spatial_index import EdgeIndex, GridIndex
+
+
+def in_rect(points, xlim, ylim):
+    """
+    Référence : indices des points du rectangle, par parcours complet
+    """
+    return np.flatnonzero((points[:, 0] >= xlim[0]) & (points[:, 0] <= xlim[1]) &
+                          (points[:, 1] >= ylim[0]) & (points[:, 1] <= ylim[1]))
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """
+    Tests unitaires pour GridIndex et EdgeIndex
+    """
+
+    def setUp(self):
+        """
+        Configuration avant chaque test : points en amas
+        """
+        rng = np.random.default_rng(0)
+        self.points = np.vstack((rng.normal(0, 1, (2000, 2)), rng.normal(20, 5, (1000, 2))))
+        self.rects = [((-1, 1), (-1, 1)), ((10, 30), (15, 18)), ((-100, 100), (-100, 100)),
+                      ((50, 60), (50, 60)), ((0.5, 0.5), (-5, 5))]
+
+    def test_grid_query_matches_scan(self):
+        """
+        Test des requêtes rectangulaires, y compris après des ajouts
+        """
+        index = GridIndex(self.points)
+        for xlim, ylim in self.rects:
+            np.testing.assert_array_equal(index.query(xlim, ylim), in_rect(self.points, xlim, ylim))
+
+        added = index.extend([[0.0, 0.0], [55.0, 55.0]])
+        self.assertEqual(added.tolist(), [3000, 3001])
+        self.assertIn(3001, index.query((50, 60), (50, 60)).tolist())
+        self.assertEqual(len(index), 3002)
+        self.assertEqual(len(GridIndex(np.empty((0, 2))).query((0, 1), (0, 1))), 0)
+
+    def test_nearest(self):
+        """
+        Test du point le plus proche dans un rayon (test de clic)
+        """
+        index = GridIndex(self.points)
+        target = self.points[1234]
+        self.assertEqual(index.nearest(tuple(target + 1e-6), 0.01), 1234)
+        self.assertIsNone(index.nearest((60.0, 60.0), 1.0))
+
+    def test_edge_query_matches_scan(self):
+        """
+        Test des arêtes touchant un rectangle, courtes et longues
+        """
+        rng = np.random.default_rng(1)
+        short = np.column_stack((np.arange(2999), np.arange(1, 3000)))
+        edges = np.vstack((short, rng.integers(0, 3000, (50, 2))))
+        index = EdgeIndex(self.points, edges)
+
+        low = np.minimum(self.points[edges[:, 0]], self.points[edges[:, 1]])
+        high = np.maximum(self.points[edges[:, 0]], self.points[edges[:, 1]])
+        for (x0, x1), (y0, y1) in self.rects:
+            expected = np.flatnonzero((low[:, 0] <= x1) & (high[:, 0] >= x0) &
+                                      (low[:, 1] <= y1) & (high[:, 1] >= y0))
+            np.testing.assert_array_equal(index.query((x0, x1), (y0, y1)), expected)
+
+        # Une arête ajoutée vers un nœud lointain traverse la vue
+        positions = np.vstack((self.points, [[100.0, 0.0]]))
+        index.extend(positions, [[0, 3000]])
+        self.assertIn(len(edges), index.query((60, 70), (-100, 100)).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
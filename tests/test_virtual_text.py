@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour les sources de lignes de la vue virtualisée
+Chronosense v0.1
+
+Auteur: Généré automatiquement
+Version: 0.1
+"""
+
+import os
+import sys
+import unittest
+
+# Ajouter le répertoire src au path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from graph_manager import GraphManager
+from virtual_text import GraphSummarySource, TextLineSource
+
+
+class TestTextLineSource(unittest.TestCase):
+    """
+    Tests unitaires pour la source de texte libre
+    """
+
+    def test_wrap_and_append(self):
+        """
+        Test du découpage et de l'ajout au fil de l'eau
+        """
+        source = TextLineSource("Titre\n\n")
+        source.set_width(20)
+        source.append("une hypothèse assez longue ")
+        source.append("pour être découpée\nfin")
+
+        lines = source.lines(0, source.line_count())
+        self.assertEqual(lines[:2], ["Titre", ""])
+        self.assertTrue(all(len(line) <= 20 for line in lines))
+        self.assertEqual(" ".join(lines[2:-1]), "une hypothèse assez longue pour être découpée")
+        self.assertEqual(lines[-1], "fin")
+
+        source.set_width(80)
+        self.assertEqual(source.line_count(), 4)
+        self.assertEqual(source.find("FIN"), 3)
+        self.assertEqual(source.find("titre", 1), -1)
+
+
+class TestGraphSummarySource(unittest.TestCase):
+    """
+    Tests unitaires pour la source adossée au résumé du graphe
+    """
+
+    def test_lines_and_find(self):
+        """
+        Test de la lecture par fenêtre et de la recherche
+        """
+        graph_manager = GraphManager()
+        artifacts = [f"artifact_{i:03d}" for i in range(100)]
+        graph_manager.add_nodes_bulk(artifacts)
+        source = GraphSummarySource(graph_manager)
+
+        full = source.lines(0, source.line_count())
+        self.assertEqual(len(full), source.line_count())
+        self.assertEqual(full[0], "📊 Résumé du Graphe:")
+        self.assertIn("Générer des Hypothèses", full[-1])
+        self.assertEqual(full[2:-2], graph_manager.get_summary_lines())
+        self.assertEqual(source.lines(30, 10), full[30:40])
+        self.assertEqual(source.lines(len(full) - 3, 10), full[-3:])
+
+        index = source.find("artifact_077")
+        self.assertTrue(full[index].endswith("artifact_077"))
+        self.assertEqual(source.find("cliquez"), len(full) - 1)
+        self.assertEqual(source.find("résumé", 1), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()